@@ -35,12 +35,18 @@ from dataclasses import dataclass
 from pathlib import Path
 
 try:
-    from .tbench_utils import extract_task_id, get_passed
+    from .results_index import ResultsIndex, TrialFile, iter_result_files
 except ImportError:
-    from tbench_utils import extract_task_id, get_passed  # type: ignore[import-not-found,no-redef]
+    from results_index import (  # type: ignore[import-not-found,no-redef]
+        ResultsIndex,
+        TrialFile,
+        iter_result_files,
+    )
 
 # Data directory for caching downloaded results
 CACHE_DIR = Path(__file__).parent / ".leaderboard_cache"
+# Index of the parsed results, updated incrementally on each run
+INDEX_PATH = CACHE_DIR / "results_index.db"
 LEADERBOARD_REPO = "alexgshaw/terminal-bench-2-leaderboard"
 DATASET_VERSION = "2.0"
 
@@ -214,10 +220,10 @@ def query_lattice_results_from_bq() -> list[TaskResult]:
 
 
 def parse_leaderboard_results(
-    repo_path: Path, exclude_lattice: bool = True
-) -> list[TaskResult]:
+    repo_path: Path, index: ResultsIndex, exclude_lattice: bool = True
+) -> int:
     """
-    Parse all agent results from the leaderboard repo structure.
+    Index all agent results from the leaderboard repo structure.
 
     Expected structure:
         submissions/terminal-bench/2.0/<Agent>__<Model>/
@@ -226,16 +232,23 @@ def parse_leaderboard_results(
                 <trial-folder>/
                     result.json  # contains "passed" or "score"
 
+    Only result.json files added or modified since the last run are parsed.
+
     Args:
+        index: Index to store the results in, under the "leaderboard" source
         exclude_lattice: If True, skip Lattice agents (we get those from BigQuery)
+
+    Returns:
+        Number of results of the leaderboard in the index
     """
-    results: list[TaskResult] = []
     submissions_dir = repo_path / "submissions" / "terminal-bench" / DATASET_VERSION
 
     if not submissions_dir.exists():
         print(f"Warning: No submissions found at {submissions_dir}", file=sys.stderr)
-        return results
+        index.sync("leaderboard", [])
+        return 0
 
+    files: list[TrialFile] = []
     for agent_dir in submissions_dir.iterdir():
         if not agent_dir.is_dir():
             continue
@@ -250,59 +263,30 @@ def parse_leaderboard_results(
             continue
 
         # Find all result.json files in trial folders
-        for result_file in agent_dir.rglob("*/result.json"):
-            # Skip job-level result.json (direct child of job folder)
-            # We want trial-level results (one more level deep)
-            relative = result_file.relative_to(agent_dir)
-            if len(relative.parts) < 3:  # job/trial/result.json = 3 parts minimum
-                continue
-
-            try:
-                with open(result_file) as f:
-                    data = json.load(f)
-
-                # Extract task_id from folder name (format: task-name__HASH)
-                trial_folder = result_file.parent.name
-                task_id = extract_task_id(trial_folder)
-
-                # Determine pass/fail using shared logic
-                passed = get_passed(data) or False
-
-                results.append(
-                    TaskResult(
-                        task_id=task_id,
-                        passed=passed,
-                        agent_name=agent_name,
-                        model_name=model_name,
-                    )
-                )
-            except (json.JSONDecodeError, OSError) as e:
-                print(f"Warning: Could not parse {result_file}: {e}", file=sys.stderr)
+        # Skip job-level result.json (direct child of job folder)
+        # We want trial-level results (one more level deep): job/trial/result.json
+        files.extend(
+            TrialFile(result_file, agent_name, model_name)
+            for result_file in iter_result_files(agent_dir, min_depth=2)
+        )
 
-    return results
+    n_parsed = index.sync("leaderboard", files)
+    if n_parsed:
+        print(f"Indexed {n_parsed} new or updated results", file=sys.stderr)
+    return index.count("leaderboard")
 
 
-def compute_agent_stats(results: list[TaskResult]) -> dict[str, AgentStats]:
+def compute_agent_stats(index: ResultsIndex) -> dict[str, AgentStats]:
     """Compute aggregate stats for each agent."""
-    # Group by agent+model
-    by_agent: dict[str, list[TaskResult]] = defaultdict(list)
-    for r in results:
-        key = f"{r.agent_name}__{r.model_name}"
-        by_agent[key].append(r)
-
-    stats: dict[str, AgentStats] = {}
-    for key, agent_results in by_agent.items():
-        parts = key.split("__", 1)
-        agent_name = parts[0]
-        model_name = parts[1] if len(parts) > 1 else "unknown"
-        n_passed = sum(1 for r in agent_results if r.passed)
-        stats[key] = AgentStats(
+    return {
+        f"{agent_name}__{model_name}": AgentStats(
             agent_name=agent_name,
             model_name=model_name,
-            n_tasks=len(agent_results),
+            n_tasks=n_tasks,
             n_passed=n_passed,
         )
-    return stats
+        for agent_name, model_name, n_tasks, n_passed in index.agent_pass_counts()
+    }
 
 
 def get_top_agents(stats: dict[str, AgentStats], n: int = 10) -> list[str]:
@@ -316,32 +300,17 @@ def get_top_agents(stats: dict[str, AgentStats], n: int = 10) -> list[str]:
 
 
 def compute_task_failure_rates(
-    results: list[TaskResult], agents: list[str] | None = None
+    index: ResultsIndex, agents: list[str] | set[str] | None = None
 ) -> dict[str, dict[str, float]]:
     """
     Compute failure rate per task per agent.
 
     Returns: {task_id: {agent_key: fail_rate}}
     """
-    # Group by task_id and agent
-    by_task_agent: dict[str, dict[str, list[bool]]] = defaultdict(
-        lambda: defaultdict(list)
-    )
-    for r in results:
-        key = f"{r.agent_name}__{r.model_name}"
-        if agents is None or key in agents:
-            by_task_agent[r.task_id][key].append(r.passed)
-
-    # Compute failure rates
-    task_rates: dict[str, dict[str, float]] = {}
-    for task_id, agent_results in by_task_agent.items():
-        task_rates[task_id] = {}
-        for agent_key, passes in agent_results.items():
-            n_total = len(passes)
-            n_failed = sum(1 for p in passes if not p)
-            task_rates[task_id][agent_key] = n_failed / n_total if n_total > 0 else 0.0
-
-    return task_rates
+    task_rates: dict[str, dict[str, float]] = defaultdict(dict)
+    for task_id, agent_key, fail_rate in index.task_fail_rates(agents):
+        task_rates[task_id][agent_key] = fail_rate
+    return dict(task_rates)
 
 
 @dataclass
@@ -357,7 +326,7 @@ class OptimizationOpportunity:
 
 
 def find_optimization_opportunities(
-    results: list[TaskResult],
+    index: ResultsIndex,
     lattice_filter: str | None = None,
     top_n_agents: int = 10,
 ) -> list[OptimizationOpportunity]:
@@ -366,7 +335,7 @@ def find_optimization_opportunities(
 
     Returns opportunities sorted by M/O ratio (descending).
     """
-    stats = compute_agent_stats(results)
+    stats = compute_agent_stats(index)
 
     # Find Lattice agents
     lattice_agents = [k for k in stats.keys() if k.startswith("Lattice__")]
@@ -396,7 +365,7 @@ def find_optimization_opportunities(
 
     # Compute task-level failure rates
     all_relevant_agents = set(lattice_agents) | set(top_agents)
-    task_rates = compute_task_failure_rates(results, all_relevant_agents)
+    task_rates = compute_task_failure_rates(index, all_relevant_agents)
 
     # Find opportunities for each Lattice agent
     opportunities: list[OptimizationOpportunity] = []
@@ -520,22 +489,29 @@ def main() -> None:
 
     # Download/load other agents from HuggingFace leaderboard
     repo_path = download_leaderboard_data(refresh=args.refresh)
-    print("Parsing leaderboard results (excluding Lattice)...", file=sys.stderr)
-    other_results = parse_leaderboard_results(repo_path, exclude_lattice=True)
-    print(f"Found {len(other_results)} results from other agents", file=sys.stderr)
-
-    # Merge results
-    results = lattice_results + other_results
-    if not results:
-        print("No results to analyze.", file=sys.stderr)
-        sys.exit(1)
-
-    # Find opportunities
-    opportunities = find_optimization_opportunities(
-        results,
-        lattice_filter=args.lattice_model,
-        top_n_agents=args.top_agents,
-    )
+    with ResultsIndex(INDEX_PATH) as index:
+        # Merge results
+        index.replace_source(
+            "bigquery",
+            (
+                (r.agent_name, r.model_name, r.task_id, r.passed)
+                for r in lattice_results
+            ),
+        )
+        print("Parsing leaderboard results (excluding Lattice)...", file=sys.stderr)
+        n_other = parse_leaderboard_results(repo_path, index, exclude_lattice=True)
+        print(f"Found {n_other} results from other agents", file=sys.stderr)
+
+        if not index.count():
+            print("No results to analyze.", file=sys.stderr)
+            sys.exit(1)
+
+        # Find opportunities
+        opportunities = find_optimization_opportunities(
+            index,
+            lattice_filter=args.lattice_model,
+            top_n_agents=args.top_agents,
+        )
 
     if args.json:
         output = [
@@ -51,67 +51,84 @@ import sys
 from pathlib import Path
 
 try:
-    from .tbench_utils import (
-        download_run_artifacts,
-        extract_task_id,
-        get_passed,
-        list_nightly_runs,
+    from .results_index import (
+        ResultsIndex,
+        TrialFile,
+        iter_result_files,
+        trial_folder,
     )
+    from .run_artifacts import DEFAULT_CACHE_DIR, fetch_run_artifacts
+    from .tbench_utils import list_nightly_runs
 except ImportError:
-    from tbench_utils import (  # type: ignore[import-not-found,no-redef]
-        download_run_artifacts,
-        extract_task_id,
-        get_passed,
-        list_nightly_runs,
+    from results_index import (  # type: ignore[import-not-found,no-redef]
+        ResultsIndex,
+        TrialFile,
+        iter_result_files,
+        trial_folder,
     )
+    from run_artifacts import (  # type: ignore[import-not-found,no-redef]
+        DEFAULT_CACHE_DIR,
+        fetch_run_artifacts,
+    )
+    from tbench_utils import list_nightly_runs  # type: ignore[import-not-found,no-redef]
 
-CACHE_DIR = Path(__file__).parent / ".run_logs"
+CACHE_DIR = DEFAULT_CACHE_DIR
+# Name of the index of parsed results, in the output directory
+INDEX_NAME = "results_index.db"
 
 
-def find_trial_results(run_dir: Path) -> list[dict]:
+def find_trial_results(run_dir: Path, index: ResultsIndex) -> list[dict]:
     """Find all trial results in a downloaded run directory.
 
     Derives task/trial identifiers from folder structure (like analyze_failure_rates.py)
     rather than requiring them in the JSON, since some results omit these fields.
+
+    Results are parsed once and kept in the index; only new or modified
+    result.json files are read on later calls.
     """
     import re
 
     # Job-level folders use timestamp format: YYYY-MM-DD__HH-MM-SS
     timestamp_pattern = re.compile(r"^\d{4}-\d{2}-\d{2}__\d{2}-\d{2}-\d{2}$")
 
-    results = []
-    for result_file in run_dir.rglob("result.json"):
+    files = []
+    for result_file in iter_result_files(run_dir):
+        parent_name = trial_folder(result_file)
         # Skip job-level result.json files (in jobs/<timestamp>/ directly)
-        if timestamp_pattern.match(result_file.parent.name):
+        if timestamp_pattern.match(parent_name):
             continue
         # Skip if parent is 'logs' or 'output'
-        if result_file.parent.name in ("logs", "output", "verifier", "agent"):
+        if parent_name in ("logs", "output", "verifier", "agent"):
             continue
+        files.append(TrialFile(result_file))
 
-        try:
-            data = json.loads(result_file.read_text())
+    source = str(run_dir.resolve())
+    index.sync(source, files)
 
+    results = [
+        {
+            "path": trial.path,
             # Derive task_name from folder structure (format: task-name__HASH)
             # Fall back to JSON field if present
-            trial_folder = result_file.parent.name
-            task_name = data.get("task_name") or extract_task_id(trial_folder)
-            trial_name = data.get("trial_name") or trial_folder
-
-            results.append(
-                {
-                    "path": result_file,
-                    "task_name": task_name,
-                    "trial_name": trial_name,
-                    "passed": get_passed(data),
-                    "data": data,
-                }
-            )
-        except (json.JSONDecodeError, OSError):
-            continue
-
+            "task_name": trial.task_name or trial.task_id,
+            "trial_name": trial.trial_name or trial.path.parent.name,
+            "passed": trial.passed,
+        }
+        for trial in index.trials(source)
+        if trial.path is not None
+    ]
     return sorted(results, key=lambda x: x["task_name"])
 
 
+def load_trial_data(trial: dict) -> dict:
+    """Load the full result.json of a trial."""
+    try:
+        data = json.loads(trial["path"].read_text())
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
 def print_trial_summary(trial: dict, verbose: bool = False) -> None:
     """Print a summary of a trial result."""
     status = (
@@ -144,7 +161,7 @@ def print_trial_summary(trial: dict, verbose: bool = False) -> None:
                                 print(f"           {line[:100]}")
 
         # Check for exception info
-        data = trial["data"]
+        data = load_trial_data(trial)
         if data.get("exception_info"):
             print(f"         exception: {data['exception_info']}")
 
@@ -187,6 +204,12 @@ def main():
         default=CACHE_DIR,
         help=f"Output directory (default: {CACHE_DIR})",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Artifacts to download and extract concurrently (default: 4)",
+    )
     args = parser.parse_args()
 
     # List runs mode
@@ -220,16 +243,18 @@ def main():
 
     # Download if needed - include smoke test artifacts for log inspection
     run_dir = args.output_dir / str(run_id)
-    if not run_dir.exists():
-        if not download_run_artifacts(
-            run_id, run_dir, include_smoke_test=True, verbose=True
-        ):
-            return 1
-    else:
-        print(f"Using cached run data from {run_dir}")
+    report = fetch_run_artifacts(
+        [run_id],
+        args.output_dir,
+        include_smoke_test=True,
+        max_workers=args.max_workers,
+    )
+    if not report.artifacts:
+        return 1
 
     # Find and filter results
-    results = find_trial_results(run_dir)
+    with ResultsIndex(args.output_dir / INDEX_NAME) as index:
+        results = find_trial_results(run_dir, index)
 
     if args.task:
         results = [r for r in results if args.task.lower() in r["task_name"].lower()]
@@ -51,25 +51,31 @@ import json
 import shutil
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 try:
-    from .tbench_utils import (
-        download_run_artifacts,
-        list_artifacts_for_run,
-        list_nightly_runs,
+    from .run_artifacts import (
+        DEFAULT_CACHE_DIR,
+        DEFAULT_MAX_WORKERS,
+        fetch_run_artifacts,
     )
+    from .tbench_utils import list_nightly_runs
 except ImportError:
-    from tbench_utils import (  # type: ignore[import-not-found,no-redef]
-        download_run_artifacts,
-        list_artifacts_for_run,
-        list_nightly_runs,
+    from run_artifacts import (  # type: ignore[import-not-found,no-redef]
+        DEFAULT_CACHE_DIR,
+        DEFAULT_MAX_WORKERS,
+        fetch_run_artifacts,
     )
+    from tbench_utils import list_nightly_runs  # type: ignore[import-not-found,no-redef]
 
 # HuggingFace leaderboard repo
 LEADERBOARD_REPO = "alexgshaw/terminal-bench-2-leaderboard"
 
+# Trial folders copied into the submission at once
+COPY_WORKERS = 8
+
 
 # Agent metadata for Lattice
 LATTICE_METADATA = {
@@ -223,6 +229,21 @@ def find_job_folders(artifacts_dir: Path) -> list[Path]:
     return job_folders
 
 
+def _copy_trial(trial_src: Path, dest_trial_dir: Path) -> None:
+    """Copy a trial folder into a submission, leaving out unneeded files."""
+    if dest_trial_dir.exists():
+        shutil.rmtree(dest_trial_dir)
+    shutil.copytree(
+        trial_src,
+        dest_trial_dir,
+        ignore=shutil.ignore_patterns(
+            "lattice-app.tar.gz",  # Large agent binary (~5MB each)
+            "lattice-tokens.json",  # Token usage (not needed for leaderboard)
+            "*.log",  # Log files trigger HF LFS and cause upload timeouts
+        ),
+    )
+
+
 def prepare_submission(
     artifacts_dir: Path,
     output_dir: Path,
@@ -314,7 +335,7 @@ def prepare_submission(
             trials_by_job[job_name].append(trial_src)
 
         # Copy trials into job folders
-        total_trials = 0
+        copies: list[tuple[Path, Path]] = []
         for job_name, trial_paths in trials_by_job.items():
             dest_job_folder = submission_dir / job_name
             dest_job_folder.mkdir(parents=True, exist_ok=True)
@@ -328,64 +349,48 @@ def prepare_submission(
                         shutil.copy2(source_file, dest_job_folder / filename)
 
             for trial_src in trial_paths:
-                dest_trial_dir = dest_job_folder / trial_src.name
-                if dest_trial_dir.exists():
-                    shutil.rmtree(dest_trial_dir)
-                shutil.copytree(
-                    trial_src,
-                    dest_trial_dir,
-                    ignore=shutil.ignore_patterns(
-                        "lattice-app.tar.gz",  # Large agent binary (~5MB each)
-                        "lattice-tokens.json",  # Token usage (not needed for leaderboard)
-                        "*.log",  # Log files trigger HF LFS and cause upload timeouts
-                    ),
-                )
-                total_trials += 1
-
-        print(f"  {model}: copied {total_trials} trial(s)")
+                copies.append((trial_src, dest_job_folder / trial_src.name))
+
+        # Copying is I/O bound: trials are copied concurrently
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            list(executor.map(lambda c: _copy_trial(*c), copies))
+
+        print(f"  {model}: copied {len(copies)} trial(s)")
         submissions[model] = submission_dir
 
     return submissions
 
 
-def download_run_to_dir(
-    run_id: int,
+def download_runs(
+    run_ids: list[int],
     models_filter: list[str] | None,
-    verbose: bool = True,
-) -> tuple[Path, str]:
-    """Download artifacts for a single GH Actions run.
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> list[Path]:
+    """Download the artifacts of GH Actions runs, concurrently, into the cache.
 
-    Returns (artifacts_dir, run_date).
-    """
-    run_info = {"databaseId": run_id, "createdAt": datetime.now().isoformat()}
-
-    run_date = run_info["createdAt"][:10]
-    print(f"Using run {run_id} from {run_date}")
+    Runs already in the cache are not downloaded again.
 
-    artifacts = list_artifacts_for_run(run_id, verbose=verbose)
-    if not artifacts:
-        print(f"No terminal-bench artifacts found for run {run_id}")
-        sys.exit(1)
+    Returns the directories of the extracted artifacts, one per run and model.
+    """
 
-    print(f"Found {len(artifacts)} artifact(s)")
+    def matches_models(artifact: dict) -> bool:
+        return not models_filter or any(
+            m.replace("/", "-") in artifact["name"] for m in models_filter
+        )
 
-    if models_filter:
-        artifacts = [
-            a
-            for a in artifacts
-            if any(m.replace("/", "-") in a["name"] for m in models_filter)
-        ]
-        print(f"Filtered to {len(artifacts)} artifact(s) for specified models")
-
-    artifacts_dir = Path(tempfile.mkdtemp(prefix="tbench-"))
-    artifact_names = [a["name"] for a in artifacts]
-    if not download_run_artifacts(
-        run_id, artifacts_dir, artifact_names, verbose=verbose
-    ):
-        print(f"Failed to download artifacts for run {run_id}")
+    print(f"Fetching {len(run_ids)} run(s): {', '.join(map(str, run_ids))}")
+    report = fetch_run_artifacts(
+        run_ids,
+        cache_dir,
+        artifact_filter=matches_models,
+        max_workers=max_workers,
+    )
+    if not report.ok:
+        print("Failed to download artifacts")
         sys.exit(1)
 
-    return artifacts_dir, run_date
+    return report.paths()
 
 
 def main():
@@ -421,6 +426,19 @@ def main():
         nargs="+",
         help="Only process specific models (e.g., anthropic/claude-opus-4-5)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Cache of downloaded runs, by run ID (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="Artifacts to download and extract concurrently "
+        f"(default: {DEFAULT_MAX_WORKERS})",
+    )
     args = parser.parse_args()
 
     # Collect all artifact directories to merge into one submission.
@@ -430,6 +448,8 @@ def main():
     artifacts_dirs: list[Path] = []
     run_date = datetime.now().strftime("%Y-%m-%d")
     temp_dirs: list[Path] = []
+    # Runs to download, all at once
+    run_ids: list[int] = []
 
     if args.artifacts_dir:
         for d in args.artifacts_dir:
@@ -439,11 +459,7 @@ def main():
             artifacts_dirs.append(d)
 
     if args.run_id:
-        for rid in args.run_id:
-            ad, rd = download_run_to_dir(rid, args.models)
-            artifacts_dirs.append(ad)
-            temp_dirs.append(ad)
-            run_date = rd
+        run_ids.extend(args.run_id)
 
     if args.n_runs is not None:
         # Auto-discover latest N successful nightly runs
@@ -459,22 +475,21 @@ def main():
             print("No successful nightly runs found")
             sys.exit(1)
         run_date = runs[0]["createdAt"][:10]
-        for run_info in runs:
-            rid = run_info["databaseId"]
-            ad, _ = download_run_to_dir(rid, args.models)
-            artifacts_dirs.append(ad)
-            temp_dirs.append(ad)
+        run_ids.extend(run_info["databaseId"] for run_info in runs)
 
     # Default: latest single nightly run
-    if not artifacts_dirs:
+    if not artifacts_dirs and not run_ids:
         run_info = get_latest_successful_nightly_run()
         if not run_info:
             print("Could not find a successful nightly run")
             sys.exit(1)
-        rid = run_info["databaseId"]
-        ad, run_date = download_run_to_dir(rid, args.models)
-        artifacts_dirs.append(ad)
-        temp_dirs.append(ad)
+        run_ids.append(run_info["databaseId"])
+        run_date = run_info["createdAt"][:10]
+
+    if run_ids:
+        artifacts_dirs.extend(
+            download_runs(run_ids, args.models, args.cache_dir, args.max_workers)
+        )
 
     # Merge all artifact sources into a combined staging directory.  Each
     # source may have its own jobs/ subdirectory tree — we link them all under
@@ -520,6 +535,9 @@ def main():
     print("    --repo-type dataset --create-pr \\")
     print(f'    --commit-message "Lattice submission ({run_date})"')
 
+    if run_ids:
+        print(f"\nNote: Downloaded runs are cached in {args.cache_dir}")
+
     # Clean up temp directories if we created any
     if temp_dirs:
         print(f"\nNote: Temp artifacts in {len(temp_dirs)} director(ies):")
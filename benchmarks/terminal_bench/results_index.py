@@ -0,0 +1,348 @@
+"""
+Local index of Terminal-Bench trial results.
+
+Leaderboard checkouts and downloaded runs hold one result.json per trial, and
+reading tens of thousands of them on every analysis is slow. The index keeps
+the outcome of each trial in SQLite, keyed by the path of its result.json, with
+the file's mtime and size. Syncing a directory only parses the files that are
+new or changed since the last run, in parallel, and drops the ones that are gone.
+
+Aggregates (pass counts per agent, failure rates per task) are computed with
+SQL GROUP BY queries instead of Python loops.
+
+Used by:
+- analyze_failure_rates.py
+- download_run_logs.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    from .tbench_utils import extract_task_id, get_passed
+except ImportError:
+    from tbench_utils import extract_task_id, get_passed  # type: ignore[import-not-found,no-redef]
+
+# Bump when the schema or the parsing of result.json changes, to rebuild the index
+INDEX_VERSION = 1
+
+# Below this many files, parsing in worker processes costs more than it saves
+PARALLEL_THRESHOLD = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trials (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    path TEXT UNIQUE,
+    mtime_ns INTEGER,
+    size INTEGER,
+    agent_name TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    task_name TEXT,
+    trial_name TEXT,
+    passed INTEGER
+);
+CREATE INDEX IF NOT EXISTS trials_source ON trials (source);
+CREATE INDEX IF NOT EXISTS trials_agent ON trials (agent_name, model_name, task_id);
+"""
+
+
+@dataclass(frozen=True)
+class TrialFile:
+    """A trial's result.json, and the agent it belongs to."""
+
+    path: str
+    agent_name: str = "unknown"
+    model_name: str = "unknown"
+
+
+@dataclass
+class IndexedTrial:
+    """A trial as stored in the index."""
+
+    path: Path | None
+    agent_name: str
+    model_name: str
+    task_id: str
+    task_name: str | None
+    trial_name: str | None
+    passed: bool | None
+
+
+def iter_result_files(root: Path | str, min_depth: int = 0) -> Iterator[str]:
+    """Yield the path of every result.json below a directory.
+
+    Paths are plain strings: building a Path per file costs more than
+    everything else a sync does on an unchanged tree.
+
+    Args:
+        root: Directory to search
+        min_depth: Skip files fewer than this many directories below root
+    """
+    root = os.path.normpath(os.fspath(root))
+    for dirpath, _dirnames, filenames in os.walk(root):
+        if "result.json" not in filenames:
+            continue
+        if min_depth and dirpath[len(root) :].count(os.sep) < min_depth:
+            continue
+        yield os.path.join(dirpath, "result.json")
+
+
+def trial_folder(path: str) -> str:
+    """Return the name of the folder a result.json is in."""
+    return os.path.basename(os.path.dirname(path))
+
+
+def read_result(path: str) -> tuple[str | None, str | None, bool | None] | str:
+    """Parse a result.json.
+
+    Runs in worker processes, so it only takes and returns picklable values.
+
+    Returns:
+        (task_name, trial_name, passed) from the JSON, or an error message
+    """
+    try:
+        with open(path, "rb") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+        return str(e)
+    if not isinstance(data, dict):
+        return "not a JSON object"
+    return data.get("task_name"), data.get("trial_name"), get_passed(data)
+
+
+class ResultsIndex:
+    """Trial results stored in SQLite, grouped by source.
+
+    A source is a set of trials synced together, e.g. a leaderboard checkout
+    or a downloaded run. Use ":memory:" as the path for a throwaway index.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = path
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS trials")
+            self.conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> ResultsIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def sync(
+        self,
+        source: str,
+        files: Iterable[TrialFile],
+        max_workers: int | None = None,
+    ) -> int:
+        """Bring the trials of a source in line with its result.json files.
+
+        Files whose mtime and size are unchanged are not read again. Files that
+        cannot be parsed are reported and left out, and retried on the next sync.
+
+        Args:
+            source: Name of the set of trials, e.g. the directory they are in
+            files: Every result.json of the source
+            max_workers: Worker processes for parsing (default: CPU count)
+
+        Returns:
+            Number of files parsed
+        """
+        known = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self.conn.execute(
+                "SELECT path, mtime_ns, size FROM trials WHERE source = ?", (source,)
+            )
+        }
+        pending: list[tuple[TrialFile, os.stat_result]] = []
+        seen: set[str] = set()
+        for file in files:
+            try:
+                stat = os.stat(file.path)
+            except OSError:
+                continue
+            seen.add(file.path)
+            if known.get(file.path) != (stat.st_mtime_ns, stat.st_size):
+                pending.append((file, stat))
+
+        removed = [(path,) for path in known if path not in seen]
+        if not pending and not removed:
+            return 0
+
+        paths = [file.path for file, _ in pending]
+        if len(paths) >= PARALLEL_THRESHOLD and max_workers != 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            workers = max_workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(
+                    executor.map(
+                        read_result,
+                        paths,
+                        chunksize=max(1, len(paths) // (workers * 8)),
+                    )
+                )
+        else:
+            parsed = [read_result(path) for path in paths]
+
+        rows = []
+        for (file, stat), result in zip(pending, parsed):
+            if isinstance(result, str):
+                print(
+                    f"Warning: Could not parse {file.path}: {result}", file=sys.stderr
+                )
+                removed.append((file.path,))
+                continue
+            task_name, trial_name, passed = result
+            rows.append(
+                (
+                    source,
+                    file.path,
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    file.agent_name,
+                    file.model_name,
+                    extract_task_id(trial_folder(file.path)),
+                    task_name,
+                    trial_name,
+                    passed,
+                )
+            )
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.executemany("DELETE FROM trials WHERE path = ?", removed)
+            self.conn.executemany(
+                "INSERT INTO trials (source, path, mtime_ns, size, agent_name,"
+                " model_name, task_id, task_name, trial_name, passed)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (path) DO UPDATE SET source = excluded.source,"
+                " mtime_ns = excluded.mtime_ns, size = excluded.size,"
+                " agent_name = excluded.agent_name, model_name = excluded.model_name,"
+                " task_id = excluded.task_id, task_name = excluded.task_name,"
+                " trial_name = excluded.trial_name, passed = excluded.passed",
+                rows,
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        return len(paths)
+
+    def replace_source(
+        self,
+        source: str,
+        trials: Iterable[tuple[str, str, str, bool | None]],
+    ) -> None:
+        """Replace the trials of a source with results not backed by files.
+
+        Args:
+            source: Name of the set of trials, e.g. "bigquery"
+            trials: (agent_name, model_name, task_id, passed) tuples
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute("DELETE FROM trials WHERE source = ?", (source,))
+            self.conn.executemany(
+                "INSERT INTO trials (source, agent_name, model_name, task_id, passed)"
+                " VALUES (?, ?, ?, ?, ?)",
+                ((source, *trial) for trial in trials),
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def trials(self, source: str | None = None) -> list[IndexedTrial]:
+        """Return the stored trials, of one source or of all."""
+        query = (
+            "SELECT path, agent_name, model_name, task_id, task_name, trial_name,"
+            " passed FROM trials"
+        )
+        params: tuple = ()
+        if source is not None:
+            query += " WHERE source = ?"
+            params = (source,)
+        return [
+            IndexedTrial(
+                path=Path(path) if path is not None else None,
+                agent_name=agent_name,
+                model_name=model_name,
+                task_id=task_id,
+                task_name=task_name,
+                trial_name=trial_name,
+                passed=None if passed is None else bool(passed),
+            )
+            for (
+                path,
+                agent_name,
+                model_name,
+                task_id,
+                task_name,
+                trial_name,
+                passed,
+            ) in self.conn.execute(query, params)
+        ]
+
+    def count(self, source: str | None = None) -> int:
+        """Return the number of stored trials, of one source or of all."""
+        if source is None:
+            return self.conn.execute("SELECT COUNT(*) FROM trials").fetchone()[0]
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM trials WHERE source = ?", (source,)
+        ).fetchone()[0]
+
+    def agent_pass_counts(self) -> list[tuple[str, str, int, int]]:
+        """Count trials and passes per agent and model.
+
+        Trials whose outcome is unknown count as failed.
+
+        Returns:
+            (agent_name, model_name, n_tasks, n_passed) tuples
+        """
+        return self.conn.execute(
+            "SELECT agent_name, model_name, COUNT(*), SUM(COALESCE(passed, 0))"
+            " FROM trials GROUP BY agent_name, model_name"
+        ).fetchall()
+
+    def task_fail_rates(
+        self, agents: Iterable[str] | None = None
+    ) -> list[tuple[str, str, float]]:
+        """Compute the failure rate of each agent on each task.
+
+        Args:
+            agents: Agent keys ("<agent>__<model>") to include, or None for all
+
+        Returns:
+            (task_id, agent_key, fail_rate) tuples
+        """
+        query = (
+            "SELECT task_id, agent_name || '__' || model_name AS agent_key,"
+            " AVG(1 - COALESCE(passed, 0)) FROM trials"
+        )
+        params: list[str] = []
+        if agents is not None:
+            params = list(agents)
+            placeholders = ", ".join("?" for _ in params)
+            query += f" WHERE agent_name || '__' || model_name IN ({placeholders})"
+        query += " GROUP BY task_id, agent_name, model_name"
+        return self.conn.execute(query, params).fetchall()
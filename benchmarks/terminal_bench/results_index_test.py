@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from . import results_index
+from .analyze_failure_rates import (
+    compute_agent_stats,
+    compute_task_failure_rates,
+    parse_leaderboard_results,
+)
+from .download_run_logs import find_trial_results
+from .results_index import ResultsIndex
+
+
+def _write_result(path: Path, data: dict) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    result = path / "result.json"
+    result.write_text(json.dumps(data))
+    return result
+
+
+@pytest.fixture
+def leaderboard(tmp_path: Path) -> Path:
+    submissions = tmp_path / "repo" / "submissions" / "terminal-bench" / "2.0"
+    alpha = submissions / "Alpha__model-a" / "2025-01-01__00-00-00"
+    _write_result(alpha, {"n_trials": 3})  # job-level result, not a trial
+    _write_result(alpha / "chess__A1", {"passed": True})
+    _write_result(alpha / "chess__A2", {"score": 0})
+    _write_result(
+        alpha / "regex__A3", {"verifier_result": {"rewards": {"reward": 1.0}}}
+    )
+    beta = submissions / "Beta__model-b" / "2025-01-01__00-00-00"
+    _write_result(beta / "chess__B1", {"passed": False})
+    lattice = submissions / "Lattice__model-c" / "2025-01-01__00-00-00"
+    _write_result(lattice / "chess__C1", {"passed": True})
+    return tmp_path / "repo"
+
+
+def test_leaderboard_index_is_incremental(
+    leaderboard: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    parsed: list[str] = []
+    read_result = results_index.read_result
+
+    def spy(path: str):
+        parsed.append(path)
+        return read_result(path)
+
+    monkeypatch.setattr(results_index, "read_result", spy)
+
+    with ResultsIndex(tmp_path / "index.db") as index:
+        assert parse_leaderboard_results(leaderboard, index) == 4
+    assert len(parsed) == 4
+
+    # Reopened, nothing changed: nothing is parsed again
+    with ResultsIndex(tmp_path / "index.db") as index:
+        assert parse_leaderboard_results(leaderboard, index) == 4
+        assert len(parsed) == 4
+
+        stats = compute_agent_stats(index)
+        assert set(stats) == {"Alpha__model-a", "Beta__model-b"}
+        alpha = stats["Alpha__model-a"]
+        assert (alpha.n_tasks, alpha.n_passed) == (3, 2)
+
+        rates = compute_task_failure_rates(index)
+        assert rates["chess"] == {"Alpha__model-a": 0.5, "Beta__model-b": 1.0}
+        assert rates["regex"] == {"Alpha__model-a": 0.0}
+        assert compute_task_failure_rates(index, {"Beta__model-b"}) == {
+            "chess": {"Beta__model-b": 1.0}
+        }
+
+
+def test_sync_reparses_changed_and_drops_removed(
+    leaderboard: Path, tmp_path: Path
+) -> None:
+    submissions = leaderboard / "submissions" / "terminal-bench" / "2.0"
+    job = "2025-01-01__00-00-00"
+    with ResultsIndex(tmp_path / "index.db") as index:
+        parse_leaderboard_results(leaderboard, index)
+
+        changed = submissions / "Beta__model-b" / job / "chess__B1"
+        result = _write_result(changed, {"passed": True, "extra": "field"})
+        os.utime(result, ns=(0, 0))
+        (submissions / "Alpha__model-a" / job / "regex__A3" / "result.json").unlink()
+
+        assert parse_leaderboard_results(leaderboard, index) == 3
+        assert compute_agent_stats(index)["Beta__model-b"].n_passed == 1
+        assert "regex" not in compute_task_failure_rates(index)
+
+
+def test_sync_in_worker_processes(
+    leaderboard: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(results_index, "PARALLEL_THRESHOLD", 1)
+    with ResultsIndex(tmp_path / "index.db") as index:
+        assert parse_leaderboard_results(leaderboard, index) == 4
+        assert compute_agent_stats(index)["Alpha__model-a"].n_passed == 2
+
+
+def test_unparseable_results_are_skipped(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run" / "jobs" / "2025-01-01__00-00-00"
+    _write_result(
+        run_dir / "chess__X1", {"passed": False, "task_name": "chess-best-move"}
+    )
+    broken = _write_result(run_dir / "regex__X2", {})
+    broken.write_text("{not json")
+
+    with ResultsIndex(":memory:") as index:
+        results = find_trial_results(tmp_path / "run", index)
+
+    assert [(r["task_name"], r["trial_name"], r["passed"]) for r in results] == [
+        ("chess-best-move", "chess__X1", False)
+    ]
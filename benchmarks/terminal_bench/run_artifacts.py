@@ -0,0 +1,329 @@
+"""
+Concurrent download of Terminal-Bench run artifacts, with a local cache.
+
+Artifacts of GitHub Actions runs are zip files. A bounded pool of workers,
+shared by every run being fetched, streams each artifact to a temporary file
+and extracts it as soon as it is complete, so the download of one artifact
+overlaps with the extraction of others.
+
+The cache is keyed by run ID:
+    <cache-dir>/<run-id>/
+        .artifacts.json         # Artifacts of the run, as listed on GitHub
+        <artifact-name>/        # Extracted artifact
+            jobs/...
+
+An artifact is only moved into place once fully extracted, so an interrupted
+download is retried on the next call, and a completed artifact is never
+fetched again. Once every artifact of a run is cached, the run is not even
+listed again.
+
+Used by:
+- download_run_logs.py
+- prepare_leaderboard_submission.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Protocol
+
+try:
+    from .tbench_utils import (
+        GITHUB_REPO,
+        is_smoke_test_artifact,
+        list_artifacts_for_run,
+    )
+except ImportError:
+    from tbench_utils import (  # type: ignore[import-not-found,no-redef]
+        GITHUB_REPO,
+        is_smoke_test_artifact,
+        list_artifacts_for_run,
+    )
+
+# Shared with download_run_logs.py, so runs downloaded by one script are reused
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".run_logs"
+
+# Concurrent downloads; GitHub throttles artifact downloads beyond a few streams
+DEFAULT_MAX_WORKERS = 4
+
+CHUNK_SIZE = 1 << 20
+
+MANIFEST_NAME = ".artifacts.json"
+
+
+class ArtifactSource(Protocol):
+    """Where the artifacts of a run come from."""
+
+    def list_artifacts(self, run_id: int) -> list[dict]:
+        """Return the artifacts of a run, as {"name", "id", "size_in_bytes"} dicts."""
+        ...
+
+    def download(self, artifact: dict, dest: IO[bytes]) -> None:
+        """Write the zip archive of an artifact to a file, raising on failure."""
+        ...
+
+
+class GitHubArtifactSource:
+    """Artifacts of GitHub Actions runs, fetched with the gh CLI."""
+
+    def __init__(self, repo: str = GITHUB_REPO, verbose: bool = False):
+        self.repo = repo
+        self.verbose = verbose
+
+    def list_artifacts(self, run_id: int) -> list[dict]:
+        return list_artifacts_for_run(
+            run_id, include_smoke_test=True, verbose=self.verbose
+        )
+
+    def download(self, artifact: dict, dest: IO[bytes]) -> None:
+        url = f"repos/{self.repo}/actions/artifacts/{artifact['id']}/zip"
+        cmd = ["gh", "api", url]
+        if self.verbose:
+            print(f"  Running: {' '.join(cmd)}")
+        # stderr goes to a file: a full pipe would block gh while we read stdout
+        with tempfile.TemporaryFile() as stderr:
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr) as proc:
+                assert proc.stdout is not None
+                shutil.copyfileobj(proc.stdout, dest, CHUNK_SIZE)
+            if proc.returncode != 0:
+                stderr.seek(0)
+                raise RuntimeError(stderr.read().decode(errors="replace").strip())
+
+
+@dataclass
+class ArtifactResult:
+    """An artifact of a run, extracted in the cache."""
+
+    run_id: int
+    name: str
+    path: Path
+    cached: bool
+    size: int = 0  # Bytes downloaded
+    seconds: float = 0.0
+
+
+@dataclass
+class FetchReport:
+    """Outcome of fetching the artifacts of one or more runs."""
+
+    artifacts: list[ArtifactResult] = field(default_factory=list)
+    # (run_id, artifact name or "" for the run itself, error)
+    failed: list[tuple[int, str, str]] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    @property
+    def downloaded_bytes(self) -> int:
+        return sum(a.size for a in self.artifacts)
+
+    def paths(self, run_id: int | None = None) -> list[Path]:
+        """Return the directories of the extracted artifacts, of one run or all."""
+        return [
+            a.path for a in self.artifacts if run_id is None or a.run_id == run_id
+        ]
+
+
+def _format_size(n_bytes: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if n_bytes < 1024:
+            return f"{n_bytes:.1f} {unit}"
+        n_bytes /= 1024
+    return f"{n_bytes:.1f} GB"
+
+
+def _read_manifest(run_dir: Path) -> list[dict] | None:
+    try:
+        artifacts = json.loads((run_dir / MANIFEST_NAME).read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return artifacts if isinstance(artifacts, list) else None
+
+
+def _write_manifest(run_dir: Path, artifacts: list[dict]) -> None:
+    run_dir.mkdir(parents=True, exist_ok=True)
+    temp = run_dir / f"{MANIFEST_NAME}.{os.getpid()}.{threading.get_ident()}"
+    temp.write_text(json.dumps(artifacts, indent=2))
+    os.replace(temp, run_dir / MANIFEST_NAME)
+
+
+def _list_run(
+    source: ArtifactSource,
+    run_id: int,
+    run_dir: Path,
+    wanted: Callable[[dict], bool],
+) -> list[dict]:
+    """Return the artifacts to fetch for a run, listing it only if needed."""
+    manifest = _read_manifest(run_dir)
+    if manifest is not None:
+        artifacts = [a for a in manifest if wanted(a)]
+        if all((run_dir / a["name"]).is_dir() for a in artifacts):
+            return artifacts
+
+    artifacts = source.list_artifacts(run_id)
+    if artifacts:
+        _write_manifest(run_dir, artifacts)
+    return [a for a in artifacts if wanted(a)]
+
+
+def _fetch_artifact(
+    source: ArtifactSource, run_id: int, run_dir: Path, artifact: dict
+) -> ArtifactResult:
+    """Download an artifact and extract it into the cache."""
+    start = time.monotonic()
+    dest = run_dir / artifact["name"]
+    run_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=run_dir, prefix=".partial-") as staging:
+        archive_path = Path(staging) / "artifact.zip"
+        with open(archive_path, "wb") as archive:
+            source.download(artifact, archive)
+        size = archive_path.stat().st_size
+
+        extracted = Path(staging) / "extracted"
+        with zipfile.ZipFile(archive_path) as archive:
+            archive.extractall(extracted)
+        archive_path.unlink()
+
+        try:
+            os.replace(extracted, dest)
+        except OSError:
+            # Extracted concurrently by another process
+            if not dest.is_dir():
+                raise
+
+    return ArtifactResult(
+        run_id=run_id,
+        name=artifact["name"],
+        path=dest,
+        cached=False,
+        size=size,
+        seconds=time.monotonic() - start,
+    )
+
+
+def fetch_run_artifacts(
+    run_ids: Iterable[int],
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+    source: ArtifactSource | None = None,
+    artifact_filter: Callable[[dict], bool] | None = None,
+    include_smoke_test: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    verbose: bool = True,
+) -> FetchReport:
+    """Fetch the artifacts of runs into the cache, concurrently.
+
+    Args:
+        run_ids: GitHub Actions run IDs
+        cache_dir: Root of the cache, with one directory per run
+        source: Where artifacts come from (default: GitHub, through gh)
+        artifact_filter: Only fetch the artifacts for which it returns True
+        include_smoke_test: If True, include the smoke test artifact
+        max_workers: Number of artifacts downloaded and extracted at once
+        verbose: If True, print progress and timings
+
+    Returns:
+        The extracted artifacts, sorted by run then name, and the failures
+    """
+    source = source or GitHubArtifactSource()
+    run_ids = list(dict.fromkeys(run_ids))
+
+    def wanted(artifact: dict) -> bool:
+        if not include_smoke_test and is_smoke_test_artifact(artifact["name"]):
+            return False
+        return artifact_filter is None or artifact_filter(artifact)
+
+    report = FetchReport()
+    start = time.monotonic()
+    lock = threading.Lock()
+
+    def log(message: str) -> None:
+        if verbose:
+            with lock:
+                print(message, flush=True)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        listings = {
+            executor.submit(
+                _list_run, source, run_id, cache_dir / str(run_id), wanted
+            ): run_id
+            for run_id in run_ids
+        }
+
+        pending: dict = {}
+        for future in as_completed(listings):
+            run_id = listings[future]
+            run_dir = cache_dir / str(run_id)
+            try:
+                artifacts = future.result()
+            except Exception as e:  # noqa: BLE001
+                report.failed.append((run_id, "", str(e)))
+                continue
+            if not artifacts:
+                report.failed.append((run_id, "", "no matching artifacts"))
+                continue
+
+            for artifact in artifacts:
+                dest = run_dir / artifact["name"]
+                if dest.is_dir():
+                    report.artifacts.append(
+                        ArtifactResult(run_id, artifact["name"], dest, cached=True)
+                    )
+                    continue
+                future = executor.submit(
+                    _fetch_artifact, source, run_id, run_dir, artifact
+                )
+                pending[future] = (run_id, artifact)
+
+        n_cached = len(report.artifacts)
+        if n_cached:
+            log(f"{n_cached} artifact(s) already cached in {cache_dir}")
+        if pending:
+            total = sum(a.get("size_in_bytes", 0) for _, a in pending.values())
+            log(
+                f"Downloading {len(pending)} artifact(s) ({_format_size(total)})"
+                f" with {max_workers} worker(s)..."
+            )
+
+        for done, future in enumerate(as_completed(pending), start=1):
+            run_id, artifact = pending[future]
+            try:
+                result = future.result()
+            except Exception as e:  # noqa: BLE001
+                report.failed.append((run_id, artifact["name"], str(e)))
+                log(f"  [{done}/{len(pending)}] {run_id}/{artifact['name']}: {e}")
+                continue
+            report.artifacts.append(result)
+            rate = result.size / result.seconds if result.seconds else 0.0
+            log(
+                f"  [{done}/{len(pending)}] {run_id}/{result.name}:"
+                f" {_format_size(result.size)} in {result.seconds:.1f}s"
+                f" ({_format_size(rate)}/s)"
+            )
+
+    order = {run_id: i for i, run_id in enumerate(run_ids)}
+    report.artifacts.sort(key=lambda a: (order[a.run_id], a.name))
+    report.seconds = time.monotonic() - start
+
+    if pending:
+        log(
+            f"Fetched {len(report.artifacts) - n_cached} artifact(s),"
+            f" {_format_size(report.downloaded_bytes)}, in {report.seconds:.1f}s"
+        )
+    for run_id, name, error in report.failed:
+        what = f"artifact {name} of run {run_id}" if name else f"run {run_id}"
+        print(f"Error fetching {what}: {error}", file=sys.stderr)
+    return report
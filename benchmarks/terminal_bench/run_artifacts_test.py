@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import IO
+
+import pytest
+
+from .prepare_leaderboard_submission import prepare_submission
+from .run_artifacts import fetch_run_artifacts
+
+
+def _artifact_zip(model: str, job: str = "2026-02-01__00-15-05") -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(f"jobs/{job}/config.json", "{}")
+        for trial in ("chess-best-move__ABC123", "regex-log__DEF456"):
+            archive.writestr(
+                f"jobs/{job}/{trial}/config.json",
+                json.dumps({"agent": {"model_name": model}}),
+            )
+            archive.writestr(f"jobs/{job}/{trial}/result.json", '{"passed": true}')
+            archive.writestr(f"jobs/{job}/{trial}/agent/trial.log", "log")
+    return buffer.getvalue()
+
+
+class FakeArtifactSource:
+    """Serves zip archives from memory, recording calls and concurrency."""
+
+    def __init__(self, runs: dict[int, dict[str, bytes]], delay: float = 0.0):
+        self.runs = runs
+        self.delay = delay
+        self.listed: list[int] = []
+        self.downloaded: list[str] = []
+        self.failing: set[str] = set()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def list_artifacts(self, run_id: int) -> list[dict]:
+        self.listed.append(run_id)
+        return [
+            {"name": name, "id": f"{run_id}-{name}", "size_in_bytes": len(data)}
+            for name, data in self.runs.get(run_id, {}).items()
+        ]
+
+    def download(self, artifact: dict, dest: IO[bytes]) -> None:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if artifact["name"] in self.failing:
+                dest.write(b"truncated")
+                raise RuntimeError("connection reset")
+            run_id, name = artifact["id"].split("-", 1)
+            dest.write(self.runs[int(run_id)][name])
+            self.downloaded.append(artifact["id"])
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def source() -> FakeArtifactSource:
+    return FakeArtifactSource(
+        {
+            run_id: {
+                "terminal-bench-results-openai-gpt-5.2": _artifact_zip(
+                    "openai/gpt-5.2"
+                ),
+                "terminal-bench-results-anthropic-claude-opus-4-6": _artifact_zip(
+                    "anthropic/claude-opus-4-6"
+                ),
+                "terminal-bench-results-anthropic-claude-sonnet-4-5": _artifact_zip(
+                    "anthropic/claude-sonnet-4-5"
+                ),
+            }
+            for run_id in (111, 222, 333)
+        },
+        delay=0.05,
+    )
+
+
+def test_fetch_is_concurrent_and_cached(
+    source: FakeArtifactSource, tmp_path: Path
+) -> None:
+    report = fetch_run_artifacts(
+        [111, 222, 333], tmp_path, source=source, max_workers=4, verbose=False
+    )
+
+    assert report.ok
+    # The smoke test artifact is left out by default
+    assert len(report.artifacts) == 6
+    assert len(source.downloaded) == 6
+    assert 1 < source.max_active <= 4
+    assert [a.run_id for a in report.artifacts] == [111, 111, 222, 222, 333, 333]
+    for path in report.paths():
+        assert (path / "jobs" / "2026-02-01__00-15-05" / "config.json").is_file()
+    assert not list(tmp_path.glob("*/.partial-*"))
+
+    # Completed runs are neither listed nor downloaded again
+    source.listed.clear()
+    report = fetch_run_artifacts(
+        [111, 222, 333], tmp_path, source=source, verbose=False
+    )
+    assert report.ok
+    assert all(a.cached for a in report.artifacts)
+    assert len(source.downloaded) == 6
+    assert source.listed == []
+
+    # Asking for the smoke test lists the run again, and only fetches what is missing
+    report = fetch_run_artifacts(
+        [111], tmp_path, source=source, include_smoke_test=True, verbose=False
+    )
+    assert report.ok
+    assert {a.name: a.cached for a in report.artifacts} == {
+        "terminal-bench-results-anthropic-claude-opus-4-6": True,
+        "terminal-bench-results-anthropic-claude-sonnet-4-5": False,
+        "terminal-bench-results-openai-gpt-5.2": True,
+    }
+    assert source.listed == [111]
+
+
+def test_failed_artifacts_are_retried(
+    source: FakeArtifactSource, tmp_path: Path
+) -> None:
+    source.failing.add("terminal-bench-results-openai-gpt-5.2")
+    report = fetch_run_artifacts([111], tmp_path, source=source, verbose=False)
+
+    assert not report.ok
+    assert report.failed == [
+        (111, "terminal-bench-results-openai-gpt-5.2", "connection reset")
+    ]
+    assert [a.name for a in report.artifacts] == [
+        "terminal-bench-results-anthropic-claude-opus-4-6"
+    ]
+    assert not (tmp_path / "111" / "terminal-bench-results-openai-gpt-5.2").exists()
+    assert not list(tmp_path.glob("*/.partial-*"))
+
+    source.failing.clear()
+    report = fetch_run_artifacts([111], tmp_path, source=source, verbose=False)
+    assert report.ok
+    assert [a.cached for a in report.artifacts] == [True, False]
+
+
+def test_unknown_run_fails(source: FakeArtifactSource, tmp_path: Path) -> None:
+    report = fetch_run_artifacts([999], tmp_path, source=source, verbose=False)
+    assert report.failed == [(999, "", "no matching artifacts")]
+
+
+def test_prepare_submission_from_fetched_artifacts(
+    source: FakeArtifactSource, tmp_path: Path
+) -> None:
+    report = fetch_run_artifacts(
+        [111],
+        tmp_path / "cache",
+        source=source,
+        artifact_filter=lambda a: "gpt-5.2" in a["name"],
+        verbose=False,
+    )
+    [artifacts_dir] = report.paths()
+
+    submissions = prepare_submission(artifacts_dir, tmp_path / "out")
+
+    job = submissions["openai/gpt-5.2"] / "2026-02-01__00-15-05"
+    assert (job / "config.json").is_file()
+    assert (job / "chess-best-move__ABC123" / "result.json").is_file()
+    assert not (job / "chess-best-move__ABC123" / "agent" / "trial.log").exists()
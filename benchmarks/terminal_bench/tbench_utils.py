@@ -12,7 +12,6 @@ from __future__ import annotations
 import json
 import subprocess
 import sys
-from pathlib import Path
 
 # GitHub repository for fetching artifacts
 GITHUB_REPO = "lattice/lattice"
@@ -130,60 +129,13 @@ def list_artifacts_for_run(
         if line:
             artifact = json.loads(line)
             # Filter out smoke test artifact unless explicitly included
-            if not include_smoke_test:
-                smoke_test_pattern = SMOKE_TEST_MODEL.replace("/", "-")
-                if smoke_test_pattern in artifact["name"]:
-                    continue
+            if not include_smoke_test and is_smoke_test_artifact(artifact["name"]):
+                continue
             artifacts.append(artifact)
     return artifacts
 
 
-def download_run_artifacts(
-    run_id: int,
-    output_dir: Path,
-    artifact_names: list[str] | None = None,
-    include_smoke_test: bool = False,
-    verbose: bool = False,
-) -> bool:
-    """Download terminal-bench artifacts for a run.
+def is_smoke_test_artifact(name: str) -> bool:
+    """Check if an artifact holds the results of the smoke test model."""
+    return SMOKE_TEST_MODEL.replace("/", "-") in name
 
-    Args:
-        run_id: GitHub Actions run ID
-        output_dir: Directory to download artifacts to
-        artifact_names: Specific artifact names to download, or None for all
-        include_smoke_test: If True, include smoke test artifact (for log inspection)
-        verbose: If True, print commands being run
-
-    Returns:
-        True if download succeeded, False otherwise
-    """
-    if artifact_names is None:
-        artifacts = list_artifacts_for_run(
-            run_id, include_smoke_test=include_smoke_test, verbose=verbose
-        )
-        if not artifacts:
-            print(f"No artifacts found for run {run_id}", file=sys.stderr)
-            return False
-        artifact_names = [a["name"] for a in artifacts]
-
-    if verbose:
-        print(f"Downloading {len(artifact_names)} artifact(s) to {output_dir}...")
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    cmd = [
-        "gh",
-        "run",
-        "download",
-        str(run_id),
-        f"--repo={GITHUB_REPO}",
-        f"--dir={output_dir}",
-    ]
-    for name in artifact_names:
-        cmd.extend(["--name", name])
-
-    result = run_command(cmd, check=False, verbose=verbose)
-    if result.returncode != 0:
-        print(f"Error downloading: {result.stderr}", file=sys.stderr)
-        return False
-
-    return True
@@ -88,6 +88,12 @@ export OPENBB_AUTO_BUILD=true
   echo "Warning: OpenBB build step had issues (may still work)"
 }
 
+# --- Build indexed provider assets ---
+echo "Building IMF metadata store..."
+"$VENV_DIR/bin/python" -m openbb_imf.utils.metadata_store >/dev/null || {
+  echo "Warning: IMF metadata store build failed (it will be built on first use)"
+}
+
 # --- Write sentinel ---
 date -u +"%Y-%m-%dT%H:%M:%SZ" > "$SENTINEL"
 echo ""
@@ -214,7 +214,7 @@ report_id : str | None
     almonds_summary, almonds_supply_distribution, apples_selected_countries, apples_supply_distribution, barley_area_yield_production, barley_regional, barley_supply_disappearance, barley_world_production_consumption_stocks, barley_world_trade, beef_veal_production, beef_veal_trade, butter_production_consumption, butter_trade, cattle_stocks, cattle_trade, cheese_production_consumption, cheese_trade, cherries_selected_countries, cherries_supply_distribution, chicken_production, chicken_trade, china_grain_supply_demand, coarse_grains_area_yield_production, coarse_grains_regional, coarse_grains_world_production_consumption_stocks, coarse_grains_world_trade, coffee_arabica_production, coffee_consumption, coffee_ending_stocks, coffee_exports_green_bean, coffee_exports_soluble, coffee_exports_total, coffee_imports_green_bean, coffee_imports_soluble, coffee_imports_total, coffee_production, coffee_robusta_production, coffee_summary, coffee_summary_2, coffee_summary_3, coffee_summary_4, copra_palm_kernel_palm_oil_production, corn_area_yield_production, corn_barley_supply_demand, corn_regional, corn_supply_disappearance, corn_world_production_consumption_stocks, corn_world_trade, cotton_area_yield_production, cotton_area_yield_production_fcr, cotton_by_country, cotton_by_country_2, cotton_foreign_supply, cotton_monthly_changes, cotton_supply_distribution, cotton_supply_distribution_2, cotton_us_supply, cotton_world_supply, cotton_world_supply_use, cotton_world_supply_use_2, cottonseed_area_yield_production, eu_grain_supply_demand, grains_summary_comparison, grapefruit_selected_countries, grapes_selected_countries, grapes_supply_distribution, lemons_limes_selected_countries, milk_cow_numbers, milk_production_consumption, nonfat_dry_milk_production_consumption, nonfat_dry_milk_trade, oats_area_yield_production, oats_regional, oats_world_production_consumption_stocks, oats_world_trade, oilseeds_area_yield_production, oilseeds_china, oilseeds_eu, oilseeds_india, oilseeds_middle_east, oilseeds_products_world_supply_demand, oilseeds_southeast_asia, oilseeds_us_supply_distribution, oilseeds_world_commodity_view, oilseeds_world_country_view, orange_juice_supply_distribution, oranges_selected_countries, oranges_selected_countries_2, other_europe_grain_supply_demand, palm_coconut_fishmeal_world_supply_demand, palm_oil_world_supply, peaches_nectarines_selected_countries, peaches_nectarines_supply_distribution, peanut_area_yield_production, pears_selected_countries, pears_supply_distribution, pistachios_summary, pistachios_supply_distribution, pork_production, pork_trade, protein_meals_world_commodity_view, protein_meals_world_country_view, raisins_selected_countries, raisins_supply_distribution, rapeseed_area_yield_production, rapeseed_products_world_supply, rapeseed_products_world_supply_demand, rice_area_yield_production, rice_regional, rice_supply_demand, rice_world_production_consumption_stocks, rice_world_trade, russia_barley, russia_corn, russia_grain_supply_demand, russia_wheat, rye_area_yield_production, rye_regional, rye_world_production_consumption_stocks, rye_world_trade, sorghum_area_yield_production, sorghum_regional, sorghum_supply_disappearance, sorghum_world_production_consumption_stocks, sorghum_world_trade, soybean_meal_world_supply, soybean_oil_world_supply, soybeans_area_yield_production, soybeans_argentina_supply_distribution, soybeans_brazil_supply_distribution, soybeans_products_world_supply_demand, soybeans_products_world_trade, soybeans_us_supply_distribution, soybeans_world_supply, sugar_ending_stocks, sugar_imports_exports, sugar_production_consumption, sunflower_area_yield_production, sunflower_products_world_supply, sunflower_products_world_supply_demand, swine_stocks, swine_trade, tangerines_mandarins_selected_countries, us_grains_supply_distribution, vegetable_oils_minor_world_supply, vegetable_oils_world_commodity_view, vegetable_oils_world_country_view, walnuts_summary, walnuts_supply_distribution, wheat_area_yield_production, wheat_coarse_grains_supply_demand, wheat_coarse_grains_world_supply_demand, wheat_flour_products_world_trade, wheat_regional, wheat_supply_disappearance, wheat_world_production_consumption_stocks, whole_milk_powder_production_consumption, whole_milk_powder_trade, world_crop_production_summary
  (provider: government_us)
 commodity : str | None
-    Commodity name to filter the data. If provided, retrieves time series data for the given commodity. Supplying both 'report_id' and 'commodity' will prioritize 'commodity' for time series data. Valid commodities are:
+    Commodity name to filter the data. If provided, retrieves time series data for the given commodity. Multiple comma separated commodities are fetched concurrently. Supplying both 'report_id' and 'commodity' will prioritize 'commodity' for time series data. Valid commodities are:
     almonds, apples, barley, beef, broiler, butter, cattle, cheese, cherries, chicken, coffee, corn, cotton, dry_whole_milk_powder, fluid_milk, grapefruit, grapes, lemons_limes, meal_copra, meal_cottonseed, meal_fish, meal_palm_kernel, meal_peanut, meal_rapeseed, meal_soybean, meal_sunflowerseed, millet, mixed_grain, nonfat_dry_milk, oats, oil_coconut, oil_cottonseed, oil_olive, oil_palm, oil_palm_kernel, oil_peanut, oil_rapeseed, oil_soybean, oil_sunflowerseed, oilseed_copra, oilseed_cottonseed, oilseed_palm_kernel, oilseed_peanut, oilseed_rapeseed, oilseed_soybean, oilseed_sunflowerseed, orange_juice, oranges, peaches_nectarines, pears, pistachios, pork, rice, rye, sorghum, sugar, swine, tangerines_mandarins, walnuts, wheat
  (provider: government_us)
 attribute : str | list[str] | None
@@ -720,6 +720,8 @@ content : str
     Base64 encoded content of the weather bulletin document.
 data_format : dict | None
     Data format information. (provider: government_us)
+sha256 : str | None
+    SHA-256 digest of the document. The API streams the raw file from `/blobs/{sha256}`. (provider: government_us)
 
 Examples
 --------
@@ -2299,6 +2299,10 @@ transform : str
     cca = Continuously Compounded Annual Rate of Change
     log = Natural Log (provider: fred)
     Choices for fred: 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log'
+realtime_start : date | None
+    The start of the real-time period, for ALFRED vintage data. Past vintages are stored locally once downloaded. (provider: fred)
+realtime_end : date | None
+    The end of the real-time period, for ALFRED vintage data. (provider: fred)
 all_pages : bool | None
     Returns all pages of data from the API call at once. (provider: intrinio)
 sleep : float | None
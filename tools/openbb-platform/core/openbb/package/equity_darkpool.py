@@ -6,7 +6,7 @@
 
 from openbb_core.app.static.container import Container
 from openbb_core.app.model.obbject import OBBject
-from typing import Annotated, Optional, Literal
+from typing import Annotated, Optional, Literal, Union
 from openbb_core.app.static.utils.decorators import exception_handler, validate
 
 from openbb_core.app.static.utils.filters import filter_inputs
@@ -27,9 +27,12 @@ class ROUTER_equity_darkpool(Container):
     def otc(
         self,
         symbol: Annotated[
-            str | None,
+            Union[str, None, list[str | None]],
             OpenBBField(
-                description='Symbol to get data for.'
+                description=(
+                    'Symbol to get data for. Multiple comma separated'
+                    'items allowed for provider(s): finra.'
+                )
             )
         ] = None,
         provider: Annotated[
@@ -53,8 +56,8 @@ Parameters
 ----------
 provider : str
     The provider to use, by default None. If None, the priority list configured in the settings is used. Default priority: finra.
-symbol : str | None
-    Symbol to get data for.
+symbol : str | list[str | None] | None
+    Symbol to get data for. Multiple comma separated items allowed for provider(s): finra.
 tier : str
     "T1 - Securities included in the S&P 500, Russell 1000 and selected exchange-traded products
 
@@ -86,6 +89,8 @@ share_quantity : float
     Aggregate weekly total number of shares reported by each ATS for the Symbol.
 trade_quantity : float
     Aggregate weekly total number of trades reported by each ATS for the Symbol
+symbol : str | None
+    Symbol representing the entity requested in the data. (provider: finra)
 
 Examples
 --------
@@ -110,6 +115,6 @@ Examples
                     "symbol": symbol,
                 },
                 extra_params=kwargs,
-                info={'tier': {'finra': {'choices': ['T1', 'T2', 'OTCE']}}},
+                info={'symbol': {'finra': {'multiple_items_allowed': True, 'choices': None}}, 'tier': {'finra': {'choices': ['T1', 'T2', 'OTCE']}}},
             )
         )
@@ -1428,7 +1428,7 @@ form_group : str
     The form group to fetch, default is 8k. (provider: nasdaq)
     Choices for nasdaq: 'annual', 'quarterly', 'proxy', 'insider', '8k', 'registration', 'comment'
 use_cache : bool
-    Whether or not to use cache.  If True, cache will store for one day. (provider: sec)
+    Whether or not to use the local index of filings. If True, the filings of a company are updated once a day. (provider: sec)
 
 Returns
 -------
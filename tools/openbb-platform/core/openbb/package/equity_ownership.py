@@ -96,6 +96,8 @@ date : date | str | None
     A specific date to get data for. The date represents the end of the reporting period. All form 13F-HR filings are based on the calendar year and are reported quarterly. If a date is not supplied, the most recent filing is returned. Submissions beginning 2013-06-30 are supported.
 limit : int | None
     The number of data entries to return. The number of previous filings to return. The date parameter takes priority over this parameter.
+use_cache : bool
+    Whether or not to use cache. Parsed filings are stored locally, and are not downloaded again. (provider: sec)
 
 Returns
 -------
@@ -6,7 +6,7 @@
 
 from openbb_core.app.static.container import Container
 from openbb_core.app.model.obbject import OBBject
-from typing import Annotated, Optional, Literal
+from typing import Annotated, Optional, Literal, Union
 from openbb_core.app.static.utils.decorators import exception_handler, validate
 
 from openbb_core.app.static.utils.filters import filter_inputs
@@ -125,9 +125,12 @@ Examples
     def short_interest(
         self,
         symbol: Annotated[
-            str,
+            Union[str, list[str]],
             OpenBBField(
-                description='Symbol to get data for.'
+                description=(
+                    'Symbol to get data for. Multiple comma separated'
+                    'items allowed for provider(s): finra.'
+                )
             )
         ],
         provider: Annotated[
@@ -148,8 +151,12 @@ Parameters
 ----------
 provider : str
     The provider to use, by default None. If None, the priority list configured in the settings is used. Default priority: finra.
-symbol : str
-    Symbol to get data for.
+symbol : Union[str, list[str]]
+    Symbol to get data for. Multiple comma separated items allowed for provider(s): finra.
+start_date : date | None
+    Start date of the data, in YYYY-MM-DD format. Filters on the settlement date. (provider: finra)
+end_date : date | None
+    End date of the data, in YYYY-MM-DD format. Filters on the settlement date. (provider: finra)
 
 Returns
 -------
@@ -209,6 +216,7 @@ Examples
                     "symbol": symbol,
                 },
                 extra_params=kwargs,
+                info={'symbol': {'finra': {'multiple_items_allowed': True, 'choices': None}}},
             )
         )
 
@@ -7,7 +7,7 @@
 from openbb_core.app.static.container import Container
 from openbb_core.app.model.obbject import OBBject
 import datetime
-from typing import Annotated, Union, Optional, Literal
+from typing import Annotated, Union, Optional, Literal, Any
 from annotated_types import Ge
 from openbb_core.app.static.utils.decorators import exception_handler, validate
 
@@ -20,6 +20,7 @@ from openbb_core.app.model.field import OpenBBField
 class ROUTER_news(Container):
     """/news
     company
+    feed
     world
     """
 
@@ -257,6 +258,126 @@ Examples
             )
         )
 
+    @exception_handler
+    @validate
+    def feed(
+        self,
+        providers: Annotated[
+            str,
+            OpenBBField(
+                description=(
+                    'Comma-separated providers to query, by order of'
+                    'precedence.'
+                )
+            )
+        ],
+        symbol: Annotated[
+            str | None,
+            OpenBBField(
+                description=(
+                    'Comma-separated symbols, to get company news'
+                    'instead of world news.'
+                )
+            )
+        ] = None,
+        start_date: Annotated[
+            Union[datetime.date, None, str] | None,
+            OpenBBField(
+                description='Start date of the articles.'
+            )
+        ] = None,
+        end_date: Annotated[
+            Union[datetime.date, None, str] | None,
+            OpenBBField(
+                description='End date of the articles.'
+            )
+        ] = None,
+        limit: Annotated[
+            int | None,
+            OpenBBField(
+                description=(
+                    'Maximum number of articles, queried from each'
+                    'provider and returned.'
+                )
+            )
+        ] = 100,
+        since: Annotated[
+            str | None,
+            OpenBBField(
+                description=(
+                    "Cursor returned in `extra['results_metadata']` by"
+                    'a previous call. Only articles published since'
+                    'that call are returned.'
+                )
+            )
+        ] = None,
+        timeout: Annotated[
+            float | None,
+            OpenBBField(
+                description='Seconds to wait for each provider. Default is 10.'
+            )
+        ] = 10.0,
+        **kwargs: Any
+    ) -> OBBject:
+        """News Feed. Merge the news of several providers into one stream.
+
+Providers are queried concurrently. Articles carried by more than one
+provider, matched on their URL or on the similarity of their titles, are
+only returned once, from the provider listed first. Providers that fail
+or time out are left out, with a warning.
+
+Parameters
+----------
+providers : str
+    Comma-separated providers to query, by order of precedence.
+symbol : Optional[str]
+    Comma-separated symbols, to get company news instead of world news.
+start_date : Optional[date]
+    Start date of the articles.
+end_date : Optional[date]
+    End date of the articles.
+limit : Optional[int]
+    Maximum number of articles, queried from each provider and returned.
+since : Optional[str]
+    Cursor returned in `extra['results_metadata']` by a previous call.
+    Only articles published since that call are returned.
+timeout : Optional[float]
+    Seconds to wait for each provider. Default is 10.
+
+Returns
+-------
+OBBject[list[Data]]
+    The articles, newest first, with the `provider` each came from.
+    `extra['results_metadata']` holds the `cursor` of this call and the
+    outcome of each provider.
+
+Examples
+--------
+>>> from openbb import obb
+>>> obb.news.feed(providers='benzinga,fmp,tiingo')
+>>> # Merge the company news of several providers.
+>>> obb.news.feed(providers='fmp,intrinio,yfinance', symbol='AAPL')
+>>> # Poll for the articles published since the last call.
+>>> feed = obb.news.feed(providers='benzinga,fmp,tiingo')
+>>> cursor = feed.extra['results_metadata']['cursor']
+>>> new = obb.news.feed(providers='benzinga,fmp,tiingo', since=cursor)
+
+        """  # noqa: E501 # pylint: disable=line-too-long
+
+        return self._run(
+            "/news/feed",
+            **filter_inputs(
+                providers=providers,
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit,
+                since=since,
+                timeout=timeout,
+                **kwargs,
+            )
+        )
+
     @exception_handler
     @validate
     def world(
@@ -172,6 +172,8 @@ filename : str | None
     The filename of the downloaded PDF. (provider: congress_gov)
 data_format : dict[str, str] | None
     Data format information, including data type and filename. (provider: congress_gov)
+sha256 : str | None
+    SHA-256 digest of the downloaded file. The API streams the raw file from `/blobs/{sha256}`. (provider: congress_gov)
 
 Examples
 --------
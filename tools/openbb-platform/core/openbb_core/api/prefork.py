@@ -0,0 +1,295 @@
+"""Pre-fork multi-worker server for the OpenBB API.
+
+`uvicorn.run(..., workers=N)` spawns fresh interpreters, so every worker
+imports the application, loads the provider registry and builds its own
+reference tables. The pre-fork server instead loads the application once in
+the parent process, freezes the garbage collector so that the loaded objects
+are never written to again, and forks the workers. The workers inherit all of
+that memory copy-on-write and share one listening socket.
+
+Cross-worker caching goes through `openbb_core.provider.utils.shared_cache`.
+Each worker periodically reports its memory, cache, rate limiter and stage
+timing statistics there, and any worker serves the aggregate at `GET /workers`.
+
+Static reference data to load before forking is declared with the
+`OPENBB_API_PRELOAD` environment variable, a comma-separated list of
+`module` or `module:callable` entries, e.g.:
+
+    OPENBB_API_PRELOAD="openbb_imf.utils.metadata:ImfMetadata"
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import gc
+import logging
+import os
+import signal
+import threading
+import time
+from importlib import import_module
+from typing import Any
+
+logger = logging.getLogger("uvicorn.error")
+
+WORKER_STATS_NAMESPACE = "api_workers"
+WORKER_STATS_INTERVAL = 15.0
+
+
+def preload(entries: str | None = None) -> None:
+    """Import modules and call hooks listed in `OPENBB_API_PRELOAD`."""
+    entries = entries if entries is not None else os.environ.get("OPENBB_API_PRELOAD")
+
+    for entry in (e.strip() for e in (entries or "").split(",")):
+        if not entry:
+            continue
+        module_name, _, attr = entry.partition(":")
+        try:
+            module = import_module(module_name)
+            if attr:
+                getattr(module, attr)()
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("Failed to preload '%s': %s", entry, e)
+
+
+def get_memory_usage() -> dict[str, int | None]:
+    """Get the memory usage of the current process, in bytes.
+
+    `pss` and `shared` are only available on Linux. PSS divides shared pages
+    between the processes mapping them, so the sum over workers is the actual
+    memory used by the server.
+    """
+    import resource
+    import sys
+
+    usage: dict[str, int | None] = {"rss": None, "pss": None, "shared": None}
+
+    try:
+        with open("/proc/self/smaps_rollup", encoding="utf-8") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                kb = value.split()
+                if not kb:
+                    continue
+                if name == "Rss":
+                    usage["rss"] = int(kb[0]) * 1024
+                elif name == "Pss":
+                    usage["pss"] = int(kb[0]) * 1024
+                elif name in ("Shared_Clean", "Shared_Dirty"):
+                    usage["shared"] = (usage["shared"] or 0) + int(kb[0]) * 1024
+    except OSError:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere.
+        usage["rss"] = max_rss if sys.platform == "darwin" else max_rss * 1024
+
+    return usage
+
+
+def get_worker_stats() -> dict[str, Any]:
+    """Collect the statistics reported by the current worker."""
+    from openbb_core.provider.utils.lru import ttl_cache_stats
+    from openbb_core.provider.utils.rate_limiter import rate_limiter_stats
+    from openbb_core.provider.utils.shared_cache import shared_cache_stats
+    from openbb_core.provider.utils.tracing import stage_metrics
+
+    return {
+        "pid": os.getpid(),
+        "updated": time.time(),
+        "memory": get_memory_usage(),
+        "caches": [
+            s for s in shared_cache_stats() if s["namespace"] != WORKER_STATS_NAMESPACE
+        ],
+        "ttl_caches": ttl_cache_stats(),
+        "rate_limiters": rate_limiter_stats(),
+        "stages": stage_metrics.snapshot(),
+    }
+
+
+def _report_worker_stats(stop: threading.Event, interval: float) -> None:
+    """Publish this worker's statistics to the shared cache until stopped."""
+    from openbb_core.provider.utils.shared_cache import get_shared_cache
+
+    cache = get_shared_cache(WORKER_STATS_NAMESPACE)
+    while True:
+        try:
+            cache.set(str(os.getpid()), get_worker_stats(), ttl=interval * 3)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug("Failed to report worker stats: %s", e)
+        if stop.wait(interval):
+            cache.delete(str(os.getpid()))
+            return
+
+
+def add_worker_stats_route(app) -> None:
+    """Add the `GET /workers` route, returning the statistics of all workers."""
+    from openbb_core.provider.utils.shared_cache import get_shared_cache
+
+    async def get_workers():
+        """Get memory and cache statistics of every API worker."""
+        cache = get_shared_cache(WORKER_STATS_NAMESPACE)
+        workers = sorted(
+            # Stage histograms are served in the Prometheus format at /metrics.
+            (
+                {k: v for k, v in stats.items() if k != "stages"}
+                for _, stats in cache.items()
+            ),
+            key=lambda s: s["pid"],
+        )
+        return {
+            "workers": workers,
+            "total_pss": sum((w["memory"].get("pss") or 0) for w in workers) or None,
+        }
+
+    app.add_api_route("/workers", get_workers, methods=["GET"], include_in_schema=False)
+
+
+class PreforkServer:
+    """Serve an ASGI app from worker processes forked from a preloaded parent.
+
+    Parameters
+    ----------
+    app : Any
+        The ASGI application, or its import string ("module:attribute").
+    workers : int
+        The number of worker processes.
+    stats_interval : float
+        Seconds between worker statistics reports.
+    **uvicorn_kwargs
+        Settings passed to `uvicorn.Config`. `reload` is not supported.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        workers: int,
+        stats_interval: float = WORKER_STATS_INTERVAL,
+        **uvicorn_kwargs,
+    ):
+        """Initialize the server."""
+        if not hasattr(os, "fork"):
+            raise RuntimeError("The pre-fork server requires a platform with os.fork.")
+        if uvicorn_kwargs.pop("reload", False):
+            raise ValueError("The pre-fork server does not support 'reload'.")
+        uvicorn_kwargs.pop("workers", None)
+        self.app = app
+        self.workers = max(1, int(workers))
+        self.stats_interval = stats_interval
+        self.uvicorn_kwargs = uvicorn_kwargs
+        self.children: dict[int, int] = {}
+        self.should_exit = False
+
+    def load(self):
+        """Load the application and the preloaded data in the current process."""
+        from uvicorn.importer import import_from_string
+
+        app = import_from_string(self.app) if isinstance(self.app, str) else self.app
+        add_worker_stats_route(app)
+        preload()
+        # Move everything loaded so far to a permanent generation, so that the
+        # collector doesn't touch (and copy) the inherited pages in workers.
+        gc.collect()
+        gc.freeze()
+
+        return app
+
+    def run(self) -> None:
+        """Load the application, fork the workers and supervise them."""
+        import uvicorn
+
+        app = self.load()
+        config = uvicorn.Config(app, **self.uvicorn_kwargs)
+        sock = config.bind_socket()
+
+        def handle_exit(sig, frame):  # pylint: disable=unused-argument
+            self.should_exit = True
+
+        signal.signal(signal.SIGTERM, handle_exit)
+        signal.signal(signal.SIGINT, handle_exit)
+
+        for index in range(self.workers):
+            self._spawn(index, config, sock)
+
+        logger.info(
+            "Started %d pre-forked workers: %s",
+            self.workers,
+            ", ".join(str(pid) for pid in self.children),
+        )
+        self.started()
+
+        try:
+            while not self.should_exit:
+                try:
+                    pid, status = os.waitpid(-1, os.WNOHANG)
+                except ChildProcessError:
+                    break
+                if pid == 0:
+                    time.sleep(0.5)
+                    continue
+                index = self.children.pop(pid, None)
+                if index is not None and not self.should_exit:
+                    logger.warning(
+                        "Worker %d exited with status %d, restarting.", pid, status
+                    )
+                    self._spawn(index, config, sock)
+        finally:
+            self._shutdown()
+            sock.close()
+
+    def started(self) -> None:
+        """Run in the parent once the socket is bound and the workers are forked."""
+
+    def _spawn(self, index: int, config, sock) -> None:
+        """Fork a worker process serving on the shared socket."""
+        pid = os.fork()
+        if pid:
+            self.children[pid] = index
+            return
+
+        # Worker process.
+        import uvicorn
+
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        exit_code = 0
+        stop = threading.Event()
+        reporter = threading.Thread(
+            target=_report_worker_stats,
+            args=(stop, self.stats_interval),
+            name=f"openbb-worker-stats-{index}",
+            daemon=True,
+        )
+        try:
+            reporter.start()
+            uvicorn.Server(config).run(sockets=[sock])
+        except BaseException:  # pylint: disable=broad-except
+            logger.exception("Worker %d crashed.", os.getpid())
+            exit_code = 1
+        finally:
+            stop.set()
+            reporter.join(timeout=5)
+            os._exit(exit_code)  # pylint: disable=protected-access
+
+    def _shutdown(self, timeout: float = 30.0) -> None:
+        """Stop the workers, killing the ones that don't exit in time."""
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        deadline = time.monotonic() + timeout
+        while self.children and time.monotonic() < deadline:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                time.sleep(0.1)
+                continue
+            self.children.pop(pid, None)
+
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        self.children.clear()
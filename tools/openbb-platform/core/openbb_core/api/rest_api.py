@@ -6,12 +6,15 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from openbb_core.api.app_loader import AppLoader
+from openbb_core.api.router.blobs import router as router_blobs
 from openbb_core.api.router.commands import router as router_commands
 from openbb_core.api.router.coverage import router as router_coverage
 from openbb_core.api.router.system import router as router_system
+from openbb_core.api.tracing import TracingMiddleware, add_metrics_route
 from openbb_core.app.service.auth_service import AuthService
 from openbb_core.app.service.system_service import SystemService
 from openbb_core.env import Env
+from openbb_core.provider.utils.tracing import is_tracing_enabled
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -74,12 +77,18 @@ app.add_middleware(
 AppLoader.add_routers(
     app=app,
     routers=(
-        [AuthService().router, router_system, router_coverage, router_commands]
+        [
+            AuthService().router,
+            router_system,
+            router_coverage,
+            router_blobs,
+            router_commands,
+        ]
         if Env().DEV_MODE
         else (
-            [router_commands, router_coverage]
+            [router_commands, router_coverage, router_blobs]
             if hasattr(router_commands, "routes") and router_commands.routes
-            else [router_commands]
+            else [router_commands, router_blobs]
         )
     ),
     prefix=system.api_settings.prefix,
@@ -87,9 +96,15 @@ AppLoader.add_routers(
 AppLoader.add_openapi_tags(app)
 AppLoader.add_exception_handlers(app)
 
+if is_tracing_enabled():
+    app.add_middleware(TracingMiddleware)
+    add_metrics_route(app)
+
 
 if __name__ == "__main__":
     # pylint: disable=import-outside-toplevel
+    import os
+
     import uvicorn
 
     # This initializes the OpenBB environment variables so they can be read before uvicorn is run.
@@ -101,5 +116,14 @@ if __name__ == "__main__":
         uvicorn_kwargs["reload"] = True
 
     uvicorn_app = uvicorn_kwargs.pop("app", "openbb_core.api.rest_api:app")
+    uvicorn_prefork = uvicorn_kwargs.pop("prefork", True)
+    workers = uvicorn_kwargs.get("workers") or 1
+
+    # Multiple workers are forked from a preloaded parent where supported.
+    if workers > 1 and uvicorn_prefork and hasattr(os, "fork"):
+        from openbb_core.api.prefork import PreforkServer
 
-    uvicorn.run(uvicorn_app, **uvicorn_kwargs)
+        uvicorn_kwargs.pop("reload", None)
+        PreforkServer(uvicorn_app, **uvicorn_kwargs).run()
+    else:
+        uvicorn.run(uvicorn_app, **uvicorn_kwargs)
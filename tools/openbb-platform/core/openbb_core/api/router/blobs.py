@@ -0,0 +1,54 @@
+"""Blobs API router."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.responses import FileResponse
+from openbb_core.app.service.auth_service import AuthService
+
+router = APIRouter(prefix="/blobs", tags=["Blobs"])
+
+
+@router.head(
+    "/{sha256}",
+    dependencies=[Depends(AuthService().auth_hook)],
+    include_in_schema=False,
+)
+@router.get(
+    "/{sha256}",
+    dependencies=[Depends(AuthService().auth_hook)],
+    openapi_extra={"widget_config": {"exclude": True}},
+    response_class=FileResponse,
+)
+async def get_blob(
+    sha256: str,
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    """Stream a document from the blob cache, by the SHA-256 digest of its content.
+
+    Documents are stored by the commands that download them, which return
+    their digest. The raw bytes are streamed from disk, and byte ranges can
+    be requested with the `Range` header.
+    """
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.provider.utils.blob_cache import get_blob_cache
+
+    blob = get_blob_cache().get_by_digest(sha256.lower())
+    if blob is None:
+        raise HTTPException(status_code=404, detail="Blob not found.")
+
+    # The content of a digest never changes.
+    headers = {
+        "ETag": f'"{blob.sha256}"',
+        "Cache-Control": "private, max-age=31536000, immutable",
+    }
+    if if_none_match and blob.sha256 in if_none_match:
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(
+        blob.path,
+        media_type=blob.content_type or "application/octet-stream",
+        filename=blob.filename or None,
+        content_disposition_type="inline",
+        headers=headers,
+    )
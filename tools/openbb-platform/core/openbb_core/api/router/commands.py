@@ -22,6 +22,7 @@ from openbb_core.app.service.system_service import SystemService
 from openbb_core.app.service.user_service import UserService
 from openbb_core.env import Env
 from openbb_core.provider.utils.helpers import to_snake_case
+from openbb_core.provider.utils.tracing import span
 from pydantic import BaseModel
 from typing_extensions import ParamSpec
 
@@ -311,31 +312,34 @@ def build_api_wrapper(
             results_only = getattr(output, "_results_only", False)
             try:
                 if results_only is True:
-                    content = output.model_dump(
-                        exclude_unset=True, exclude_none=True
-                    ).get("results", [])
+                    with span("encode"):
+                        content = output.model_dump(
+                            exclude_unset=True, exclude_none=True
+                        ).get("results", [])
 
-                    return JSONResponse(
-                        content=jsonable_encoder(content), status_code=200
-                    )
+                        return JSONResponse(
+                            content=jsonable_encoder(content), status_code=200
+                        )
 
                 if (mutated_output and isinstance(output, OBBject)) or (
                     isinstance(output, OBBject) and no_validate
                 ):
-                    output.results = output.model_dump(
-                        exclude_unset=True, exclude_none=True
-                    ).get("results")
-
-                    return JSONResponse(
-                        content=jsonable_encoder(output), status_code=200
-                    )
+                    with span("encode"):
+                        output.results = output.model_dump(
+                            exclude_unset=True, exclude_none=True
+                        ).get("results")
+
+                        return JSONResponse(
+                            content=jsonable_encoder(output), status_code=200
+                        )
             except Exception as exc:  # pylint: disable=W0703
                 raise OpenBBError(
                     f"Error serializing output for an extension-modified endpoint {path}: {exc}",
                 ) from exc
 
             if not no_validate:
-                return validate_output(output)
+                with span("validate_output"):
+                    return validate_output(output)
 
         return output
 
@@ -0,0 +1,92 @@
+"""Request tracing for the OpenBB API.
+
+When tracing is enabled in the Python settings, every sampled request is
+recorded as a trace whose root span covers the whole request. The command
+spans recorded by the `CommandRunner` are nested under it, and the time
+between the end of the endpoint and the start of the response, spent by
+FastAPI serializing the output, is recorded as the `serialize` stage.
+
+`GET /metrics` serves the stage duration histograms in the Prometheus text
+format. With the pre-fork server, it sums the histograms reported by every
+worker.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import time
+
+from openbb_core.provider.utils.tracing import Span, start_trace
+
+
+class TracingMiddleware:
+    """ASGI middleware starting a trace for each HTTP request."""
+
+    def __init__(self, app):
+        """Initialize the middleware."""
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        """Trace the request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope.get("path", "")
+
+        with start_trace("request", route=path, method=scope.get("method")) as trace:
+            if trace is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    _record_serialize(trace)
+                    trace.attributes["status"] = message.get("status")
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+def _record_serialize(trace) -> None:
+    """Record the time from the end of the endpoint to the response start."""
+    now = time.perf_counter_ns()
+    children = [
+        s
+        for s in trace.spans
+        if s.parent is trace.root and s.end_ns is not None and s.name == "command"
+    ]
+    if not children:
+        return
+    serialize = Span("serialize", trace.root, {})
+    serialize.start_ns = max(s.end_ns for s in children)  # type: ignore[type-var]
+    serialize.end_ns = now
+    with trace.lock:
+        trace.spans.append(serialize)
+
+
+def add_metrics_route(app) -> None:
+    """Add the `GET /metrics` route, serving the stage duration histograms."""
+    import os
+
+    from fastapi.responses import PlainTextResponse
+    from openbb_core.api.prefork import WORKER_STATS_NAMESPACE
+    from openbb_core.provider.utils.shared_cache import get_shared_cache
+    from openbb_core.provider.utils.tracing import render_prometheus, stage_metrics
+
+    async def get_metrics():
+        """Get the stage duration histograms in the Prometheus text format."""
+        pid = str(os.getpid())
+        snapshots = [stage_metrics.snapshot()]
+        try:
+            workers = get_shared_cache(WORKER_STATS_NAMESPACE).items()
+        except Exception:  # pylint: disable=broad-except
+            workers = []
+        snapshots.extend(
+            stats.get("stages") or {} for key, stats in workers if key != pid
+        )
+        return PlainTextResponse(
+            render_prometheus(snapshots),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+    app.add_api_route("/metrics", get_metrics, methods=["GET"], include_in_schema=False)
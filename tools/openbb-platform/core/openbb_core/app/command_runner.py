@@ -22,6 +22,13 @@ from openbb_core.app.provider_interface import ExtraParams
 from openbb_core.app.static.package_builder import PathHandler
 from openbb_core.env import Env
 from openbb_core.provider.utils.helpers import maybe_coroutine, run_async, to_snake_case
+from openbb_core.provider.utils.tracing import (
+    current_trace,
+    profile_route,
+    set_trace_attribute,
+    span,
+    start_trace,
+)
 from pydantic import BaseModel, ConfigDict, create_model
 
 if TYPE_CHECKING:
@@ -333,12 +340,13 @@ class StaticCommandRunner:
                 kwargs_copy = deepcopy(kwargs)
                 chart = kwargs.pop("chart", False)
                 kwargs_copy = deepcopy(kwargs)
-                kwargs = ParametersBuilder.build(
-                    args=args,
-                    execution_context=execution_context,
-                    func=func,
-                    kwargs=kwargs,
-                )
+                with span("build_parameters"):
+                    kwargs = ParametersBuilder.build(
+                        args=args,
+                        execution_context=execution_context,
+                        func=func,
+                        kwargs=kwargs,
+                    )
                 kwargs = kwargs if kwargs is not None else {}
                 # If **kwargs is in the function signature, we need to make sure to pass
                 # All kwargs to the function so dependency injection happens
@@ -357,7 +365,8 @@ class StaticCommandRunner:
                     for name, default in model_headers.items() or {}
                 } or None
 
-                obbject = await cls._command(func, kwargs)
+                with span("execute"):
+                    obbject = await cls._command(func, kwargs)
                 # The output might be from a router command with 'no_validate=True'
                 # It might be of a different type than OBBject.
                 # In this case, we avoid accessing those attributes.
@@ -389,7 +398,8 @@ class StaticCommandRunner:
                                     k, None
                                 )
 
-                        cls._chart(obbject, **kwargs_copy)
+                        with span("chart"):
+                            cls._chart(obbject, **kwargs_copy)
 
                 raised_warnings = warning_list if warning_list else []
         finally:
@@ -413,16 +423,17 @@ class StaticCommandRunner:
                 # pylint: disable=import-outside-toplevel
                 from openbb_core.app.logs.logging_service import LoggingService
 
-                ls = LoggingService(system_settings, user_settings)
-                ls.log(
-                    user_settings=user_settings,
-                    system_settings=system_settings,
-                    route=route,
-                    func=func,
-                    kwargs=kwargs,
-                    exec_info=exc_info(),
-                    custom_headers=custom_headers,
-                )
+                with span("logging"):
+                    ls = LoggingService(system_settings, user_settings)
+                    ls.log(
+                        user_settings=user_settings,
+                        system_settings=system_settings,
+                        route=route,
+                        func=func,
+                        kwargs=kwargs,
+                        exec_info=exc_info(),
+                        custom_headers=custom_headers,
+                    )
 
         return obbject
 
@@ -436,6 +447,22 @@ class StaticCommandRunner:
         **kwargs,
     ) -> OBBject:
         """Run a command and return the OBBject as output."""
+        route = execution_context.route
+
+        with start_trace("command", route=route), profile_route(route):
+            set_trace_attribute("route", route)
+            return await cls._run(execution_context, *args, **kwargs)
+
+    # pylint: disable=W0718
+    @classmethod
+    async def _run(
+        cls,
+        execution_context: ExecutionContext,
+        /,
+        *args,
+        **kwargs,
+    ) -> OBBject:
+        """Run a command and add its metadata."""
         timestamp = datetime.now()
         start_ns = perf_counter_ns()
 
@@ -459,11 +486,13 @@ class StaticCommandRunner:
             obbject, OBBject
         ):
             try:
+                trace = current_trace()
                 obbject.extra["metadata"] = Metadata(
                     arguments=kwargs,
                     duration=duration,
                     route=route,
                     timestamp=timestamp,
+                    stages=trace.stages() if trace else None,
                 )
             except Exception as e:
                 if Env().DEBUG_MODE:
@@ -505,7 +534,8 @@ class StaticCommandRunner:
 
         if isinstance(obbject, OBBject):
             try:
-                cls._trigger_command_output_callbacks(route, obbject)
+                with span("output_callbacks"):
+                    cls._trigger_command_output_callbacks(route, obbject)
             except Exception as e:
                 if Env().DEBUG_MODE:
                     raise OpenBBError(e) from e
@@ -18,6 +18,11 @@ class Metadata(BaseModel):
     duration: int = Field(
         description="Execution duration in nano second of the command."
     )
+    stages: dict[str, int] | None = Field(
+        default=None,
+        description="Execution duration in nano second of each stage of the command,"
+        + " when tracing is enabled.",
+    )
     route: str = Field(description="Route of the command.")
     timestamp: datetime = Field(description="Execution starting timestamp.")
 
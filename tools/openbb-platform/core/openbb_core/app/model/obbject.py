@@ -18,6 +18,8 @@ from openbb_core.app.model.abstract.warning import Warning_
 from openbb_core.app.model.charts.chart import Chart
 from openbb_core.provider.abstract.annotated_result import AnnotatedResult
 from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.abstract.data_table import DataTable
+from openbb_core.provider.utils.tracing import span
 from pydantic import BaseModel, Field, PrivateAttr
 
 if TYPE_CHECKING:
@@ -98,6 +100,7 @@ class OBBject(Tagged, Generic[T]):
         - Dict[str, Dict]
         - Dict[str, List]
         - Dict[str, BaseModel]
+        - DataTable
 
         Other supported formats:
         - str
@@ -138,6 +141,7 @@ class OBBject(Tagged, Generic[T]):
         - Dict[str, Dict]
         - Dict[str, List]
         - Dict[str, BaseModel]
+        - DataTable
 
         Other supported formats:
         - str
@@ -226,6 +230,11 @@ class OBBject(Tagged, Generic[T]):
 
                 df = concat(dict_of_df, axis=1)
 
+            # DataTable
+            elif isinstance(res, DataTable):
+                df = res.to_dataframe()
+                sort_columns = False
+
             # List[BaseModel]
             elif is_list_of_basemodel(res):
                 dt: list[Data] | Data = res  # type: ignore
@@ -375,8 +384,10 @@ class OBBject(Tagged, Generic[T]):
             OBBject with results.
         """
         results = await query.execute()
-        if isinstance(results, AnnotatedResult):
-            return cls(
-                results=results.result, extra={"results_metadata": results.metadata}
-            )
-        return cls(results=results)
+        with span("build_obbject"):
+            if isinstance(results, AnnotatedResult):
+                return cls(
+                    results=results.result,
+                    extra={"results_metadata": results.metadata},
+                )
+            return cls(results=results)
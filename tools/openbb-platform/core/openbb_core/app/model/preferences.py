@@ -13,6 +13,10 @@ class Preferences(BaseModel):
     chart_style: Literal["dark", "light"] = "dark"
     data_directory: str = str(Path.home() / "OpenBBUserData")
     export_directory: str = str(Path.home() / "OpenBBUserData" / "exports")
+    historical_store: bool = Field(
+        default=False,
+        description="Store historical prices locally and only fetch the missing dates.",
+    )
     metadata: bool = True
     output_type: Literal[
         "OBBject", "dataframe", "polars", "numpy", "dict", "chart", "llm"
@@ -12,6 +12,7 @@ from openbb_core.app.provider_interface import (
     ProviderInterface,
     StandardParams,
 )
+from openbb_core.provider.utils.tracing import span
 
 
 class Query:
@@ -65,10 +66,11 @@ class Query:
 
     async def execute(self) -> Any:
         """Execute the query."""
-        standard_dict = asdict(self.standard_params)
-        extra_dict = (
-            self.filter_extra_params(self.extra_params, self.provider) if self.extra_params else {}  # type: ignore
-        )
+        with span("filter_params"):
+            standard_dict = asdict(self.standard_params)
+            extra_dict = (
+                self.filter_extra_params(self.extra_params, self.provider) if self.extra_params else {}  # type: ignore
+            )
         query_executor = self.provider_interface.create_executor()
 
         return await query_executor.execute(
@@ -0,0 +1,281 @@
+"""Columnar results.
+
+A `DataTable` holds the results of a fetcher as one NumPy array per field,
+instead of one `Data` instance per row. It implements the read-only sequence
+protocol of a `list[Data]`, and validates a row as the `Data` model only when
+it is accessed. Converting it to a DataFrame does not create any rows.
+
+Missing values of required fields are checked when the table is created, so
+that bad data fails in `transform_data`, as it does for a list of `Data`.
+A NaN in a numeric column is kept for a required field, and omitted for an
+optional one, leaving the field to its default.
+
+Fetchers that already hold their data in a DataFrame can return it directly:
+
+    def transform_data(query, data: DataFrame, **kwargs) -> list[MyData]:
+        return DataTable.from_dataframe(data, MyData)
+"""
+
+# pylint: disable=import-outside-toplevel
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from types import NoneType
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, get_args, overload
+
+from openbb_core.provider.abstract.data import Data
+from pydantic_core import SchemaSerializer, core_schema
+
+if TYPE_CHECKING:
+    from numpy import ndarray  # noqa
+    from pandas import DataFrame  # noqa
+
+D = TypeVar("D", bound=Data)
+
+
+class DataTable(Sequence[D], Generic[D]):
+    """Results stored as columns, validated as `Data` rows on access.
+
+    Parameters
+    ----------
+    columns : Mapping[str, Any]
+        The values of each field, as arrays of equal length.
+        Arrays are used as they are, without copying.
+    data_type : type[Data]
+        The model of a row. Defaults to `Data`.
+
+    Raises
+    ------
+    ValueError
+        If the columns differ in length, or a required field is missing or
+        has missing values that are not NaN in a numeric column.
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str, Any],
+        data_type: type[D] = Data,  # type: ignore[assignment]
+    ):
+        """Initialize the table."""
+        from numpy import asarray
+
+        self._columns: dict[str, ndarray] = {
+            str(name): asarray(values) for name, values in columns.items()
+        }
+        lengths = {len(values) for values in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length.")
+        self._length = lengths.pop() if lengths else 0
+        self._data_type = data_type
+        self._kinds: dict[str, str] = {}
+        self._required = self._check_required()
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df: "DataFrame",
+        data_type: type[D] = Data,  # type: ignore[assignment]
+        index: bool = False,
+    ) -> "DataTable[D]":
+        """Create a table from a DataFrame, without copying its columns.
+
+        Columns named after an alias in `data_type.__alias_dict__` are renamed
+        to their field.
+
+        Parameters
+        ----------
+        df : DataFrame
+            The data, one row per result.
+        data_type : type[Data]
+            The model of a row.
+        index : bool
+            Include the index of the DataFrame as columns.
+
+        Returns
+        -------
+        DataTable
+            The table.
+        """
+        if index:
+            df = df.reset_index()
+        if df.columns.has_duplicates:
+            raise ValueError("The DataFrame has duplicate column names.")
+        aliases = {
+            alias: field
+            for field, alias in getattr(data_type, "__alias_dict__", {}).items()
+        }
+        return cls(
+            {aliases.get(name, name): df[name].to_numpy() for name in df.columns},
+            data_type,
+        )
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[dict],
+        data_type: type[D] = Data,  # type: ignore[assignment]
+    ) -> "DataTable[D]":
+        """Create a table from a list of dictionaries."""
+        from pandas import DataFrame
+
+        return cls.from_dataframe(DataFrame(list(records)), data_type)
+
+    def _check_required(self) -> set[str]:
+        """Check the columns of the required fields, returning their names."""
+        from numpy import isnat
+        from pandas import isna
+        from pydantic.alias_generators import to_camel
+
+        required: set[str] = set()
+        if not self._length:
+            return required
+        alias_dict = getattr(self._data_type, "__alias_dict__", {})
+        for field_name, field in self._data_type.model_fields.items():
+            if not field.is_required() or NoneType in get_args(field.annotation):
+                continue
+            names = (field_name, alias_dict.get(field_name), field.alias)
+            names += (to_camel(field_name),)
+            name = next((n for n in names if n in self._columns), None)
+            if name is None:
+                raise ValueError(f"The required field '{field_name}' has no column.")
+            values = self._columns[name]
+            kind = values.dtype.kind
+            if kind == "M":
+                missing = int(isnat(values).sum())
+            elif kind == "O":
+                missing = int(isna(values).sum())
+            else:
+                missing = 0
+            if missing:
+                raise ValueError(
+                    f"The required field '{field_name}' has {missing} missing values."
+                )
+            required.add(name)
+        return required
+
+    @property
+    def data_type(self) -> type[D]:
+        """The model of a row."""
+        return self._data_type
+
+    @property
+    def columns(self) -> dict[str, "ndarray"]:
+        """The arrays of the table, by field name."""
+        return dict(self._columns)
+
+    def _kind(self, name: str) -> str:
+        """Return how the values of a column are converted to Python."""
+        kind = self._kinds.get(name)
+        if kind is None:
+            values = self._columns[name]
+            kind = values.dtype.kind
+            # Dates are stored as datetimes at midnight, as in `basemodel_to_df`.
+            if kind == "M" and name == "date":
+                from numpy import isnat
+
+                days = values.astype("datetime64[D]").astype(values.dtype)
+                if not isnat(values).any() and (values == days).all():
+                    kind = "D"
+            self._kinds[name] = kind
+        return kind
+
+    def _value(self, name: str, index: int) -> Any:
+        """Return a value as a Python object, or None if it is missing."""
+        from pandas import NaT, Timestamp
+
+        value = self._columns[name][index]
+        kind = self._kind(name)
+        if kind in "MD":
+            timestamp = Timestamp(value)
+            if timestamp is NaT:
+                return None
+            return timestamp.date() if kind == "D" else timestamp.to_pydatetime()
+        if kind == "O":
+            if value is None or value is NaT:
+                return None
+            if isinstance(value, float) and value != value:
+                return None
+            if isinstance(value, Timestamp):
+                return value.to_pydatetime()
+            return value
+        value = value.item()
+        if isinstance(value, float) and value != value:
+            return None
+        return value
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Return a row as a dictionary, without the missing optional values."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("DataTable index out of range.")
+        row: dict[str, Any] = {}
+        for name in self._columns:
+            value = self._value(name, index)
+            if value is not None:
+                row[name] = value
+            elif name in self._required:
+                # Only NaN of numeric columns is left missing in required fields.
+                row[name] = float("nan")
+        return row
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Return the rows as a list of dictionaries, without validating them."""
+        return [self.row(index) for index in range(self._length)]
+
+    def to_dataframe(self) -> "DataFrame":
+        """Return the table as a DataFrame, without creating its rows.
+
+        A date column of datetimes at midnight is converted to dates,
+        as for a list of `Data`.
+        """
+        from pandas import DataFrame
+
+        df = DataFrame(self._columns, copy=False)
+        if "date" in df.columns and self._kind("date") == "D":
+            df["date"] = df["date"].dt.date
+        return df
+
+    def to_list(self) -> list[D]:
+        """Validate every row, returning a list of `Data`."""
+        return list(self)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> D: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "DataTable[D]": ...
+
+    def __getitem__(self, index):
+        """Return a row as `Data`, or a slice of the table without copying it."""
+        if isinstance(index, slice):
+            return DataTable(
+                {name: values[index] for name, values in self._columns.items()},
+                self._data_type,
+            )
+        return self._data_type.model_validate(self.row(index))
+
+    def __iter__(self) -> Iterator[D]:
+        """Iterate over the rows as `Data`."""
+        for index in range(self._length):
+            yield self._data_type.model_validate(self.row(index))
+
+    def __repr__(self) -> str:
+        """Return a short representation of the table."""
+        return (
+            f"{self.__class__.__name__}[{self._data_type.__name__}]"
+            f"({self._length} rows, columns={list(self._columns)})"
+        )
+
+
+# Tables are serialized as a list of `Data`, e.g. in `OBBject.model_dump()`.
+DataTable.__pydantic_serializer__ = SchemaSerializer(  # type: ignore[attr-defined]
+    core_schema.any_schema(
+        serialization=core_schema.plain_serializer_function_ser_schema(
+            DataTable.to_list
+        )
+    )
+)
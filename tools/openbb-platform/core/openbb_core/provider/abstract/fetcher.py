@@ -13,8 +13,10 @@ from typing import (
 
 from openbb_core.provider.abstract.annotated_result import AnnotatedResult
 from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.abstract.data_table import DataTable
 from openbb_core.provider.abstract.query_params import QueryParams
 from openbb_core.provider.utils.helpers import maybe_coroutine, run_async
+from openbb_core.provider.utils.tracing import span
 
 Q = TypeVar("Q", bound=QueryParams)
 D = TypeVar("D", bound=Data)
@@ -78,11 +80,14 @@ class Fetcher(Generic[Q, R]):
         **kwargs,
     ) -> R | AnnotatedResult[R]:
         """Fetch data from a provider."""
-        query = cls.transform_query(params=params)
-        data = await maybe_coroutine(
-            cls.extract_data, query=query, credentials=credentials, **kwargs
-        )
-        return cls.transform_data(query=query, data=data, **kwargs)
+        with span("transform_query", fetcher=cls.__name__):
+            query = cls.transform_query(params=params)
+        with span("extract_data", fetcher=cls.__name__):
+            data = await maybe_coroutine(
+                cls.extract_data, query=query, credentials=credentials, **kwargs
+            )
+        with span("transform_data", fetcher=cls.__name__):
+            return cls.transform_data(query=query, data=data, **kwargs)
 
     @classproperty
     def query_params_type(self) -> Q:
@@ -193,6 +198,10 @@ class Fetcher(Generic[Q, R]):
 
         assert transformed_data, "Transformed data must not be None."
 
+        if isinstance(transformed_data, DataTable):
+            # The rows of a table are validated on access: validate all of them.
+            transformed_data = transformed_data.to_list()
+
         if isinstance(transformed_data, list):
             return_type_args = cls.return_type.__args__[0]
             return_type_is_dict = (
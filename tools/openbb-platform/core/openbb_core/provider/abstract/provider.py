@@ -1,6 +1,7 @@
 """Provider Abstract Class."""
 
 from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.utils.rate_limiter import RateLimit, register_rate_limit
 
 
 class Provider:
@@ -17,6 +18,7 @@ class Provider:
         repr_name: str | None = None,
         deprecated_credentials: dict[str, str | None] | None = None,
         instructions: str | None = None,
+        rate_limit: RateLimit | None = None,
     ) -> None:
         """Initialize the provider.
 
@@ -38,6 +40,8 @@ class Provider:
             Map of deprecated credentials to its current name, by default None.
         instructions: Optional[str]
             Instructions on how to setup the provider. For example, how to get an API key.
+        rate_limit: Optional[RateLimit]
+            Request limits of the provider API, applied to helper requests to its hosts.
         """
         self.name = name
         self.description = description
@@ -52,3 +56,7 @@ class Provider:
         self.repr_name = repr_name
         self.deprecated_credentials = deprecated_credentials
         self.instructions = instructions
+        self.rate_limit = rate_limit
+        self.rate_limiter = (
+            register_rate_limit(self.name, rate_limit) if rate_limit else None
+        )
@@ -6,6 +6,8 @@ from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.abstract.provider import Provider
 from openbb_core.provider.registry import Registry, RegistryLoader
+from openbb_core.provider.utils.bar_store import HISTORICAL_MODELS, fetch_historical
+from openbb_core.provider.utils.tracing import set_trace_attribute, span
 from pydantic import SecretStr
 
 
@@ -91,7 +93,15 @@ class QueryExecutor:
         """
         provider = self.get_provider(provider_name)
         fetcher = self.get_fetcher(provider, model_name)
-        filtered_credentials = self.filter_credentials(
-            credentials, provider, fetcher.require_credentials
-        )
+        set_trace_attribute("provider", provider.name)
+        set_trace_attribute("model", model_name)
+        with span("filter_credentials"):
+            filtered_credentials = self.filter_credentials(
+                credentials, provider, fetcher.require_credentials
+            )
+        preferences = kwargs.get("preferences") or {}
+        if preferences.get("historical_store") and model_name in HISTORICAL_MODELS:
+            return await fetch_historical(
+                fetcher, provider.name, model_name, params, filtered_credentials, **kwargs
+            )
         return await fetcher.fetch_data(params, filtered_credentials, **kwargs)
@@ -0,0 +1,609 @@
+"""Local store of historical price bars, synced incrementally.
+
+Historical bars do not change once a period has closed, so the results of
+the `*Historical` price models can be kept on disk and reused. The store is
+a SQLite database in WAL mode, partitioned by provider, model, symbol and
+the remaining query parameters, such as the interval and the adjustment.
+
+Each partition records the date ranges it covers. A query is served by
+fetching only the missing ranges through the provider's fetcher, one symbol
+at a time, and then reading the requested range from the store:
+
+    - The current day is never marked as covered, since its bars may still
+      change. It is fetched again by every query that includes it.
+    - A missing range that directly follows a covered range is fetched
+      starting from the last stored bar of that range. If that bar no longer
+      matches, e.g. because a split or a dividend changed the adjusted
+      prices, the partition is dropped and the whole requested range is
+      fetched again. Other missing ranges are fetched as they are.
+
+The store is enabled with the `historical_store` user preference. To reclaim
+space from the command line:
+
+    python -m openbb_core.provider.utils.bar_store compact --max-age-days 90
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import asyncio
+import json
+import pickle  # noqa: S403
+import sqlite3
+import time
+from contextlib import closing
+from datetime import date as dateType, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+# Bumped when the schema changes, so the store is rebuilt.
+STORE_VERSION = 1
+# The standard models served from the store.
+HISTORICAL_MODELS = {
+    "CryptoHistorical",
+    "CurrencyHistorical",
+    "EquityHistorical",
+    "IndexHistorical",
+}
+# Fields compared to detect a change of the stored prices.
+PRICE_FIELDS = ("open", "high", "low", "close")
+# Relative difference between two prices considered a change.
+PRICE_TOLERANCE = 1e-6
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS partitions (
+    id INTEGER PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    UNIQUE (provider, model, symbol, variant)
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    partition_id INTEGER NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    PRIMARY KEY (partition_id, start_date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS bars (
+    partition_id INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    day TEXT NOT NULL,
+    record BLOB NOT NULL,
+    PRIMARY KEY (partition_id, timestamp)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS bars_day ON bars (partition_id, day);
+"""
+
+
+def get_store_path() -> Path:
+    """Return the path to the database, in the user cache directory."""
+    from openbb_core.app.utils import get_user_cache_directory
+
+    path = Path(get_user_cache_directory()) / "caches/bar_store.db"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    return path
+
+
+def _to_date(value: Any) -> dateType | None:
+    """Convert a date, datetime or ISO string to a date."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, dateType):
+        return value
+    return datetime.fromisoformat(str(value)).date()
+
+
+def missing_ranges(
+    covered: list[tuple[dateType, dateType]], start: dateType, end: dateType
+) -> list[tuple[dateType, dateType]]:
+    """Return the parts of a date range not in the covered ranges.
+
+    Parameters
+    ----------
+    covered : list[tuple[date, date]]
+        Covered ranges, inclusive, sorted by their start date.
+    start : date
+        The first date of the range.
+    end : date
+        The last date of the range, inclusive.
+
+    Returns
+    -------
+    list[tuple[date, date]]
+        The missing ranges, inclusive and in chronological order.
+    """
+    gaps: list = []
+    current = start
+    for covered_start, covered_end in covered:
+        if covered_end < current:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > current:
+            gaps.append((current, covered_start - timedelta(days=1)))
+        current = max(current, covered_end + timedelta(days=1))
+        if current > end:
+            return gaps
+    if current <= end:
+        gaps.append((current, end))
+    return gaps
+
+
+def merge_ranges(
+    ranges: list[tuple[dateType, dateType]],
+) -> list[tuple[dateType, dateType]]:
+    """Merge overlapping and adjacent date ranges."""
+    merged: list = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _prices_changed(stored: Any, fetched: Any) -> bool:
+    """Check if the prices of two versions of a bar differ."""
+    for field in PRICE_FIELDS:
+        old = getattr(stored, field, None)
+        new = getattr(fetched, field, None)
+        if old is None or new is None:
+            continue
+        if abs(old - new) > PRICE_TOLERANCE * max(abs(old), abs(new), 1e-12):
+            return True
+    return False
+
+
+class BarStore:
+    """Historical bars stored on disk, with the date ranges they cover.
+
+    Parameters
+    ----------
+    path : Path | None
+        The database file. Defaults to `get_store_path()`.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the store."""
+        self.path = Path(path) if path else get_store_path()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection to the store, creating its schema if needed."""
+        cnx = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        cnx.execute("PRAGMA journal_mode = WAL")
+        cnx.execute("PRAGMA synchronous = NORMAL")
+        if cnx.execute("PRAGMA user_version").fetchone()[0] != STORE_VERSION:
+            cnx.executescript(
+                "DROP TABLE IF EXISTS partitions; DROP TABLE IF EXISTS coverage;"
+                " DROP TABLE IF EXISTS bars;"
+            )
+            cnx.execute(f"PRAGMA user_version = {STORE_VERSION}")
+        cnx.executescript(_SCHEMA)
+        return cnx
+
+    def get_partition(
+        self, provider: str, model: str, symbol: str, variant: str
+    ) -> int:
+        """Return the ID of a partition, creating it if needed."""
+        with closing(self.connect()) as cnx:
+            cnx.execute(
+                "INSERT INTO partitions (provider, model, symbol, variant, last_used)"
+                " VALUES (?, ?, ?, ?, ?) ON CONFLICT (provider, model, symbol, variant)"
+                " DO UPDATE SET last_used = excluded.last_used",
+                (provider, model, symbol, variant, time.time()),
+            )
+            return cnx.execute(
+                "SELECT id FROM partitions"
+                " WHERE provider = ? AND model = ? AND symbol = ? AND variant = ?",
+                (provider, model, symbol, variant),
+            ).fetchone()[0]
+
+    def get_coverage(self, partition_id: int) -> list[tuple[dateType, dateType]]:
+        """Return the date ranges covered by a partition, sorted."""
+        with closing(self.connect()) as cnx:
+            rows = cnx.execute(
+                "SELECT start_date, end_date FROM coverage"
+                " WHERE partition_id = ? ORDER BY start_date",
+                (partition_id,),
+            ).fetchall()
+        return [
+            (dateType.fromisoformat(start), dateType.fromisoformat(end))
+            for start, end in rows
+        ]
+
+    def last_bar_before(self, partition_id: int, day: dateType) -> Any:
+        """Return the last stored bar of a partition before a date."""
+        with closing(self.connect()) as cnx:
+            row = cnx.execute(
+                "SELECT record FROM bars WHERE partition_id = ? AND day < ?"
+                " ORDER BY timestamp DESC LIMIT 1",
+                (partition_id, day.isoformat()),
+            ).fetchone()
+        return pickle.loads(row[0]) if row else None  # noqa: S301
+
+    def write(
+        self,
+        partition_id: int,
+        bars: list,
+        covered: tuple[dateType, dateType] | None = None,
+    ) -> None:
+        """Write bars to a partition and extend its coverage, atomically.
+
+        Parameters
+        ----------
+        partition_id : int
+            The partition.
+        bars : list
+            The bars, `Data` objects with a `date` field.
+        covered : tuple[date, date] | None
+            The date range, inclusive, now completely stored.
+        """
+        with closing(self.connect()) as cnx:
+            cnx.execute("BEGIN IMMEDIATE")
+            try:
+                cnx.executemany(
+                    "INSERT OR REPLACE INTO bars"
+                    " (partition_id, timestamp, day, record) VALUES (?, ?, ?, ?)",
+                    [
+                        (
+                            partition_id,
+                            str(bar.date.isoformat()),
+                            _to_date(bar.date).isoformat(),  # type: ignore
+                            pickle.dumps(bar, protocol=5),
+                        )
+                        for bar in bars
+                    ],
+                )
+                if covered:
+                    ranges = [
+                        (dateType.fromisoformat(start), dateType.fromisoformat(end))
+                        for start, end in cnx.execute(
+                            "SELECT start_date, end_date FROM coverage"
+                            " WHERE partition_id = ?",
+                            (partition_id,),
+                        )
+                    ]
+                    cnx.execute(
+                        "DELETE FROM coverage WHERE partition_id = ?", (partition_id,)
+                    )
+                    cnx.executemany(
+                        "INSERT INTO coverage (partition_id, start_date, end_date)"
+                        " VALUES (?, ?, ?)",
+                        [
+                            (partition_id, start.isoformat(), end.isoformat())
+                            for start, end in merge_ranges([*ranges, covered])
+                        ],
+                    )
+                cnx.execute("COMMIT")
+            except BaseException:
+                cnx.execute("ROLLBACK")
+                raise
+
+    def read(self, partition_id: int, start: dateType, end: dateType) -> list:
+        """Read the bars of a partition in a date range, in chronological order."""
+        with closing(self.connect()) as cnx:
+            rows = cnx.execute(
+                "SELECT record FROM bars WHERE partition_id = ?"
+                " AND day BETWEEN ? AND ? ORDER BY timestamp",
+                (partition_id, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return [pickle.loads(row[0]) for row in rows]  # noqa: S301
+
+    def clear(self, partition_id: int) -> None:
+        """Drop the bars and coverage of a partition."""
+        with closing(self.connect()) as cnx:
+            cnx.execute("BEGIN IMMEDIATE")
+            try:
+                cnx.execute("DELETE FROM bars WHERE partition_id = ?", (partition_id,))
+                cnx.execute(
+                    "DELETE FROM coverage WHERE partition_id = ?", (partition_id,)
+                )
+                cnx.execute("COMMIT")
+            except BaseException:
+                cnx.execute("ROLLBACK")
+                raise
+
+    def invalidate(
+        self,
+        provider: str | None = None,
+        symbol: str | None = None,
+        model: str | None = None,
+    ) -> int:
+        """Drop the partitions matching a provider, symbol and model.
+
+        Use it after a corporate action, to force the adjusted history of a
+        symbol to be downloaded again. Returns the number of partitions dropped.
+        """
+        conditions, params = [], []
+        for column, value in (
+            ("provider", provider),
+            ("symbol", symbol),
+            ("model", model),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with closing(self.connect()) as cnx:
+            ids = [
+                row[0]
+                for row in cnx.execute(
+                    f"SELECT id FROM partitions{where}", params  # noqa: S608
+                )
+            ]
+            self._drop_partitions(cnx, ids)
+        return len(ids)
+
+    @staticmethod
+    def _drop_partitions(cnx: sqlite3.Connection, ids: list[int]) -> None:
+        """Delete partitions and their data."""
+        cnx.execute("BEGIN IMMEDIATE")
+        try:
+            for table, column in (
+                ("bars", "partition_id"),
+                ("coverage", "partition_id"),
+                ("partitions", "id"),
+            ):
+                cnx.executemany(
+                    f"DELETE FROM {table} WHERE {column} = ?",  # noqa: S608
+                    [(i,) for i in ids],
+                )
+            cnx.execute("COMMIT")
+        except BaseException:
+            cnx.execute("ROLLBACK")
+            raise
+
+    def compact(self, max_age_days: float | None = None) -> dict[str, int]:
+        """Compact the store.
+
+        Drops the partitions not used in `max_age_days`, if given, merges the
+        coverage of each partition, removes bars of deleted partitions and
+        rebuilds the database file.
+
+        Returns
+        -------
+        dict[str, int]
+            The number of partitions dropped, and the file size before and after.
+        """
+        size_before = self.path.stat().st_size if self.path.exists() else 0
+        with closing(self.connect()) as cnx:
+            dropped: list[int] = []
+            if max_age_days is not None:
+                dropped = [
+                    row[0]
+                    for row in cnx.execute(
+                        "SELECT id FROM partitions WHERE last_used < ?",
+                        (time.time() - max_age_days * 86400,),
+                    )
+                ]
+                self._drop_partitions(cnx, dropped)
+
+            cnx.execute("BEGIN IMMEDIATE")
+            try:
+                cnx.execute(
+                    "DELETE FROM bars WHERE partition_id NOT IN"
+                    " (SELECT id FROM partitions)"
+                )
+                rows = cnx.execute(
+                    "SELECT partition_id, start_date, end_date FROM coverage"
+                ).fetchall()
+                coverage: dict[int, list] = {}
+                for partition_id, start, end in rows:
+                    coverage.setdefault(partition_id, []).append(
+                        (dateType.fromisoformat(start), dateType.fromisoformat(end))
+                    )
+                cnx.execute("DELETE FROM coverage")
+                cnx.executemany(
+                    "INSERT INTO coverage (partition_id, start_date, end_date)"
+                    " VALUES (?, ?, ?)",
+                    [
+                        (partition_id, start.isoformat(), end.isoformat())
+                        for partition_id, ranges in coverage.items()
+                        for start, end in merge_ranges(ranges)
+                    ],
+                )
+                cnx.execute("COMMIT")
+            except BaseException:
+                cnx.execute("ROLLBACK")
+                raise
+
+            cnx.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            cnx.execute("VACUUM")
+            cnx.execute("PRAGMA optimize")
+
+        return {
+            "partitions_dropped": len(dropped),
+            "size_before": size_before,
+            "size_after": self.path.stat().st_size,
+        }
+
+
+def _variant(params: dict[str, Any]) -> str:
+    """Identify the parameters of a query that change its bars."""
+    return json.dumps(
+        {
+            key: value
+            for key, value in params.items()
+            if key not in ("symbol", "start_date", "end_date") and value is not None
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+async def fetch_historical(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    fetcher: Any,
+    provider: str,
+    model: str,
+    params: dict[str, Any],
+    credentials: dict[str, str] | None = None,
+    store: BarStore | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Fetch historical bars, serving the stored date ranges from the store.
+
+    Parameters
+    ----------
+    fetcher : type[Fetcher]
+        The provider's fetcher of the model.
+    provider : str
+        The provider name.
+    model : str
+        The model name, one of `HISTORICAL_MODELS`.
+    params : dict[str, Any]
+        The query parameters.
+    credentials : dict[str, str] | None
+        The provider credentials.
+    store : BarStore | None
+        The store. Defaults to the one in the user cache directory.
+    **kwargs : Any
+        Passed to the fetcher.
+
+    Returns
+    -------
+    list[Data]
+        The bars of the requested range, sorted by date, and symbol if several.
+        When the query has no start or end date, it is sent to the fetcher as is.
+    """
+    from openbb_core.provider.abstract.annotated_result import AnnotatedResult
+    from openbb_core.provider.utils.errors import EmptyDataError
+
+    query = fetcher.transform_query(dict(params))
+    start_date = _to_date(getattr(query, "start_date", None))
+    end_date = _to_date(getattr(query, "end_date", None))
+    if start_date is None or end_date is None or start_date > end_date:
+        return await fetcher.fetch_data(params, credentials, **kwargs)
+
+    store = store or BarStore()
+    variant = _variant(params)
+    symbols = [s.strip() for s in str(params["symbol"]).split(",") if s.strip()]
+    # The bars of the current day may still change.
+    last_final_day = dateType.today() - timedelta(days=1)
+
+    async def fetch_range(symbol: str, start: dateType, end: dateType) -> list:
+        """Fetch the bars of a symbol in a date range."""
+        try:
+            result = await fetcher.fetch_data(
+                {**params, "symbol": symbol, "start_date": start, "end_date": end},
+                credentials,
+                **kwargs,
+            )
+        except EmptyDataError:
+            return []
+        if isinstance(result, AnnotatedResult):
+            result = result.result
+        return [bar for bar in result or [] if getattr(bar, "date", None)]
+
+    def covered(start: dateType, end: dateType) -> tuple | None:
+        """Return the part of a fetched range that is final."""
+        end = min(end, last_final_day)
+        return (start, end) if start <= end else None
+
+    async def sync(symbol: str) -> list:
+        """Fetch the missing ranges of a symbol and read the requested range."""
+        partition_id = await asyncio.to_thread(
+            store.get_partition, provider, model, symbol, variant
+        )
+        coverage = await asyncio.to_thread(store.get_coverage, partition_id)
+        gaps = missing_ranges(coverage, start_date, end_date)  # type: ignore
+        # Anchor a gap at the last stored bar only when it extends a covered
+        # range, not at a bar stored before an older, unrelated range.
+        covered_starts = {end: start for start, end in coverage}
+        anchors: list = []
+        for start, _ in gaps:
+            anchor = None
+            previous_start = covered_starts.get(start - timedelta(days=1))
+            if previous_start is not None:
+                anchor = await asyncio.to_thread(
+                    store.last_bar_before, partition_id, start
+                )
+                anchor_day = _to_date(anchor.date) if anchor is not None else None
+                if anchor_day is None or anchor_day < previous_start:
+                    anchor = None
+            anchors.append(anchor)
+        fetched = await asyncio.gather(
+            *[
+                fetch_range(
+                    symbol, _to_date(anchor.date) if anchor else start, end  # type: ignore
+                )
+                for (start, end), anchor in zip(gaps, anchors)
+            ]
+        )
+
+        changed = False
+        for anchor, bars in zip(anchors, fetched):
+            if anchor is None:
+                continue
+            match = next((bar for bar in bars if bar.date == anchor.date), None)
+            if match is not None and _prices_changed(anchor, match):
+                changed = True
+                break
+
+        if changed:
+            # The stored history was adjusted since it was downloaded.
+            await asyncio.to_thread(store.clear, partition_id)
+            bars = await fetch_range(symbol, start_date, end_date)  # type: ignore
+            await asyncio.to_thread(
+                store.write, partition_id, bars, covered(start_date, end_date)  # type: ignore
+            )
+        else:
+            for (start, end), bars in zip(gaps, fetched):
+                await asyncio.to_thread(
+                    store.write, partition_id, bars, covered(start, end)
+                )
+
+        return await asyncio.to_thread(store.read, partition_id, start_date, end_date)  # type: ignore
+
+    results = await asyncio.gather(*[sync(symbol) for symbol in symbols])
+
+    if len(symbols) > 1:
+        for symbol, bars in zip(symbols, results):
+            for bar in bars:
+                if getattr(bar, "symbol", None) is None:
+                    bar.symbol = symbol
+    data = [bar for bars in results for bar in bars]
+    if not data:
+        raise EmptyDataError(f"No data found for {', '.join(symbols)}.")
+
+    return sorted(
+        data,
+        key=lambda bar: (
+            (str(bar.date), bar.symbol) if len(symbols) > 1 else str(bar.date)
+        ),
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage the historical bar store.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compact_parser = commands.add_parser("compact", help="Compact the store.")
+    compact_parser.add_argument(
+        "--max-age-days",
+        type=float,
+        default=None,
+        help="Drop the partitions not used for this many days.",
+    )
+    invalidate_parser = commands.add_parser(
+        "invalidate", help="Drop stored histories."
+    )
+    invalidate_parser.add_argument("--provider", default=None)
+    invalidate_parser.add_argument("--symbol", default=None)
+    invalidate_parser.add_argument("--model", default=None)
+    args = parser.parse_args()
+
+    _store = BarStore()
+    if args.command == "compact":
+        print(_store.compact(args.max_age_days))  # noqa: T201
+    else:
+        print(  # noqa: T201
+            f"{_store.invalidate(args.provider, args.symbol, args.model)}"
+            " partitions dropped."
+        )
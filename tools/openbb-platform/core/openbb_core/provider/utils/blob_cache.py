@@ -0,0 +1,469 @@
+"""Content-addressed cache of downloaded documents.
+
+Documents such as PDF filings, bulletins and archives are streamed to disk
+as they are downloaded, instead of being read into memory. Each file is
+stored once, named after the SHA-256 digest of its content, and an index
+maps the URL it was downloaded from to its digest and to the validators
+returned by the server, i.e. the `ETag` and `Last-Modified` headers.
+
+A document already in the cache is revalidated with a conditional request.
+When the server answers `304 Not Modified`, the stored file is used and
+nothing is downloaded again. Documents that never change, such as EDGAR
+archives, can be served without any request.
+
+Stored documents are served by the REST API at `/blobs/{sha256}`, with
+support for range requests.
+
+    blobs = await fetch_blobs(urls)
+    for blob in blobs:
+        with blob.open() as f:
+            ...
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any
+
+# Bumped when the schema of the index changes, so it is rebuilt.
+STORE_VERSION = 1
+# Bytes read from a response, or a file, at once.
+CHUNK_SIZE = 1 << 16
+# Maximum number of documents downloaded at once by `fetch_blobs`.
+MAX_CONCURRENCY = 8
+# Seconds to wait for the next chunk of a response.
+READ_TIMEOUT = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    url TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    content_type TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS blobs_sha256 ON blobs (sha256);
+"""
+
+_COLUMNS = (
+    "url",
+    "sha256",
+    "size",
+    "content_type",
+    "etag",
+    "last_modified",
+    "fetched_at",
+)
+
+
+def get_blob_cache_path() -> Path:
+    """Get the directory of the blob cache.
+
+    Defaults to `blobs` in the user cache directory, and can be overridden
+    with the `OPENBB_BLOB_CACHE_PATH` environment variable.
+    """
+    if path := os.environ.get("OPENBB_BLOB_CACHE_PATH"):
+        return Path(path)
+
+    from openbb_core.app.utils import get_user_cache_directory
+
+    return Path(get_user_cache_directory()) / "blobs"
+
+
+class Blob:
+    """A document stored in the blob cache.
+
+    Attributes
+    ----------
+    url : str
+        The URL the document was downloaded from.
+    sha256 : str
+        The SHA-256 digest of the content, as a hexadecimal string.
+    size : int
+        The size of the content, in bytes.
+    content_type : str | None
+        The `Content-Type` header returned by the server.
+    path : Path
+        The file holding the content.
+    """
+
+    __slots__ = (
+        "url",
+        "sha256",
+        "size",
+        "content_type",
+        "etag",
+        "last_modified",
+        "fetched_at",
+        "path",
+    )
+
+    def __init__(self, path: Path, **entry: Any):
+        """Initialize the blob from its index entry."""
+        self.path = path
+        for name in _COLUMNS:
+            setattr(self, name, entry.get(name))
+
+    @property
+    def filename(self) -> str:
+        """The last segment of the URL path."""
+        return self.url.split("?", 1)[0].rstrip("/").split("/")[-1]
+
+    @property
+    def media_type(self) -> str | None:
+        """The media type of the content, without its parameters."""
+        if not self.content_type:
+            return None
+        return self.content_type.split(";", 1)[0].strip().lower()
+
+    @property
+    def charset(self) -> str | None:
+        """The charset parameter of the `Content-Type` header, if any."""
+        for parameter in (self.content_type or "").split(";")[1:]:
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() == "charset":
+                return value.strip().strip('"') or None
+        return None
+
+    def open(self) -> IO[bytes]:
+        """Open the content for reading, in binary mode."""
+        return self.path.open("rb")
+
+    def read_bytes(self) -> bytes:
+        """Read the whole content."""
+        return self.path.read_bytes()
+
+    def read_text(self, encoding: str | None = None, errors: str = "replace") -> str:
+        """Read the whole content as text.
+
+        Parameters
+        ----------
+        encoding : str | None
+            The encoding of the content. Defaults to the charset returned by
+            the server, or UTF-8.
+        errors : str
+            How decoding errors are handled, as in `bytes.decode`.
+        """
+        return self.read_bytes().decode(encoding or self.charset or "utf-8", errors)
+
+    def to_base64(self) -> str:
+        """Encode the content as a Base64 string, reading the file in chunks."""
+        import base64
+
+        # A multiple of 3 bytes encodes without padding, so chunks can be joined.
+        chunk_size = CHUNK_SIZE * 3
+        parts: list[str] = []
+        with self.open() as f:
+            while chunk := f.read(chunk_size):
+                parts.append(base64.b64encode(chunk).decode("ascii"))
+        return "".join(parts)
+
+    def __repr__(self) -> str:
+        """Return a short representation of the blob."""
+        return f"Blob(url={self.url!r}, sha256={self.sha256!r}, size={self.size})"
+
+
+class BlobCache:
+    """Downloaded documents, stored on disk by content digest and indexed by URL.
+
+    The index is a SQLite database in WAL mode, shared by every process
+    using the same directory. Files are written to a temporary name and
+    renamed once complete, so a partial download is never served.
+
+    Parameters
+    ----------
+    path : Path | None
+        The directory of the cache. Defaults to `get_blob_cache_path()`.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the cache."""
+        self.path = Path(path) if path else get_blob_cache_path()
+        self.objects = self.path / "objects"
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """Create the directories and the index if they don't exist."""
+        (self.path / "tmp").mkdir(parents=True, exist_ok=True)
+        self.objects.mkdir(parents=True, exist_ok=True)
+        conn = self._conn
+        conn.execute("PRAGMA journal_mode = WAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != STORE_VERSION:
+            conn.execute("DROP TABLE IF EXISTS blobs")
+            conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+        conn.executescript(_SCHEMA)
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Return a connection owned by the current thread and process."""
+        # Connections must not cross a fork, so reconnect in child processes.
+        if self._pid != os.getpid():
+            self._local = threading.local()
+            self._inflight = {}
+            self._pid = os.getpid()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path / "index.db",
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def object_path(self, sha256: str) -> Path:
+        """Return the path of the file holding a digest."""
+        return self.objects / sha256[:2] / sha256[2:]
+
+    def _blob(self, row: tuple | None) -> Blob | None:
+        """Return the blob of an index row, if its file still exists."""
+        if row is None:
+            return None
+        entry = dict(zip(_COLUMNS, row))
+        path = self.object_path(entry["sha256"])
+        return Blob(path, **entry) if path.exists() else None
+
+    def get(self, url: str) -> Blob | None:
+        """Return the stored document of a URL, without any request."""
+        row = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM blobs WHERE url = ?",  # noqa: S608
+            (url,),
+        ).fetchone()
+        return self._blob(row)
+
+    def get_by_digest(self, sha256: str) -> Blob | None:
+        """Return a stored document by the digest of its content."""
+        if len(sha256) != 64 or not all(c in "0123456789abcdef" for c in sha256):
+            return None
+        row = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM blobs"  # noqa: S608
+            " WHERE sha256 = ? ORDER BY fetched_at DESC LIMIT 1",
+            (sha256,),
+        ).fetchone()
+        return self._blob(row)
+
+    def _touch(self, url: str) -> None:
+        """Record that a stored document was revalidated."""
+        self._conn.execute(
+            "UPDATE blobs SET fetched_at = ? WHERE url = ?", (time.time(), url)
+        )
+
+    def _store(self, url: str, temp: Path, sha256: str, size: int, headers) -> Blob:
+        """Move a downloaded file into the cache, and index it under its URL."""
+        path = self.object_path(sha256)
+        if path.exists():
+            temp.unlink(missing_ok=True)
+        else:
+            path.parent.mkdir(exist_ok=True)
+            os.replace(temp, path)
+        entry = {
+            "url": url,
+            "sha256": sha256,
+            "size": size,
+            "content_type": headers.get("Content-Type"),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        }
+        self._conn.execute(
+            f"INSERT INTO blobs ({', '.join(_COLUMNS)})"  # noqa: S608
+            f" VALUES ({', '.join('?' for _ in _COLUMNS)})"
+            " ON CONFLICT (url) DO UPDATE SET "
+            + ", ".join(f"{name} = excluded.{name}" for name in _COLUMNS[1:]),
+            tuple(entry.values()),
+        )
+        return Blob(path, **entry)
+
+    async def fetch(
+        self,
+        url: str,
+        max_age: float | None = 0,
+        use_cache: bool = True,
+        **kwargs: Any,
+    ) -> Blob:
+        """Get a document, downloading it only if it is missing or has changed.
+
+        Concurrent calls for the same URL share one download.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the document.
+        max_age : float | None
+            Seconds a stored document is used without revalidating it.
+            By default, it is revalidated on every call. When None, a stored
+            document is always used, for URLs whose content never changes.
+        use_cache : bool
+            When False, the document is downloaded again, and replaces the
+            stored one.
+        **kwargs : Any
+            Passed to `amake_request`, e.g. `headers`, `session` or `timeout`.
+
+        Returns
+        -------
+        Blob
+            The stored document.
+
+        Raises
+        ------
+        aiohttp.ClientResponseError
+            If the server answers with an error status.
+        """
+        stored = self.get(url) if use_cache else None
+        if stored is not None and (
+            max_age is None or time.time() - stored.fetched_at < max_age
+        ):
+            return stored
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), url)
+        task = self._inflight.get(key)
+        if task is None:
+            task = loop.create_task(self._download(url, stored, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _download(self, url: str, stored: Blob | None, **kwargs: Any) -> Blob:
+        """Request a document, conditionally if it is stored, streaming it to disk."""
+        import hashlib
+        import tempfile
+
+        from aiohttp import ClientTimeout
+        from openbb_core.provider.utils.helpers import amake_request
+
+        # Large documents take longer than a request timeout to download,
+        # so the timeout applies to each read instead of the whole body.
+        kwargs.setdefault(
+            "timeout", ClientTimeout(sock_connect=10, sock_read=READ_TIMEOUT)
+        )
+        headers = dict(kwargs.pop("headers", None) or {})
+        if stored is not None:
+            if stored.etag:
+                headers["If-None-Match"] = stored.etag
+            if stored.last_modified:
+                headers["If-Modified-Since"] = stored.last_modified
+
+        async def callback(response, _):
+            """Write the body to a temporary file while hashing it."""
+            if response.status == 304 and stored is not None:
+                response.release()
+                self._touch(url)
+                return stored
+            response.raise_for_status()
+            digest = hashlib.sha256()
+            size = 0
+            fd, name = tempfile.mkstemp(dir=self.path / "tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                        digest.update(chunk)
+                        f.write(chunk)
+                        size += len(chunk)
+                return self._store(
+                    url, Path(name), digest.hexdigest(), size, response.headers
+                )
+            except BaseException:
+                Path(name).unlink(missing_ok=True)
+                raise
+
+        return await amake_request(  # type: ignore[return-value]
+            url, headers=headers, response_callback=callback, **kwargs
+        )
+
+    def prune(self) -> int:
+        """Remove stored files no longer indexed under any URL.
+
+        Returns
+        -------
+        int
+            The number of files removed.
+        """
+        digests = {
+            row[0] for row in self._conn.execute("SELECT DISTINCT sha256 FROM blobs")
+        }
+        removed = 0
+        for path in self.objects.glob("*/*"):
+            if path.parent.name + path.name not in digests:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+_cache: BlobCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_blob_cache() -> BlobCache:
+    """Return the blob cache of the process."""
+    global _cache  # noqa: PLW0603  # pylint: disable=global-statement
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = BlobCache()
+        return _cache
+
+
+async def fetch_blob(url: str, **kwargs: Any) -> Blob:
+    """Get a document through the blob cache. See `BlobCache.fetch`."""
+    return await get_blob_cache().fetch(url, **kwargs)
+
+
+async def fetch_blobs(
+    urls: list[str],
+    max_concurrency: int = MAX_CONCURRENCY,
+    return_exceptions: bool = False,
+    **kwargs: Any,
+) -> list[Blob | BaseException]:
+    """Get several documents through the blob cache, concurrently, over one session.
+
+    Parameters
+    ----------
+    urls : list[str]
+        The URLs of the documents.
+    max_concurrency : int
+        The maximum number of documents requested at once. Requests are also
+        throttled by the rate limit registered for their host.
+    return_exceptions : bool
+        Return the exception raised for a document in its place, instead of
+        raising the first one.
+    **kwargs : Any
+        Passed to `BlobCache.fetch`. A `session` keyword is used instead of
+        opening a new session, and is left open.
+
+    Returns
+    -------
+    list[Blob | BaseException]
+        The documents, in the order of `urls`.
+    """
+    from openbb_core.provider.utils.helpers import get_async_requests_session
+
+    cache = get_blob_cache()
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    owns_session = "session" not in kwargs
+    session = kwargs.pop("session", None) or await get_async_requests_session()
+
+    async def fetch(url: str) -> Blob:
+        """Fetch one document."""
+        async with semaphore:
+            return await cache.fetch(url, session=session, **kwargs)
+
+    try:
+        return await asyncio.gather(
+            *[fetch(url) for url in urls], return_exceptions=return_exceptions
+        )
+    finally:
+        if owns_session:
+            await session.close()
@@ -22,6 +22,11 @@ from openbb_core.provider.utils.client import (
     get_user_agent,
 )
 from openbb_core.provider.utils.errors import UnauthorizedError
+from openbb_core.provider.utils.rate_limiter import (
+    THROTTLE_STATUS_CODES,
+    RateLimiter,
+    get_rate_limiter_for_url,
+)
 from typing_extensions import ParamSpec
 
 if TYPE_CHECKING:
@@ -363,6 +368,9 @@ async def amake_request(
         Async callback with response and session as arguments that returns the json, by default None
     session : ClientSession, optional
         Custom session to use for requests, by default None
+    rate_limiter : RateLimiter | bool, optional
+        Limiter to throttle the request with, by default the one registered for the URL host.
+        Pass False to bypass rate limiting.
 
 
     Returns
@@ -374,6 +382,7 @@ async def amake_request(
         raise ValueError("Method must be GET or POST")
 
     kwargs["timeout"] = kwargs.pop("preferences", {}).get("request_timeout", timeout)
+    limiter = _resolve_rate_limiter(url, kwargs.pop("rate_limiter", None))
 
     response_callback = response_callback or (
         lambda r, _: asyncio.ensure_future(r.json())
@@ -383,13 +392,55 @@ async def amake_request(
     session = kwargs.pop("session", await get_async_requests_session(**kwargs))
 
     try:
-        response = await session.request(method, url, **kwargs)
-        return await response_callback(response, session)
+        if limiter is None:
+            response = await session.request(method, url, **kwargs)
+            return await response_callback(response, session)
+
+        from aiohttp import (  # pylint: disable=import-outside-toplevel
+            ClientResponseError,
+        )
+
+        attempt = 0
+        while True:
+            async with limiter:
+                try:
+                    response = await session.request(method, url, **kwargs)
+                except ClientResponseError as e:
+                    # Raised by sessions created with `raise_for_status`.
+                    if (
+                        e.status not in THROTTLE_STATUS_CODES
+                        or attempt >= limiter.limit.max_retries
+                    ):
+                        raise
+                    limiter.on_response(
+                        e.status, (e.headers or {}).get("Retry-After"), attempt
+                    )
+                else:
+                    throttled = limiter.on_response(
+                        response.status, response.headers.get("Retry-After"), attempt
+                    )
+                    if throttled is None or attempt >= limiter.limit.max_retries:
+                        return await response_callback(response, session)
+                    response.release()
+            # The limiter holds back the retry until the backoff has elapsed.
+            attempt += 1
+            limiter.record_retry()
     finally:
         if not with_session:
             await session.close()
 
 
+def _resolve_rate_limiter(
+    url: str, rate_limiter: RateLimiter | bool | None
+) -> RateLimiter | None:
+    """Get the limiter for a request, by default the one registered for the URL host."""
+    if rate_limiter is False:
+        return None
+    if isinstance(rate_limiter, RateLimiter):
+        return rate_limiter
+    return get_rate_limiter_for_url(url)
+
+
 async def amake_requests(
     urls: str | list[str],
     response_callback: (
@@ -519,6 +570,10 @@ def make_request(
     timeout : int, optional
         Timeout in seconds, by default 10.  Can be overwritten by user setting, request_timeout
 
+    rate_limiter : RateLimiter | bool, optional
+        Limiter to throttle the request with, by default the one registered for the URL host.
+        Pass False to bypass rate limiting.
+
     Returns
     -------
     Response
@@ -529,6 +584,9 @@ def make_request(
     ValueError
         If invalid method is passed
     """
+    if method.upper() not in ["GET", "POST"]:
+        raise ValueError("Method must be GET or POST")
+
     # We want to add a user agent to the request, so check if there are any headers
     # If there are headers, check if there is a user agent, if not add one.
     # Some requests seem to work only with a specific user agent, so we want to be able to override it.
@@ -545,24 +603,30 @@ def make_request(
     if "User-Agent" not in headers:
         headers["User-Agent"] = get_user_agent()
 
+    limiter = _resolve_rate_limiter(url, kwargs.pop("rate_limiter", None))
     # Allow a custom session for caching, if desired
     _session = kwargs.pop("session", get_requests_session(**kwargs))
+    send = _session.get if method.upper() == "GET" else _session.post
 
-    if method.upper() == "GET":
-        return _session.get(
-            url,
-            headers=headers,
-            timeout=timeout,
-            **kwargs,
-        )
-    if method.upper() == "POST":
-        return _session.post(
-            url,
-            headers=headers,
-            timeout=timeout,
-            **kwargs,
+    if limiter is None:
+        return send(url, headers=headers, timeout=timeout, **kwargs)
+
+    attempt = 0
+    while True:
+        limiter.acquire_sync()
+        try:
+            response = send(url, headers=headers, timeout=timeout, **kwargs)
+        finally:
+            limiter.release_sync()
+        throttled = limiter.on_response(
+            response.status_code, response.headers.get("Retry-After"), attempt
         )
-    raise ValueError("Method must be GET or POST")
+        if throttled is None or attempt >= limiter.limit.max_retries:
+            return response
+        response.close()
+        # The limiter holds back the retry until the backoff has elapsed.
+        attempt += 1
+        limiter.record_retry()
 
 
 def to_snake_case(string: str) -> str:
@@ -0,0 +1,240 @@
+"""Chunked, concurrent downloads of historical bars.
+
+Most APIs limit the date range of a single intraday request, e.g. a few days
+of one-minute bars. A long history is downloaded by splitting the range of
+each symbol into windows no longer than the provider allows, and requesting
+the windows concurrently over one shared session, within the provider's
+rate limit.
+
+The bars of each window are appended to a `BarBuffer` as soon as they
+arrive. Bars returned by two windows, e.g. when an API includes both ends
+of a range, are only kept once.
+
+A provider declares its maximum window for each interval, and a function
+that requests one window of one symbol:
+
+    WINDOWS = {"1m": 5, "1h": 180, "1d": None}
+
+    async def fetch_window(symbol, start, end, session) -> list[dict]:
+        ...
+
+    bars = await download_history(
+        symbols, start_date, end_date, fetch_window, WINDOWS.get(interval)
+    )
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import date as dateType, datetime, timedelta
+from typing import Any
+
+MAX_CONCURRENCY = 8
+
+FetchWindow = Callable[[str, dateType | None, dateType | None, Any], Awaitable[list]]
+
+
+def split_date_range(
+    start_date: dateType | None,
+    end_date: dateType | None,
+    window: int | timedelta | None = None,
+) -> list[tuple[dateType | None, dateType | None]]:
+    """Split a date range into consecutive windows.
+
+    Parameters
+    ----------
+    start_date : date | None
+        The first date of the range.
+    end_date : date | None
+        The last date of the range, inclusive.
+    window : int | timedelta | None
+        The maximum number of days in a window, including both ends.
+        When None, or either end of the range is open, the range is not split.
+
+    Returns
+    -------
+    list[tuple[date | None, date | None]]
+        The start and end dates of each window, in chronological order.
+        The windows do not overlap.
+    """
+    if isinstance(start_date, datetime):
+        start_date = start_date.date()
+    if isinstance(end_date, datetime):
+        end_date = end_date.date()
+    if isinstance(window, timedelta):
+        window = window.days
+    if not window or start_date is None or end_date is None:
+        return [(start_date, end_date)]
+    if window < 1:
+        raise ValueError("The window must be at least one day.")
+    if start_date > end_date:
+        return [(start_date, end_date)]
+
+    step = timedelta(days=window)
+    windows: list = []
+    current = start_date
+    while current <= end_date:
+        last = min(current + step - timedelta(days=1), end_date)
+        windows.append((current, last))
+        current = last + timedelta(days=1)
+
+    return windows
+
+
+class BarBuffer:
+    """Bars of one or more symbols, stored as one list per column.
+
+    Each bar is identified by its symbol and its `key` field, usually the
+    date. Bars already in the buffer are ignored when appended again.
+    """
+
+    def __init__(self, key: str = "date", symbol_field: str = "symbol"):
+        """Initialize an empty buffer."""
+        self.key = key
+        self.symbol_field = symbol_field
+        self.columns: dict[str, list] = {}
+        self.counts: dict[str, int] = {}
+        self._pools: dict[str, dict] = {}
+        self._seen: set = set()
+        self._length = 0
+
+    def append(self, symbol: str, bar: dict) -> bool:
+        """Append a bar of a symbol, unless it is already in the buffer.
+
+        Returns
+        -------
+        bool
+            True if the bar was appended.
+        """
+        identity = (symbol, bar.get(self.key))
+        if identity in self._seen:
+            return False
+        self._seen.add(identity)
+
+        row = {**bar, self.symbol_field: symbol}
+        for field in row.keys() - self.columns.keys():
+            self.columns[field] = [None] * self._length
+            self._pools[field] = {}
+        for field, column in self.columns.items():
+            value = row.get(field)
+            if isinstance(value, str):
+                value = self._pools[field].setdefault(value, value)
+            column.append(value)
+        self._length += 1
+        self.counts[symbol] = self.counts.get(symbol, 0) + 1
+
+        return True
+
+    def extend(self, symbol: str, bars: list[dict]) -> int:
+        """Append the bars of a symbol, returning the number appended."""
+        return sum(self.append(symbol, bar) for bar in bars)
+
+    def row(self, index: int) -> dict:
+        """Return a bar as a dictionary, without its missing values."""
+        return {
+            field: column[index]
+            for field, column in self.columns.items()
+            if column[index] is not None
+        }
+
+    def to_records(self, sort: bool = False) -> list[dict]:
+        """Return the bars as a list of dictionaries.
+
+        Parameters
+        ----------
+        sort : bool
+            Sort the bars by symbol and key. Otherwise, they are in the order
+            they were received.
+        """
+        indexes: Any = range(self._length)
+        if sort and self._length:
+            symbols = self.columns[self.symbol_field]
+            keys = self.columns.get(self.key, [None] * self._length)
+            indexes = sorted(indexes, key=lambda i: (symbols[i], str(keys[i])))
+        return [self.row(i) for i in indexes]
+
+    def __len__(self) -> int:
+        """Return the number of bars."""
+        return self._length
+
+    def __iter__(self) -> Iterator[dict]:
+        """Iterate over the bars as dictionaries."""
+        for index in range(self._length):
+            yield self.row(index)
+
+
+async def download_history(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    symbols: list[str],
+    start_date: dateType | None,
+    end_date: dateType | None,
+    fetch_window: FetchWindow,
+    window: int | timedelta | None = None,
+    max_concurrency: int = MAX_CONCURRENCY,
+    key: str = "date",
+    buffer: BarBuffer | None = None,
+    **kwargs: Any,
+) -> BarBuffer:
+    """Download the bars of several symbols, in windows, concurrently.
+
+    Parameters
+    ----------
+    symbols : list[str]
+        The symbols to download.
+    start_date : date | None
+        The first date to download.
+    end_date : date | None
+        The last date to download, inclusive.
+    fetch_window : Callable
+        Async function `(symbol, start_date, end_date, session)` returning
+        the bars of a symbol in a window, as a list of dictionaries.
+        It should return an empty list when there is no data.
+    window : int | timedelta | None
+        The maximum number of days requested at once. When None, the range
+        is requested at once.
+    max_concurrency : int
+        The maximum number of windows requested at once. Requests are also
+        throttled by the rate limit of the provider.
+    key : str
+        The field identifying a bar of a symbol, used to drop duplicates.
+    buffer : BarBuffer | None
+        A buffer to append the bars to. A new one is created by default.
+    **kwargs : Any
+        Passed to `get_async_requests_session`. A `session` keyword is
+        used instead of opening a new session, and is left open.
+
+    Returns
+    -------
+    BarBuffer
+        The bars, in the order they were received.
+        `BarBuffer.counts` holds the number of bars of each symbol.
+    """
+    from openbb_core.provider.utils.helpers import get_async_requests_session
+
+    buffer = buffer if buffer is not None else BarBuffer(key=key)
+    windows = split_date_range(start_date, end_date, window)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    owns_session = "session" not in kwargs
+    session = await get_async_requests_session(**kwargs)
+
+    async def fetch(symbol: str, start, end):
+        """Fetch one window and append its bars."""
+        async with semaphore:
+            bars = await fetch_window(symbol, start, end, session)
+        if bars:
+            buffer.extend(symbol, bars)
+
+    tasks = [
+        asyncio.create_task(fetch(symbol, start, end))
+        for symbol in symbols
+        for start, end in windows
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if owns_session:
+            await session.close()
+
+    return buffer
@@ -1,40 +1,505 @@
-"""Utilities for LRU caching."""
+"""Caching of function results with a time to live.
 
-# pylint: disable=W0613
+`ttl_cache` memoizes synchronous and asynchronous functions with:
 
+    - Per-entry expiry. Each result expires `ttl` seconds after it was loaded.
+    - LRU eviction, bounded by a number of entries and, optionally, by the
+      estimated memory of the cached values.
+    - Single-flight loading. Concurrent calls for a missing key share one call
+      of the function, whether they come from threads or from an event loop.
+    - Stale-while-revalidate. For `stale_ttl` seconds past its expiry, a result
+      is still served while it is reloaded in the background.
+    - An optional disk tier. With `shared=True`, results are also kept in the
+      cross-process `SharedCache`, so that other workers and restarted
+      processes start warm.
+
+Exceptions are never cached.
+
+    @ttl_cache(maxsize=32, ttl=3600, stale_ttl=600)
+    async def get_documents(symbol: str) -> list[dict]:
+        ...
+
+The decorated function exposes its `cache`, with `cache_info()`,
+`cache_clear()` and `cache_invalidate(*args, **kwargs)`.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import asyncio
+import sys
+import threading
 import time
-from collections.abc import Callable
-from functools import lru_cache, update_wrapper
-from math import floor
+import warnings
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from functools import _make_key, update_wrapper
+from inspect import iscoroutinefunction
 from typing import Any
 
 
-def ttl_cache(maxsize: int = 128, typed: bool = False, ttl: int = -1):
-    """Cache a function's return value each ttl seconds."""
-    if ttl <= 0:
-        ttl = 65536
+def estimate_size(value: Any) -> int:
+    """Estimate the memory used by a value, in bytes.
+
+    DataFrames and Series report their deep memory usage, containers are
+    measured recursively and other objects with `sys.getsizeof`.
+    """
+    if hasattr(value, "memory_usage") and hasattr(value, "dtypes"):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if isinstance(value, (bytes, bytearray, str)):
+        return sys.getsizeof(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class _Entry:
+    """A cached value, its expiry and its estimated size."""
+
+    __slots__ = ("expires_at", "size", "value")
+
+    def __init__(self, value: Any, expires_at: float | None, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+class TTLCache:
+    """An LRU cache whose entries expire individually.
+
+    Parameters
+    ----------
+    name : str
+        Name of the cache, as reported in its statistics.
+    maxsize : int | None
+        Maximum number of entries. None is unbounded.
+    ttl : float | None
+        Seconds an entry stays fresh after it was loaded. None never expires.
+    stale_ttl : float
+        Seconds past its expiry during which an entry is still returned, as stale.
+    max_bytes : int | None
+        Maximum estimated memory of the cached values. Values larger than
+        this on their own are not cached.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        name: str,
+        maxsize: int | None = 128,
+        ttl: float | None = None,
+        stale_ttl: float = 0.0,
+        max_bytes: int | None = None,
+    ):
+        """Initialize the cache."""
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, 0.0)
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._metrics = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "loads": 0,
+            "coalesced": 0,
+            "refreshes": 0,
+            "errors": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    def _count(self, metric: str) -> None:
+        with self._lock:
+            self._metrics[metric] += 1
+
+    def _drop(self, key: Hashable) -> None:
+        """Remove an entry. The lock must be held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def lookup(self, key: Hashable) -> tuple[Any, bool] | None:
+        """Look up a key.
+
+        Returns
+        -------
+        tuple[Any, bool] | None
+            The value and whether it is stale, or None if the key is missing
+            or past its stale window.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            now = time.time()
+            if entry.expires_at is None or now < entry.expires_at:
+                self._entries.move_to_end(key)
+                return entry.value, False
+            if now < entry.expires_at + self.stale_ttl:
+                self._entries.move_to_end(key)
+                return entry.value, True
+            self._drop(key)
+            self._metrics["expirations"] += 1
+            return None
+
+    def set(self, key: Hashable, value: Any, loaded_at: float | None = None) -> None:
+        """Store a value loaded at `loaded_at` (default: now), evicting as needed."""
+        loaded_at = time.time() if loaded_at is None else loaded_at
+        expires_at = loaded_at + self.ttl if self.ttl is not None else None
+        size = estimate_size(value) if self.max_bytes is not None else 0
+        with self._lock:
+            self._drop(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._entries[key] = _Entry(value, expires_at, size)
+            self._bytes += size
+            while self._entries and (
+                (self.maxsize is not None and len(self._entries) > self.maxsize)
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                self._drop(next(iter(self._entries)))
+                self._metrics["evictions"] += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a key, if present."""
+        with self._lock:
+            self._drop(key)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def purge_expired(self) -> int:
+        """Remove the entries past their stale window, returning how many were removed."""
+        now = time.time()
+        with self._lock:
+            expired = [
+                key
+                for key, entry in self._entries.items()
+                if entry.expires_at is not None
+                and entry.expires_at + self.stale_ttl <= now
+            ]
+            for key in expired:
+                self._drop(key)
+            self._metrics["expirations"] += len(expired)
+        return len(expired)
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the cache metrics."""
+        with self._lock:
+            hits = self._metrics["hits"] + self._metrics["stale_hits"]
+            total = hits + self._metrics["misses"]
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxsize": self.maxsize,
+                "max_bytes": self.max_bytes,
+                **self._metrics,
+                "hit_rate": hits / total if total else None,
+            }
+
+
+class _CachedFunction:
+    """The loading logic behind a function decorated with `ttl_cache`."""
+
+    def __init__(self, func: Callable, cache: TTLCache, typed: bool, shared: bool):
+        self.func = func
+        self.cache = cache
+        self.typed = typed
+        self.shared = shared
+        self._inflight: dict[Hashable, Future] = {}
+        self._tasks: dict[Hashable, tuple[asyncio.AbstractEventLoop, asyncio.Task]] = (
+            {}
+        )
+        self._background: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def _shared_cache(self):
+        from openbb_core.provider.utils.shared_cache import get_shared_cache
 
-    hash_gen = _ttl_hash_gen(ttl)
+        return get_shared_cache(f"ttl_cache:{self.cache.name}")
 
-    def wrapper(func: Callable) -> Callable:
+    @staticmethod
+    def _shared_key(args: tuple, kwargs: dict) -> str:
+        return repr((args, tuple(kwargs.items())))
+
+    def _lookup(self, key: Hashable, args: tuple, kwargs: dict) -> tuple | None:
+        """Look up a key in memory, then in the shared tier."""
+        found = self.cache.lookup(key)
+        if found is None and self.shared:
+            try:
+                stored = self._shared_cache.get(self._shared_key(args, kwargs))
+            except Exception:  # pylint: disable=broad-except
+                stored = None
+            if stored is not None:
+                value, loaded_at = stored
+                self.cache.set(key, value, loaded_at)
+                found = self.cache.lookup(key)
+        return found
+
+    def _store(self, key: Hashable, args: tuple, kwargs: dict, value: Any) -> None:
+        """Store a freshly loaded value."""
+        loaded_at = time.time()
+        self.cache.set(key, value, loaded_at)
+        if self.shared:
+            ttl = self.cache.ttl
+            try:
+                self._shared_cache.set(
+                    self._shared_key(args, kwargs),
+                    (value, loaded_at),
+                    ttl=ttl + self.cache.stale_ttl if ttl is not None else None,
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                warnings.warn(f"Could not share cached '{self.cache.name}': {e}")
+
+    def call(self, args: tuple, kwargs: dict) -> Any:
+        """Call a synchronous function through the cache."""
+        key = _make_key(args, kwargs, self.typed)
+        found = self._lookup(key, args, kwargs)
+        if found is None:
+            self.cache._count("misses")  # pylint: disable=protected-access
+            return self._load(key, args, kwargs)
+
+        value, stale = found
+        # pylint: disable=protected-access
+        self.cache._count("stale_hits" if stale else "hits")
+        if stale:
+            with self._lock:
+                refreshing = key in self._inflight
+            if not refreshing:
+                self.cache._count("refreshes")
+                threading.Thread(
+                    target=self._refresh,
+                    args=(key, args, kwargs),
+                    name=f"ttl_cache-refresh-{self.cache.name}",
+                    daemon=True,
+                ).start()
+        return value
+
+    def _load(self, key: Hashable, args: tuple, kwargs: dict) -> Any:
+        """Call the function for a key, or wait for the call already running."""
+        with self._lock:
+            running = self._inflight.get(key)
+            if running is None:
+                future = self._inflight[key] = Future()
+            else:
+                self.cache._metrics["coalesced"] += 1  # pylint: disable=protected-access
+        if running is not None:
+            return running.result()
+
+        # pylint: disable=protected-access
+        try:
+            # Another thread may have loaded it just before we took over.
+            found = self.cache.lookup(key)
+            if found is not None and not found[1]:
+                self.cache._count("coalesced")
+                value = found[0]
+            else:
+                self.cache._count("loads")
+                try:
+                    value = self.func(*args, **kwargs)
+                except Exception:
+                    self.cache._count("errors")
+                    raise
+                self._store(key, args, kwargs, value)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def _refresh(self, key: Hashable, args: tuple, kwargs: dict) -> None:
+        """Reload a stale key in a background thread."""
+        try:
+            self._load(key, args, kwargs)
+        except Exception as e:  # pylint: disable=broad-except
+            warnings.warn(f"Failed to refresh cached '{self.cache.name}': {e}")
+
+    async def acall(self, args: tuple, kwargs: dict) -> Any:
+        """Call an asynchronous function through the cache."""
+        key = _make_key(args, kwargs, self.typed)
+        found = self._lookup(key, args, kwargs)
+        if found is None:
+            self.cache._count("misses")  # pylint: disable=protected-access
+            # Shield the shared load from the cancellation of a single caller.
+            return await asyncio.shield(self._aload_once(key, args, kwargs))
+
+        value, stale = found
+        # pylint: disable=protected-access
+        self.cache._count("stale_hits" if stale else "hits")
+        if stale:
+            with self._lock:
+                refreshing = key in self._tasks
+            if not refreshing:
+                self.cache._count("refreshes")
+                task = self._aload_once(key, args, kwargs)
+                self._background.add(task)
+                task.add_done_callback(self._finish_background)
+        return value
+
+    async def _aload(self, key: Hashable, args: tuple, kwargs: dict) -> Any:
+        """Await the function for a key, storing the result."""
+        self.cache._count("loads")  # pylint: disable=protected-access
+        try:
+            value = await self.func(*args, **kwargs)
+        except Exception:
+            self.cache._count("errors")  # pylint: disable=protected-access
+            raise
+        self._store(key, args, kwargs, value)
+        return value
+
+    def _aload_once(self, key: Hashable, args: tuple, kwargs: dict) -> asyncio.Task:
+        """Start loading a key, or join the load already running on this loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            running = self._tasks.get(key)
+            if running is not None and running[0] is loop and not running[1].done():
+                self.cache._metrics["coalesced"] += 1  # pylint: disable=protected-access
+                return running[1]
+            task = loop.create_task(self._aload(key, args, kwargs))
+            self._tasks[key] = (loop, task)
+
+        def _done(t: asyncio.Task) -> None:
+            with self._lock:
+                if self._tasks.get(key, (None, None))[1] is t:
+                    del self._tasks[key]
+            # Mark the outcome as retrieved, in case every caller was cancelled.
+            if not t.cancelled():
+                t.exception()
+
+        task.add_done_callback(_done)
+        return task
+
+    def _finish_background(self, task: asyncio.Task) -> None:
+        """Retrieve the outcome of a background refresh."""
+        self._background.discard(task)
+        if not task.cancelled() and (e := task.exception()):
+            warnings.warn(f"Failed to refresh cached '{self.cache.name}': {e}")
+
+    def invalidate(self, args: tuple, kwargs: dict) -> None:
+        """Drop the result for the given arguments."""
+        self.cache.pop(_make_key(args, kwargs, self.typed))
+        if self.shared:
+            try:
+                self._shared_cache.delete(self._shared_key(args, kwargs))
+            except Exception:  # pylint: disable=broad-except  # noqa: S110
+                pass
+
+    def clear(self) -> None:
+        """Drop every result."""
+        self.cache.clear()
+        if self.shared:
+            try:
+                self._shared_cache.clear()
+            except Exception:  # pylint: disable=broad-except  # noqa: S110
+                pass
+
+
+_caches: dict[str, TTLCache] = {}
+
+
+# pylint: disable=too-many-arguments
+def ttl_cache(
+    maxsize: int | None | Callable = 128,
+    typed: bool = False,
+    ttl: float = -1,
+    *,
+    stale_ttl: float = 0,
+    max_bytes: int | None = None,
+    shared: bool = False,
+    namespace: str | None = None,
+):
+    """Cache the results of a function for `ttl` seconds.
+
+    Works on both regular and async functions, and may be applied without
+    arguments, as `@ttl_cache`.
+
+    Parameters
+    ----------
+    maxsize : int | None
+        Maximum number of cached results. None is unbounded.
+    typed : bool
+        Cache arguments of different types separately, e.g. 3 and 3.0.
+    ttl : float
+        Seconds a result stays fresh. Zero or less never expires.
+    stale_ttl : float
+        Seconds past its expiry during which a result is still returned
+        while it is reloaded in the background.
+    max_bytes : int | None
+        Maximum estimated memory of the cached results.
+    shared : bool
+        Also keep results in the cross-process shared cache. Arguments must
+        have a stable repr and results must be picklable.
+    namespace : str | None
+        Name of the cache in statistics and in the shared tier.
+        Defaults to the qualified name of the function.
+
+    Returns
+    -------
+    Callable
+        The decorator, or the decorated function when applied without arguments.
+    """
+    if callable(maxsize):
+        return ttl_cache()(maxsize)
+
+    def decorator(func: Callable) -> Callable:
         """Wrap the function for ttl_cache."""
+        name = namespace or f"{func.__module__}.{func.__qualname__}"
+        cache = TTLCache(
+            name,
+            maxsize=maxsize,
+            ttl=ttl if ttl > 0 else None,
+            stale_ttl=stale_ttl,
+            max_bytes=max_bytes,
+        )
+        cached = _CachedFunction(func, cache, typed, shared)
+        # Decorating a function again, e.g. on reload, replaces its statistics.
+        _caches[name] = cache
 
-        @lru_cache(maxsize, typed)
-        def ttl_func(ttl_hash, *args, **kwargs):
-            return func(*args, **kwargs)
+        if iscoroutinefunction(func):
 
-        def wrapped(*args, **kwargs) -> Any:
-            """Wrap the function for ttl_cache."""
-            th = next(hash_gen)
-            return ttl_func(th, *args, **kwargs)
+            async def wrapped(*args, **kwargs) -> Any:
+                return await cached.acall(args, kwargs)
 
-        return update_wrapper(wrapped, func)
+        else:
+
+            def wrapped(*args, **kwargs) -> Any:
+                return cached.call(args, kwargs)
 
-    return wrapper
+        wrapped.cache = cache  # type: ignore[attr-defined]
+        wrapped.cache_info = cache.stats  # type: ignore[attr-defined]
+        wrapped.cache_clear = cached.clear  # type: ignore[attr-defined]
+        wrapped.cache_invalidate = lambda *args, **kwargs: cached.invalidate(  # type: ignore[attr-defined]
+            args, kwargs
+        )
+        return update_wrapper(wrapped, func)
 
+    return decorator
 
-def _ttl_hash_gen(seconds: int):
-    start_time = time.time()
 
-    while True:
-        yield floor((time.time() - start_time) / seconds)
+def ttl_cache_stats() -> list[dict[str, Any]]:
+    """Return the metrics of every function cached with `ttl_cache`."""
+    return [cache.stats() for cache in list(_caches.values())]
@@ -0,0 +1,405 @@
+"""Per-provider rate limiting.
+
+Providers declare their request limits with a `RateLimit` passed to the
+`Provider` constructor. Each limit gets a `RateLimiter`, registered under the
+provider name and under each of the hosts it covers. The request helpers
+(`make_request`, `amake_request` and `amake_requests`) look up the limiter by
+the host of the requested URL, so every helper-based request is throttled
+without changes at the call site.
+
+A limiter combines:
+    - A token bucket, refilled at `requests_per_second` up to `burst` tokens.
+    - A cap on the number of requests in flight.
+    - Adaptive backoff. A 429 (or 503) response pauses the bucket for the
+      `Retry-After` delay, or an exponential backoff on the retries of the
+      request when it isn't given, and halves the request rate once per
+      backoff. The rate then doubles back every `RECOVERY_INTERVAL` seconds.
+
+Limits can be overridden in the `rate_limits` key of the Python settings in
+`system_settings.json`, keyed by provider name:
+
+    "python_settings": {
+        "rate_limits": {"fmp": {"requests_per_second": 5, "max_concurrency": 4}}
+    }
+
+`rate_limits_disabled()` turns the limiters off, for example to replay
+recorded responses in tests.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlparse
+
+# Status codes that signal the upstream is shedding load.
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+class RateLimit:
+    """Request limits declared by a provider.
+
+    Parameters
+    ----------
+    requests_per_second : float
+        Sustained request rate allowed by the upstream.
+    burst : int | None
+        Requests allowed back-to-back before throttling, by default 1 second of requests.
+    max_concurrency : int | None
+        Maximum requests in flight at once, by default unlimited.
+    hosts : list[str] | None
+        Hosts the limit applies to. Subdomains of a host are included.
+    max_retries : int
+        Retries of a throttled (429/503) request before giving up.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: int | None = None,
+        max_concurrency: int | None = None,
+        hosts: list[str] | None = None,
+        max_retries: int = 3,
+    ) -> None:
+        """Initialize the rate limit."""
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0.")
+        self.requests_per_second = float(requests_per_second)
+        self.burst = max(1, int(burst or max(1, requests_per_second)))
+        self.max_concurrency = max_concurrency
+        self.hosts = [h.lower() for h in hosts or []]
+        self.max_retries = max_retries
+
+    @classmethod
+    def per_minute(cls, requests: float, **kwargs) -> "RateLimit":
+        """Create a limit from a number of requests per minute."""
+        kwargs.setdefault("burst", max(1, int(requests // 60)) or 1)
+        return cls(requests / 60, **kwargs)
+
+    def __repr__(self) -> str:
+        """Return the string representation."""
+        return (
+            f"{self.__class__.__name__}(requests_per_second={self.requests_per_second},"
+            f" burst={self.burst}, max_concurrency={self.max_concurrency},"
+            f" hosts={self.hosts})"
+        )
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header, in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Token bucket with concurrency cap and adaptive backoff.
+
+    The limiter is shared by the threads and event loops of a process.
+    """
+
+    # Lowest fraction of the declared rate the adaptive backoff goes down to.
+    MIN_RATE_FACTOR = 0.05
+    # Seconds without throttling after which a reduced rate doubles.
+    RECOVERY_INTERVAL = 5.0
+    BASE_BACKOFF = 1.0
+    MAX_BACKOFF = 60.0
+
+    def __init__(self, name: str, limit: RateLimit) -> None:
+        """Initialize the limiter."""
+        self.name = name
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._reset()
+        self._in_flight = 0
+        self._sync_slots = (
+            threading.BoundedSemaphore(limit.max_concurrency)
+            if limit.max_concurrency
+            else None
+        )
+        self._async_slots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _reset(self) -> None:
+        """Set the bucket, backoff and metrics to their initial state."""
+        self._tokens = float(self.limit.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        # The rate set by the last throttled response, and when it was set.
+        self._reduced_rate = self.limit.requests_per_second
+        self._reduced_at = self._updated
+        self._metrics = {
+            "requests": 0,
+            "delayed": 0,
+            "wait_time": 0.0,
+            "throttled": 0,
+            "retries": 0,
+        }
+
+    def reset(self) -> None:
+        """Clear the backoff and refill the bucket. Requests in flight are kept."""
+        with self._lock:
+            self._reset()
+
+    @property
+    def rate(self) -> float:
+        """The current request rate, recovering from the last throttled response."""
+        return self._rate(time.monotonic())
+
+    def _rate(self, now: float) -> float:
+        """Return the request rate at a time."""
+        declared = self.limit.requests_per_second
+        if self._reduced_rate >= declared:
+            return declared
+        recovered = self._reduced_rate * 2 ** (
+            (now - self._reduced_at) / self.RECOVERY_INTERVAL
+        )
+        return min(declared, recovered)
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.limit.burst),
+                self._tokens + (now - self._updated) * self._rate(now),
+            )
+            self._updated = now
+            # Tokens may go negative: each waiter reserves its own future slot.
+            self._tokens -= 1
+            wait = max(
+                -self._tokens / self._rate(now) if self._tokens < 0 else 0.0,
+                self._blocked_until - now,
+            )
+            self._metrics["requests"] += 1
+            if wait > 0:
+                self._metrics["delayed"] += 1
+                self._metrics["wait_time"] += wait
+            return wait
+
+    def _async_slot(self) -> asyncio.Semaphore | None:
+        """Get the concurrency semaphore of the running event loop."""
+        if not self.limit.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slot = self._async_slots.get(loop)
+            if slot is None:
+                slot = asyncio.Semaphore(self.limit.max_concurrency)
+                self._async_slots[loop] = slot
+            return slot
+
+    def _cancel(self) -> None:
+        """Give back the token of a request cancelled before it was sent."""
+        with self._lock:
+            self._tokens = min(float(self.limit.burst), self._tokens + 1)
+
+    async def acquire(self) -> None:
+        """Wait for a token. Pair with `release()`, or use `async with limiter`.
+
+        If the wait is cancelled, the slot and the token are given back.
+        """
+        if slot := self._async_slot():
+            await slot.acquire()
+        with self._lock:
+            self._in_flight += 1
+        if (wait := self._reserve()) > 0:
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                self._cancel()
+                self.release()
+                raise
+
+    def release(self) -> None:
+        """Release the concurrency slot taken by `acquire()`."""
+        with self._lock:
+            self._in_flight -= 1
+        if slot := self._async_slot():
+            slot.release()
+
+    async def __aenter__(self) -> "RateLimiter":
+        """Acquire the limiter."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        """Release the limiter."""
+        self.release()
+
+    def acquire_sync(self) -> None:
+        """Blocking version of `acquire()`. Pair with `release_sync()`."""
+        if self._sync_slots:
+            self._sync_slots.acquire()  # pylint: disable=consider-using-with
+        with self._lock:
+            self._in_flight += 1
+        if (wait := self._reserve()) > 0:
+            try:
+                time.sleep(wait)
+            except BaseException:
+                self._cancel()
+                self.release_sync()
+                raise
+
+    def release_sync(self) -> None:
+        """Release the concurrency slot taken by `acquire_sync()`."""
+        with self._lock:
+            self._in_flight -= 1
+        if self._sync_slots:
+            self._sync_slots.release()
+
+    def on_response(
+        self, status: int, retry_after: str | None = None, attempt: int = 0
+    ) -> float | None:
+        """Adapt the limiter to a response status.
+
+        Parameters
+        ----------
+        status : int
+            The status code of the response.
+        retry_after : str | None
+            The `Retry-After` header of the response.
+        attempt : int
+            The number of retries of the request so far, which sets the
+            exponential backoff when the response has no `Retry-After`.
+
+        Returns
+        -------
+        float | None
+            Seconds to wait before retrying if the request was throttled, else None.
+        """
+        if status not in THROTTLE_STATUS_CODES:
+            return None
+
+        with self._lock:
+            now = time.monotonic()
+            self._metrics["throttled"] += 1
+            delay = parse_retry_after(retry_after)
+            if delay is None:
+                delay = min(self.MAX_BACKOFF, self.BASE_BACKOFF * 2**attempt)
+            # Responses throttled during a backoff answer the same overload:
+            # the rate is halved once per backoff, not once per response.
+            if now >= self._blocked_until:
+                self._reduced_rate = max(
+                    self.limit.requests_per_second * self.MIN_RATE_FACTOR,
+                    self._rate(now) / 2,
+                )
+                self._reduced_at = now
+            self._blocked_until = max(self._blocked_until, now + delay)
+            self._tokens = min(self._tokens, 0.0)
+            return delay
+
+    def record_retry(self) -> None:
+        """Count a retry of a throttled request."""
+        with self._lock:
+            self._metrics["retries"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return the limiter metrics."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "requests_per_second": self.limit.requests_per_second,
+                "current_rate": self._rate(time.monotonic()),
+                "max_concurrency": self.limit.max_concurrency,
+                "in_flight": self._in_flight,
+                **self._metrics,
+            }
+
+
+_limiters: dict[str, RateLimiter] = {}
+_hosts: dict[str, RateLimiter] = {}
+_registry_lock = threading.Lock()
+_enabled = True
+
+
+def _get_limit_overrides(name: str) -> dict:
+    """Get the user overrides for a provider's limit from the Python settings."""
+    try:
+        from openbb_core.app.service.system_service import SystemService
+
+        python_settings = SystemService().system_settings.python_settings.model_dump()
+    except Exception:  # pylint: disable=broad-except
+        return {}
+    return (python_settings.get("rate_limits") or {}).get(name, {}) or {}
+
+
+def register_rate_limit(name: str, limit: RateLimit) -> RateLimiter:
+    """Register the rate limit of a provider, returning its limiter."""
+    name = name.lower()
+    if overrides := _get_limit_overrides(name):
+        limit = RateLimit(
+            requests_per_second=overrides.get(
+                "requests_per_second", limit.requests_per_second
+            ),
+            burst=overrides.get("burst", limit.burst),
+            max_concurrency=overrides.get("max_concurrency", limit.max_concurrency),
+            hosts=overrides.get("hosts", limit.hosts),
+            max_retries=overrides.get("max_retries", limit.max_retries),
+        )
+    limiter = RateLimiter(name, limit)
+    with _registry_lock:
+        _limiters[name] = limiter
+        for host in limit.hosts:
+            _hosts[host] = limiter
+    return limiter
+
+
+def get_rate_limiter(name: str) -> RateLimiter | None:
+    """Get the limiter registered for a provider."""
+    return _limiters.get(name.lower())
+
+
+def get_rate_limiter_for_url(url: str) -> RateLimiter | None:
+    """Get the limiter covering the host of a URL, including parent domains."""
+    if not _enabled or not _hosts:
+        return None
+    host = (urlparse(url).hostname or "").lower()
+    while host:
+        if limiter := _hosts.get(host):
+            return limiter
+        _, _, host = host.partition(".")
+    return None
+
+
+def rate_limiter_stats() -> list[dict[str, Any]]:
+    """Return the metrics of every registered limiter."""
+    with _registry_lock:
+        limiters = list(_limiters.values())
+    return [limiter.stats() for limiter in limiters]
+
+
+def reset_rate_limiters() -> None:
+    """Clear the backoff and the metrics of every registered limiter."""
+    with _registry_lock:
+        limiters = list(_limiters.values())
+    for limiter in limiters:
+        limiter.reset()
+
+
+@contextmanager
+def rate_limits_disabled() -> Iterator[None]:
+    """Turn off the rate limiting of requests made through the helpers.
+
+    On exit, the limiters are reset, so that no backoff carries over.
+    """
+    global _enabled  # pylint: disable=global-statement
+    previous, _enabled = _enabled, False
+    try:
+        yield
+    finally:
+        _enabled = previous
+        reset_rate_limiters()
@@ -0,0 +1,340 @@
+"""Reference data registry.
+
+Providers look up large, slowly changing reference lists on the hot path:
+symbol directories, instrument lists, ETF universes. This module gives them
+one place to declare such datasets, with:
+
+    - Single-flight loading. Concurrent cold requests for a dataset share one
+      upstream request instead of stampeding the provider.
+    - Refresh ahead of expiry. Once a value is past `refresh_ahead` of its
+      lifetime, it is still served while a background task reloads it.
+    - Compact storage. DataFrames have their repetitive string columns
+      stored as categoricals.
+    - An optional shared tier. With `shared=True`, values are also kept in
+      the cross-process `SharedCache`, so that other workers and restarted
+      processes start warm.
+
+Declare a dataset at module level and read it in place of the upstream call:
+
+    etfs = register_dataset("tmx_etfs", _load_etfs, ttl=4 * 3600, shared=True)
+
+    async def get_all_etfs(use_cache: bool = True) -> list[dict]:
+        return await etfs.get(refresh=not use_cache)
+
+Datasets may be parametrized. Positional arguments passed to `get()` are
+forwarded to the loader and key separate entries.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import asyncio
+import threading
+import time
+import warnings
+from collections.abc import Awaitable, Callable
+from inspect import iscoroutinefunction
+from typing import Any
+
+
+def compact_frame(df, max_unique_ratio: float = 0.5):
+    """Store repetitive string columns of a DataFrame as categoricals.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The DataFrame to compact. It is not modified.
+    max_unique_ratio : float
+        Columns with fewer unique values than this fraction of rows are converted.
+
+    Returns
+    -------
+    DataFrame
+        A compacted copy of the DataFrame.
+    """
+    from pandas.api.types import is_object_dtype, is_string_dtype
+
+    if len(df) < 2:  # noqa: PLR2004
+        return df
+    # The loader may keep a reference to its frame: convert a copy.
+    df = df.copy()
+    for column in df.columns:
+        dtype = df[column].dtype
+        if not (is_object_dtype(dtype) or is_string_dtype(dtype)):
+            continue
+        try:
+            unique = df[column].nunique(dropna=False)
+        except TypeError:  # Unhashable values, such as dicts.
+            continue
+        if unique / len(df) <= max_unique_ratio:
+            df[column] = df[column].astype("category")
+    return df
+
+
+class _Entry:
+    """A loaded value and its timestamps."""
+
+    __slots__ = ("expires_at", "loaded_at", "value")
+
+    def __init__(self, value: Any, loaded_at: float, ttl: float | None):
+        self.value = value
+        self.loaded_at = loaded_at
+        self.expires_at = loaded_at + ttl if ttl is not None else None
+
+
+class ReferenceDataset:
+    """A reference dataset, loaded on demand and kept fresh.
+
+    Parameters
+    ----------
+    name : str
+        Unique name of the dataset.
+    loader : Callable[..., Any | Awaitable[Any]]
+        Function loading the dataset from the upstream, sync or async.
+    ttl : float | None
+        Seconds a loaded value stays valid. None never expires.
+    refresh_ahead : float
+        Fraction of the TTL, at the end of a value's lifetime, during which the
+        value is still served while it is reloaded in the background.
+    shared : bool
+        Also keep values in the cross-process shared cache.
+    compact : bool
+        Convert repetitive string columns of DataFrame values to categoricals.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-instance-attributes
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[..., Any | Awaitable[Any]],
+        ttl: float | None = None,
+        refresh_ahead: float = 0.2,
+        shared: bool = False,
+        compact: bool = False,
+    ):
+        """Initialize the dataset."""
+        self.name = name
+        self.loader = loader
+        self.ttl = ttl
+        self.refresh_ahead = min(max(refresh_ahead, 0.0), 1.0)
+        self.shared = shared
+        self.compact = compact
+        self._entries: dict[tuple, _Entry] = {}
+        self._inflight: dict[tuple, tuple[asyncio.AbstractEventLoop, asyncio.Task]] = (
+            {}
+        )
+        self._background: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+        self._sync_locks: dict[tuple, threading.Lock] = {}
+        self._metrics = {
+            "hits": 0,
+            "misses": 0,
+            "loads": 0,
+            "coalesced": 0,
+            "refreshes": 0,
+            "errors": 0,
+        }
+
+    def _count(self, metric: str) -> None:
+        with self._lock:
+            self._metrics[metric] += 1
+
+    def _shared_key(self, key: tuple) -> str:
+        return f"{self.name}:{key!r}"
+
+    def _get_entry(self, key: tuple) -> _Entry | None:
+        """Get the entry for a key from memory, then from the shared tier."""
+        entry = self._entries.get(key)
+        now = time.time()
+        if entry is not None and (entry.expires_at is None or entry.expires_at > now):
+            return entry
+        if self.shared:
+            try:
+                from openbb_core.provider.utils.shared_cache import get_shared_cache
+
+                stored = get_shared_cache("reference_data").get(self._shared_key(key))
+            except Exception:  # pylint: disable=broad-except
+                stored = None
+            if stored is not None:
+                value, loaded_at = stored
+                entry = _Entry(value, loaded_at, self.ttl)
+                self._entries[key] = entry
+                return entry
+        return None
+
+    def _store(self, key: tuple, value: Any) -> _Entry:
+        """Store a freshly loaded value."""
+        if self.compact and hasattr(value, "dtypes"):
+            value = compact_frame(value)
+        entry = _Entry(value, time.time(), self.ttl)
+        self._entries[key] = entry
+        if self.shared:
+            try:
+                from openbb_core.provider.utils.shared_cache import get_shared_cache
+
+                get_shared_cache("reference_data").set(
+                    self._shared_key(key), (value, entry.loaded_at), ttl=self.ttl
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                warnings.warn(f"Could not share reference data '{self.name}': {e}")
+        return entry
+
+    def _needs_refresh(self, entry: _Entry) -> bool:
+        """Check if an entry is in its refresh-ahead window."""
+        if entry.expires_at is None or self.ttl is None:
+            return False
+        return time.time() >= entry.expires_at - self.ttl * self.refresh_ahead
+
+    async def _load(self, key: tuple, args: tuple) -> Any:
+        """Load a key from the upstream, storing the result."""
+        self._count("loads")
+        try:
+            if iscoroutinefunction(self.loader):
+                value = await self.loader(*args)
+            else:
+                value = await asyncio.to_thread(self.loader, *args)
+        except Exception:
+            self._count("errors")
+            raise
+        return self._store(key, value).value
+
+    def _load_once(self, key: tuple, args: tuple) -> asyncio.Task:
+        """Start loading a key, or join the load already running on this loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            inflight = self._inflight.get(key)
+            if inflight is not None and inflight[0] is loop and not inflight[1].done():
+                self._metrics["coalesced"] += 1
+                return inflight[1]
+            task = loop.create_task(self._load(key, args))
+            self._inflight[key] = (loop, task)
+
+        def _done(t: asyncio.Task) -> None:
+            with self._lock:
+                if self._inflight.get(key, (None, None))[1] is t:
+                    del self._inflight[key]
+
+        task.add_done_callback(_done)
+        return task
+
+    async def get(self, *args, refresh: bool = False) -> Any:
+        """Get the dataset, loading it if it is missing, expired or `refresh` is True."""
+        key = tuple(args)
+        entry = None if refresh else self._get_entry(key)
+
+        if entry is None:
+            self._count("misses")
+            # Shield the shared load from the cancellation of a single caller.
+            return await asyncio.shield(self._load_once(key, args))
+
+        self._count("hits")
+        if self._needs_refresh(entry):
+            with self._lock:
+                refreshing = key in self._inflight
+            if not refreshing:
+                self._count("refreshes")
+                task = self._load_once(key, args)
+                self._background.add(task)
+                task.add_done_callback(self._finish_background)
+        return entry.value
+
+    def _finish_background(self, task: asyncio.Task) -> None:
+        """Retrieve the outcome of a background refresh."""
+        self._background.discard(task)
+        if not task.cancelled() and (e := task.exception()):
+            warnings.warn(f"Failed to refresh reference data '{self.name}': {e}")
+
+    def get_sync(self, *args, refresh: bool = False) -> Any:
+        """Get the dataset from synchronous code. The loader must be synchronous."""
+        if iscoroutinefunction(self.loader):
+            raise TypeError(f"Reference data '{self.name}' has an async loader.")
+        key = tuple(args)
+        if not refresh and (entry := self._get_entry(key)) is not None:
+            self._count("hits")
+            return entry.value
+
+        with self._lock:
+            lock = self._sync_locks.setdefault(key, threading.Lock())
+        with lock:
+            # Another thread may have loaded it while we waited.
+            if not refresh and (entry := self._get_entry(key)) is not None:
+                self._count("coalesced")
+                return entry.value
+            self._count("misses")
+            self._count("loads")
+            try:
+                value = self.loader(*args)
+            except Exception:
+                self._count("errors")
+                raise
+            return self._store(key, value).value
+
+    def invalidate(self, *args) -> None:
+        """Drop a loaded key, or every key when called without arguments."""
+        keys = [tuple(args)] if args else list(self._entries)
+        for key in keys:
+            self._entries.pop(key, None)
+            if self.shared:
+                try:
+                    from openbb_core.provider.utils.shared_cache import (
+                        get_shared_cache,
+                    )
+
+                    get_shared_cache("reference_data").delete(self._shared_key(key))
+                except Exception:  # pylint: disable=broad-except  # noqa: S110
+                    pass
+
+    def stats(self) -> dict[str, Any]:
+        """Return the dataset metrics."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                **self._metrics,
+            }
+
+
+_datasets: dict[str, ReferenceDataset] = {}
+
+
+def register_dataset(  # pylint: disable=too-many-arguments
+    name: str,
+    loader: Callable[..., Any | Awaitable[Any]],
+    *,
+    ttl: float | None = None,
+    refresh_ahead: float = 0.2,
+    shared: bool = False,
+    compact: bool = False,
+) -> ReferenceDataset:
+    """Declare a reference dataset, returning it.
+
+    See `ReferenceDataset` for the parameters. Registering a name again
+    replaces the previous dataset, e.g. when its module is reloaded.
+    """
+    dataset = ReferenceDataset(
+        name,
+        loader,
+        ttl=ttl,
+        refresh_ahead=refresh_ahead,
+        shared=shared,
+        compact=compact,
+    )
+    _datasets[name] = dataset
+    return dataset
+
+
+def get_dataset(name: str) -> ReferenceDataset:
+    """Get a registered reference dataset by name."""
+    if name not in _datasets:
+        raise KeyError(f"Reference dataset '{name}' is not registered.")
+    return _datasets[name]
+
+
+def reference_data_stats() -> list[dict[str, Any]]:
+    """Return the metrics of every registered dataset."""
+    return [dataset.stats() for dataset in list(_datasets.values())]
+
+
+def clear_datasets() -> None:
+    """Drop the loaded values of every registered dataset, e.g. between tests."""
+    for dataset in list(_datasets.values()):
+        dataset.invalidate()
@@ -0,0 +1,660 @@
+"""Streaming SDMX data reader.
+
+Statistical agencies (OECD, IMF, ECB, ...) publish data as SDMX messages, in
+one of three formats:
+
+    - "generic": SDMX-ML where every key and value is a `Value` element.
+    - "structure_specific": SDMX-ML where dimensions and attributes are XML
+      attributes of the `Series` and `Obs` elements.
+    - "json": SDMX-JSON, where keys and values are indexes into the
+      dimension values listed in the structure.
+
+XML messages are fed by chunks to an event-based expat parser, without
+building an element tree. Each series is emitted as soon as it ends. The
+observations of a series are stored column by column, and dimension codes
+are interned, so that the codes repeated by thousands of observations are
+stored once.
+
+`iter_sdmx` yields the groups and series of a message, for callers that
+process each series. `read_sdmx` collects them into a DataFrame, or an
+Arrow table, where the values of each series key are broadcast to its
+observations.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import json
+import sys
+from collections.abc import Iterator
+from io import BytesIO
+from itertools import repeat
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Literal, Union
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+    from pyarrow import Table
+
+SdmxFormat = Literal["generic", "structure_specific", "json"]
+SdmxSource = Union[str, bytes, Path, IO[bytes]]
+
+TIME_PERIOD = "TIME_PERIOD"
+OBS_VALUE = "OBS_VALUE"
+
+_intern = sys.intern
+
+
+class SdmxGroup:
+    """A group of series, carrying attributes shared by its series.
+
+    Attributes
+    ----------
+    key : dict[str, str]
+        The dimension values identifying the group.
+    attributes : dict[str, str]
+        The attributes of the group.
+    """
+
+    __slots__ = ("attributes", "key")
+
+    def __init__(self, key: dict[str, str], attributes: dict[str, str]):
+        """Initialize the group."""
+        self.key = key
+        self.attributes = attributes
+
+    def __repr__(self) -> str:
+        """Return the representation of the group."""
+        return f"SdmxGroup(key={self.key!r}, attributes={self.attributes!r})"
+
+
+class SdmxSeries:
+    """A series, with its observations stored column by column.
+
+    Attributes
+    ----------
+    key : dict[str, str]
+        The dimension values identifying the series. In structure-specific
+        messages, the dimensions can not be told from the attributes without
+        the data structure definition, so all of them are in the key.
+    attributes : dict[str, str]
+        The attributes of the series.
+    observations : dict[str, list]
+        The observations, one list per column. `TIME_PERIOD` and `OBS_VALUE`
+        hold the time dimension and the value; other columns hold
+        observation-level attributes, None where an observation has none.
+    """
+
+    __slots__ = ("_length", "attributes", "key", "observations")
+
+    def __init__(self, key: dict[str, str], attributes: dict[str, str] | None = None):
+        """Initialize the series."""
+        self.key = key
+        self.attributes = attributes or {}
+        self.observations: dict[str, list] = {}
+        self._length = 0
+
+    def add_observation(self, values: dict[str, Any]) -> None:
+        """Append an observation."""
+        observations = self.observations
+        for name in values:
+            if name not in observations:
+                observations[name] = [None] * self._length
+        for name, column in observations.items():
+            column.append(values.get(name))
+        self._length += 1
+
+    def __len__(self) -> int:
+        """Return the number of observations."""
+        return self._length
+
+    def __repr__(self) -> str:
+        """Return the representation of the series."""
+        return f"SdmxSeries(key={self.key!r}, observations={self._length})"
+
+
+class SdmxColumns:
+    """Columnar builder for the rows of many series.
+
+    The values constant over a series, such as its key, are broadcast to its
+    observations when the series is added. Missing values are filled with
+    `missing`.
+    """
+
+    def __init__(self, missing: Any = None):
+        """Initialize an empty builder."""
+        self.columns: dict[str, list] = {}
+        self.constant_columns: set[str] = set()
+        self.missing = missing
+        self.length = 0
+
+    def add(
+        self,
+        constants: dict[str, Any],
+        observations: dict[str, list],
+        length: int | None = None,
+    ) -> None:
+        """Add the rows of a series.
+
+        Parameters
+        ----------
+        constants : dict[str, Any]
+            The values of the series, repeated on each of its rows.
+        observations : dict[str, list]
+            The columns of the observations. Their values take precedence over
+            the constants of the same name, which fill their missing values.
+        length : int | None
+            The number of rows. Defaults to the length of the observation columns.
+        """
+        if length is None:
+            length = len(next(iter(observations.values()), []))
+        if not length:
+            return
+        for name in (*constants, *observations):
+            if name not in self.columns:
+                self.columns[name] = [self.missing] * self.length
+                if name not in observations:
+                    self.constant_columns.add(name)
+        for name, column in self.columns.items():
+            if name in observations and name in constants:
+                constant = constants[name]
+                column.extend(
+                    constant if value is None else value
+                    for value in observations[name]
+                )
+            elif name in observations:
+                column.extend(observations[name])
+            elif name in constants:
+                column.extend(repeat(constants[name], length))
+            else:
+                column.extend(repeat(self.missing, length))
+        self.length += length
+
+    def add_series(self, series: SdmxSeries) -> None:
+        """Add the rows of a series, with its key and attributes."""
+        self.add({**series.key, **series.attributes}, series.observations, len(series))
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.length
+
+    def to_dataframe(self, categorical: bool = False) -> "DataFrame":
+        """Return the rows as a DataFrame.
+
+        Parameters
+        ----------
+        categorical : bool
+            Store the series-level string columns, such as dimension codes,
+            as categoricals.
+        """
+        from pandas import Categorical, DataFrame
+
+        data: dict[str, Any] = {}
+        for name, column in self.columns.items():
+            if (
+                categorical
+                and name in self.constant_columns
+                and all(isinstance(v, str) or v is None for v in column)
+            ):
+                data[name] = Categorical(column)
+            else:
+                data[name] = column
+        return DataFrame(data)
+
+    def to_arrow(self, categorical: bool = True) -> "Table":
+        """Return the rows as an Arrow table.
+
+        Parameters
+        ----------
+        categorical : bool
+            Dictionary-encode the series-level string columns.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise ImportError(
+                "Please install pyarrow: `pip install pyarrow` to use this method."
+            ) from exc
+
+        arrays: dict[str, Any] = {}
+        for name, column in self.columns.items():
+            array = pa.array(column)
+            if (
+                categorical
+                and name in self.constant_columns
+                and pa.types.is_string(array.type)
+            ):
+                array = array.dictionary_encode()
+            arrays[name] = array
+        return pa.table(arrays)
+
+
+def _open_source(source: SdmxSource) -> tuple[IO[bytes], bool]:
+    """Open a source as a binary stream, returning if it should be closed."""
+    if isinstance(source, bytes):
+        return BytesIO(source), True
+    if isinstance(source, Path):
+        return open(source, "rb"), True  # noqa: SIM115
+    if isinstance(source, str):
+        return BytesIO(source.encode("utf-8")), True
+    return source, False
+
+
+def detect_format(source: SdmxSource) -> SdmxFormat:
+    """Detect the format of an SDMX message from its first bytes.
+
+    Streams are left at their position.
+    """
+    if isinstance(source, (bytes, str)):
+        head = source[:4096]
+    elif isinstance(source, Path):
+        with open(source, "rb") as f:
+            head = f.read(4096)
+    else:
+        position = source.tell()
+        head = source.read(4096)
+        source.seek(position)
+    if isinstance(head, str):
+        head = head.encode("utf-8", "replace")
+    stripped = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+    if stripped.startswith((b"{", b"[")):
+        return "json"
+    if b"GenericData" in head or b"/data/generic" in head:
+        return "generic"
+    return "structure_specific"
+
+
+class _XmlHandler:
+    """Base of the SDMX-ML event handlers.
+
+    Element names are passed without their namespace. Completed groups and
+    series are appended to `items`, to be yielded between parsed chunks.
+    """
+
+    def __init__(self):
+        """Initialize the handler."""
+        self.items: list[SdmxSeries | SdmxGroup] = []
+        self._names: dict[str, str] = {}
+        self._text: list[str] | None = None
+
+    def local_name(self, name: str) -> str:
+        """Strip the namespace of an element name."""
+        local = self._names.get(name)
+        if local is None:
+            local = self._names[name] = _intern(name.rsplit("}", 1)[-1])
+        return local
+
+    def start(self, name: str, attrs: dict[str, str]) -> None:
+        """Handle the start of an element."""
+
+    def end(self, name: str) -> None:
+        """Handle the end of an element."""
+
+    def data(self, text: str) -> None:
+        """Collect the text of the element being captured."""
+        if self._text is not None:
+            self._text.append(text)
+
+    def capture_text(self) -> None:
+        """Start capturing the text of an element."""
+        self._text = []
+
+    def captured_text(self) -> str | None:
+        """Stop capturing text, returning it."""
+        text = "".join(self._text) if self._text else None
+        self._text = None
+        return text
+
+
+class _GenericHandler(_XmlHandler):
+    """Handle the events of a generic SDMX-ML message."""
+
+    def __init__(self):
+        """Initialize the handler."""
+        super().__init__()
+        self.series: SdmxSeries | None = None
+        self.group: SdmxGroup | None = None
+        self.observation: dict | None = None
+        # Where the `Value` elements being read go: the series or group key,
+        # the series or group attributes, or the observation.
+        self.target: dict | None = None
+        self.in_series = False
+
+    def start(self, name: str, attrs: dict[str, str]) -> None:
+        """Handle the start of an element."""
+        name = self.local_name(name)
+        if name == "Value":
+            if self.target is not None and (value_id := attrs.get("id")):
+                self.target[_intern(value_id)] = _intern(attrs.get("value", ""))
+        elif name == "Obs":
+            self.observation = {}
+            if self.series is None:
+                # Observations directly in the data set, with all the dimensions
+                # in an ObsKey.
+                self.series = SdmxSeries({})
+        elif name == "ObsDimension":
+            if self.observation is not None:
+                self.observation[_intern(attrs.get("id") or TIME_PERIOD)] = _intern(
+                    attrs.get("value", "")
+                )
+        elif name == "ObsValue":
+            if self.observation is not None:
+                self.observation[OBS_VALUE] = attrs.get("value")
+        elif name == "Series":
+            self.series = SdmxSeries({})
+            self.in_series = True
+        elif name == "Group":
+            self.group = SdmxGroup({}, {})
+        elif name == "SeriesKey" and self.series is not None:
+            self.target = self.series.key
+        elif name == "GroupKey" and self.group is not None:
+            self.target = self.group.key
+        elif name == "ObsKey":
+            self.target = self.observation
+        elif name == "Attributes":
+            if self.observation is not None:
+                self.target = self.observation
+            elif self.series is not None:
+                self.target = self.series.attributes
+            elif self.group is not None:
+                self.target = self.group.attributes
+
+    def end(self, name: str) -> None:
+        """Handle the end of an element."""
+        name = self.local_name(name)
+        if name in ("SeriesKey", "GroupKey", "ObsKey", "Attributes"):
+            self.target = None
+        elif name == "Obs" and self.observation is not None:
+            self.series.add_observation(self.observation)  # type: ignore
+            self.observation = None
+            if not self.in_series:
+                # Flat observations are emitted as a series each.
+                self.items.append(self.series)  # type: ignore
+                self.series = None
+        elif name == "Series" and self.series is not None:
+            self.items.append(self.series)
+            self.series = None
+            self.in_series = False
+        elif name == "Group" and self.group is not None:
+            self.items.append(self.group)
+            self.group = None
+
+
+class _StructureSpecificHandler(_XmlHandler):
+    """Handle the events of a structure-specific SDMX-ML message."""
+
+    def __init__(self):
+        """Initialize the handler."""
+        super().__init__()
+        self.in_data_set = False
+        self.series: SdmxSeries | None = None
+        self.group: SdmxGroup | None = None
+        self.observation: dict | None = None
+        # The `Comp` element being read, in SDMX 3.0 messages.
+        self.comp_id: str | None = None
+        self.comp_values: list[str] = []
+
+    def start(self, name: str, attrs: dict[str, str]) -> None:
+        """Handle the start of an element."""
+        name = self.local_name(name)
+        if name == "Obs":
+            if self.in_data_set:
+                self.observation = {
+                    _intern(k): v if k == OBS_VALUE else _intern(v)
+                    for k, v in attrs.items()
+                }
+        elif name == "Series":
+            if self.in_data_set:
+                self.series = SdmxSeries(
+                    {_intern(k): _intern(v) for k, v in attrs.items()}
+                )
+        elif name == "Comp":
+            self.comp_id = attrs.get("id")
+            self.comp_values = []
+        elif name == "Value":
+            if self.comp_id is not None:
+                self.capture_text()
+        elif name in ("ObsValue", "OBS_VALUE"):
+            if self.observation is not None:
+                if "value" in attrs:
+                    self.observation.setdefault(OBS_VALUE, attrs["value"])
+                else:
+                    self.capture_text()
+        elif name == "Group":
+            if self.in_data_set:
+                self.group = SdmxGroup(dict(attrs), {})
+        elif name == "DataSet":
+            self.in_data_set = True
+
+    def end(self, name: str) -> None:  # noqa: PLR0912
+        """Handle the end of an element."""
+        name = self.local_name(name)
+        if name == "Obs":
+            if self.observation is not None:
+                if self.series is None:
+                    # Observations directly in the data set are each emitted as a
+                    # series.
+                    flat = SdmxSeries({})
+                    flat.add_observation(self.observation)
+                    self.items.append(flat)
+                else:
+                    self.series.add_observation(self.observation)
+                self.observation = None
+        elif name == "Series":
+            if self.series is not None:
+                self.items.append(self.series)
+                self.series = None
+        elif name == "Value":
+            if self.comp_id is not None:
+                self.comp_values.append(self.captured_text() or "")
+        elif name == "Comp":
+            if self.comp_id is not None:
+                value = (
+                    self.comp_values[0]
+                    if len(self.comp_values) == 1
+                    else ";".join(self.comp_values)
+                )
+                if self.observation is not None:
+                    self.observation[_intern(self.comp_id)] = value
+                elif self.group is not None:
+                    self.group.attributes[_intern(self.comp_id)] = value
+                elif self.series is not None:
+                    self.series.attributes[_intern(self.comp_id)] = value
+            self.comp_id = None
+        elif name in ("ObsValue", "OBS_VALUE"):
+            if self.observation is not None and self._text is not None:
+                self.observation.setdefault(OBS_VALUE, self.captured_text())
+        elif name == "Group":
+            if self.group is not None:
+                self.items.append(self.group)
+                self.group = None
+        elif name == "DataSet":
+            self.in_data_set = False
+
+
+def _forbid_entities(*args) -> None:
+    """Refuse entity declarations, which can expand to unbounded documents."""
+    raise ValueError("Entity declarations are not allowed in SDMX messages.")
+
+
+def _parse_xml(
+    stream: IO[bytes], handler: _XmlHandler, chunk_size: int = 1 << 16
+) -> Iterator[SdmxSeries | SdmxGroup]:
+    """Feed a stream to an expat parser by chunks, yielding the completed items."""
+    from xml.parsers import expat  # noqa: S410
+
+    parser = expat.ParserCreate(namespace_separator="}")
+    parser.buffer_text = True
+    parser.StartElementHandler = handler.start
+    parser.EndElementHandler = handler.end
+    parser.CharacterDataHandler = handler.data
+    parser.EntityDeclHandler = _forbid_entities
+    parser.UnparsedEntityDeclHandler = _forbid_entities
+    parser.ExternalEntityRefHandler = _forbid_entities
+
+    while chunk := stream.read(chunk_size):
+        parser.Parse(chunk, False)
+        if handler.items:
+            yield from handler.items
+            handler.items.clear()
+    parser.Parse(b"", True)
+    yield from handler.items
+    handler.items.clear()
+
+
+def _json_values(components: list[dict]) -> list[tuple[str, list[str | None]]]:
+    """Return the ID and the value codes of SDMX-JSON components.
+
+    Values without an ID, such as the titles of series, are given by their name.
+    """
+    return [
+        (
+            _intern(component.get("id", "")),
+            [
+                _intern(str(v.get("id", v.get("value", v.get("name", "")))))
+                if isinstance(v, dict)
+                else v
+                for v in component.get("values", [])
+            ],
+        )
+        for component in components
+    ]
+
+
+def _decode_json(
+    components: list[tuple[str, list]], indexes: list, target: dict
+) -> None:
+    """Decode component value indexes into a dictionary."""
+    for (component_id, values), index in zip(components, indexes):
+        if index is None or index == "":
+            continue
+        index = int(index)  # noqa: PLW2901
+        target[component_id] = values[index] if 0 <= index < len(values) else None
+
+
+def _iter_json(stream: IO[bytes]) -> Iterator[SdmxSeries | SdmxGroup]:
+    """Parse an SDMX-JSON message, version 1.0 or 2.0.
+
+    JSON messages are decoded at once, but the observations are still
+    emitted as columns, without a dictionary per observation.
+    """
+    document = json.load(stream)
+    root = document.get("data", document)
+    structure = root.get("structure") or (root.get("structures") or [{}])[0]
+    dimensions = structure.get("dimensions", {})
+    attributes = structure.get("attributes", {})
+    series_dimensions = _json_values(dimensions.get("series", []))
+    observation_dimensions = _json_values(dimensions.get("observation", []))
+    series_attributes = _json_values(attributes.get("series", []))
+    observation_attributes = _json_values(attributes.get("observation", []))
+    observation_names = [name for name, _ in observation_dimensions]
+
+    for data_set in root.get("dataSets", []):
+        all_series = data_set.get("series")
+        if all_series is None:
+            # Flat data sets, with all the dimensions at the observation level.
+            all_series = {"": {"observations": data_set.get("observations", {})}}
+        for series_key, content in all_series.items():
+            key: dict = {}
+            _decode_json(
+                series_dimensions,
+                series_key.split(":") if series_key else [],
+                key,
+            )
+            series_attrs: dict = {}
+            _decode_json(
+                series_attributes, content.get("attributes") or [], series_attrs
+            )
+            series = SdmxSeries(key, series_attrs)
+            for observation_key, values in (content.get("observations") or {}).items():
+                observation: dict = {}
+                _decode_json(
+                    observation_dimensions, observation_key.split(":"), observation
+                )
+                if len(observation_names) == 1 and TIME_PERIOD not in observation:
+                    observation[TIME_PERIOD] = observation.pop(
+                        observation_names[0], None
+                    )
+                observation[OBS_VALUE] = values[0] if values else None
+                _decode_json(observation_attributes, values[1:], observation)
+                series.add_observation(observation)
+            yield series
+
+
+def iter_sdmx(
+    source: SdmxSource, sdmx_format: SdmxFormat | None = None
+) -> Iterator[SdmxSeries | SdmxGroup]:
+    """Iterate over the groups and series of an SDMX data message.
+
+    Parameters
+    ----------
+    source : str | bytes | Path | IO[bytes]
+        The message, as text, bytes, a file path or a binary stream.
+    sdmx_format : SdmxFormat | None
+        The format of the message. Detected when not given.
+
+    Yields
+    ------
+    SdmxSeries | SdmxGroup
+        The groups and series, in the order of the message.
+    """
+    sdmx_format = sdmx_format or detect_format(source)
+    stream, close = _open_source(source)
+    try:
+        if sdmx_format == "json":
+            yield from _iter_json(stream)
+        elif sdmx_format == "generic":
+            yield from _parse_xml(stream, _GenericHandler())
+        elif sdmx_format == "structure_specific":
+            yield from _parse_xml(stream, _StructureSpecificHandler())
+        else:
+            raise ValueError(f"Unsupported SDMX format: {sdmx_format}")
+    finally:
+        if close:
+            stream.close()
+
+
+def read_sdmx_columns(
+    source: SdmxSource, sdmx_format: SdmxFormat | None = None, missing: Any = None
+) -> SdmxColumns:
+    """Read the series of an SDMX data message into an `SdmxColumns` builder.
+
+    The attributes of groups are not applied to their series.
+    """
+    columns = SdmxColumns(missing=missing)
+    for item in iter_sdmx(source, sdmx_format):
+        if isinstance(item, SdmxSeries):
+            columns.add_series(item)
+    return columns
+
+
+def read_sdmx(
+    source: SdmxSource,
+    sdmx_format: SdmxFormat | None = None,
+    output: Literal["pandas", "arrow"] = "pandas",
+    categorical: bool = False,
+) -> Union["DataFrame", "Table"]:
+    """Read an SDMX data message into a DataFrame or an Arrow table.
+
+    Parameters
+    ----------
+    source : str | bytes | Path | IO[bytes]
+        The message, as text, bytes, a file path or a binary stream.
+    sdmx_format : SdmxFormat | None
+        The format of the message. Detected when not given.
+    output : Literal["pandas", "arrow"]
+        The type of the result.
+    categorical : bool
+        Store the series key and attribute columns as categoricals, or
+        dictionary-encoded arrays.
+
+    Returns
+    -------
+    DataFrame | Table
+        One row per observation, with the series key and attributes, the
+        `TIME_PERIOD`, the `OBS_VALUE` and the observation attributes.
+        Values are returned as strings.
+    """
+    columns = read_sdmx_columns(source, sdmx_format)
+    if output == "arrow":
+        return columns.to_arrow(categorical=categorical)
+    return columns.to_dataframe(categorical=categorical)
@@ -0,0 +1,194 @@
+"""Cross-process shared cache tier.
+
+A small key-value cache backed by a local SQLite database in WAL mode. Every
+process opening the same file reads and writes the same entries, so results
+cached by one API worker are served to all the others, and the cache survives
+worker restarts.
+
+Values are pickled, and every entry may carry its own expiry time. Expired
+entries of every namespace are removed when a cache is opened, and then by
+`set` at most once every `PURGE_INTERVAL` seconds.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import os
+import pickle  # noqa: S403
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+# Minimum seconds between two purges of expired entries by the same process.
+PURGE_INTERVAL = 600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at);
+"""
+
+
+def get_shared_cache_path() -> Path:
+    """Get the path of the shared cache database.
+
+    Defaults to `shared_cache.db` in the user cache directory, and can be
+    overridden with the `OPENBB_SHARED_CACHE_PATH` environment variable.
+    """
+    if path := os.environ.get("OPENBB_SHARED_CACHE_PATH"):
+        return Path(path)
+
+    from openbb_core.app.utils import get_user_cache_directory
+
+    return Path(get_user_cache_directory()) / "shared_cache.db"
+
+
+class SharedCache:
+    """Key-value cache shared by every process using the same database file.
+
+    Parameters
+    ----------
+    namespace : str
+        Namespace isolating the keys of one cache user from the others.
+    path : Path | None
+        The database file. Defaults to `get_shared_cache_path()`.
+    default_ttl : float | None
+        Time-to-live in seconds for entries set without one. None never expires.
+
+    Examples
+    --------
+    >>> cache = SharedCache("sec_symbol_map")
+    >>> cache.set("AAPL", "0000320193", ttl=86400)
+    >>> cache.get("AAPL")
+    '0000320193'
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        path: Path | None = None,
+        default_ttl: float | None = None,
+    ):
+        """Initialize the shared cache."""
+        self.namespace = namespace
+        self.path = Path(path) if path else get_shared_cache_path()
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._last_purge = 0.0
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """Create the database and its schema if they don't exist."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._conn
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(_SCHEMA)
+        self.purge_expired()
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Return a connection owned by the current thread and process."""
+        # Connections must not cross a fork, so reconnect in child processes.
+        if self._pid != os.getpid():
+            self._local = threading.local()
+            self._pid = os.getpid()
+            self.hits = 0
+            self.misses = 0
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value, or `default` if it is missing or expired."""
+        row = self._conn.execute(
+            "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+            (self.namespace, key),
+        ).fetchone()
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            self.misses += 1
+            return default
+        self.hits += 1
+        return pickle.loads(row[0])  # noqa: S301
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Set a value, expiring after `ttl` seconds (or the default TTL)."""
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._conn.execute(
+            "INSERT INTO cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (namespace, key) DO UPDATE SET "
+            "value = excluded.value, expires_at = excluded.expires_at",
+            (self.namespace, key, pickle.dumps(value, protocol=5), expires_at),
+        )
+        if time.time() - self._last_purge >= PURGE_INTERVAL:
+            self.purge_expired()
+
+    def items(self) -> list[tuple[str, Any]]:
+        """Return every unexpired entry of this namespace."""
+        rows = self._conn.execute(
+            "SELECT key, value FROM cache WHERE namespace = ? "
+            "AND (expires_at IS NULL OR expires_at > ?)",
+            (self.namespace, time.time()),
+        ).fetchall()
+        return [(key, pickle.loads(value)) for key, value in rows]  # noqa: S301
+
+    def delete(self, key: str) -> None:
+        """Remove a key."""
+        self._conn.execute(
+            "DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key)
+        )
+
+    def clear(self) -> None:
+        """Remove every key of this namespace."""
+        self._conn.execute("DELETE FROM cache WHERE namespace = ?", (self.namespace,))
+
+    def purge_expired(self) -> int:
+        """Remove expired entries of every namespace, returning how many were removed."""
+        self._last_purge = time.time()
+        cursor = self._conn.execute(
+            "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+        return cursor.rowcount
+
+    def stats(self) -> dict[str, Any]:
+        """Return the hit and miss counts of this process."""
+        total = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else None,
+        }
+
+
+_caches: dict[str, SharedCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_shared_cache(namespace: str, default_ttl: float | None = None) -> SharedCache:
+    """Get the process-wide shared cache for a namespace, creating it if needed."""
+    with _caches_lock:
+        if namespace not in _caches:
+            _caches[namespace] = SharedCache(namespace, default_ttl=default_ttl)
+        return _caches[namespace]
+
+
+def shared_cache_stats() -> list[dict[str, Any]]:
+    """Return the statistics of every shared cache used by this process."""
+    with _caches_lock:
+        return [cache.stats() for cache in _caches.values()]
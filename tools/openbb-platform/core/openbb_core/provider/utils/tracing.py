@@ -0,0 +1,447 @@
+"""Per-stage timing spans for command execution.
+
+A command goes through several stages: parameter building and validation,
+credential filtering, the fetcher's `transform_query`, `extract_data` and
+`transform_data`, OBBject construction, output callbacks and, in the API,
+JSON encoding. Each stage is wrapped in a `span`, nested under the trace
+started for the command, so the time spent in every stage is recorded with
+the route and provider it belongs to.
+
+Tracing is disabled by default, and spans are then no-ops. It is configured
+in the `tracing` key of the Python settings in `system_settings.json`:
+
+    "python_settings": {
+        "tracing": {
+            "enabled": true,
+            "sample_rate": 0.1,
+            "exporters": ["prometheus", "otel"],
+            "profile_routes": {"/equity/price/historical": 0.01}
+        }
+    }
+
+- `sample_rate` is the fraction of commands traced.
+- `exporters` selects where finished traces go. "prometheus" aggregates stage
+  durations into histograms, served by the API at `GET /metrics`. "otel"
+  re-emits the spans through the OpenTelemetry API, when it is installed.
+  More exporters can be added with `register_span_exporter`.
+- `profile_routes` runs cProfile around a sample of the commands of a route,
+  writing the profiles to the `profiles` folder of the user cache directory.
+  Other profilers can be attached to routes with `register_profiler`.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import os
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any
+
+# Upper bounds, in seconds, of the stage duration histogram buckets.
+DURATION_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class Span:
+    """A timed stage of a trace."""
+
+    __slots__ = ("attributes", "end_ns", "name", "parent", "span_id", "start_ns")
+
+    def __init__(self, name: str, parent: "Span | None", attributes: dict):
+        """Initialize and start the span."""
+        self.name = name
+        self.parent = parent
+        self.attributes = attributes
+        self.span_id = random.getrandbits(64)  # noqa: S311
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: int | None = None
+
+    @property
+    def duration(self) -> int:
+        """Duration of the span in nanoseconds."""
+        return (self.end_ns or time.perf_counter_ns()) - self.start_ns
+
+
+class Trace:
+    """The spans recorded for one command or request."""
+
+    __slots__ = ("attributes", "epoch_ns", "lock", "root", "spans", "trace_id")
+
+    def __init__(self, name: str, attributes: dict):
+        """Initialize the trace and start its root span."""
+        self.trace_id = random.getrandbits(128)  # noqa: S311
+        self.attributes = attributes
+        # Wall clock time of the trace start, to convert span times for exporters.
+        self.epoch_ns = time.time_ns()
+        self.lock = threading.Lock()
+        self.root = Span(name, None, {})
+        self.spans: list[Span] = [self.root]
+
+    def to_epoch_ns(self, perf_ns: int) -> int:
+        """Convert a `perf_counter_ns` time of this trace to nanoseconds since the epoch."""
+        return self.epoch_ns + perf_ns - self.root.start_ns
+
+    def stages(self) -> dict[str, int]:
+        """Return the total duration of each stage, in nanoseconds."""
+        stages: dict[str, int] = {}
+        for s in self.spans:
+            if s.end_ns is not None:
+                stages[s.name] = stages.get(s.name, 0) + s.duration
+        return stages
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("openbb_trace", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("openbb_span", default=None)
+
+_settings: dict[str, Any] | None = None
+_exporters: list[Callable[[Trace], None]] = []
+_profilers: dict[str, list[Callable[[str], AbstractContextManager]]] = {}
+_NULL_CONTEXT = nullcontext()
+
+
+def get_tracing_settings() -> dict[str, Any]:
+    """Get the tracing settings from the Python settings, reading them once."""
+    if _settings is None:
+        try:
+            from openbb_core.app.service.system_service import SystemService
+
+            python_settings = (
+                SystemService().system_settings.python_settings.model_dump()
+            )
+            settings = python_settings.get("tracing") or {}
+        except Exception:  # pylint: disable=broad-except
+            settings = {}
+        configure_tracing(**settings)
+
+    return _settings  # type: ignore[return-value]
+
+
+def configure_tracing(
+    enabled: bool = False,
+    sample_rate: float = 1.0,
+    exporters: list[str] | None = None,
+    profile_routes: dict[str, float] | None = None,
+    profile_dir: str | None = None,
+) -> None:
+    """Configure tracing, replacing the settings read from `system_settings.json`.
+
+    Parameters
+    ----------
+    enabled : bool
+        Record spans for commands.
+    sample_rate : float
+        Fraction of the commands traced, between 0 and 1.
+    exporters : list[str] | None
+        Built-in exporters to send finished traces to: "prometheus" and "otel".
+        Defaults to "prometheus".
+    profile_routes : dict[str, float] | None
+        Routes to profile with cProfile, and the fraction of their commands profiled.
+    profile_dir : str | None
+        Folder to write the profiles to. Defaults to the user cache directory.
+    """
+    global _settings  # noqa: PLW0603  # pylint: disable=global-statement
+
+    exporters = ["prometheus"] if exporters is None else exporters
+    _settings = {
+        "enabled": bool(enabled),
+        "sample_rate": min(max(float(sample_rate), 0.0), 1.0),
+        "exporters": exporters,
+        "profile_routes": profile_routes or {},
+        "profile_dir": profile_dir,
+    }
+    _exporters[:] = [e for e in _exporters if not getattr(e, "builtin", False)]
+    if "prometheus" in exporters:
+        _exporters.append(stage_metrics.record)
+    if "otel" in exporters:
+        _exporters.append(export_otel)
+
+
+def is_tracing_enabled() -> bool:
+    """Check if tracing is enabled."""
+    return get_tracing_settings()["enabled"]
+
+
+def register_span_exporter(exporter: Callable[[Trace], None]) -> None:
+    """Register a function called with every finished trace."""
+    _exporters.append(exporter)
+
+
+def register_profiler(
+    route: str, profiler: Callable[[str], AbstractContextManager]
+) -> None:
+    """Register a profiler for a route, or for every route with "*".
+
+    The profiler is called with the route and returns a context manager
+    wrapping the execution of the command.
+    """
+    _profilers.setdefault(route, []).append(profiler)
+
+
+def current_trace() -> Trace | None:
+    """Get the trace recorded in the current context."""
+    return _current_trace.get()
+
+
+def set_trace_attribute(key: str, value: Any) -> None:
+    """Set an attribute of the current trace, such as the provider."""
+    if (trace := _current_trace.get()) is not None:
+        trace.attributes[key] = value
+
+
+def span(name: str, **attributes) -> AbstractContextManager:
+    """Time a stage of the current trace. Does nothing when no trace is recorded."""
+    if _current_trace.get() is None:
+        return _NULL_CONTEXT
+    return _span(name, attributes)
+
+
+@contextmanager
+def _span(name: str, attributes: dict) -> Iterator[Span]:
+    trace = _current_trace.get()
+    s = Span(name, _current_span.get(), attributes)
+    with trace.lock:  # type: ignore[union-attr]
+        trace.spans.append(s)  # type: ignore[union-attr]
+    token = _current_span.set(s)
+    try:
+        yield s
+    finally:
+        s.end_ns = time.perf_counter_ns()
+        _current_span.reset(token)
+
+
+def start_trace(name: str, **attributes) -> AbstractContextManager:
+    """Start a trace, or a span when a trace is already recorded.
+
+    The trace is recorded if tracing is enabled and the command is sampled.
+    """
+    if _current_trace.get() is not None:
+        return _span(name, attributes)
+    settings = get_tracing_settings()
+    if not settings["enabled"] or random.random() >= settings["sample_rate"]:  # noqa: S311
+        return _NULL_CONTEXT
+    return _trace(name, attributes)
+
+
+@contextmanager
+def _trace(name: str, attributes: dict) -> Iterator[Trace]:
+    trace = Trace(name, attributes)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(trace.root)
+    try:
+        yield trace
+    finally:
+        trace.root.end_ns = time.perf_counter_ns()
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+        for exporter in list(_exporters):
+            try:
+                exporter(trace)
+            except Exception:  # pylint: disable=broad-except  # noqa: S110
+                pass
+
+
+def profile_route(route: str) -> AbstractContextManager:
+    """Run the profilers registered and configured for a route."""
+    profilers = _profilers.get(route, []) + _profilers.get("*", [])
+    rate = get_tracing_settings()["profile_routes"].get(route)
+    if rate and random.random() < rate:  # noqa: S311
+        profilers = [*profilers, cprofile_profiler]
+    if not profilers:
+        return _NULL_CONTEXT
+    return _profile(route, profilers)
+
+
+@contextmanager
+def _profile(route: str, profilers: list) -> Iterator[None]:
+    from contextlib import ExitStack
+
+    with ExitStack() as stack:
+        for profiler in profilers:
+            stack.enter_context(profiler(route))
+        yield
+
+
+_cprofile_lock = threading.Lock()
+
+
+@contextmanager
+def cprofile_profiler(route: str) -> Iterator[None]:
+    """Profile a command with cProfile, writing the stats to the profile folder.
+
+    Only one command is profiled at a time. In the API, the profile also
+    covers the other requests served by the event loop meanwhile.
+    """
+    import cProfile
+    from pathlib import Path
+
+    if not _cprofile_lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+        yield
+        return
+
+    profile_dir = get_tracing_settings()["profile_dir"]
+    if not profile_dir:
+        from openbb_core.app.utils import get_user_cache_directory
+
+        profile_dir = Path(get_user_cache_directory()) / "profiles"
+
+    profiler = cProfile.Profile()
+    try:
+        try:
+            profiler.enable()
+        except ValueError:  # Another profiler is active in this thread.
+            yield
+            return
+        try:
+            yield
+        finally:
+            profiler.disable()
+            path = Path(profile_dir)
+            path.mkdir(parents=True, exist_ok=True)
+            name = route.strip("/").replace("/", ".") or "root"
+            profiler.dump_stats(path / f"{name}-{time.time_ns()}-{os.getpid()}.prof")
+    finally:
+        _cprofile_lock.release()
+
+
+class StageMetrics:
+    """Histograms of stage durations by route, provider and stage."""
+
+    def __init__(self):
+        """Initialize the metrics."""
+        self._lock = threading.Lock()
+        # (route, provider, stage) -> [bucket counts..., +Inf count, sum]
+        self._series: dict[tuple[str, str, str], list] = {}
+
+    def record(self, trace: Trace) -> None:
+        """Add the spans of a finished trace to the histograms."""
+        from bisect import bisect_left
+
+        route = str(trace.attributes.get("route", ""))
+        provider = str(trace.attributes.get("provider", ""))
+        with self._lock:
+            for s in trace.spans:
+                if s.end_ns is None:
+                    continue
+                seconds = s.duration / 1e9
+                key = (route, provider, s.name)
+                series = self._series.get(key)
+                if series is None:
+                    series = [0] * (len(DURATION_BUCKETS) + 1) + [0.0]
+                    self._series[key] = series
+                series[bisect_left(DURATION_BUCKETS, seconds)] += 1
+                series[-1] += seconds
+
+    record.builtin = True  # type: ignore[attr-defined]
+
+    def snapshot(self) -> dict[tuple[str, str, str], list]:
+        """Return a copy of the histograms."""
+        with self._lock:
+            return {key: list(series) for key, series in self._series.items()}
+
+    def clear(self) -> None:
+        """Reset the histograms."""
+        with self._lock:
+            self._series.clear()
+
+
+stage_metrics = StageMetrics()
+
+
+def render_prometheus(
+    snapshots: list[dict[tuple[str, str, str], list]] | None = None,
+) -> str:
+    """Render stage histograms in the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    snapshots : list[dict] | None
+        Histogram snapshots to sum, e.g. one per API worker.
+        Defaults to the metrics of the current process.
+    """
+    if snapshots is None:
+        snapshots = [stage_metrics.snapshot()]
+
+    merged: dict[tuple[str, str, str], list] = {}
+    for snapshot in snapshots:
+        for key, series in snapshot.items():
+            if key in merged:
+                merged[key] = [a + b for a, b in zip(merged[key], series)]
+            else:
+                merged[key] = list(series)
+
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    name = "openbb_stage_duration_seconds"
+    lines = [
+        f"# HELP {name} Duration of command execution stages.",
+        f"# TYPE {name} histogram",
+    ]
+    for (route, provider, stage), series in sorted(merged.items()):
+        labels = (
+            f'route="{escape(route)}",provider="{escape(provider)}",'
+            f'stage="{escape(stage)}"'
+        )
+        cumulative = 0
+        for bound, count in zip(DURATION_BUCKETS, series):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        count = cumulative + series[len(DURATION_BUCKETS)]
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+        lines.append(f"{name}_sum{{{labels}}} {series[-1]}")
+        lines.append(f"{name}_count{{{labels}}} {count}")
+
+    return "\n".join(lines) + "\n"
+
+
+def export_otel(trace: Trace) -> None:
+    """Re-emit the spans of a finished trace through the OpenTelemetry API.
+
+    Spans go to the tracer provider configured by the application, and are
+    dropped if `opentelemetry-api` is not installed.
+    """
+    try:
+        from opentelemetry import trace as otel_trace
+    except ImportError:
+        return
+
+    tracer = otel_trace.get_tracer("openbb_core")
+    otel_spans: dict[int, Any] = {}
+    attributes = {
+        f"openbb.{k}": str(v) for k, v in trace.attributes.items() if v is not None
+    }
+    # Spans are recorded in start order, so parents are created before children.
+    for s in trace.spans:
+        parent = otel_spans.get(s.parent.span_id) if s.parent else None
+        context = otel_trace.set_span_in_context(parent) if parent else None
+        otel_span = tracer.start_span(
+            s.name,
+            context=context,
+            start_time=trace.to_epoch_ns(s.start_ns),
+            attributes={
+                **attributes,
+                **{f"openbb.{k}": str(v) for k, v in s.attributes.items()},
+            },
+        )
+        otel_spans[s.span_id] = otel_span
+    for s in reversed(trace.spans):
+        otel_spans[s.span_id].end(end_time=trace.to_epoch_ns(s.end_ns or s.start_ns))
+
+
+export_otel.builtin = True  # type: ignore[attr-defined]
@@ -0,0 +1,90 @@
+"""Test the blobs API router."""
+
+import hashlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from openbb_core.api.router.blobs import router
+from openbb_core.provider.utils import blob_cache
+from openbb_core.provider.utils.blob_cache import BlobCache
+
+# pylint: disable=redefined-outer-name
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def blob(tmp_path, monkeypatch):
+    """Store a document in a temporary blob cache."""
+    cache = BlobCache(tmp_path)
+    monkeypatch.setattr(blob_cache, "_cache", cache)
+    temp = tmp_path / "tmp" / "download"
+    temp.write_bytes(CONTENT)
+    return cache._store(  # pylint: disable=protected-access
+        "https://example.com/data/report.pdf",
+        temp,
+        hashlib.sha256(CONTENT).hexdigest(),
+        len(CONTENT),
+        {"Content-Type": "application/pdf"},
+    )
+
+
+@pytest.fixture
+def client():
+    """Return a client of the router."""
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_get_blob(client, blob):
+    """Test that a document is streamed with its media type and digest."""
+    response = client.get(f"/blobs/{blob.sha256}")
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["etag"] == f'"{blob.sha256}"'
+    assert "immutable" in response.headers["cache-control"]
+    assert 'filename="report.pdf"' in response.headers["content-disposition"]
+    # Digests are case insensitive.
+    assert client.get(f"/blobs/{blob.sha256.upper()}").status_code == 200
+
+
+@pytest.mark.parametrize("digest", ["0" * 64, "not-a-digest", "ab" * 33])
+def test_unknown_or_invalid_digest(client, blob, digest):
+    """Test that unknown and invalid digests are not found."""
+    assert client.get(f"/blobs/{digest}").status_code == 404
+
+
+def test_if_none_match(client, blob):
+    """Test that a client holding the document gets a 304."""
+    response = client.get(
+        f"/blobs/{blob.sha256}", headers={"If-None-Match": f'"{blob.sha256}"'}
+    )
+
+    assert response.status_code == 304
+    assert not response.content
+    assert response.headers["etag"] == f'"{blob.sha256}"'
+
+
+def test_range(client, blob):
+    """Test that byte ranges of a document can be requested."""
+    response = client.get(f"/blobs/{blob.sha256}", headers={"Range": "bytes=10-19"})
+
+    assert response.status_code == 206
+    assert response.content == CONTENT[10:20]
+    assert response.headers["content-range"] == f"bytes 10-19/{len(CONTENT)}"
+
+    response = client.get(f"/blobs/{blob.sha256}", headers={"Range": "bytes=-5"})
+    assert response.content == CONTENT[-5:]
+
+
+def test_head(client, blob):
+    """Test that a HEAD request returns the headers without the content."""
+    response = client.head(f"/blobs/{blob.sha256}")
+
+    assert response.status_code == 200
+    assert not response.content
+    assert response.headers["content-length"] == str(len(CONTENT))
@@ -0,0 +1,140 @@
+"""Test the columnar results."""
+
+from datetime import date as dateType
+
+import pytest
+from openbb_core.app.model.obbject import OBBject
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.abstract.data_table import DataTable
+from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.abstract.query_params import QueryParams
+from pandas import DataFrame, to_datetime
+from pydantic import Field, ValidationError
+
+
+class Bar(Data):
+    """A daily bar."""
+
+    __alias_dict__ = {"close": "Close"}
+
+    date: dateType = Field(description="The date.")
+    close: float = Field(description="The close price.")
+    volume: float | None = Field(default=None, description="The volume.")
+    exchange: str | None = Field(default=None, description="The exchange.")
+
+
+def bars(**columns) -> DataFrame:
+    """Return two bars, with columns replaced."""
+    return DataFrame(
+        {
+            "date": to_datetime(["2024-01-02", "2024-01-03"]),
+            "Close": [1.5, 2.5],
+            "volume": [100.0, 200.0],
+            "exchange": ["NYSE", None],
+            **columns,
+        }
+    )
+
+
+def test_rows_are_validated_on_access():
+    """Test that the rows are the `Data` of the table, read from the columns."""
+    table = DataTable.from_dataframe(bars(), Bar)
+
+    assert len(table) == 2
+    assert list(table.columns) == ["date", "close", "volume", "exchange"]
+    assert table[0] == Bar(
+        date=dateType(2024, 1, 2), close=1.5, volume=100, exchange="NYSE"
+    )
+    assert table[-1].exchange is None
+    assert [bar.close for bar in table] == [1.5, 2.5]
+    assert table.to_records()[1] == {
+        "date": dateType(2024, 1, 3),
+        "close": 2.5,
+        "volume": 200.0,
+    }
+
+
+def test_slices_and_dataframe():
+    """Test that slices are tables, and the DataFrame has dates."""
+    table = DataTable.from_dataframe(bars(), Bar)
+
+    sliced = table[1:]
+    assert isinstance(sliced, DataTable)
+    assert [bar.close for bar in sliced] == [2.5]
+    assert table.to_dataframe()["date"].tolist() == [
+        dateType(2024, 1, 2),
+        dateType(2024, 1, 3),
+    ]
+    with pytest.raises(IndexError):
+        table.row(2)
+
+
+def test_nan_in_optional_field_is_omitted():
+    """Test that a NaN of an optional field leaves the field to its default."""
+    table = DataTable.from_dataframe(bars(volume=[float("nan"), 200.0]), Bar)
+
+    assert table[0].volume is None
+    assert "volume" not in table.row(0)
+
+
+def test_nan_in_required_numeric_field_is_kept():
+    """Test that a NaN of a required number is kept, as in a list of `Data`."""
+    table = DataTable.from_dataframe(bars(Close=[float("nan"), 2.5]), Bar)
+
+    assert table[0].close != table[0].close
+    dumped = OBBject(results=table).model_dump()["results"]
+    assert dumped[0]["close"] != dumped[0]["close"]
+    assert dumped[1]["close"] == 2.5
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [
+        {"date": to_datetime(["2024-01-02", None])},
+        {"Close": [1.5, None]},
+    ],
+)
+def test_missing_values_in_required_fields_fail_on_creation(columns):
+    """Test that missing required values fail when the table is created."""
+    df = bars(**columns)
+    if "Close" in columns:
+        df["Close"] = df["Close"].astype(object)
+
+    with pytest.raises(ValueError, match="has 1 missing values"):
+        DataTable.from_dataframe(df, Bar)
+
+
+def test_missing_required_column_fails_on_creation():
+    """Test that a table without the column of a required field is refused."""
+    with pytest.raises(ValueError, match="'close' has no column"):
+        DataTable.from_dataframe(bars().drop(columns="Close"), Bar)
+
+
+def test_fetcher_test_validates_every_row():
+    """Test that `Fetcher.test` validates the rows of a returned table."""
+
+    class BarQueryParams(QueryParams):
+        """Bar query."""
+
+    class BarFetcher(Fetcher[BarQueryParams, list[Bar]]):
+        """Fetcher returning a table with an invalid last row."""
+
+        require_credentials = False
+
+        @staticmethod
+        def transform_query(params):
+            """Return the query."""
+            return BarQueryParams(**params)
+
+        @staticmethod
+        def extract_data(query, credentials, **kwargs):
+            """Return the bars."""
+            return [{"date": "2024-01-02", "Close": 1.5}]
+
+        @staticmethod
+        def transform_data(query, data, **kwargs):
+            """Return a table whose last close is not a number."""
+            return DataTable.from_dataframe(bars(Close=[1.5, "n/a"]), Bar)
+
+    with pytest.raises(ValidationError):
+        BarFetcher.test({})
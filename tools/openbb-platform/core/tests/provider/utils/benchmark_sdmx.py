@@ -0,0 +1,104 @@
+"""Benchmark the streaming SDMX reader against the parsers it replaced.
+
+The samples in `sdmx_samples` are scaled up by repeating their series, then
+parsed to a DataFrame by the previous ElementTree parsers and by the reader,
+reporting the time and the peak of allocated memory of each.
+
+    python benchmark_sdmx.py --copies 20000
+"""
+
+import argparse
+import json
+import re
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from openbb_core.provider.utils.sdmx import read_sdmx
+from pandas import DataFrame
+from sdmx_reference import imf_observation_rows, oecd_xml_to_df
+
+try:
+    from openbb_oecd.utils.helpers import oecd_xml_to_df as oecd_reader
+except ImportError:
+    # The OECD provider reads the generic format with the reader.
+    oecd_reader = partial(read_sdmx, sdmx_format="generic")
+
+SAMPLES = Path(__file__).parent / "sdmx_samples"
+
+
+def scale_xml(content: bytes, copies: int) -> bytes:
+    """Repeat the series of an XML message."""
+    matches = list(
+        re.finditer(rb"<(generic:)?Series[ >].*?</\1?Series>", content, re.DOTALL)
+    )
+    series = b"".join(match.group() for match in matches)
+    start, end = matches[0].start(), matches[-1].end()
+    return content[:start] + series * copies + content[end:]
+
+
+def scale_json(content: bytes, copies: int) -> bytes:
+    """Repeat the series of an SDMX-JSON message, under new currencies."""
+    message = json.loads(content)
+    currency = message["structure"]["dimensions"]["series"][1]
+    values = currency["values"]
+    data_set = message["dataSets"][0]
+    series: dict = {}
+    for copy in range(copies):
+        for key, observations in data_set["series"].items():
+            parts = key.split(":")
+            parts[1] = str(int(parts[1]) + copy * len(values))
+            series[":".join(parts)] = observations
+    currency["values"] = [
+        {"id": f"{v['id']}{copy}", "name": v["name"]}
+        for copy in range(copies)
+        for v in values
+    ]
+    data_set["series"] = series
+    return json.dumps(message).encode()
+
+
+def imf_reader(content: bytes) -> DataFrame:
+    """Parse an IMF message with the reader, dropping the missing values."""
+    df = read_sdmx(content, "structure_specific")
+    return df[~df["OBS_VALUE"].isin(["", "D"])]
+
+
+def measure(name: str, parse: Callable[[bytes], DataFrame], content: bytes) -> None:
+    """Print the time and the peak memory of a parser, measured separately."""
+    start = time.perf_counter()
+    df = parse(content)
+    elapsed = time.perf_counter() - start
+    del df
+    tracemalloc.start()
+    df = parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {name:<12} {len(df):>10} rows {elapsed:>8.2f} s {peak / 1e6:>8.1f} MB")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=10000)
+    copies = parser.parse_args().copies
+
+    oecd = scale_xml((SAMPLES / "oecd_generic.xml").read_bytes(), copies)
+    print(f"OECD generic, {len(oecd) / 1e6:.1f} MB")
+    measure("ElementTree", oecd_xml_to_df, oecd)
+    measure("reader", oecd_reader, oecd)
+
+    imf = scale_xml((SAMPLES / "imf_structure_specific.xml").read_bytes(), copies)
+    print(f"IMF structure-specific, {len(imf) / 1e6:.1f} MB")
+    measure("ElementTree", lambda c: DataFrame(imf_observation_rows(c)), imf)
+    measure("reader", imf_reader, imf)
+
+    ecb = scale_json((SAMPLES / "ecb_exr.json").read_bytes(), copies)
+    print(f"ECB SDMX-JSON, {len(ecb) / 1e6:.1f} MB")
+    measure("reader", read_sdmx, ecb)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Parsers replaced by the streaming SDMX reader, kept as a reference.
+
+`oecd_xml_to_df` is the ElementTree parser of the OECD provider, before it was
+moved to `openbb_core.provider.utils.sdmx`. The tests check the new parsers
+against it, and the benchmark compares their time and memory.
+"""
+
+from defusedxml.ElementTree import fromstring
+from pandas import DataFrame
+
+
+def oecd_xml_to_df(xml_string: str | bytes) -> DataFrame:
+    """Parse the OECD XML and return a dataframe.
+
+    Parameters
+    ----------
+    xml_string : str | bytes
+        A string containing the OECD XML data.
+
+    Returns
+    -------
+    DataFrame
+        A Pandas DataFrame containing the parsed data from the XML string.
+    """
+    root = fromstring(xml_string)
+
+    namespaces = {
+        "message": "http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message",
+        "generic": "http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/generic",
+    }
+
+    data = []
+
+    for series in root.findall(".//generic:Series", namespaces=namespaces):
+        series_data = {}
+        for value in series.findall(".//generic:Value", namespaces=namespaces):
+            series_data[value.get("id")] = value.get("value")
+        for obs in series.findall("./generic:Obs", namespaces=namespaces):
+            obs_data = series_data.copy()
+            obs_data["TIME_PERIOD"] = obs.find(
+                "./generic:ObsDimension", namespaces=namespaces
+            ).get(  # type: ignore
+                "value"
+            )
+            obs_data["VALUE"] = obs.find(
+                "./generic:ObsValue", namespaces=namespaces
+            ).get(  # type: ignore
+                "value"
+            )
+            data.append(obs_data)
+
+    return DataFrame(data)
+
+
+def imf_observation_rows(xml_string: str | bytes) -> list[dict]:
+    """Return the raw rows of an IMF structure-specific message.
+
+    This is the ElementTree loop of `ImfQueryBuilder.fetch_data`, before it
+    was moved to `openbb_core.provider.utils.sdmx`, without the translation of
+    the codes: one row per observation with a value, holding the attributes of
+    its series and the TIME_PERIOD, OBS_VALUE, UNIT, SCALE and DERIVATION_TYPE
+    of the observation.
+    """
+    root = fromstring(xml_string)
+    namespaces = {
+        "message": "http://www.sdmx.org/resources/sdmxml/schemas/v3_0/message",
+        "ss": "http://www.sdmx.org/resources/sdmxml/schemas/v3_0/data/"
+        "structurespecific",
+    }
+    dataset = root.find(".//message:DataSet", namespaces)
+    if dataset is None:
+        dataset = root.find(".//DataSet")
+    if dataset is None:
+        return []
+
+    rows: list[dict] = []
+    for series in dataset.findall("Series") + dataset.findall(
+        "ss:Series", namespaces
+    ):
+        series_meta = dict(series.attrib)
+        for obs in series.findall("Obs") + series.findall("ss:Obs", namespaces):
+            obs_row = series_meta.copy()
+            obs_row["TIME_PERIOD"] = (
+                obs.attrib.get("TIME_PERIOD")
+                or obs.attrib.get("TIME")
+                or obs.attrib.get("time")
+                or ""
+            )
+            obs_value = obs.attrib.get("OBS_VALUE") or obs.attrib.get("OBSERVATION")
+            if obs_value is None:
+                obs_value_elem = obs.find("ss:ObsValue", namespaces)
+                if obs_value_elem is None:
+                    obs_value_elem = obs.find("ObsValue")
+                if obs_value_elem is not None:
+                    obs_value = (
+                        obs_value_elem.attrib.get("value") or obs_value_elem.text
+                    )
+            for name in ("UNIT", "SCALE", "DERIVATION_TYPE"):
+                if obs_attr := obs.attrib.get(name):
+                    obs_row[name] = obs_attr
+            if obs_value is not None and obs_value not in ("", "D"):
+                obs_row["OBS_VALUE"] = obs_value
+                rows.append(obs_row)
+
+    return rows
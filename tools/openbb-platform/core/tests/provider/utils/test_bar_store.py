@@ -0,0 +1,168 @@
+"""Test the local store of historical bars."""
+
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.utils.bar_store import (
+    BarStore,
+    fetch_historical,
+    merge_ranges,
+    missing_ranges,
+)
+
+# pylint: disable=redefined-outer-name
+
+JAN = [date(2024, 1, day) for day in range(1, 32)]
+
+
+class Query:
+    """Query of the fake fetcher."""
+
+    def __init__(self, params: dict):
+        """Read the dates of the query."""
+        self.start_date = params.get("start_date")
+        self.end_date = params.get("end_date")
+
+
+class Fetcher:
+    """Fetcher of daily bars, recording its requests."""
+
+    def __init__(self):
+        """Initialize the prices, equal to the day of the month."""
+        self.factor = {"AAA": 1.0, "BBB": 10.0}
+        self.requests: list = []
+
+    def transform_query(self, params: dict) -> Query:
+        """Return the query."""
+        return Query(params)
+
+    async def fetch_data(self, params: dict, credentials=None, **kwargs) -> list:
+        """Return one bar per day of the requested range."""
+        symbol, start, end = params["symbol"], params["start_date"], params["end_date"]
+        self.requests.append((symbol, start, end))
+        bars = []
+        day = start
+        while day <= end:
+            price = day.day * self.factor[symbol]
+            bars.append(Data(date=day, open=price, high=price, low=price, close=price))
+            day += timedelta(days=1)
+        return bars
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Return a store in a temporary directory."""
+    return BarStore(tmp_path / "bars.db")
+
+
+def fetch(fetcher, store, symbol, start, end):
+    """Fetch the bars of a range through the store."""
+    return asyncio.run(
+        fetch_historical(
+            fetcher,
+            "test",
+            "EquityHistorical",
+            {"symbol": symbol, "start_date": start, "end_date": end},
+            store=store,
+        )
+    )
+
+
+def test_missing_ranges():
+    """Test the parts of a range outside the covered ranges."""
+    covered = [(JAN[4], JAN[9]), (JAN[14], JAN[19])]
+
+    assert missing_ranges([], JAN[0], JAN[30]) == [(JAN[0], JAN[30])]
+    assert missing_ranges(covered, JAN[0], JAN[30]) == [
+        (JAN[0], JAN[3]),
+        (JAN[10], JAN[13]),
+        (JAN[20], JAN[30]),
+    ]
+    assert not missing_ranges(covered, JAN[5], JAN[8])
+    assert missing_ranges(covered, JAN[7], JAN[16]) == [(JAN[10], JAN[13])]
+    assert missing_ranges(covered, JAN[21], JAN[25]) == [(JAN[21], JAN[25])]
+
+
+def test_merge_ranges():
+    """Test the merge of overlapping and adjacent ranges."""
+    assert merge_ranges(
+        [(JAN[10], JAN[12]), (JAN[0], JAN[4]), (JAN[3], JAN[6]), (JAN[7], JAN[8])]
+    ) == [(JAN[0], JAN[8]), (JAN[10], JAN[12])]
+    assert not merge_ranges([])
+
+
+def test_fetch_only_missing_ranges(store):
+    """Test that stored ranges are served from the store."""
+    fetcher = Fetcher()
+
+    first = fetch(fetcher, store, "AAA", JAN[9], JAN[19])
+    second = fetch(fetcher, store, "AAA", JAN[9], JAN[19])
+
+    assert [bar.close for bar in first] == [bar.close for bar in second]
+    assert fetcher.requests == [("AAA", JAN[9], JAN[19])]
+
+
+def test_gap_after_covered_range_is_anchored(store):
+    """Test that a gap extending a covered range starts at its last bar."""
+    fetcher = Fetcher()
+    fetch(fetcher, store, "AAA", JAN[0], JAN[9])
+
+    bars = fetch(fetcher, store, "AAA", JAN[0], JAN[14])
+
+    assert fetcher.requests[1] == ("AAA", JAN[9], JAN[14])
+    assert [bar.close for bar in bars] == [float(day.day) for day in JAN[:15]]
+
+
+def test_gap_away_from_covered_range_is_not_anchored(store):
+    """Test that a gap after an older range is fetched on its own."""
+    fetcher = Fetcher()
+    fetch(fetcher, store, "AAA", JAN[0], JAN[4])
+
+    bars = fetch(fetcher, store, "AAA", JAN[19], JAN[24])
+
+    assert fetcher.requests[1] == ("AAA", JAN[19], JAN[24])
+    assert [bar.close for bar in bars] == [float(day.day) for day in JAN[19:25]]
+
+
+def test_adjusted_history_is_downloaded_again(store):
+    """Test that a change of the stored prices drops the partition."""
+    fetcher = Fetcher()
+    fetch(fetcher, store, "AAA", JAN[0], JAN[9])
+
+    # A split halves the adjusted prices.
+    fetcher.factor["AAA"] = 0.5
+    bars = fetch(fetcher, store, "AAA", JAN[4], JAN[14])
+
+    assert fetcher.requests[1:] == [
+        ("AAA", JAN[9], JAN[14]),
+        ("AAA", JAN[4], JAN[14]),
+    ]
+    assert [bar.close for bar in bars] == [day.day * 0.5 for day in JAN[4:15]]
+    # The bars before the new range were dropped with the old prices.
+    fetch(fetcher, store, "AAA", JAN[0], JAN[4])
+    assert fetcher.requests[-1] == ("AAA", JAN[0], JAN[3])
+
+
+def test_multiple_symbols(store):
+    """Test that the bars of several symbols are merged by date and symbol."""
+    fetcher = Fetcher()
+    fetch(fetcher, store, "AAA", JAN[0], JAN[2])
+
+    bars = fetch(fetcher, store, "BBB,AAA", JAN[0], JAN[3])
+
+    assert [(str(bar.date), bar.symbol, bar.close) for bar in bars] == [
+        ("2024-01-01", "AAA", 1.0),
+        ("2024-01-01", "BBB", 10.0),
+        ("2024-01-02", "AAA", 2.0),
+        ("2024-01-02", "BBB", 20.0),
+        ("2024-01-03", "AAA", 3.0),
+        ("2024-01-03", "BBB", 30.0),
+        ("2024-01-04", "AAA", 4.0),
+        ("2024-01-04", "BBB", 40.0),
+    ]
+    assert sorted(fetcher.requests[1:]) == [
+        ("AAA", JAN[2], JAN[3]),
+        ("BBB", JAN[0], JAN[3]),
+    ]
@@ -0,0 +1,175 @@
+"""Test the content-addressed cache of downloaded documents."""
+
+import asyncio
+import hashlib
+
+import pytest
+from openbb_core.provider.utils import helpers
+from openbb_core.provider.utils.blob_cache import BlobCache
+
+# pylint: disable=redefined-outer-name
+
+URL = "https://example.com/filings/report.pdf?download=1"
+
+
+class Content:
+    """Body of a fake response."""
+
+    def __init__(self, body: bytes):
+        """Initialize the body."""
+        self.body = body
+
+    async def iter_chunked(self, size: int):
+        """Yield the body in chunks."""
+        for start in range(0, len(self.body), size):
+            yield self.body[start : start + size]
+
+
+class Response:
+    """Response of a fake server."""
+
+    def __init__(self, status: int, body: bytes = b"", headers: dict | None = None):
+        """Initialize the response."""
+        self.status = status
+        self.content = Content(body)
+        self.headers = headers or {}
+        self.released = False
+
+    def release(self):
+        """Release the connection."""
+        self.released = True
+
+    def raise_for_status(self):
+        """Raise for an error status."""
+        if self.status >= 400:  # noqa: PLR2004
+            raise ValueError(f"Status {self.status}")
+
+
+class Server:
+    """Server of one document, answering conditional requests."""
+
+    def __init__(self, body: bytes, etag: str = '"v1"'):
+        """Initialize the document."""
+        self.body = body
+        self.etag = etag
+        self.status: int | None = None
+        self.requests: list[dict] = []
+        self.delay = 0.0
+
+    async def __call__(self, url, headers=None, response_callback=None, **kwargs):
+        """Answer a request through the callback of the cache."""
+        headers = headers or {}
+        self.requests.append(headers)
+        await asyncio.sleep(self.delay)
+        if self.status is not None:
+            response = Response(self.status)
+        elif headers.get("If-None-Match") == self.etag:
+            response = Response(304)
+        else:
+            response = Response(
+                200,
+                self.body,
+                {"ETag": self.etag, "Content-Type": "application/pdf"},
+            )
+        return await response_callback(response, None)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Return a cache in a temporary directory."""
+    return BlobCache(tmp_path)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Serve a document to the cache."""
+    fake = Server(b"%PDF-1.7 " + bytes(range(256)) * 1000)
+    monkeypatch.setattr(helpers, "amake_request", fake)
+    return fake
+
+
+def test_download_is_stored_by_digest(cache, server):
+    """Test that a document is stored under the digest of its content."""
+    blob = asyncio.run(cache.fetch(URL))
+
+    assert blob.sha256 == hashlib.sha256(server.body).hexdigest()
+    assert blob.size == len(server.body)
+    assert blob.read_bytes() == server.body
+    assert blob.path == cache.object_path(blob.sha256)
+    assert blob.filename == "report.pdf"
+    assert blob.media_type == "application/pdf"
+    assert cache.get(URL).sha256 == blob.sha256  # type: ignore[union-attr]
+    assert not list((cache.path / "tmp").iterdir())
+
+
+def test_unchanged_document_is_revalidated(cache, server):
+    """Test that a stored document is reused when the server answers 304."""
+    first = asyncio.run(cache.fetch(URL))
+    second = asyncio.run(cache.fetch(URL))
+
+    assert server.requests[1]["If-None-Match"] == '"v1"'
+    assert second.sha256 == first.sha256
+    assert second.fetched_at >= first.fetched_at
+    assert len(list(cache.objects.glob("*/*"))) == 1
+
+
+def test_changed_document_replaces_the_stored_one(cache, server):
+    """Test that a new version is stored and the previous file can be pruned."""
+    first = asyncio.run(cache.fetch(URL))
+    server.body, server.etag = b"new version", '"v2"'
+
+    second = asyncio.run(cache.fetch(URL))
+
+    assert second.read_bytes() == b"new version"
+    assert cache.get(URL).sha256 == second.sha256  # type: ignore[union-attr]
+    assert cache.prune() == 1
+    assert not first.path.exists()
+
+
+def test_max_age(cache, server):
+    """Test that a document is used without a request within `max_age`."""
+    asyncio.run(cache.fetch(URL))
+    asyncio.run(cache.fetch(URL, max_age=None))
+    asyncio.run(cache.fetch(URL, max_age=3600))
+    asyncio.run(cache.fetch(URL, use_cache=False))
+
+    assert len(server.requests) == 2
+    assert "If-None-Match" not in server.requests[1]
+
+
+def test_concurrent_fetches_share_one_download(cache, server):
+    """Test that concurrent requests for a URL share one download."""
+    server.delay = 0.05
+
+    async def run():
+        return await asyncio.gather(*[cache.fetch(URL) for _ in range(4)])
+
+    blobs = asyncio.run(run())
+
+    assert len({blob.sha256 for blob in blobs}) == 1
+    assert len(server.requests) == 1
+
+
+def test_failed_download_is_not_stored(cache, server):
+    """Test that an error status raises and stores nothing."""
+    server.status = 500
+
+    with pytest.raises(ValueError):
+        asyncio.run(cache.fetch(URL))
+
+    assert cache.get(URL) is None
+    assert not list((cache.path / "tmp").iterdir())
+
+
+def test_get_by_digest(cache, server):
+    """Test the lookup of a document by digest, and invalid digests."""
+    blob = asyncio.run(cache.fetch(URL))
+
+    assert cache.get_by_digest(blob.sha256).url == URL  # type: ignore[union-attr]
+    assert cache.get_by_digest("0" * 64) is None
+    for digest in (blob.sha256.upper(), blob.sha256[:-1], "../" + blob.sha256[3:]):
+        assert cache.get_by_digest(digest) is None
+
+    # A document whose file was removed is not served.
+    blob.path.unlink()
+    assert cache.get_by_digest(blob.sha256) is None
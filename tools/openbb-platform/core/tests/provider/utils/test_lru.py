@@ -0,0 +1,200 @@
+"""Test the caching of function results with a time to live."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from openbb_core.provider.utils.lru import TTLCache, estimate_size, ttl_cache
+
+
+def test_entries_expire_individually():
+    """Test that each entry expires `ttl` seconds after it was loaded."""
+    cache = TTLCache("test", ttl=10)
+    cache.set("old", 1, loaded_at=time.time() - 11)
+    cache.set("new", 2, loaded_at=time.time() - 9)
+
+    assert cache.lookup("old") is None
+    assert cache.lookup("new") == (2, False)
+    assert len(cache) == 1
+    assert cache.stats()["expirations"] == 1
+
+
+def test_stale_window():
+    """Test that an expired entry is served as stale within `stale_ttl`."""
+    cache = TTLCache("test", ttl=10, stale_ttl=5)
+    cache.set("stale", 1, loaded_at=time.time() - 12)
+    cache.set("expired", 2, loaded_at=time.time() - 16)
+
+    assert cache.lookup("stale") == (1, True)
+    assert cache.purge_expired() == 1
+    assert cache.lookup("expired") is None
+
+
+def test_maxsize_evicts_least_recently_used():
+    """Test that the least recently used entry is evicted first."""
+    cache = TTLCache("test", maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.lookup("a")
+    cache.set("c", 3)
+
+    assert cache.lookup("b") is None
+    assert cache.lookup("a") == (1, False)
+    assert cache.lookup("c") == (3, False)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_max_bytes_eviction():
+    """Test that entries are evicted to keep the cached values under `max_bytes`."""
+    size = estimate_size(b"x" * 1000)
+    cache = TTLCache("test", maxsize=None, max_bytes=int(size * 2.5))
+    for key in "abc":
+        cache.set(key, key.encode() * 1000)
+
+    assert cache.lookup("a") is None
+    assert cache.stats()["bytes"] == 2 * size
+    # A value larger than the limit on its own is not cached.
+    cache.set("d", b"x" * 3000)
+    assert cache.lookup("d") is None
+    assert len(cache) == 2
+
+
+def test_exceptions_are_not_cached():
+    """Test that a failed call is retried by the next call."""
+    results = iter([ValueError("Upstream error."), "data"])
+
+    @ttl_cache(ttl=60)
+    def load(key):
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    with pytest.raises(ValueError):
+        load("key")
+    assert load("key") == "data"
+    assert load.cache_info()["errors"] == 1
+    assert load.cache_info()["loads"] == 2
+
+
+def test_async_exceptions_are_not_cached():
+    """Test that a failed coroutine is retried by the next call."""
+    results = iter([ValueError("Upstream error."), "data"])
+
+    @ttl_cache(ttl=60)
+    async def load(key):
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    with pytest.raises(ValueError):
+        asyncio.run(load("key"))
+    assert asyncio.run(load("key")) == "data"
+
+
+def test_threads_share_one_call():
+    """Test that concurrent threads requesting a missing key share one call."""
+    calls: list = []
+
+    @ttl_cache(ttl=60)
+    def load(key):
+        calls.append(key)
+        time.sleep(0.05)
+        return key.upper()
+
+    results: list = []
+    threads = [
+        threading.Thread(target=lambda: results.append(load("a"))) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["A"] * 4
+    assert calls == ["a"]
+    assert load.cache_info()["coalesced"] == 3
+
+
+def test_coroutines_share_one_call():
+    """Test that concurrent coroutines share one call, even if one is cancelled."""
+    calls: list = []
+
+    @ttl_cache(ttl=60)
+    async def load(key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return key.upper()
+
+    async def run():
+        cancelled = asyncio.create_task(load("a"))
+        others = [asyncio.create_task(load("a")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        return await asyncio.gather(*others, load("b"))
+
+    assert asyncio.run(run()) == ["A", "A", "A", "B"]
+    assert calls == ["a", "b"]
+
+
+def test_stale_value_is_refreshed_in_the_background():
+    """Test that a stale value is served while it is reloaded."""
+    versions = iter(range(10))
+
+    @ttl_cache(ttl=10, stale_ttl=60)
+    def load():
+        return next(versions)
+
+    assert load() == 0
+    for entry in load.cache._entries.values():  # pylint: disable=protected-access
+        entry.expires_at = time.time() - 1
+
+    assert load() == 0
+    deadline = time.time() + 5
+    while load() == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    assert load() == 1
+    assert load.cache_info()["refreshes"] == 1
+
+
+def test_async_stale_value_is_refreshed_in_the_background():
+    """Test that a stale value is served while a task reloads it."""
+    versions = iter(range(10))
+
+    @ttl_cache(ttl=10, stale_ttl=60)
+    async def load():
+        return next(versions)
+
+    async def run():
+        assert await load() == 0
+        for entry in load.cache._entries.values():  # pylint: disable=protected-access
+            entry.expires_at = time.time() - 1
+        assert await load() == 0
+        await asyncio.sleep(0.01)
+        assert await load() == 1
+
+    asyncio.run(run())
+    assert load.cache_info()["stale_hits"] == 1
+
+
+def test_invalidate_and_clear():
+    """Test that results can be dropped by arguments or all at once."""
+    calls: list = []
+
+    @ttl_cache
+    def load(key):
+        calls.append(key)
+        return key
+
+    load("a")
+    load("b")
+    load.cache_invalidate("a")
+    load("a")
+    load("b")
+    assert calls == ["a", "b", "a"]
+
+    load.cache_clear()
+    load("b")
+    assert calls == ["a", "b", "a", "b"]
@@ -0,0 +1,158 @@
+"""Test the per-provider rate limiters."""
+
+import asyncio
+import time
+
+import pytest
+import requests
+from openbb_core.provider.utils.helpers import make_request
+from openbb_core.provider.utils.rate_limiter import (
+    RateLimit,
+    RateLimiter,
+    get_rate_limiter_for_url,
+    rate_limits_disabled,
+    register_rate_limit,
+)
+
+
+class Response:
+    """Response of a fake session."""
+
+    def __init__(self, status_code: int, headers: dict | None = None):
+        """Initialize the response."""
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def close(self):
+        """Release the connection."""
+
+
+class Session(requests.Session):
+    """Session replaying responses."""
+
+    def __init__(self, responses: list):
+        """Initialize the session."""
+        super().__init__()
+        self.responses = responses
+        self.requests = 0
+
+    def get(self, url, **kwargs):  # type: ignore[override]
+        """Return the next response."""
+        self.requests += 1
+        return self.responses.pop(0)
+
+
+def test_acquire_cancelled_releases_slot():
+    """Test that a request cancelled while waiting gives back its slot."""
+    limiter = RateLimiter("test", RateLimit(10, burst=1, max_concurrency=2))
+
+    async def run():
+        async with limiter:
+            pass
+        for _ in range(2):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(limiter.acquire(), 0.01)
+        assert limiter.stats()["in_flight"] == 0
+        # The slots and the tokens of the cancelled requests are available.
+        await asyncio.wait_for(limiter.acquire(), 1)
+        await asyncio.wait_for(limiter.acquire(), 1)
+        assert limiter.stats()["in_flight"] == 2
+        limiter.release()
+        limiter.release()
+
+    asyncio.run(run())
+
+
+def test_token_pacing():
+    """Test that requests past the burst are spaced at the declared rate."""
+    limiter = RateLimiter("test", RateLimit(20, burst=2))
+
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire_sync()
+        limiter.release_sync()
+    elapsed = time.monotonic() - start
+
+    # Two requests from the burst, then four at 20 per second.
+    assert 0.15 <= elapsed < 0.5
+    assert limiter.stats()["delayed"] == 4
+
+
+def test_retry_after():
+    """Test that a throttled response pauses the limiter for `Retry-After`."""
+    limiter = RateLimiter("test", RateLimit(10, burst=5))
+
+    assert limiter.on_response(200) is None
+    assert limiter.on_response(429, "2") == 2.0
+    assert limiter.rate == pytest.approx(5, rel=0.01)
+    assert limiter._reserve() == pytest.approx(2, abs=0.05)
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_backoff_is_scoped_to_the_request():
+    """Test that the backoff follows the retries of a request and recovers."""
+    limiter = RateLimiter("test", RateLimit(10))
+
+    assert limiter.on_response(429, attempt=2) == 4.0
+    # Another request starts from the base backoff, and a throttle during the
+    # backoff answers the same overload: the rate is not halved again.
+    assert limiter.on_response(503) == 1.0
+    assert limiter.rate == pytest.approx(5, rel=0.01)
+    # A throttle after the backoff halves it again.
+    limiter._blocked_until = time.monotonic()
+    assert limiter.on_response(429) == 1.0
+    assert limiter.rate == pytest.approx(2.5, rel=0.01)
+
+    # The rate doubles back every recovery interval without throttling.
+    limiter._reduced_at -= limiter.RECOVERY_INTERVAL
+    assert limiter.rate == pytest.approx(5, rel=0.01)
+    limiter._reduced_at -= limiter.RECOVERY_INTERVAL * 10
+    assert limiter.rate == 10
+
+    limiter.reset()
+    assert limiter.stats()["throttled"] == 0
+    assert limiter._reserve() == 0
+
+
+def test_make_request_retries_throttled_response():
+    """Test that the request helper retries after the `Retry-After` delay."""
+    limiter = RateLimiter("test", RateLimit(100, max_retries=2))
+    session = Session([Response(429, {"Retry-After": "0.1"}), Response(200)])
+
+    start = time.monotonic()
+    response = make_request(
+        "https://example.com", session=session, rate_limiter=limiter
+    )
+
+    assert response.status_code == 200
+    assert session.requests == 2
+    assert time.monotonic() - start >= 0.1
+    assert limiter.stats()["retries"] == 1
+
+
+def test_make_request_gives_up_after_max_retries():
+    """Test that a request throttled past `max_retries` returns the response."""
+    limiter = RateLimiter("test", RateLimit(100, max_retries=1))
+    session = Session([Response(429, {"Retry-After": "0"}) for _ in range(3)])
+
+    response = make_request(
+        "https://example.com", session=session, rate_limiter=limiter
+    )
+
+    assert response.status_code == 429
+    assert session.requests == 2
+
+
+def test_rate_limits_disabled():
+    """Test that the limiters can be turned off and are reset afterwards."""
+    limiter = register_rate_limit(
+        "rate_limiter_test", RateLimit(1, hosts=["rate-limiter.test"])
+    )
+    assert get_rate_limiter_for_url("https://api.rate-limiter.test/x") is limiter
+    limiter.on_response(429, "60")
+
+    with rate_limits_disabled():
+        assert get_rate_limiter_for_url("https://api.rate-limiter.test/x") is None
+
+    assert get_rate_limiter_for_url("https://api.rate-limiter.test/x") is limiter
+    assert limiter._reserve() == 0
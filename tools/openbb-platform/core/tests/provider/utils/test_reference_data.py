@@ -0,0 +1,170 @@
+"""Test the reference data registry."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from openbb_core.provider.utils.reference_data import (
+    ReferenceDataset,
+    clear_datasets,
+    compact_frame,
+    get_dataset,
+    register_dataset,
+)
+from pandas import DataFrame
+
+
+def test_concurrent_gets_share_one_load():
+    """Test that concurrent cold requests share one upstream request."""
+    calls: list = []
+
+    async def loader(symbol):
+        calls.append(symbol)
+        await asyncio.sleep(0.05)
+        return f"{symbol} data"
+
+    dataset = ReferenceDataset("test", loader, ttl=60)
+
+    async def run():
+        return await asyncio.gather(
+            *(dataset.get("AAPL") for _ in range(5)), dataset.get("MSFT")
+        )
+
+    assert asyncio.run(run()) == ["AAPL data"] * 5 + ["MSFT data"]
+    assert calls == ["AAPL", "MSFT"]
+    stats = dataset.stats()
+    assert stats["loads"] == 2
+    assert stats["coalesced"] == 4
+    assert stats["entries"] == 2
+
+
+def test_cancelled_caller_does_not_cancel_the_load():
+    """Test that the shared load survives the cancellation of one caller."""
+    calls: list = []
+
+    async def loader():
+        calls.append(None)
+        await asyncio.sleep(0.05)
+        return "data"
+
+    dataset = ReferenceDataset("test", loader)
+
+    async def run():
+        first = asyncio.create_task(dataset.get())
+        second = asyncio.create_task(dataset.get())
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == "data"
+    assert len(calls) == 1
+
+
+def test_get_sync_shares_one_load():
+    """Test that threads requesting a cold dataset share one load."""
+    calls: list = []
+
+    def loader():
+        calls.append(None)
+        time.sleep(0.05)
+        return "data"
+
+    dataset = ReferenceDataset("test", loader)
+    results: list = []
+    threads = [
+        threading.Thread(target=lambda: results.append(dataset.get_sync()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["data"] * 4
+    assert len(calls) == 1
+
+
+def test_refresh_ahead():
+    """Test that a value close to expiry is served while it is reloaded."""
+    versions = iter(range(10))
+
+    async def loader():
+        return next(versions)
+
+    dataset = ReferenceDataset("test", loader, ttl=10, refresh_ahead=0.5)
+
+    async def run():
+        assert await dataset.get() == 0
+        # Fresh values are served without reloading.
+        assert await dataset.get() == 0
+        assert dataset.stats()["refreshes"] == 0
+        # Within the last half of its lifetime, the value is still served.
+        dataset._entries[()].expires_at = time.time() + 1
+        assert await dataset.get() == 0
+        await asyncio.gather(*dataset._background)
+        assert await dataset.get() == 1
+
+    asyncio.run(run())
+    stats = dataset.stats()
+    assert stats["refreshes"] == 1
+    assert stats["loads"] == 2
+
+
+def test_expired_value_is_reloaded():
+    """Test that an expired value is not served."""
+    versions = iter(range(10))
+    dataset = ReferenceDataset("test", lambda: next(versions), ttl=10)
+
+    assert dataset.get_sync() == 0
+    dataset._entries[()].expires_at = time.time() - 1
+    assert dataset.get_sync() == 1
+
+
+def test_errors_are_not_stored():
+    """Test that a failed load is retried by the next request."""
+    results = iter([ValueError("Upstream error."), "data"])
+
+    def loader():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    dataset = ReferenceDataset("test", loader)
+
+    with pytest.raises(ValueError):
+        dataset.get_sync()
+    assert dataset.get_sync() == "data"
+    assert dataset.stats()["errors"] == 1
+
+
+def test_compact_frame_copies():
+    """Test that compacting converts repetitive strings of a copy."""
+    df = DataFrame(
+        {
+            "symbol": ["A", "B", "C", "D"],
+            "exchange": ["NYSE", "NYSE", "NASDAQ", "NYSE"],
+            "price": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    dtypes = df.dtypes.copy()
+
+    compacted = compact_frame(df)
+
+    assert compacted["exchange"].dtype == "category"
+    assert compacted["symbol"].dtype == dtypes["symbol"]
+    assert compacted["price"].dtype == dtypes["price"]
+    assert df.dtypes.equals(dtypes)
+
+
+def test_clear_datasets():
+    """Test that clearing the registry drops the loaded values."""
+    versions = iter(range(10))
+    dataset = register_dataset("reference_data_test", lambda: next(versions))
+
+    assert get_dataset("reference_data_test") is dataset
+    assert dataset.get_sync() == 0
+    assert dataset.get_sync() == 0
+    clear_datasets()
+    assert dataset.get_sync() == 1
@@ -0,0 +1,208 @@
+"""Test the streaming SDMX reader against the parsers it replaced."""
+
+import json
+from pathlib import Path
+
+import pytest
+from openbb_core.provider.utils.sdmx import (
+    SdmxGroup,
+    SdmxSeries,
+    detect_format,
+    iter_sdmx,
+    read_sdmx,
+)
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+from sdmx_reference import imf_observation_rows, oecd_xml_to_df
+
+# pylint: disable=redefined-outer-name
+
+SAMPLES = Path(__file__).parent / "sdmx_samples"
+OECD_GENERIC = SAMPLES / "oecd_generic.xml"
+IMF_STRUCTURE_SPECIFIC = SAMPLES / "imf_structure_specific.xml"
+ECB_JSON = SAMPLES / "ecb_exr.json"
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        (OECD_GENERIC, "generic"),
+        (IMF_STRUCTURE_SPECIFIC, "structure_specific"),
+        (ECB_JSON, "json"),
+    ],
+)
+def test_detect_format(path, expected):
+    """Test the detection of the format of the samples."""
+    assert detect_format(path) == expected
+    assert detect_format(path.read_bytes()) == expected
+
+
+def test_oecd_generic_matches_reference():
+    """Test the OECD parser against the ElementTree parser it replaced."""
+    helpers = pytest.importorskip("openbb_oecd.utils.helpers")
+    content = OECD_GENERIC.read_bytes()
+
+    expected = oecd_xml_to_df(content)
+    result = helpers.oecd_xml_to_df(content)
+
+    assert_frame_equal(result, expected)
+
+
+def test_imf_structure_specific_matches_reference():
+    """Test the rows read from an IMF message against the ElementTree parser."""
+    expected = DataFrame(imf_observation_rows(IMF_STRUCTURE_SPECIFIC.read_bytes()))
+
+    result = read_sdmx(IMF_STRUCTURE_SPECIFIC)
+    # The previous parser dropped the observations without a value.
+    result = result[~result["OBS_VALUE"].isin(["", "D"])].reset_index(drop=True)
+
+    assert_frame_equal(
+        result[expected.columns].fillna("").astype(object),
+        expected.fillna("").astype(object),
+    )
+
+
+def test_imf_structure_specific_groups():
+    """Test that the attributes of groups are read."""
+    groups = [
+        item
+        for item in iter_sdmx(IMF_STRUCTURE_SPECIFIC)
+        if isinstance(item, SdmxGroup)
+    ]
+
+    assert len(groups) == 1
+    assert groups[0].key["INDEX_TYPE"] == "CPI"
+    assert groups[0].attributes == {"PUBLICATION_SOURCE": "National Statistics Office"}
+
+
+def test_imf_fetch_data_matches_previous_output(monkeypatch):
+    """Test the IMF query builder against the output of its previous parser."""
+    query_builder = pytest.importorskip("openbb_imf.utils.query_builder")
+    content = IMF_STRUCTURE_SPECIFIC.read_bytes()
+
+    class Response:
+        """Saved response."""
+
+        status_code = 200
+
+        def __init__(self):
+            """Return the sample."""
+            self.content = content
+            self.text = content.decode()
+
+        def raise_for_status(self):
+            """Succeed."""
+
+    class Metadata:
+        """Metadata of the sample dataflow."""
+
+        dataflows = {
+            "CPI": {
+                "structureRef": {"id": "DSD_CPI"},
+                "name": "Consumer Price Index (CPI)",
+            }
+        }
+        datastructures = {
+            "DSD_CPI": {
+                "dimensions": [
+                    {"id": dimension}
+                    for dimension in (
+                        "COUNTRY",
+                        "INDEX_TYPE",
+                        "COICOP_1999",
+                        "TYPE_OF_TRANSFORMATION",
+                        "FREQUENCY",
+                    )
+                ],
+                "attributes": [{"id": "UNIT"}, {"id": "SCALE"}],
+            }
+        }
+        _codelist_cache = {
+            "CL_UNIT_MULT": {"0": "Units", "3": "Thousands"},
+            "CL_DERIVATION_TYPE": {"E": "Estimated"},
+        }
+
+        def _resolve_codelist_id(self, *args):
+            """Use the codes."""
+
+        def get_indicators_in(self, dataflow):
+            """Return no indicator descriptions."""
+            return []
+
+    monkeypatch.setattr(
+        "openbb_core.provider.utils.helpers.make_request",
+        lambda *args, **kwargs: Response(),
+    )
+    builder = query_builder.ImfQueryBuilder.__new__(query_builder.ImfQueryBuilder)
+    builder.metadata = Metadata()
+    builder.build_url = lambda *args, **kwargs: "https://example.com/data"
+    builder._get_cached_translations = lambda dataflow: {
+        "COUNTRY": {"USA": "United States", "FRA": "France", "DEU": "Germany"},
+        "COICOP_1999": {
+            "_T": "All Items",
+            "CP01": "Food and non-alcoholic beverages",
+        },
+    }
+    builder._extract_dataset_attributes_from_cache = lambda dataflow: {}
+
+    result = builder.fetch_data("CPI", _skip_validation=True)
+
+    with open(SAMPLES / "imf_structure_specific.expected.json", encoding="utf-8") as f:
+        expected = json.load(f)
+    result = json.loads(
+        json.dumps(
+            {"data": result["data"], "metadata": result["metadata"]}, default=str
+        )
+    )
+    assert_frame_equal(DataFrame(result["data"]), DataFrame(expected["data"]))
+    assert result["metadata"] == expected["metadata"]
+
+
+def test_ecb_json():
+    """Test reading an SDMX-JSON message of the ECB."""
+    result = read_sdmx(ECB_JSON)
+
+    expected = DataFrame(
+        {
+            "FREQ": ["M"] * 5,
+            "CURRENCY": ["USD", "USD", "USD", "GBP", "GBP"],
+            "CURRENCY_DENOM": ["EUR"] * 5,
+            "EXR_TYPE": ["SP00"] * 5,
+            "EXR_SUFFIX": ["A"] * 5,
+            "TITLE": ["US dollar/Euro"] * 3 + ["UK pound sterling/Euro"] * 2,
+            "UNIT_MULT": ["0"] * 5,
+            "TIME_PERIOD": ["2024-01", "2024-02", "2024-03", "2024-01", "2024-03"],
+            "OBS_VALUE": [1.0905, 1.0795, 1.0872, 0.85846, 0.85541],
+            "OBS_STATUS": ["A", "A", "P", "A", "A"],
+            "OBS_COM": [None, None, "Estimated", None, None],
+            "TITLE_COMPL": [None] * 3 + ["ECB reference exchange rate"] * 2,
+        }
+    )
+    assert_frame_equal(result, expected)
+
+
+def test_series_attributes_fill_observation_attributes():
+    """Test that the observations without an attribute get the series value."""
+    series = [
+        item
+        for item in iter_sdmx(IMF_STRUCTURE_SPECIFIC)
+        if isinstance(item, SdmxSeries) and item.key["COUNTRY"] == "FRA"
+    ]
+    result = read_sdmx(IMF_STRUCTURE_SPECIFIC)
+    france = result[result["COUNTRY"] == "FRA"]
+
+    assert series[0].key["SCALE"] == "0"
+    assert france["SCALE"].tolist() == ["0", "3", "0"]
+    assert france["UNIT"].tolist() == ["IX", "IX", "PC"]
+
+
+def test_entities_are_refused():
+    """Test that messages declaring entities are not parsed."""
+    content = (
+        b'<?xml version="1.0"?><!DOCTYPE d [<!ENTITY e "x">]>'
+        b"<message:GenericData xmlns:message="
+        b'"http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message">'
+        b"&e;</message:GenericData>"
+    )
+    with pytest.raises(ValueError):
+        read_sdmx(content)
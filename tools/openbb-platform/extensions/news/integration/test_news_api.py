@@ -207,3 +207,22 @@ def test_news_company(params, headers):
     result = requests.get(url, headers=headers, timeout=10)
     assert isinstance(result, requests.Response)
     assert result.status_code == 200
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        ({"providers": "benzinga,fmp,tiingo", "limit": 20}),
+        ({"providers": "fmp,intrinio,yfinance", "symbol": "AAPL", "limit": 20}),
+    ],
+)
+@pytest.mark.integration
+def test_news_feed(params, headers):
+    """Test the merged news feed of several providers."""
+    params = {p: v for p, v in params.items() if v}
+
+    query_str = get_querystring(params, [])
+    url = f"http://0.0.0.0:8000/api/v1/news/feed?{query_str}"
+    result = requests.get(url, headers=headers, timeout=30)
+    assert isinstance(result, requests.Response)
+    assert result.status_code == 200
@@ -188,3 +188,23 @@ def test_news_company(params, obb):
     assert result
     assert isinstance(result, OBBject)
     assert len(result.results) > 0
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        ({"providers": "benzinga,fmp,tiingo", "limit": 20}),
+        ({"providers": "fmp,intrinio,yfinance", "symbol": "AAPL", "limit": 20}),
+    ],
+)
+@pytest.mark.integration
+def test_news_feed(params, obb):
+    """Test the merged news feed of several providers."""
+    result = obb.news.feed(**params)
+    assert result
+    assert isinstance(result, OBBject)
+    assert len(result.results) > 0
+
+    cursor = result.extra["results_metadata"]["cursor"]
+    result = obb.news.feed(**params, since=cursor)
+    assert isinstance(result, OBBject)
@@ -0,0 +1,322 @@
+"""Aggregation of news from several providers.
+
+`aggregate_news` queries the selected providers concurrently, each with its
+own timeout, and merges their articles into one stream, newest first.
+
+Providers often carry the same story. Duplicates are dropped by a
+`DedupIndex`, which matches articles on their normalized URL or on the
+similarity of their titles. Titles are compared as sets of word shingles,
+and an inverted index of shingles limits the comparison of a new title to
+the titles sharing at least one shingle with it.
+
+Each stream comes with an opaque cursor. Passed back as `since`, only the
+articles newer than the last poll are returned. The cursor holds a date and
+the fingerprints of the articles fetched at or after it, duplicates included,
+so that an article is not returned again by another provider or at a later
+poll.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import re
+import time
+import warnings
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from datetime import date as dateType, datetime, timezone
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.app.model.abstract.warning import OpenBBWarning
+from openbb_core.provider.utils.errors import EmptyDataError
+
+# Query parameters that only track where a reader came from.
+TRACKING_PARAMS = ("utm_", "cmpid", "ncid", "guccounter", "yptr", "fbclid", "gclid")
+
+# Minimum Jaccard similarity of title shingles for two articles to be the same.
+TITLE_SIMILARITY = 0.6
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def normalize_url(url: str | None) -> str | None:
+    """Normalize an article URL, so that links to the same page compare equal.
+
+    The scheme, a leading "www.", the fragment, a trailing slash and
+    tracking parameters are dropped, and the remaining parameters sorted.
+    """
+    if not url:
+        return None
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return None
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode(
+        sorted(
+            (k, v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if not k.lower().startswith(TRACKING_PARAMS)
+        )
+    )
+    return urlunsplit(("", host, parts.path.rstrip("/"), query, ""))
+
+
+def title_shingles(title: str | None, size: int = 2) -> frozenset[str]:
+    """Split a title into its set of `size`-word shingles."""
+    words = _WORD.findall((title or "").lower())
+    if len(words) <= size:
+        return frozenset([" ".join(words)]) if words else frozenset()
+    return frozenset(
+        " ".join(words[i : i + size]) for i in range(len(words) - size + 1)
+    )
+
+
+def fingerprint(url: str | None, title: str | None) -> str:
+    """Return a short, stable identifier of an article."""
+    key = normalize_url(url) or " ".join(_WORD.findall((title or "").lower()))
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+class DedupIndex:
+    """Index of the articles seen so far, to recognize duplicates.
+
+    Parameters
+    ----------
+    similarity : float
+        Minimum Jaccard similarity of the title shingles of two articles
+        for them to be considered the same.
+    shingle_size : int
+        Number of words per title shingle.
+    """
+
+    def __init__(self, similarity: float = TITLE_SIMILARITY, shingle_size: int = 2):
+        """Initialize the index."""
+        self.similarity = similarity
+        self.shingle_size = shingle_size
+        self._urls: set[str] = set()
+        self._titles: list[frozenset[str]] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of articles indexed."""
+        return len(self._titles)
+
+    def is_duplicate(self, url: str | None, title: str | None) -> bool:
+        """Check if an article matches one already in the index."""
+        normalized = normalize_url(url)
+        if normalized is not None and normalized in self._urls:
+            return True
+        shingles = title_shingles(title, self.shingle_size)
+        if not shingles:
+            return False
+        overlaps = Counter(
+            doc for shingle in shingles for doc in self._postings.get(shingle, ())
+        )
+        for doc, overlap in overlaps.items():
+            union = len(shingles) + len(self._titles[doc]) - overlap
+            if overlap / union >= self.similarity:
+                return True
+        return False
+
+    def add(self, url: str | None, title: str | None) -> bool:
+        """Add an article, unless it is a duplicate.
+
+        Returns
+        -------
+        bool
+            True if the article was new, False if it was a duplicate.
+        """
+        if self.is_duplicate(url, title):
+            return False
+        if (normalized := normalize_url(url)) is not None:
+            self._urls.add(normalized)
+        shingles = title_shingles(title, self.shingle_size)
+        doc = len(self._titles)
+        self._titles.append(shingles)
+        for shingle in shingles:
+            self._postings.setdefault(shingle, []).append(doc)
+        return True
+
+
+def article_date(article: Any) -> datetime | None:
+    """Return the publication date of an article as an aware UTC datetime."""
+    value = getattr(article, "date", None)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+    if isinstance(value, dateType):
+        return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+    return None
+
+
+def encode_cursor(newest: datetime, fingerprints: set[str]) -> str:
+    """Encode the position of a poll: a date and the articles seen since."""
+    payload = json.dumps(
+        {"date": newest.isoformat(), "seen": sorted(fingerprints)},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, set[str]]:
+    """Decode a cursor returned by `encode_cursor`."""
+    try:
+        payload = json.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        )
+        newest = datetime.fromisoformat(payload["date"])
+        seen = set(payload["seen"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise OpenBBError(f"Invalid news cursor: '{cursor}'") from e
+    if newest.tzinfo is None:
+        newest = newest.replace(tzinfo=timezone.utc)
+    return newest, seen
+
+
+def _fingerprint(article: Any) -> str:
+    """Return the fingerprint of an article."""
+    return fingerprint(getattr(article, "url", None), getattr(article, "title", None))
+
+
+def _is_new(article: Any, since: tuple[datetime, set[str]] | None) -> bool:
+    """Check if an article is newer than the poll a cursor points to."""
+    if since is None:
+        return True
+    published = article_date(article)
+    if published is None:
+        return False
+    newest, seen = since
+    if published < newest:
+        return False
+    return _fingerprint(article) not in seen
+
+
+async def _fetch_provider(
+    fetch: Callable[[str], Awaitable[Any]], provider: str, timeout: float | None
+) -> tuple[list, float]:
+    """Fetch the articles of one provider, returning them and the time taken."""
+    start = time.perf_counter()
+    try:
+        results = await asyncio.wait_for(fetch(provider), timeout)
+    except EmptyDataError:
+        results = []
+    results = getattr(results, "result", results) or []
+    return list(results), time.perf_counter() - start
+
+
+async def aggregate_news(
+    fetch: Callable[[str], Awaitable[Any]],
+    providers: list[str],
+    limit: int | None = None,
+    since: str | None = None,
+    timeout: float | None = 10.0,
+) -> tuple[list, dict[str, Any]]:
+    """Query providers concurrently and merge their articles.
+
+    Providers earlier in the list take precedence: of duplicate articles,
+    the one from the first provider is kept.
+
+    Parameters
+    ----------
+    fetch : Callable[[str], Awaitable[Any]]
+        Coroutine function fetching the articles of a provider, by name.
+    providers : list[str]
+        Names of the providers to query.
+    limit : int | None
+        Maximum number of articles returned.
+    since : str | None
+        Cursor of a previous call. Only articles newer than it are returned.
+    timeout : float | None
+        Seconds to wait for each provider. None waits indefinitely.
+
+    Returns
+    -------
+    tuple[list, dict[str, Any]]
+        The articles, newest first, each with the `provider` it came from, and
+        metadata: the cursor of this poll and the outcome of each provider.
+
+    Raises
+    ------
+    OpenBBError
+        If every provider failed.
+    """
+    cursor = decode_cursor(since) if since else None
+    outcomes = await asyncio.gather(
+        *(_fetch_provider(fetch, provider, timeout) for provider in providers),
+        return_exceptions=True,
+    )
+
+    index = DedupIndex()
+    articles: list = []
+    # Every article fetched, including the duplicates, positions the cursor.
+    fetched: list = []
+    latest: datetime | None = None
+    report: dict[str, dict[str, Any]] = {}
+    errors: list[str] = []
+    for provider, outcome in zip(providers, outcomes):
+        if isinstance(outcome, BaseException):
+            if isinstance(outcome, asyncio.TimeoutError):
+                error = f"timed out after {timeout} seconds"
+            else:
+                error = str(outcome) or type(outcome).__name__
+            errors.append(f"{provider}: {error}")
+            report[provider] = {"articles": 0, "duplicates": 0, "error": error}
+            warnings.warn(
+                f"News from '{provider}' is not included: {error}",
+                category=OpenBBWarning,
+            )
+            continue
+
+        results, seconds = outcome
+        fetched.extend(results)
+        duplicates = 0
+        for article in results:
+            if not _is_new(article, cursor):
+                continue
+            if (published := article_date(article)) and (
+                latest is None or published > latest
+            ):
+                latest = published
+            url, title = getattr(article, "url", None), getattr(article, "title", None)
+            if not index.add(url, title):
+                duplicates += 1
+                continue
+            article.provider = provider
+            articles.append(article)
+        report[provider] = {
+            "articles": len(results),
+            "duplicates": duplicates,
+            "seconds": round(seconds, 3),
+        }
+
+    if errors and len(errors) == len(providers):
+        raise OpenBBError("No provider returned news. " + "; ".join(errors))
+
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
+    articles.sort(key=lambda a: article_date(a) or oldest, reverse=True)
+    dropped: list = []
+    if limit and len(articles) > limit:
+        articles, dropped = articles[:limit], articles[limit:]
+
+    next_cursor = since
+    if latest is not None:
+        # When articles are cut by the limit, the cursor stops at the last one
+        # returned, so that the cut articles published at that date are
+        # returned by the next poll.
+        position = (article_date(articles[-1]) if dropped else None) or latest
+        not_returned = {_fingerprint(a) for a in dropped}
+        seen = {
+            fingerprint
+            for a in fetched
+            if (published := article_date(a)) is not None and published >= position
+            if (fingerprint := _fingerprint(a)) not in not_returned
+        }
+        if cursor is not None and cursor[0] == position:
+            seen |= cursor[1]
+        next_cursor = encode_cursor(position, seen)
+
+    return articles, {"cursor": next_cursor, "providers": report}
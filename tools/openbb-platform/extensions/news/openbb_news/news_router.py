@@ -1,16 +1,22 @@
 # pylint: disable=import-outside-toplevel, W0613:unused-argument
 """News Router."""
 
+from datetime import date as dateType
+
+from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.app.model.command_context import CommandContext
-from openbb_core.app.model.example import APIEx
+from openbb_core.app.model.example import APIEx, PythonEx
 from openbb_core.app.model.obbject import OBBject
 from openbb_core.app.provider_interface import (
     ExtraParams,
     ProviderChoices,
+    ProviderInterface,
     StandardParams,
 )
 from openbb_core.app.query import Query
 from openbb_core.app.router import Router
+from openbb_core.provider.abstract.data import Data
+from openbb_news.aggregation import aggregate_news, decode_cursor
 
 router = Router(prefix="", description="Financial market news data.")
 
@@ -100,3 +106,104 @@ async def company(
 ) -> OBBject:
     """Company News. Get news for one or more companies."""
     return await OBBject.from_query(Query(**locals()))
+
+
+@router.command(
+    methods=["GET"],
+    examples=[
+        APIEx(parameters={"providers": "benzinga,fmp,tiingo"}),
+        APIEx(
+            description="Merge the company news of several providers.",
+            parameters={"providers": "fmp,intrinio,yfinance", "symbol": "AAPL"},
+        ),
+        PythonEx(
+            description="Poll for the articles published since the last call.",
+            code=[
+                "feed = obb.news.feed(providers='benzinga,fmp,tiingo')",
+                "cursor = feed.extra['results_metadata']['cursor']",
+                "new = obb.news.feed(providers='benzinga,fmp,tiingo', since=cursor)",
+            ],
+        ),
+    ],
+)
+async def feed(  # pylint: disable=R0913, R0917
+    cc: CommandContext,
+    providers: str,
+    symbol: str | None = None,
+    start_date: dateType | None = None,
+    end_date: dateType | None = None,
+    limit: int | None = 100,
+    since: str | None = None,
+    timeout: float | None = 10.0,
+) -> OBBject[list[Data]]:
+    """News Feed. Merge the news of several providers into one stream.
+
+    Providers are queried concurrently. Articles carried by more than one
+    provider, matched on their URL or on the similarity of their titles, are
+    only returned once, from the provider listed first. Providers that fail
+    or time out are left out, with a warning.
+
+    Parameters
+    ----------
+    providers : str
+        Comma-separated providers to query, by order of precedence.
+    symbol : Optional[str]
+        Comma-separated symbols, to get company news instead of world news.
+    start_date : Optional[date]
+        Start date of the articles.
+    end_date : Optional[date]
+        End date of the articles.
+    limit : Optional[int]
+        Maximum number of articles, queried from each provider and returned.
+    since : Optional[str]
+        Cursor returned in `extra['results_metadata']` by a previous call.
+        Only articles published since that call are returned.
+    timeout : Optional[float]
+        Seconds to wait for each provider. Default is 10.
+
+    Returns
+    -------
+    OBBject[list[Data]]
+        The articles, newest first, with the `provider` each came from.
+        `extra['results_metadata']` holds the `cursor` of this call and the
+        outcome of each provider.
+    """
+    model = "CompanyNews" if symbol else "WorldNews"
+    provider_interface = ProviderInterface()
+    available = [p for p in provider_interface.map.get(model, {}) if p != "openbb"]
+    names = list(
+        dict.fromkeys(p.strip().lower() for p in providers.split(",") if p.strip())
+    )
+    if not names:
+        raise OpenBBError("At least one provider is required.")
+    if unknown := [p for p in names if p not in available]:
+        raise OpenBBError(
+            f"Providers not available for {model}: {', '.join(unknown)}."
+            f" Available: {', '.join(available)}."
+        )
+
+    if since:
+        # Only ask providers for the days since the last poll.
+        since_date = decode_cursor(since)[0].date()
+        start_date = max(start_date, since_date) if start_date else since_date
+
+    params: dict = {"start_date": start_date, "end_date": end_date, "limit": limit}
+    if symbol:
+        params["symbol"] = symbol
+    executor = provider_interface.create_executor()
+    credentials = cc.user_settings.credentials.model_dump()
+    preferences = cc.user_settings.preferences.model_dump()
+
+    async def fetch(provider: str):
+        return await executor.execute(
+            provider_name=provider,
+            model_name=model,
+            params=dict(params),
+            credentials=credentials,
+            preferences=preferences,
+        )
+
+    results, metadata = await aggregate_news(
+        fetch, names, limit=limit, since=since, timeout=timeout
+    )
+    return OBBject(results=results, extra={"results_metadata": metadata})
@@ -0,0 +1,197 @@
+"""Test the news aggregation module."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.app.model.abstract.warning import OpenBBWarning
+from openbb_core.provider.standard_models.world_news import WorldNewsData
+from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_news.aggregation import (
+    DedupIndex,
+    aggregate_news,
+    decode_cursor,
+    normalize_url,
+)
+
+# pylint: disable=redefined-outer-name
+
+NOW = datetime(2024, 2, 1, 12, tzinfo=timezone.utc)
+
+
+def article(title: str, url: str, minutes_ago: int) -> WorldNewsData:
+    """Create an article published some minutes before NOW."""
+    return WorldNewsData(
+        date=NOW - timedelta(minutes=minutes_ago), title=title, url=url
+    )
+
+
+@pytest.fixture
+def feeds() -> dict:
+    """Articles by provider."""
+    return {
+        "benzinga": [
+            article("Apple shares rise after earnings beat", "https://a.com/1", 10),
+            article("Fed holds rates steady", "https://a.com/2", 30),
+        ],
+        "fmp": [
+            article(
+                "Apple Shares Rise After Earnings Beat Estimates",
+                "https://b.com/x",
+                12,
+            ),
+            article(
+                "Oil prices fall", "https://www.a.com/2/?utm_source=fmp#top", 31
+            ),
+            article("Tesla recalls vehicles", "https://b.com/y", 5),
+        ],
+        "tiingo": [article("Gold hits record high", "https://c.com/1", 20)],
+    }
+
+
+def make_fetch(feeds: dict, delays: dict | None = None):
+    """Return a fetch function serving the feeds, after an optional delay."""
+
+    async def fetch(provider: str):
+        await asyncio.sleep((delays or {}).get(provider, 0.05))
+        value = feeds[provider]
+        if isinstance(value, Exception):
+            raise value
+        return list(value)
+
+    return fetch
+
+
+def test_normalize_url():
+    assert normalize_url("https://www.A.com/2/?utm_source=x&b=2&a=1#top") == (
+        "//a.com/2?a=1&b=2"
+    )
+    assert normalize_url("http://a.com/2") == normalize_url("https://a.com/2/")
+    assert normalize_url("not a url") is None
+
+
+def test_dedup_index():
+    index = DedupIndex()
+    assert index.add("https://a.com/1", "Apple shares rise after earnings beat")
+    assert not index.add("https://b.com/1", "Apple shares rise after earnings beat!")
+    assert not index.add("https://a.com/1?utm_medium=rss", "Something else")
+    assert index.add("https://b.com/2", "Apple shares fall after earnings miss")
+    assert index.add(None, "Fed holds rates steady")
+    assert len(index) == 3
+
+
+def test_aggregate_news(feeds):
+    start = time.perf_counter()
+    results, metadata = asyncio.run(
+        aggregate_news(make_fetch(feeds), ["benzinga", "fmp", "tiingo"])
+    )
+    # Providers are queried concurrently.
+    assert time.perf_counter() - start < 0.15
+
+    assert [(a.provider, a.title) for a in results] == [
+        ("fmp", "Tesla recalls vehicles"),
+        ("benzinga", "Apple shares rise after earnings beat"),
+        ("tiingo", "Gold hits record high"),
+        ("benzinga", "Fed holds rates steady"),
+    ]
+    assert metadata["providers"]["fmp"]["articles"] == 3
+    assert metadata["providers"]["fmp"]["duplicates"] == 2
+    assert decode_cursor(metadata["cursor"])[0] == NOW - timedelta(minutes=5)
+
+
+def test_aggregate_news_since_cursor(feeds):
+    fetch = make_fetch(feeds)
+    results, metadata = asyncio.run(aggregate_news(fetch, ["benzinga", "tiingo"]))
+    assert len(results) == 3
+
+    # Nothing new since the last poll.
+    results, metadata = asyncio.run(
+        aggregate_news(fetch, ["benzinga", "tiingo"], since=metadata["cursor"])
+    )
+    assert results == []
+    cursor = metadata["cursor"]
+
+    # Only the articles published since are returned, including those
+    # published at the same time as the newest article of the last poll.
+    feeds["tiingo"].append(article("Bitcoin rallies", "https://c.com/2", 1))
+    feeds["tiingo"].append(article("Same minute", "https://c.com/3", 10))
+    feeds["tiingo"].append(article("Older", "https://c.com/4", 11))
+    results, metadata = asyncio.run(
+        aggregate_news(fetch, ["benzinga", "tiingo"], since=cursor)
+    )
+    assert [a.title for a in results] == ["Bitcoin rallies", "Same minute"]
+    assert metadata["cursor"] != cursor
+
+    with pytest.raises(OpenBBError, match="Invalid news cursor"):
+        asyncio.run(aggregate_news(fetch, ["tiingo"], since="garbage"))
+
+
+def test_aggregate_news_since_cursor_duplicates(feeds):
+    fetch = make_fetch(feeds)
+    # The duplicate is the newest article fetched, but it is not returned.
+    feeds["fmp"] = [
+        article(
+            "Apple shares rise after earnings beat, analysts say",
+            "https://b.com/x",
+            2,
+        )
+    ]
+    results, metadata = asyncio.run(aggregate_news(fetch, ["benzinga", "fmp"]))
+    assert [a.provider for a in results] == ["benzinga", "benzinga"]
+    assert metadata["providers"]["fmp"]["duplicates"] == 1
+    assert decode_cursor(metadata["cursor"])[0] == NOW - timedelta(minutes=2)
+
+    results, _ = asyncio.run(
+        aggregate_news(fetch, ["benzinga", "fmp"], since=metadata["cursor"])
+    )
+    assert results == []
+
+
+def test_aggregate_news_since_cursor_limit(feeds):
+    fetch = make_fetch(feeds)
+    feeds["tiingo"].append(article("Same minute", "https://c.com/3", 20))
+    results, metadata = asyncio.run(
+        aggregate_news(fetch, ["benzinga", "tiingo"], limit=2)
+    )
+    assert [a.title for a in results] == [
+        "Apple shares rise after earnings beat",
+        "Gold hits record high",
+    ]
+    # The cursor stops at the last article returned, not at the newest one.
+    assert decode_cursor(metadata["cursor"])[0] == NOW - timedelta(minutes=20)
+
+    # The article cut at that date is returned next, not those returned before.
+    results, metadata = asyncio.run(
+        aggregate_news(fetch, ["benzinga", "tiingo"], since=metadata["cursor"])
+    )
+    assert [a.title for a in results] == ["Same minute"]
+
+    results, _ = asyncio.run(
+        aggregate_news(fetch, ["benzinga", "tiingo"], since=metadata["cursor"])
+    )
+    assert results == []
+
+
+def test_aggregate_news_failures(feeds):
+    feeds["fmp"] = RuntimeError("Unauthorized")
+    feeds["tiingo"] = EmptyDataError()
+    fetch = make_fetch(feeds, delays={"benzinga": 0.5})
+
+    with pytest.warns(OpenBBWarning) as record:
+        results, metadata = asyncio.run(
+            aggregate_news(
+                fetch, ["benzinga", "fmp", "tiingo"], limit=1, timeout=0.2
+            )
+        )
+    assert results == []
+    assert metadata["cursor"] is None
+    assert metadata["providers"]["benzinga"]["error"] == "timed out after 0.2 seconds"
+    assert metadata["providers"]["fmp"]["error"] == "Unauthorized"
+    assert metadata["providers"]["tiingo"]["articles"] == 0
+    assert len(record) == 2
+
+    with pytest.raises(OpenBBError, match="No provider returned news"):
+        with pytest.warns(OpenBBWarning):
+            asyncio.run(aggregate_news(fetch, ["benzinga", "fmp"], timeout=0.2))
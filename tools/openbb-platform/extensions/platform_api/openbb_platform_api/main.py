@@ -10,7 +10,7 @@ import sys
 from pathlib import Path
 
 import uvicorn
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
 from openbb_core.api.rest_api import app
 from openbb_core.app.service.system_service import SystemService
 from openbb_core.env import Env
@@ -22,6 +22,11 @@ from .utils.api import (
     get_widgets_json,
     parse_args,
 )
+from .utils.artifacts import (
+    ArtifactCache,
+    JSONArtifactResponse,
+    serve_openapi_artifact,
+)
 from .utils.merge_agents import get_additional_agents, has_additional_agents
 from .utils.merge_apps import get_additional_apps, has_additional_apps
 
@@ -61,6 +66,7 @@ DEFAULT_APPS_PATH = (
 AGENTS_PATH = kwargs.pop("agents-json", None)
 build = kwargs.pop("build", True)
 build = False if kwargs.pop("no-build", None) else build
+use_cache = not kwargs.pop("no-cache", False)
 dont_filter = kwargs.pop("no-filter", False)
 widget_exclude_filter: list = kwargs.pop("exclude", [])
 uvicorn_settings = (
@@ -104,11 +110,23 @@ def check_for_platform_extensions(fastapi_app, widgets_to_exclude) -> list:
 
 
 widget_exclude_filter = check_for_platform_extensions(app, widget_exclude_filter)
-openapi = app.openapi()
 current_settings = get_user_settings(CURRENT_USER_SETTINGS)
+# The OpenAPI schema and widgets of the previous launch are reused when unchanged.
+artifact_cache = ArtifactCache(
+    Path(
+        current_settings.get("preferences", {}).get(
+            "cache_directory", HOME + "/OpenBBUserData/cache"
+        )
+    ).joinpath("platform_api"),
+    use_cache=use_cache,
+)
+openapi, openapi_artifact = artifact_cache.load_openapi(app)
+route_cache = artifact_cache.load_widgets()
 widgets_json = get_widgets_json(
-    build, openapi, widget_exclude_filter, EDITABLE, WIDGETS_PATH, app
+    build, openapi, widget_exclude_filter, EDITABLE, WIDGETS_PATH, app, route_cache
 )
+artifact_cache.save_widgets(route_cache)
+serve_openapi_artifact(app, openapi_artifact)
 APPS_PATH = (
     APPS_PATH
     if APPS_PATH
@@ -143,15 +161,15 @@ if not has_root_widgets:
         global FIRST_RUN  # noqa PLW0603  # pylint: disable=global-statement
         if FIRST_RUN is True:
             FIRST_RUN = False
-            return JSONResponse(content=widgets_json, headers=obb_headers)
+            return JSONArtifactResponse(content=widgets_json, headers=obb_headers)
         if EDITABLE:
-            return JSONResponse(
+            return JSONArtifactResponse(
                 content=get_widgets_json(
                     False, openapi, widget_exclude_filter, EDITABLE, WIDGETS_PATH, app
                 ),
                 headers=obb_headers,
             )
-        return JSONResponse(content=widgets_json, headers=obb_headers)
+        return JSONArtifactResponse(content=widgets_json, headers=obb_headers)
 
 else:
     # Populate the local name `get_widgets` with the endpoint function of the existing
@@ -165,7 +183,7 @@ else:
         # Fallback mechanism
         async def get_widgets():
             """Return the generated widgets.json"""
-            return JSONResponse(content=widgets_json, headers=obb_headers)
+            return JSONArtifactResponse(content=widgets_json, headers=obb_headers)
 
 
 # Check if the app has already defined apps.json at the root.
@@ -240,9 +258,9 @@ if not has_root_apps:
                         new_templates.append(template)
 
             if new_templates:
-                return JSONResponse(content=new_templates, headers=obb_headers)
+                return JSONArtifactResponse(content=new_templates, headers=obb_headers)
 
-        return JSONResponse(content=[], headers=obb_headers)
+        return JSONArtifactResponse(content=[], headers=obb_headers)
 
 
 if AGENTS_PATH:
@@ -253,8 +271,8 @@ if AGENTS_PATH:
         if os.path.exists(AGENTS_PATH):
             with open(AGENTS_PATH, encoding="utf-8") as f:
                 agents = json.load(f)
-            return JSONResponse(content=agents, headers=obb_headers)
-        return JSONResponse(content={}, headers=obb_headers)
+            return JSONArtifactResponse(content=agents, headers=obb_headers)
+        return JSONArtifactResponse(content={}, headers=obb_headers)
 
 
 # Check if the app has already defined agents.json at the root.
@@ -271,7 +289,7 @@ if not has_root_agents and has_additional_agents(app):
             for path_agents in additional_agents.values():
                 for k, v in path_agents.items():
                     new_agents[k] = v
-        return JSONResponse(content=new_agents, headers=obb_headers)
+        return JSONArtifactResponse(content=new_agents, headers=obb_headers)
 
 else:
 
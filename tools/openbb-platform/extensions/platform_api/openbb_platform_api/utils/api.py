@@ -25,6 +25,7 @@ Launcher specific arguments:
     --editable                      Flag to make widgets.json an editable file that can be modified during runtime. Default is 'false'.
     --build                         If the file already exists, changes prompt action to overwrite/append/ignore. Only valid when --editable true.
     --no-build                      Do not build the widgets.json file. Use this flag to load an existing widgets.json file without checking for updates.
+    --no-cache                      Regenerate the OpenAPI schema and all widgets, instead of using the ones cached by the previous launch.
     --exclude                       JSON encoded list of API paths to exclude from widgets.json. Disable entire routes with '*' - e.g. '["/api/v1/*"]'.
     --no-filter                     Do not filter out widgets in widget_settings.json file.
     --widgets-json                  Absolute/relative path to use as the widgets.json file. Default is ~/envs/{env}/assets/widgets.json, when --editable is 'true'.
@@ -114,8 +115,13 @@ def get_widgets_json(
     editable: bool = False,
     widgets_path: str | None = None,
     app: FastAPI | None = None,
+    route_cache: dict | None = None,
 ):
-    """Generate and serve the widgets.json for the OpenBB Platform API."""
+    """Generate and serve the widgets.json for the OpenBB Platform API.
+
+    When `route_cache` is supplied, only the widgets of routes that changed
+    since the build stored in it are rebuilt. See `build_json`.
+    """
     # pylint: disable=import-outside-toplevel
     from openbb_core.provider.utils.helpers import run_async  # noqa
     from .merge_widgets import get_and_fix_widget_paths, has_additional_widgets
@@ -165,11 +171,16 @@ def get_widgets_json(
         _widgets_json = (
             existing_widgets_json
             if _build is False
-            else build_json(_openapi, widget_exclude_filter)
+            else build_json(_openapi, widget_exclude_filter, route_cache)
         )
 
         if _build:
-            diff = DeepDiff(existing_widgets_json, _widgets_json, ignore_order=True)
+            # Comparing first avoids the much slower diff when nothing changed.
+            diff = (
+                DeepDiff(existing_widgets_json, _widgets_json, ignore_order=True)
+                if existing_widgets_json != _widgets_json
+                else None
+            )
             merge_prompt = None
             if diff and json_exists:
                 print("Differences found:", diff)  # noqa: T201
@@ -193,10 +204,10 @@ def get_widgets_json(
                     _widgets_json = (
                         existing_widgets_json
                         if existing_widgets_json
-                        else build_json(_openapi, widget_exclude_filter)
+                        else build_json(_openapi, widget_exclude_filter, route_cache)
                     )
     else:
-        _widgets_json = build_json(_openapi, widget_exclude_filter)
+        _widgets_json = build_json(_openapi, widget_exclude_filter, route_cache)
 
         if PATH_WIDGETS:
             for k in PATH_WIDGETS:
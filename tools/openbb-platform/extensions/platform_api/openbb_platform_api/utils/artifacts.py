@@ -0,0 +1,373 @@
+"""Cached build artifacts of the API.
+
+Generating the OpenAPI schema of every installed extension, and the
+widgets.json built from it, takes several seconds at each launch. The schema
+is stored on disk under a fingerprint of the loaded OpenBB modules, the routes
+of the app and the settings it is built from, and reused until any of them
+changes. The widgets are stored by route, so when an extension changes, only
+the widgets of the routes whose schema changed are rebuilt.
+
+JSON documents served by the launcher are serialized and compressed once,
+and sent with an ETag. A client sending it back in `If-None-Match` is
+answered with `304 Not Modified`.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+
+logger = logging.getLogger("openbb_platform_api")
+
+# Bumped when the format of the artifacts changes, so they are rebuilt.
+ARTIFACTS_VERSION = 1
+# Bodies smaller than this are not worth compressing.
+MINIMUM_GZIP_SIZE = 1024
+# Number of serialized documents kept in memory.
+MAX_ARTIFACTS = 16
+
+
+def get_fingerprint(app) -> str:
+    """Fingerprint everything the OpenAPI schema of an app is generated from.
+
+    This covers the source files of the loaded OpenBB modules and of any
+    module outside the Python installation, e.g. the file of a custom app,
+    the versions of Python, FastAPI and Pydantic, the routes and metadata
+    of the app, and the `OPENBB_` environment variables.
+
+    Parameters
+    ----------
+    app : FastAPI
+        The app.
+
+    Returns
+    -------
+    str
+        The SHA-256 digest of the inputs, as a hexadecimal string.
+    """
+    import fastapi
+    import pydantic
+
+    prefixes = tuple(
+        str(Path(p).resolve()) for p in {sys.prefix, sys.base_prefix, sys.exec_prefix}
+    )
+    modules: list = []
+
+    for name, module in sorted(list(sys.modules.items()), key=lambda x: x[0]):
+        file = getattr(module, "__file__", None)
+        if not file:
+            continue
+        if not name.startswith("openbb") and str(Path(file).resolve()).startswith(
+            prefixes
+        ):
+            continue
+        try:
+            stat = os.stat(file)
+        except OSError:
+            continue
+        modules.append((name, stat.st_mtime_ns, stat.st_size))
+
+    routes = [
+        (
+            getattr(route, "path", ""),
+            sorted(getattr(route, "methods", None) or []),
+            getattr(route, "name", ""),
+        )
+        for route in app.routes
+    ]
+    inputs = [
+        ARTIFACTS_VERSION,
+        sys.version,
+        fastapi.__version__,
+        pydantic.VERSION,
+        app.title,
+        app.version,
+        app.description,
+        app.openapi_version,
+        app.servers,
+        app.openapi_tags,
+        routes,
+        sorted((k, v) for k, v in os.environ.items() if k.startswith("OPENBB_")),
+        modules,
+    ]
+    content = json.dumps(inputs, sort_keys=True, default=str).encode()
+
+    return hashlib.sha256(content).hexdigest()
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    """Write a file through a temporary one, so it is never read partially."""
+    temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp.write_bytes(content)
+    os.replace(temp, path)
+
+
+class JSONArtifact:
+    """A JSON document, serialized once, with its ETag and compressed body.
+
+    Parameters
+    ----------
+    body : bytes
+        The serialized document.
+    gzip_body : bytes | None
+        The body compressed with gzip. Compressed when first needed by default.
+    """
+
+    __slots__ = ("body", "etag", "_gzip_body")
+
+    def __init__(self, body: bytes, gzip_body: bytes | None = None):
+        """Initialize the artifact."""
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()}"'
+        self._gzip_body = gzip_body
+
+    @classmethod
+    def from_content(cls, content: Any) -> "JSONArtifact":
+        """Serialize a document, as `JSONResponse` does."""
+        body = json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        return cls(body)
+
+    @property
+    def gzip_body(self) -> bytes:
+        """The body compressed with gzip."""
+        if self._gzip_body is None:
+            import gzip
+
+            self._gzip_body = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._gzip_body
+
+
+_artifacts: dict[int, tuple[Any, JSONArtifact]] = {}
+_compressed: dict[str, JSONArtifact] = {}
+
+
+def get_artifact(content: Any) -> JSONArtifact:
+    """Get the artifact of a document, serializing it only once.
+
+    The same object is only serialized once, so it must not be modified
+    after it is served. Compressed bodies are reused for equal documents.
+    """
+    cached = _artifacts.get(id(content))
+    if cached is not None and cached[0] is content:
+        return cached[1]
+
+    artifact = JSONArtifact.from_content(content)
+    if (previous := _compressed.get(artifact.etag)) is not None:
+        artifact = previous
+    else:
+        _compressed[artifact.etag] = artifact
+        if len(_compressed) > MAX_ARTIFACTS:
+            del _compressed[next(iter(_compressed))]
+
+    _artifacts[id(content)] = (content, artifact)
+    if len(_artifacts) > MAX_ARTIFACTS:
+        del _artifacts[next(iter(_artifacts))]
+
+    return artifact
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Check if an `Accept-Encoding` header allows gzip."""
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+class JSONArtifactResponse(Response):
+    """JSON response sent from a `JSONArtifact`.
+
+    The body is compressed with gzip when the client accepts it, and the
+    response is `304 Not Modified` when the client already has the document.
+    `body` is always the uncompressed document.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any = None,
+        status_code: int = 200,
+        headers: dict | None = None,
+        artifact: JSONArtifact | None = None,
+    ):
+        """Initialize the response."""
+        self.artifact = artifact if artifact is not None else get_artifact(content)
+        super().__init__(content, status_code=status_code, headers=headers)
+        self.headers["ETag"] = self.artifact.etag
+        self.headers["Vary"] = "Accept-Encoding"
+
+    def render(self, content: Any) -> bytes:
+        """Return the serialized document."""
+        return self.artifact.body
+
+    async def __call__(self, scope, receive, send) -> None:
+        """Send the response, compressed or not modified if possible."""
+        request_headers = Headers(scope=scope)
+        if_none_match = request_headers.get("if-none-match", "")
+        etags = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",") if tag
+        }
+        body = self.body
+
+        if self.status_code == 200 and (self.artifact.etag in etags or "*" in etags):
+            self.status_code = 304
+            body = b""
+            del self.headers["content-length"]
+            del self.headers["content-type"]
+        elif len(body) >= MINIMUM_GZIP_SIZE and _accepts_gzip(
+            request_headers.get("accept-encoding", "")
+        ):
+            body = self.artifact.gzip_body
+            self.headers["Content-Encoding"] = "gzip"
+            self.headers["Content-Length"] = str(len(body))
+
+        # The uncompressed document stays in `body` for the application.
+        original, self.body = self.body, body
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.body = original
+
+
+class ArtifactCache:
+    """The OpenAPI schema and the widgets of an app, stored on disk.
+
+    Parameters
+    ----------
+    directory : str | Path
+        The directory of the artifacts.
+    use_cache : bool
+        When False, the stored artifacts are ignored, and replaced.
+    """
+
+    def __init__(self, directory: str | Path, use_cache: bool = True):
+        """Initialize the cache."""
+        self.directory = Path(directory)
+        self.use_cache = use_cache
+        self._widgets_digest: str | None = None
+
+    def _openapi_path(self, fingerprint: str) -> Path:
+        """Return the path of a stored OpenAPI schema."""
+        return self.directory / f"openapi-{fingerprint}.json.gz"
+
+    def load_openapi(self, app) -> tuple[dict, JSONArtifact]:
+        """Get the OpenAPI schema of an app, generating it only if it changed.
+
+        The schema is set as the schema of the app, so `app.openapi()`
+        returns it without generating it.
+
+        Parameters
+        ----------
+        app : FastAPI
+            The app.
+
+        Returns
+        -------
+        tuple[dict, JSONArtifact]
+            The schema, and its serialized artifact.
+        """
+        import gzip
+
+        fingerprint = get_fingerprint(app)
+        path = self._openapi_path(fingerprint)
+
+        if self.use_cache and path.exists():
+            try:
+                compressed = path.read_bytes()
+                artifact = JSONArtifact(gzip.decompress(compressed), compressed)
+                openapi = json.loads(artifact.body)
+                app.openapi_schema = openapi
+                return openapi, artifact
+            except (OSError, ValueError) as e:
+                logger.info("Rebuilding the cached OpenAPI schema -> %s", e)
+
+        app.openapi_schema = None
+        openapi = app.openapi()
+        # Serialized before widgets.json is built from it, as it is generated.
+        artifact = JSONArtifact.from_content(openapi)
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for old in self.directory.glob("openapi-*.json.gz"):
+                old.unlink(missing_ok=True)
+            _write_atomic(path, artifact.gzip_body)
+        except OSError as e:
+            logger.info("Unable to cache the OpenAPI schema -> %s", e)
+
+        return openapi, artifact
+
+    def load_widgets(self) -> dict:
+        """Load the widgets of the previous build, by route."""
+        path = self.directory / "widgets.json"
+        if not self.use_cache or not path.exists():
+            return {}
+        try:
+            content = path.read_bytes()
+            cached = json.loads(content)
+        except (OSError, ValueError):
+            return {}
+        self._widgets_digest = hashlib.sha256(content).hexdigest()
+        if cached.get("version") != ARTIFACTS_VERSION:
+            return {}
+        return cached.get("routes", {})
+
+    def save_widgets(self, routes: dict) -> None:
+        """Store the widgets of a build, by route, unless they are unchanged."""
+        content = json.dumps(
+            {"version": ARTIFACTS_VERSION, "routes": routes}, ensure_ascii=False
+        ).encode("utf-8")
+        if hashlib.sha256(content).hexdigest() == self._widgets_digest:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self.directory / "widgets.json", content)
+        except OSError as e:
+            logger.info("Unable to cache widgets.json -> %s", e)
+
+
+def serve_openapi_artifact(app, artifact: JSONArtifact) -> None:
+    """Serve the OpenAPI schema of an app from its artifact.
+
+    The route FastAPI creates at `app.openapi_url` is replaced. Requests
+    behind a proxy with a root path are still answered by FastAPI, which
+    adds the root path to the servers of the schema.
+    """
+    from starlette.routing import Route
+
+    url = app.openapi_url
+    if not url:
+        return
+
+    original = next(
+        (r for r in app.router.routes if isinstance(r, Route) and r.path == url),
+        None,
+    )
+    if original is None:
+        return
+
+    original_endpoint = original.endpoint
+
+    async def openapi(request):
+        """Send the OpenAPI schema."""
+        if request.scope.get("root_path", "").rstrip("/") and app.root_path_in_servers:
+            return await original_endpoint(request)
+        return JSONArtifactResponse(artifact=artifact)
+
+    index = app.router.routes.index(original)
+    app.router.routes[index] = Route(url, openapi, include_in_schema=False)
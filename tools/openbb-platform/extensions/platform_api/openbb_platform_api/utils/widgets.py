@@ -229,13 +229,40 @@ def get_form_input_paths(openapi: dict) -> dict:
         and config.get("form_endpoint")
     }
 
-
-def build_json(  # noqa: PLR0912  # pylint: disable=too-many-branches, too-many-locals, too-many-statements
-    openapi: dict, widget_exclude_filter: list
-):
-    """Build the widgets.json file."""
+def build_route_widgets(  # noqa: PLR0912, PLR0913  # pylint: disable=too-many-branches, too-many-locals, too-many-statements, too-many-arguments, too-many-positional-arguments
+    openapi: dict,
+    route: str,
+    widget_exclude_filter: list,
+    starred_list: list,
+    form_endpoint_paths: dict,
+    api_prefix: str,
+) -> dict:
+    """Build the widgets of one route of the OpenAPI schema.
+
+    The widgets of a route only depend on its path item, the path item of its
+    form endpoint, and the component schemas they reference.
+
+    Parameters
+    ----------
+    openapi : dict
+        The OpenAPI schema.
+    route : str
+        The path of the route.
+    widget_exclude_filter : list
+        Widget IDs to exclude. The IDs of POST widgets are appended to it.
+    starred_list : list
+        Path patterns, ending with '*', to exclude.
+    form_endpoint_paths : dict
+        The form endpoint of each route, from `get_form_input_paths`.
+    api_prefix : str
+        The prefix of the API routes.
+
+    Returns
+    -------
+    dict
+        The widgets of the route, by widget ID.
+    """
     # pylint: disable=import-outside-toplevel
-    from openbb_core.app.service.system_service import SystemService  # noqa
     from .openapi import (
         TO_CAPS_STRINGS,
         data_schema_to_columns_defs,
@@ -244,220 +271,152 @@ def build_json(  # noqa: PLR0912  # pylint: disable=too-many-branches, too-many-
         post_query_schema_for_widget,
     )
 
-    if not openapi:
-        return {}
-
-    starred_list: list = []
-    api_prefix = SystemService().system_settings.api_settings.prefix or ""
-
-    for item in widget_exclude_filter.copy():
-        if "*" in item:
-            starred_list.append(item)
-            widget_exclude_filter.remove(item)
-
-    # Collect all routes that are designated as form endpoints to exclude them from direct widget generation
-    form_endpoint_paths = get_form_input_paths(openapi)
     widgets_json: dict = {}
-    routes = [
-        p
-        for p in openapi["paths"]
-        if openapi["paths"].get(p, {})
-        and ("get" in openapi["paths"][p] or "post" in openapi["paths"][p])
-    ]
-    for route in routes:
-        # Skip routes that are only used as form endpoints for other routes
-        if route in form_endpoint_paths.values() or route.endswith("widgets.json"):
-            continue
+    # Skip routes that are only used as form endpoints for other routes
+    if route in form_endpoint_paths.values() or route.endswith("widgets.json"):
+        return widgets_json
 
-        route_api = openapi["paths"][route]
+    route_api = openapi["paths"][route]
 
-        has_form_endpoint = route in list(form_endpoint_paths)
-        form_endpoint_path = form_endpoint_paths.get(route) if has_form_endpoint else ""
-        form_route: dict = (
-            openapi["paths"][form_endpoint_path]["post"] if has_form_endpoint else {}
-        )
-        # Determine the primary method for the widget
-        # If a GET exists, it's the primary. Otherwise, it's a POST.
-        route_method = "get" if "get" in route_api else "post"
-
-        skip = False
-        for starred in starred_list:
-            if route.startswith(
-                starred.replace("*", "")
-                .replace("[", "")
-                .replace("]", "")
-                .replace('"', "")
-                .replace("'", "")
-            ):
-                skip = True
-                break
+    has_form_endpoint = route in list(form_endpoint_paths)
+    form_endpoint_path = form_endpoint_paths.get(route) if has_form_endpoint else ""
+    form_route: dict = (
+        openapi["paths"][form_endpoint_path]["post"] if has_form_endpoint else {}
+    )
+    # Determine the primary method for the widget
+    # If a GET exists, it's the primary. Otherwise, it's a POST.
+    route_method = "get" if "get" in route_api else "post"
+
+    skip = False
+    for starred in starred_list:
+        if route.startswith(
+            starred.replace("*", "")
+            .replace("[", "")
+            .replace("]", "")
+            .replace('"', "")
+            .replace("'", "")
+        ):
+            skip = True
+            break
 
-        if skip is True:
-            continue
+    if skip is True:
+        return widgets_json
 
-        route_copy = route.replace(api_prefix, "")
-        widget_id = (
-            route_copy[1:].replace("/", "_")
-            if route_copy[0] == "/"
-            else route_copy.replace("/", "_")
-        )
+    route_copy = route.replace(api_prefix, "")
+    widget_id = (
+        route_copy[1:].replace("/", "_")
+        if route_copy[0] == "/"
+        else route_copy.replace("/", "_")
+    )
 
-        if widget_id in widget_exclude_filter:
-            continue
+    if widget_id in widget_exclude_filter:
+        return widgets_json
 
-        widget_config_dict = route_api.get(route_method, {}).get("widget_config", {})
+    widget_config_dict = route_api.get(route_method, {}).get("widget_config", {})
 
-        # If the widget is marked as excluded, skip it.
-        if widget_config_dict.get("exclude") is True:
-            continue
+    # If the widget is marked as excluded, skip it.
+    if widget_config_dict.get("exclude") is True:
+        return widgets_json
 
-        response_schema = (
-            route_api.get(route_method, {})
-            .get("responses", {})
-            .get("200", {})
-            .get("content", {})
-            .get("application/json", {})
-            .get("schema", {})
-        )
+    response_schema = (
+        route_api.get(route_method, {})
+        .get("responses", {})
+        .get("200", {})
+        .get("content", {})
+        .get("application/json", {})
+        .get("schema", {})
+    )
 
-        # Extract providers from raw params BEFORE building query_schema
-        # This allows us to build provider-specific schemas
+    # Extract providers from raw params BEFORE building query_schema
+    # This allows us to build provider-specific schemas
+    if route_method == "get":
+        raw_params = route_api.get("get", {}).get("parameters", [])
+        providers = extract_providers(raw_params)
+        has_chart = any(p["name"] == "chart" for p in raw_params)
+    else:  # post
+        providers = []
+        has_chart = False
+
+    if not providers:
+        providers = ["custom"]
+
+    for provider in providers:
+        # Build query schema PER PROVIDER to get provider-specific descriptions/defaults
         if route_method == "get":
-            raw_params = route_api.get("get", {}).get("parameters", [])
-            providers = extract_providers(raw_params)
-            has_chart = any(p["name"] == "chart" for p in raw_params)
+            query_schema, _ = get_query_schema_for_widget(openapi, route, provider)
         else:  # post
-            providers = []
-            has_chart = False
-
-        if not providers:
-            providers = ["custom"]
-
-        for provider in providers:
-            # Build query schema PER PROVIDER to get provider-specific descriptions/defaults
-            if route_method == "get":
-                query_schema, _ = get_query_schema_for_widget(openapi, route, provider)
-            else:  # post
-                query_schema = (
-                    post_query_schema_for_widget(
-                        openapi, route_api.get("post", {}).get("operationId", ""), route
-                    )
-                    or []
+            query_schema = (
+                post_query_schema_for_widget(
+                    openapi, route_api.get("post", {}).get("operationId", ""), route
                 )
-
-            columns_defs = (
-                data_schema_to_columns_defs(openapi, widget_id, provider, route)
-                if widget_config_dict.get("type")
-                not in ["multi_file_viewer", "pdf", "metric"]
-                else []
-            )
-            _cats = [
-                r
-                for r in route.split("/")
-                if r and r != "api" and r[0].lower() != "v" and not r[1:].isdigit()
-            ]
-            category = _cats[0].title() if _cats else ""
-            category = category.replace("Fixedincome", "Fixed Income")
-            subcat = (
-                _cats[1].title().replace("_", " ")
-                if len(_cats) > 2
-                else _cats[1].replace("_", " ").title() if len(_cats) > 1 else None
-            )
-            name = (
-                widget_id.replace("fixedincome", "fixed income")
-                .replace("_", " ")
-                .title()
-                .replace(category if category else "", "")
-                .replace(subcat if subcat else "", "")
-                .strip()
+                or []
             )
 
-            name = " ".join(
-                [
-                    (word.upper() if word in TO_CAPS_STRINGS else word)
-                    for word in name.split()
-                ]
-            )
-            modified_query_schema = modify_query_schema(query_schema, provider)
-
-            param_names: list = []
-            var_schema: dict = {}
-
-            # Determine the source of the POST body schema
-            post_body_source = None
-            if has_form_endpoint:
-                post_body_source = form_route
-            elif route_method == "post":
-                post_body_source = route_api.get("post")
-
-            if post_body_source:
-                if (
-                    _schema := post_body_source.get("requestBody", {})
-                    .get("content", {})
-                    .get("application/json", {})
-                    .get("schema", {})
-                ):
-                    schema_name = _schema.get("$ref", "").split("/")[-1]
-                    var_schema = openapi["components"]["schemas"].get(schema_name, {})
-
-                    if var_schema:
-                        var_props = var_schema.get("properties", {})
-                        for k, v in var_props.items():
-                            if "$ref" in v:
-                                param_names.append(k)
-
-                if param_names:
-                    for _param in param_names:
-                        post_params = post_query_schema_for_widget(
-                            openapi, post_body_source.get("operationId"), route, _param
-                        )
-                        modified_post_params = modify_query_schema(
-                            post_params,  # type: ignore
-                            provider,  # type: ignore
-                        )
+        columns_defs = (
+            data_schema_to_columns_defs(openapi, widget_id, provider, route)
+            if widget_config_dict.get("type")
+            not in ["multi_file_viewer", "pdf", "metric"]
+            else []
+        )
+        _cats = [
+            r
+            for r in route.split("/")
+            if r and r != "api" and r[0].lower() != "v" and not r[1:].isdigit()
+        ]
+        category = _cats[0].title() if _cats else ""
+        category = category.replace("Fixedincome", "Fixed Income")
+        subcat = (
+            _cats[1].title().replace("_", " ")
+            if len(_cats) > 2
+            else _cats[1].replace("_", " ").title() if len(_cats) > 1 else None
+        )
+        name = (
+            widget_id.replace("fixedincome", "fixed income")
+            .replace("_", " ")
+            .title()
+            .replace(category if category else "", "")
+            .replace(subcat if subcat else "", "")
+            .strip()
+        )
 
-                        if has_form_endpoint:
-                            has_submit = False
-                            for item in modified_post_params:
-                                if item.get("type") == "button":
-                                    has_submit = True
-                                    break
-
-                            if not has_submit:
-                                modified_post_params.append(
-                                    {
-                                        "paramName": "submit",
-                                        "label": "Submit",
-                                        "type": "button",
-                                        "value": True,
-                                        "description": "Submit the form.",
-                                    }
-                                )
+        name = " ".join(
+            [
+                (word.upper() if word in TO_CAPS_STRINGS else word)
+                for word in name.split()
+            ]
+        )
+        modified_query_schema = modify_query_schema(query_schema, provider)
+
+        param_names: list = []
+        var_schema: dict = {}
+
+        # Determine the source of the POST body schema
+        post_body_source = None
+        if has_form_endpoint:
+            post_body_source = form_route
+        elif route_method == "post":
+            post_body_source = route_api.get("post")
+
+        if post_body_source:
+            if (
+                _schema := post_body_source.get("requestBody", {})
+                .get("content", {})
+                .get("application/json", {})
+                .get("schema", {})
+            ):
+                schema_name = _schema.get("$ref", "").split("/")[-1]
+                var_schema = openapi["components"]["schemas"].get(schema_name, {})
 
-                            form_params = {
-                                "type": "form",
-                                "paramName": _param,
-                                "label": "Form",
-                                "description": "Form Data",
-                                "endpoint": form_endpoint_path,
-                                "inputParams": modified_post_params,
-                            }
+                if var_schema:
+                    var_props = var_schema.get("properties", {})
+                    for k, v in var_props.items():
+                        if "$ref" in v:
+                            param_names.append(k)
 
-                            if post_config := var_schema.get("x-widget_config", {}):
-                                form_params = deep_merge_configs(
-                                    form_params,
-                                    post_config,
-                                )
-
-                            modified_query_schema.append(form_params)
-                        else:
-                            # For non-form endpoints, extend with the modified params directly
-                            modified_query_schema.extend(modified_post_params)
-                else:  # This handles POST requests with no parameters in the body
+            if param_names:
+                for _param in param_names:
                     post_params = post_query_schema_for_widget(
-                        openapi,
-                        post_body_source.get("operationId"),
-                        form_endpoint_path if has_form_endpoint else route,
+                        openapi, post_body_source.get("operationId"), route, _param
                     )
                     modified_post_params = modify_query_schema(
                         post_params,  # type: ignore
@@ -476,266 +435,465 @@ def build_json(  # noqa: PLR0912  # pylint: disable=too-many-branches, too-many-
                                 {
                                     "paramName": "submit",
                                     "label": "Submit",
-                                    "value": True,
                                     "type": "button",
+                                    "value": True,
                                     "description": "Submit the form.",
                                 }
                             )
 
                         form_params = {
                             "type": "form",
-                            "paramName": "form",
-                            "label": var_schema.get("title", "Form"),
-                            "description": var_schema.get("description", ""),
+                            "paramName": _param,
+                            "label": "Form",
+                            "description": "Form Data",
                             "endpoint": form_endpoint_path,
                             "inputParams": modified_post_params,
                         }
 
-                        var_key: dict = {}
-                        # Widget Config at the model level goes first.
                         if post_config := var_schema.get("x-widget_config", {}):
-                            for key, value in post_config.copy().items():
-                                if key.startswith("$."):
-                                    var_key[key] = value
-                                else:
-                                    form_params[key] = value
-
                             form_params = deep_merge_configs(
                                 form_params,
                                 post_config,
                             )
 
-                        # Then the widget config at the POST endpoint level takes priority.
-                        if post_config := form_route.get("widget_config", {}):
-                            for key, value in post_config.copy().items():
-                                if key.startswith("$."):
-                                    var_key[key] = value
+                        modified_query_schema.append(form_params)
+                    else:
+                        # For non-form endpoints, extend with the modified params directly
+                        modified_query_schema.extend(modified_post_params)
+            else:  # This handles POST requests with no parameters in the body
+                post_params = post_query_schema_for_widget(
+                    openapi,
+                    post_body_source.get("operationId"),
+                    form_endpoint_path if has_form_endpoint else route,
+                )
+                modified_post_params = modify_query_schema(
+                    post_params,  # type: ignore
+                    provider,  # type: ignore
+                )
 
-                            form_params = deep_merge_configs(
-                                form_params,
-                                {
-                                    k: v
-                                    for k, v in post_config.items()
-                                    if not k.startswith("$.")
-                                },
-                            )
+                if has_form_endpoint:
+                    has_submit = False
+                    for item in modified_post_params:
+                        if item.get("type") == "button":
+                            has_submit = True
+                            break
 
-                        modified_query_schema.append(form_params)
+                    if not has_submit:
+                        modified_post_params.append(
+                            {
+                                "paramName": "submit",
+                                "label": "Submit",
+                                "value": True,
+                                "type": "button",
+                                "description": "Submit the form.",
+                            }
+                        )
 
-                        if var_key:
-                            for key, value in var_key.items():
-                                if (
-                                    key.replace("$.", "") in widget_config_dict
-                                    and "params" not in key
-                                    and "inputParams" not in key
-                                ):
-                                    widget_config_dict.update(
-                                        {key.replace("$.", ""): value}
-                                    )
-                                else:
-                                    widget_config_dict[key.replace("$.", "")] = value
-
-                    elif route_method == "post":
-                        var_key = {}
-                        # Widget Config at the model level goes first.
-                        if post_config := var_schema.get("x-widget_config", {}):
-                            for key, value in post_config.copy().items():
-                                if key.startswith("$."):
-                                    var_key[key] = value
-
-                        if var_key:
-                            for key, value in var_key.items():
-                                if (
-                                    key.replace("$.", "") in widget_config_dict
-                                    and "params" not in key
-                                    and "inputParams" not in key
-                                ):
-                                    widget_config_dict.update(
-                                        {key.replace("$.", ""): value}
-                                    )
-                                else:
-                                    widget_config_dict[key.replace("$.", "")] = value
-
-            provider_map = {
-                "tmx": "TMX",
-                "ecb": "ECB",
-                "econdb": "EconDB",
-                "eia": "EIA",
-                "fmp": "FMP",
-                "oecd": "OECD",
-                "finra": "FINRA",
-                "fred": "FRED",
-                "imf": "IMF",
-                "bls": "BLS",
-                "yfinance": "yFinance",
-                "sec": "SEC",
-                "cftc": "CFTC",
-                "tradingeconomics": "Trading Economics",
-                "wsj": "WSJ",
-            }
-            provider_name = provider_map.get(
-                provider.lower(), provider.replace("_", " ").title()
+                    form_params = {
+                        "type": "form",
+                        "paramName": "form",
+                        "label": var_schema.get("title", "Form"),
+                        "description": var_schema.get("description", ""),
+                        "endpoint": form_endpoint_path,
+                        "inputParams": modified_post_params,
+                    }
+
+                    var_key: dict = {}
+                    # Widget Config at the model level goes first.
+                    if post_config := var_schema.get("x-widget_config", {}):
+                        for key, value in post_config.copy().items():
+                            if key.startswith("$."):
+                                var_key[key] = value
+                            else:
+                                form_params[key] = value
+
+                        form_params = deep_merge_configs(
+                            form_params,
+                            post_config,
+                        )
+
+                    # Then the widget config at the POST endpoint level takes priority.
+                    if post_config := form_route.get("widget_config", {}):
+                        for key, value in post_config.copy().items():
+                            if key.startswith("$."):
+                                var_key[key] = value
+
+                        form_params = deep_merge_configs(
+                            form_params,
+                            {
+                                k: v
+                                for k, v in post_config.items()
+                                if not k.startswith("$.")
+                            },
+                        )
+
+                    modified_query_schema.append(form_params)
+
+                    if var_key:
+                        for key, value in var_key.items():
+                            if (
+                                key.replace("$.", "") in widget_config_dict
+                                and "params" not in key
+                                and "inputParams" not in key
+                            ):
+                                widget_config_dict.update(
+                                    {key.replace("$.", ""): value}
+                                )
+                            else:
+                                widget_config_dict[key.replace("$.", "")] = value
+
+                elif route_method == "post":
+                    var_key = {}
+                    # Widget Config at the model level goes first.
+                    if post_config := var_schema.get("x-widget_config", {}):
+                        for key, value in post_config.copy().items():
+                            if key.startswith("$."):
+                                var_key[key] = value
+
+                    if var_key:
+                        for key, value in var_key.items():
+                            if (
+                                key.replace("$.", "") in widget_config_dict
+                                and "params" not in key
+                                and "inputParams" not in key
+                            ):
+                                widget_config_dict.update(
+                                    {key.replace("$.", ""): value}
+                                )
+                            else:
+                                widget_config_dict[key.replace("$.", "")] = value
+
+        provider_map = {
+            "tmx": "TMX",
+            "ecb": "ECB",
+            "econdb": "EconDB",
+            "eia": "EIA",
+            "fmp": "FMP",
+            "oecd": "OECD",
+            "finra": "FINRA",
+            "fred": "FRED",
+            "imf": "IMF",
+            "bls": "BLS",
+            "yfinance": "yFinance",
+            "sec": "SEC",
+            "cftc": "CFTC",
+            "tradingeconomics": "Trading Economics",
+            "wsj": "WSJ",
+        }
+        provider_name = provider_map.get(
+            provider.lower(), provider.replace("_", " ").title()
+        )
+
+        data_key = (
+            "results"
+            if response_schema
+            and isinstance(response_schema, dict)
+            and "$ref" in response_schema
+            and "/OBBject" in response_schema.get("$ref", "")
+            else ""
+        )
+        widget_type = (
+            "markdown"
+            if isinstance(response_schema, dict)
+            and response_schema.get("type") == "string"
+            else "table"
+        )
+        widget_config = {
+            "name": f"{name}" if name else route_api[route_method].get("summary"),
+            "description": route_api[route_method].get("description", ""),
+            "category": category.replace("_", " ").title(),
+            "type": widget_type,
+            "widgetId": f"{widget_id}_{provider}_obb",
+            "mcp_tool": {
+                "mcp_server": "Open Data Platform",
+                "tool_id": f"{widget_id}",
+            },
+            "params": modified_query_schema,
+            "endpoint": route,
+            "runButton": False,
+            "gridData": {"w": 40, "h": 15},
+            "data": {
+                "dataKey": data_key,
+                "table": {
+                    "showAll": True,
+                },
+            },
+            "source": [provider_name],
+        }
+
+        if subcat:
+            subcat = " ".join(
+                [
+                    (word.upper() if word in TO_CAPS_STRINGS else word)
+                    for word in subcat.split()
+                ]
+            )
+            subcat = (
+                subcat.replace("Estimates", "Analyst Estimates")
+                .replace("Fundamental", "Fundamental Analysis")
+                .replace("Compare", "Comparison Analysis")
+            )
+            widget_config["subCategory"] = subcat
+
+        if columns_defs:
+            widget_config["data"]["table"]["columnsDefs"] = columns_defs
+
+        data_var_key: dict = {}
+
+        if data_config := data_schema_to_columns_defs(
+            openapi, widget_id, provider, route, True
+        ):
+            for key, value in data_config.copy().items():  # type: ignore
+                if key.startswith("$."):
+                    data_var_key[key] = value
+
+            widget_config["data"] = deep_merge_configs(
+                widget_config["data"],
+                {k: v for k, v in data_config.items() if not k.startswith("$.")},  # type: ignore
+            )
+
+        if data_var_key:
+            for key, value in data_var_key.items():
+                if (
+                    key.replace("$.", "") in widget_config_dict
+                    and key != "$.data"
+                    and "columnsDefs" not in key
+                ):
+                    widget_config_dict.update({key.replace("$.", ""): value})
+                else:
+                    widget_config_dict[key.replace("$.", "")] = value
+
+        # Update the widget configuration with any supplied configurations in @router.command
+        if widget_config_dict:
+            widget_config = deep_merge_configs(
+                widget_config,
+                widget_config_dict,
             )
 
-            data_key = (
-                "results"
-                if response_schema
-                and isinstance(response_schema, dict)
-                and "$ref" in response_schema
-                and "/OBBject" in response_schema.get("$ref", "")
-                else ""
+        if widget_config.get("type") == "table":
+            widget_config["data"]["table"]["enableAdvanced"] = True
+
+        if widget_config.get("type") == "metric":
+            widget_config["gridData"]["w"] = (
+                4
+                if widget_config["gridData"].get("w") == 40
+                and "gridData" not in widget_config_dict
+                else widget_config["gridData"].get("w")
             )
-            widget_type = (
-                "markdown"
-                if isinstance(response_schema, dict)
-                and response_schema.get("type") == "string"
-                else "table"
+            widget_config["gridData"]["h"] = (
+                5
+                if widget_config["gridData"].get("h") == 15
+                and "gridData" not in widget_config_dict
+                else widget_config["gridData"].get("h")
             )
-            widget_config = {
-                "name": f"{name}" if name else route_api[route_method].get("summary"),
-                "description": route_api[route_method].get("description", ""),
-                "category": category.replace("_", " ").title(),
-                "type": widget_type,
-                "widgetId": f"{widget_id}_{provider}_obb",
-                "mcp_tool": {
-                    "mcp_server": "Open Data Platform",
-                    "tool_id": f"{widget_id}",
-                },
-                "params": modified_query_schema,
-                "endpoint": route,
-                "runButton": False,
-                "gridData": {"w": 40, "h": 15},
-                "data": {
-                    "dataKey": data_key,
-                    "table": {
-                        "showAll": True,
-                    },
+        elif widget_config.get("type") == "pdf":
+            widget_config["gridData"]["w"] = (
+                20
+                if widget_config["gridData"].get("w") == 40
+                and "gridData" not in widget_config_dict
+                else widget_config["gridData"].get("w")
+            )
+            widget_config["gridData"]["h"] = (
+                25
+                if widget_config["gridData"].get("h") == 15
+                and "gridData" not in widget_config_dict
+                else widget_config["gridData"].get("h")
+            )
+
+        if source := widget_config_dict.get("source", []):
+            widget_config["source"] = source
+
+        if route_method == "post" and widget_config.get("type", "") not in [
+            "ssrm_table",
+            "omni",
+            "multi_file_viewer",
+        ]:
+            widget_exclude_filter.append(widget_config["widgetId"])
+
+        # Add the widget configuration to the widgets.json
+        if widget_config["widgetId"] not in widget_exclude_filter:
+            widgets_json[widget_config["widgetId"]] = widget_config
+
+        if has_chart:
+            widget_config_chart = deepcopy(widget_config)
+            widget_config_chart["type"] = "chart"
+            widget_config_chart["name"] = widget_config_chart["name"] + " (Chart)"
+            widget_config_chart["widgetId"] = (
+                f"{widget_config_chart['widgetId']}_chart"
+            )
+            widget_config_chart["params"].append(
+                {
+                    "paramName": "chart",
+                    "label": "Chart",
+                    "description": "Returns chart",
+                    "optional": True,
+                    "value": True,
+                    "type": "boolean",
+                    "show": False,
                 },
-                "source": [provider_name],
-            }
+            )
+            widget_config_chart["gridData"]["h"] = widget_config_dict.get(
+                "gridData", {}
+            ).get("h", 20)
+            widget_config_chart["gridData"]["w"] = widget_config_dict.get(
+                "gridData", {}
+            ).get("w", 40)
+            widget_config_chart["defaultViz"] = "chart"
+            widget_config_chart["data"]["dataKey"] = (
+                "chart.content" if data_key else ""
+            )
+            if widget_config_chart["widgetId"] not in widget_exclude_filter:
+                widgets_json[widget_config_chart["widgetId"]] = widget_config_chart
 
-            if subcat:
-                subcat = " ".join(
-                    [
-                        (word.upper() if word in TO_CAPS_STRINGS else word)
-                        for word in subcat.split()
-                    ]
-                )
-                subcat = (
-                    subcat.replace("Estimates", "Analyst Estimates")
-                    .replace("Fundamental", "Fundamental Analysis")
-                    .replace("Compare", "Comparison Analysis")
-                )
-                widget_config["subCategory"] = subcat
+    return widgets_json
 
-            if columns_defs:
-                widget_config["data"]["table"]["columnsDefs"] = columns_defs
 
-            data_var_key: dict = {}
+def get_route_cache_key(
+    openapi: dict, route: str, form_endpoint_paths: dict, inputs: str = ""
+) -> str:
+    """Hash everything the widgets of a route are built from.
+
+    Parameters
+    ----------
+    openapi : dict
+        The OpenAPI schema.
+    route : str
+        The path of the route.
+    form_endpoint_paths : dict
+        The form endpoint of each route, from `get_form_input_paths`.
+    inputs : str
+        Other inputs of the build, such as the exclude filter.
+
+    Returns
+    -------
+    str
+        The SHA-256 digest of the route, the path items of the route and its
+        form endpoint, and every component schema they reference.
+    """
+    # pylint: disable=import-outside-toplevel
+    import hashlib
+    import json
+
+    paths = openapi.get("paths", {})
+    schemas = openapi.get("components", {}).get("schemas", {})
+    items = [paths.get(route)]
+
+    if form_endpoint := form_endpoint_paths.get(route):
+        items.append(paths.get(form_endpoint))
+
+    referenced: dict = {}
+    stack: list = list(items)
+
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            ref = obj.get("$ref")
+            if isinstance(ref, str) and ref.startswith("#/components/schemas/"):
+                name = ref.split("/")[-1]
+                if name not in referenced:
+                    referenced[name] = schemas.get(name)
+                    stack.append(referenced[name])
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+
+    # A route used as the form endpoint of another one has no widgets.
+    is_form_endpoint = route in form_endpoint_paths.values()
+    content = json.dumps(
+        [inputs, route, is_form_endpoint, items, referenced],
+        sort_keys=True,
+        default=str,
+    ).encode()
+
+    return hashlib.sha256(content).hexdigest()
+
+
+def build_json(
+    openapi: dict, widget_exclude_filter: list, cache: dict | None = None
+) -> dict:
+    """Build the widgets.json file.
+
+    Parameters
+    ----------
+    openapi : dict
+        The OpenAPI schema.
+    widget_exclude_filter : list
+        Widget IDs, and path patterns ending with '*', to exclude.
+    cache : dict | None
+        The widgets of a previous build, by route. Routes whose inputs have not
+        changed are not rebuilt. Rebuilt routes are written to it, and routes
+        no longer in the schema are removed.
+
+    Returns
+    -------
+    dict
+        The widgets, by widget ID.
+    """
+    # pylint: disable=import-outside-toplevel
+    import json  # noqa
+    from openbb_core.app.service.system_service import SystemService
 
-            if data_config := data_schema_to_columns_defs(
-                openapi, widget_id, provider, route, True
-            ):
-                for key, value in data_config.copy().items():  # type: ignore
-                    if key.startswith("$."):
-                        data_var_key[key] = value
+    if not openapi:
+        return {}
 
-                widget_config["data"] = deep_merge_configs(
-                    widget_config["data"],
-                    {k: v for k, v in data_config.items() if not k.startswith("$.")},  # type: ignore
-                )
+    starred_list: list = []
+    api_prefix = SystemService().system_settings.api_settings.prefix or ""
 
-            if data_var_key:
-                for key, value in data_var_key.items():
-                    if (
-                        key.replace("$.", "") in widget_config_dict
-                        and key != "$.data"
-                        and "columnsDefs" not in key
-                    ):
-                        widget_config_dict.update({key.replace("$.", ""): value})
-                    else:
-                        widget_config_dict[key.replace("$.", "")] = value
+    for item in widget_exclude_filter.copy():
+        if "*" in item:
+            starred_list.append(item)
+            widget_exclude_filter.remove(item)
 
-            # Update the widget configuration with any supplied configurations in @router.command
-            if widget_config_dict:
-                widget_config = deep_merge_configs(
-                    widget_config,
-                    widget_config_dict,
+    # Collect all routes that are designated as form endpoints to exclude them from direct widget generation
+    form_endpoint_paths = get_form_input_paths(openapi)
+    widgets_json: dict = {}
+    routes = [
+        p
+        for p in openapi["paths"]
+        if openapi["paths"].get(p, {})
+        and ("get" in openapi["paths"][p] or "post" in openapi["paths"][p])
+    ]
+    inputs = json.dumps([api_prefix, widget_exclude_filter, starred_list])
+
+    for route in routes:
+        if cache is None:
+            widgets_json.update(
+                build_route_widgets(
+                    openapi,
+                    route,
+                    widget_exclude_filter,
+                    starred_list,
+                    form_endpoint_paths,
+                    api_prefix,
                 )
+            )
+            continue
 
-            if widget_config.get("type") == "table":
-                widget_config["data"]["table"]["enableAdvanced"] = True
+        key = get_route_cache_key(openapi, route, form_endpoint_paths, inputs)
+        entry = cache.get(route)
 
-            if widget_config.get("type") == "metric":
-                widget_config["gridData"]["w"] = (
-                    4
-                    if widget_config["gridData"].get("w") == 40
-                    and "gridData" not in widget_config_dict
-                    else widget_config["gridData"].get("w")
-                )
-                widget_config["gridData"]["h"] = (
-                    5
-                    if widget_config["gridData"].get("h") == 15
-                    and "gridData" not in widget_config_dict
-                    else widget_config["gridData"].get("h")
-                )
-            elif widget_config.get("type") == "pdf":
-                widget_config["gridData"]["w"] = (
-                    20
-                    if widget_config["gridData"].get("w") == 40
-                    and "gridData" not in widget_config_dict
-                    else widget_config["gridData"].get("w")
-                )
-                widget_config["gridData"]["h"] = (
-                    25
-                    if widget_config["gridData"].get("h") == 15
-                    and "gridData" not in widget_config_dict
-                    else widget_config["gridData"].get("h")
-                )
+        if entry and entry.get("key") == key:
+            widget_exclude_filter.extend(entry.get("excluded", []))
+        else:
+            excluded = len(widget_exclude_filter)
+            entry = {
+                "key": key,
+                "widgets": build_route_widgets(
+                    openapi,
+                    route,
+                    widget_exclude_filter,
+                    starred_list,
+                    form_endpoint_paths,
+                    api_prefix,
+                ),
+                "excluded": widget_exclude_filter[excluded:],
+            }
+            cache[route] = entry
 
-            if source := widget_config_dict.get("source", []):
-                widget_config["source"] = source
-
-            if route_method == "post" and widget_config.get("type", "") not in [
-                "ssrm_table",
-                "omni",
-                "multi_file_viewer",
-            ]:
-                widget_exclude_filter.append(widget_config["widgetId"])
-
-            # Add the widget configuration to the widgets.json
-            if widget_config["widgetId"] not in widget_exclude_filter:
-                widgets_json[widget_config["widgetId"]] = widget_config
-
-            if has_chart:
-                widget_config_chart = deepcopy(widget_config)
-                widget_config_chart["type"] = "chart"
-                widget_config_chart["name"] = widget_config_chart["name"] + " (Chart)"
-                widget_config_chart["widgetId"] = (
-                    f"{widget_config_chart['widgetId']}_chart"
-                )
-                widget_config_chart["params"].append(
-                    {
-                        "paramName": "chart",
-                        "label": "Chart",
-                        "description": "Returns chart",
-                        "optional": True,
-                        "value": True,
-                        "type": "boolean",
-                        "show": False,
-                    },
-                )
-                widget_config_chart["gridData"]["h"] = widget_config_dict.get(
-                    "gridData", {}
-                ).get("h", 20)
-                widget_config_chart["gridData"]["w"] = widget_config_dict.get(
-                    "gridData", {}
-                ).get("w", 40)
-                widget_config_chart["defaultViz"] = "chart"
-                widget_config_chart["data"]["dataKey"] = (
-                    "chart.content" if data_key else ""
-                )
-                if widget_config_chart["widgetId"] not in widget_exclude_filter:
-                    widgets_json[widget_config_chart["widgetId"]] = widget_config_chart
+        widgets_json.update(entry["widgets"])
+
+    if cache is not None:
+        for route in set(cache).difference(routes):
+            del cache[route]
 
     return widgets_json
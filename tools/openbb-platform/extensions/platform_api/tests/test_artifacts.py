@@ -0,0 +1,137 @@
+import asyncio
+import copy
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from openbb_platform_api.utils.artifacts import (
+    ArtifactCache,
+    JSONArtifact,
+    JSONArtifactResponse,
+    _accepts_gzip,
+)
+from openbb_platform_api.utils.widgets import build_json
+
+# pylint: disable=redefined-outer-name,protected-access
+
+
+@pytest.fixture(scope="module")
+def mock_openapi_json():
+    mock_openapi_path = Path(__file__).parent / "mock_openapi.json"
+    with open(mock_openapi_path) as file:
+        return json.load(file)
+
+
+@pytest.fixture(scope="module")
+def mock_widgets_json():
+    mock_widgets_path = Path(__file__).parent / "mock_widgets.json"
+    with open(mock_widgets_path) as file:
+        return json.load(file)
+
+
+def send_request(response, headers: dict) -> tuple[int, dict, bytes]:
+    """Send a response to a request with the given headers."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    }
+    messages: list = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(response(scope, receive, send))
+    start = messages[0]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    response_headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    return start["status"], response_headers, body
+
+
+def test_build_json_with_cache(mock_openapi_json, mock_widgets_json):
+    cache: dict = {}
+    result = build_json(copy.deepcopy(mock_openapi_json), [], cache)
+    assert result == mock_widgets_json
+    assert cache
+
+    # Reused routes give the same widgets.
+    keys = {route: entry["key"] for route, entry in cache.items()}
+    result = build_json(copy.deepcopy(mock_openapi_json), [], cache)
+    assert result == mock_widgets_json
+    assert {route: entry["key"] for route, entry in cache.items()} == keys
+
+    # A changed route is rebuilt, and a removed route is dropped.
+    openapi = copy.deepcopy(mock_openapi_json)
+    removed, changed = list(cache)[:2]
+    openapi["paths"].pop(removed)
+    for operation in openapi["paths"][changed].values():
+        operation["description"] = "Changed."
+    build_json(openapi, [], cache)
+    assert removed not in cache
+    assert cache[changed]["key"] != keys[changed]
+
+
+def test_json_artifact_response():
+    content = {"data": list(range(1000))}
+    response = JSONArtifactResponse(content)
+    assert json.loads(response.body) == content
+    etag = response.headers["etag"]
+
+    status, headers, body = send_request(response, {})
+    assert status == 200
+    assert "content-encoding" not in headers
+    assert json.loads(body) == content
+
+    status, headers, body = send_request(response, {"Accept-Encoding": "gzip, br"})
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert int(headers["content-length"]) == len(body)
+    assert json.loads(gzip.decompress(body)) == content
+    assert json.loads(response.body) == content
+
+    status, headers, body = send_request(response, {"If-None-Match": etag})
+    assert status == 304
+    assert body == b""
+    assert headers["etag"] == etag
+
+    # The same document is only serialized once.
+    assert JSONArtifactResponse(content).artifact is response.artifact
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("", False),
+        ("gzip", True),
+        ("deflate, gzip;q=0.5", True),
+        ("gzip;q=0", False),
+        ("*", True),
+        ("br", False),
+    ],
+)
+def test_accepts_gzip(header, expected):
+    assert _accepts_gzip(header) is expected
+
+
+def test_artifact_cache_widgets(tmp_path):
+    cache = ArtifactCache(tmp_path)
+    assert cache.load_widgets() == {}
+
+    routes = {"/api/v1/test": {"key": "abc", "widgets": {}, "excluded": []}}
+    cache.save_widgets(routes)
+    assert ArtifactCache(tmp_path).load_widgets() == routes
+    assert ArtifactCache(tmp_path, use_cache=False).load_widgets() == {}
+
+
+def test_json_artifact_etag():
+    body = b'{"a":1}'
+    assert JSONArtifact(body).etag == JSONArtifact.from_content({"a": 1}).etag
+
+
+if __name__ == "__main__":
+    pytest.main()
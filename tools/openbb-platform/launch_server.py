@@ -19,6 +19,12 @@ def main():
     parser = argparse.ArgumentParser(description="OpenBB API Server (Lattice-managed)")
     parser.add_argument("--host", default="127.0.0.1", help="Bind host")
     parser.add_argument("--port", type=int, default=6900, help="Bind port")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes, forked from a preloaded parent when more than one",
+    )
     args = parser.parse_args()
 
     # Set environment before importing OpenBB
@@ -55,6 +61,28 @@ def main():
         access_log=False,
     )
 
+    if args.workers > 1 and hasattr(os, "fork"):
+        from openbb_core.api.prefork import PreforkServer
+
+        class ReadyPreforkServer(PreforkServer):
+            def started(self):
+                print(f"OPENBB_READY port={args.port}", flush=True)
+
+        print(
+            f"Starting OpenBB API on {args.host}:{args.port} "
+            f"with {args.workers} workers...",
+            flush=True,
+        )
+        ReadyPreforkServer(
+            app,
+            workers=args.workers,
+            host=args.host,
+            port=args.port,
+            log_level="warning",
+            access_log=False,
+        ).run()
+        return
+
     server = uvicorn.Server(config)
 
     # Graceful shutdown on SIGTERM
@@ -0,0 +1,334 @@
+"""Compiled BLS series catalogs.
+
+The series assets are LZMA-compressed CSV files. Decompressing and scanning
+them on every search takes seconds for the largest categories, so each asset
+is compiled once into a SQLite database in the user cache directory:
+
+    - `series_id`, `series_title` and `survey_name` are stored as text, and
+      every other column is encoded as an integer key into a `labels` table,
+      like a categorical.
+    - A full-text index with the trigram tokenizer covers all the values of
+      each series, so that substring searches use the index instead of
+      scanning every row.
+
+A catalog is rebuilt when its asset changes. The databases are opened once
+per process, read-only and memory-mapped.
+
+To compile all the catalogs ahead of time, e.g. when building an image:
+
+    python -m openbb_bls.utils.catalog
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+# Bumped when the format changes, so the catalogs are rebuilt.
+CATALOG_VERSION = 1
+# Columns stored as text. The others are encoded as labels.
+TEXT_COLUMNS = ["series_id", "series_title", "survey_name"]
+# Separator between the values of a series in the full-text document.
+_SEPARATOR = " | "
+# Trigram indexes only match terms of at least three characters.
+_MIN_INDEXED_LENGTH = 3
+# Terms with these characters are matched as regular expressions, or can not
+# be expressed as a LIKE pattern.
+_SPECIAL_CHARS = re.compile(r"[\\.^$*+?{}\[\]|()%_]")
+
+_catalogs: dict[str, "SeriesCatalog"] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_asset_path(category: str) -> Path:
+    """Return the path to the series asset of a category."""
+    from importlib.resources import files
+
+    return Path(str(files("openbb_bls").joinpath("assets"))) / f"{category}_series.xz"
+
+
+def get_catalog_path(category: str) -> Path:
+    """Return the path to the compiled catalog of a category."""
+    from openbb_core.app.utils import get_user_cache_directory
+
+    path = Path(get_user_cache_directory()) / "caches/bls_catalog" / f"{category}.db"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    return path
+
+
+def _asset_stamp(asset: Path) -> str:
+    """Identify a version of an asset."""
+    stat = asset.stat()
+    return f"{CATALOG_VERSION}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def read_series_asset(category: str):
+    """Read the series asset of a category into a DataFrame."""
+    from numpy import nan
+    from openbb_core.app.model.abstract.error import OpenBBError
+    from pandas import read_csv
+
+    asset = get_asset_path(category)
+    if not asset.exists():
+        raise OpenBBError(f"Asset '{asset.name}' not found.")
+
+    with open(asset, "rb") as f:
+        df = read_csv(f, compression="xz", low_memory=False, dtype="str")
+
+    return df.replace({nan: None, "nan": None, "''": None}).dropna(how="all", axis=1)
+
+
+def compile_catalog(category: str) -> Path:
+    """Compile the series asset of a category into its catalog database.
+
+    The catalog is written to a temporary file and moved into place, so that
+    readers never see a partial catalog.
+    """
+    import os
+
+    asset = get_asset_path(category)
+    df = read_series_asset(category)
+    columns = list(df.columns)
+    label_columns = [c for c in columns if c not in TEXT_COLUMNS]
+
+    # Encode the label columns with one shared table of distinct values.
+    labels: dict[str, int] = {}
+    encoded = {
+        column: [
+            None if value is None else labels.setdefault(value, len(labels))
+            for value in df[column].tolist()
+        ]
+        for column in label_columns
+    }
+    values = {column: df[column].tolist() for column in columns}
+
+    path = get_catalog_path(category)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    cnx = sqlite3.connect(tmp_path)
+    try:
+        quoted = [f'"{c}"' for c in columns]
+        column_defs = ", ".join(
+            f"{q} {'TEXT' if c in TEXT_COLUMNS else 'INTEGER'}"
+            for c, q in zip(columns, quoted)
+        )
+        cnx.executescript(
+            f"""
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE labels (id INTEGER PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE series (rowid INTEGER PRIMARY KEY, {column_defs});
+            CREATE VIRTUAL TABLE series_text USING fts5(
+                document, tokenize = 'trigram', detail = 'none'
+            );
+            """
+        )
+        cnx.executemany(
+            "INSERT INTO labels (id, value) VALUES (?, ?)",
+            [(i, v) for v, i in labels.items()],
+        )
+        cnx.executemany(
+            f"INSERT INTO series ({', '.join(quoted)})"
+            f" VALUES ({', '.join('?' * len(columns))})",
+            zip(
+                *(
+                    values[c] if c in TEXT_COLUMNS else encoded[c]  # type: ignore
+                    for c in columns
+                )
+            ),
+        )
+        cnx.executemany(
+            "INSERT INTO series_text (rowid, document) VALUES (?, ?)",
+            (
+                (i + 1, _SEPARATOR.join(str(v) for v in row if v is not None))
+                for i, row in enumerate(zip(*(values[c] for c in columns)))
+            ),
+        )
+        cnx.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [("stamp", _asset_stamp(asset)), ("columns", "\t".join(columns))],
+        )
+        cnx.commit()
+        cnx.execute("INSERT INTO series_text (series_text) VALUES ('optimize')")
+        cnx.commit()
+    finally:
+        cnx.close()
+
+    os.replace(tmp_path, path)
+
+    return path
+
+
+def _is_current(path: Path, category: str) -> bool:
+    """Check if a compiled catalog matches its asset."""
+    if not path.exists():
+        return False
+    try:
+        cnx = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            row = cnx.execute("SELECT value FROM meta WHERE key = 'stamp'").fetchone()
+        finally:
+            cnx.close()
+    except sqlite3.Error:
+        return False
+    return row is not None and row[0] == _asset_stamp(get_asset_path(category))
+
+
+class SeriesCatalog:
+    """A compiled, read-only series catalog."""
+
+    def __init__(self, path: Path):
+        """Open the catalog."""
+        self.path = path
+        self._cnx = sqlite3.connect(
+            f"file:{path}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._cnx.execute("PRAGMA mmap_size = 268435456")
+        self._cnx.create_function("regexp", 2, _regexp, deterministic=True)
+        self._lock = threading.Lock()
+        self.columns = (
+            self._cnx.execute("SELECT value FROM meta WHERE key = 'columns'")
+            .fetchone()[0]
+            .split("\t")
+        )
+        self.labels = dict(self._cnx.execute("SELECT id, value FROM labels"))
+
+    def _term_condition(self, term: str) -> tuple[str, list, bool]:
+        """Return the condition matching a search term, with its parameters.
+
+        Terms are case-insensitive regular expressions. Literal terms are
+        matched against the full-text document of a series, using the trigram
+        index when they are long enough. Patterns are matched against each
+        column, so that anchors and alternations behave as on a single value.
+
+        Returns
+        -------
+        tuple[str, list, bool]
+            The condition, its parameters, and whether it applies to the
+            full-text table rather than to the series table.
+        """
+        if _SPECIAL_CHARS.search(term):
+            matches = [
+                (
+                    f'"{c}" REGEXP ?'
+                    if c in TEXT_COLUMNS
+                    else f'"{c}" IN (SELECT id FROM labels WHERE value REGEXP ?)'
+                )
+                for c in self.columns
+            ]
+            return f"({' OR '.join(matches)})", [term] * len(matches), False
+        if len(term) >= _MIN_INDEXED_LENGTH:
+            return "document LIKE ?", [f"%{term}%"], True
+        return "instr(lower(document), ?) > 0", [term.lower()], True
+
+    def search(self, terms: list[str], include_extras: bool = False) -> list[dict]:
+        """Return the series matching all the terms, in the order of the asset.
+
+        Parameters
+        ----------
+        terms : list[str]
+            Case-insensitive regular expressions, matched against any value of a
+            series. An empty list returns all the series.
+        include_extras : bool
+            Include all the columns, instead of the series ID, title and survey name.
+
+        Returns
+        -------
+        list[dict]
+            The matching series.
+        """
+        columns = (
+            self.columns
+            if include_extras
+            else [c for c in self.columns if c in TEXT_COLUMNS]
+        )
+        select = ", ".join(f'"{c}"' for c in columns)
+        text_conditions: list[str] = []
+        text_params: list = []
+        conditions: list[str] = []
+        params: list = []
+        for term in terms:
+            condition, term_params, is_text = self._term_condition(term)
+            if is_text:
+                text_conditions.append(condition)
+                text_params.extend(term_params)
+            else:
+                conditions.append(condition)
+                params.extend(term_params)
+        if text_conditions:
+            conditions.insert(
+                0,
+                "rowid IN (SELECT rowid FROM series_text"  # noqa: S608
+                f" WHERE {' AND '.join(text_conditions)})",
+            )
+            params = text_params + params
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = f"SELECT {select} FROM series{where} ORDER BY rowid"  # noqa: S608
+
+        with self._lock:
+            rows = self._cnx.execute(sql, params).fetchall()
+
+        label_indexes = [i for i, c in enumerate(columns) if c not in TEXT_COLUMNS]
+        labels = self.labels
+        results: list[dict] = []
+        for row in rows:
+            if label_indexes:
+                row = list(row)  # noqa: PLW2901
+                for i in label_indexes:
+                    if row[i] is not None:
+                        row[i] = labels[row[i]]
+            results.append(dict(zip(columns, row)))
+
+        return results
+
+
+def _regexp(pattern: str, value: str | None) -> bool:
+    """Match a case-insensitive regular expression, for the REGEXP operator."""
+    if value is None:
+        return False
+    return _compile_pattern(pattern).search(value) is not None
+
+
+_patterns: dict[str, re.Pattern] = {}
+
+
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a pattern, caching it."""
+    compiled = _patterns.get(pattern)
+    if compiled is None:
+        compiled = _patterns[pattern] = re.compile(pattern, re.IGNORECASE)
+    return compiled
+
+
+def get_catalog(category: str) -> SeriesCatalog:
+    """Get the catalog of a category, compiling it if it is missing or outdated."""
+    catalog = _catalogs.get(category)
+    if catalog is not None:
+        return catalog
+
+    with _catalogs_lock:
+        catalog = _catalogs.get(category)
+        if catalog is None:
+            path = get_catalog_path(category)
+            if not _is_current(path, category):
+                compile_catalog(category)
+            catalog = _catalogs[category] = SeriesCatalog(path)
+
+    return catalog
+
+
+def invalidate_catalog(category: str) -> None:
+    """Drop the open catalog of a category, e.g. after its asset is updated."""
+    with _catalogs_lock:
+        _catalogs.pop(category, None)
+
+
+if __name__ == "__main__":
+    from openbb_bls.utils.constants import SURVEY_CATEGORY_NAMES
+
+    for _category in SURVEY_CATEGORY_NAMES:
+        if get_asset_path(_category).exists():
+            print(f"{_category}: {compile_catalog(_category)}")  # noqa: T201
@@ -366,9 +366,8 @@ def open_asset(asset: str) -> Union["DataFrame", dict]:
     import json
     from importlib.resources import files
     from pathlib import Path
-    from numpy import nan
+    from openbb_bls.utils.catalog import read_series_asset
     from openbb_core.app.model.abstract.error import OpenBBError
-    from pandas import read_csv
 
     if ".xz" not in asset and "series" in asset:
         asset = asset + ".xz"
@@ -388,11 +387,7 @@ def open_asset(asset: str) -> Union["DataFrame", dict]:
         with open(assets_path.joinpath(asset)) as f:
             return json.load(f)
     else:
-        with open(assets_path.joinpath(asset), "rb") as f:
-            df = read_csv(f, compression="xz", low_memory=False, dtype="str")
-        return df.replace({nan: None, "nan": None, "''": None}).dropna(
-            how="all", axis=1
-        )
+        return read_series_asset(asset.removesuffix(".xz").removesuffix("_series"))
 
 
 async def update_static_asset(category: str) -> None:
@@ -404,6 +399,7 @@ async def update_static_asset(category: str) -> None:
     from importlib.resources import files
     from pathlib import Path
     from openbb_core.app.model.abstract.error import OpenBBError
+    from openbb_bls.utils.catalog import compile_catalog, invalidate_catalog
     from openbb_bls.utils.constants import SURVEY_CATEGORY_NAMES
     from numpy import nan
     from pandas import DataFrame
@@ -432,3 +428,5 @@ async def update_static_asset(category: str) -> None:
         df.to_csv(
             assets_path.joinpath(f"{category}_series.xz"), index=False, compression="xz"
         )
+        compile_catalog(category)
+        invalidate_catalog(category)
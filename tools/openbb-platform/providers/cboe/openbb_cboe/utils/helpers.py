@@ -6,6 +6,7 @@ from datetime import date as dateType
 from typing import TYPE_CHECKING, Any, Literal
 
 from openbb_core.provider.utils.helpers import amake_request, to_snake_case
+from openbb_core.provider.utils.reference_data import register_dataset
 
 if TYPE_CHECKING:
     from pandas import DataFrame
@@ -109,22 +110,15 @@ async def get_cboe_data(url, use_cache: bool = True, **kwargs) -> Any:
     return data
 
 
-async def get_company_directory(use_cache: bool = True, **kwargs) -> "DataFrame":
-    """Get the US Company Directory for Cboe options.
-
-    If use_cache is True, the data will be cached for 24 hours.
-
-    Returns
-    -------
-    DataFrame: Pandas DataFrame of the Cboe listings directory
-    """
+async def _load_company_directory() -> "DataFrame":
+    """Load the US Company Directory for Cboe options."""
     # pylint: disable=import-outside-toplevel
     from io import BytesIO  # noqa
     from pandas import read_csv  # noqa
 
     url = "https://www.cboe.com/us/options/symboldir/equity_index_options/?download=csv"
 
-    results = await get_cboe_data(url, use_cache)
+    results = await get_cboe_data(url, use_cache=False)
 
     response = BytesIO(results)
 
@@ -142,21 +136,28 @@ async def get_company_directory(use_cache: bool = True, **kwargs) -> "DataFrame"
     return directory.astype(str)
 
 
-async def get_index_directory(use_cache: bool = True, **kwargs) -> "DataFrame":
-    """Get the Cboe Index Directory.
+async def get_company_directory(use_cache: bool = True, **kwargs) -> "DataFrame":
+    """Get the US Company Directory for Cboe options.
 
     If use_cache is True, the data will be cached for 24 hours.
 
     Returns
     -------
-    List[Dict]: A list of dictionaries containing the index information.
+    DataFrame: Pandas DataFrame of the Cboe listings directory
     """
+    directory = await CBOE_COMPANY_DIRECTORY.get(refresh=not use_cache)
+
+    return directory.copy()
+
+
+async def _load_index_directory() -> "DataFrame":
+    """Load the Cboe Index Directory."""
     # pylint: disable=import-outside-toplevel
     from pandas import DataFrame
 
     url = "https://cdn.cboe.com/api/global/us_indices/definitions/all_indices.json"
 
-    results = await get_cboe_data(url, use_cache=use_cache)
+    results = await get_cboe_data(url, use_cache=False)
 
     [result.pop("featured") for result in results]
     [result.pop("featured_order") for result in results]
@@ -167,16 +168,25 @@ async def get_index_directory(use_cache: bool = True, **kwargs) -> "DataFrame":
     return results
 
 
-async def list_futures(**kwargs) -> list[dict]:
-    """List of CBOE futures and their underlying symbols.
+async def get_index_directory(use_cache: bool = True, **kwargs) -> "DataFrame":
+    """Get the Cboe Index Directory.
+
+    If use_cache is True, the data will be cached for 24 hours.
 
     Returns
     -------
-    pd.DataFrame
-        Pandas DataFrame with results.
+    List[Dict]: A list of dictionaries containing the index information.
     """
+    directory = await CBOE_INDEX_DIRECTORY.get(refresh=not use_cache)
+
+    return directory.copy()
+
+
+async def _load_futures_roots() -> list[dict]:
+    """Load the CBOE futures roots."""
     r = await get_cboe_data(
-        "https://cdn.cboe.com/api/global/delayed_quotes/symbol_book/futures-roots.json"
+        "https://cdn.cboe.com/api/global/delayed_quotes/symbol_book/futures-roots.json",
+        use_cache=False,
     )
     data = r.get("data")
     [d.pop("sort_order") for d in data]
@@ -184,6 +194,31 @@ async def list_futures(**kwargs) -> list[dict]:
     return data
 
 
+async def list_futures(**kwargs) -> list[dict]:
+    """List of CBOE futures and their underlying symbols.
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas DataFrame with results.
+    """
+    data = await CBOE_FUTURES_ROOTS.get()
+
+    return [d.copy() for d in data]
+
+
+# Symbol directories shared by the Cboe fetchers, kept warm in the background.
+CBOE_COMPANY_DIRECTORY = register_dataset(
+    "cboe_company_directory", _load_company_directory, ttl=3600 * 24, shared=True
+)
+CBOE_INDEX_DIRECTORY = register_dataset(
+    "cboe_index_directory", _load_index_directory, ttl=3600 * 24, shared=True
+)
+CBOE_FUTURES_ROOTS = register_dataset(
+    "cboe_futures_roots", _load_futures_roots, ttl=3600 * 24, shared=True
+)
+
+
 async def get_settlement_prices(
     settlement_date: dateType | None = None,
     options: bool = False,
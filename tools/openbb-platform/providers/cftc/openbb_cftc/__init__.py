@@ -3,6 +3,7 @@
 from openbb_cftc.models.cot import CftcCotFetcher
 from openbb_cftc.models.cot_search import CftcCotSearchFetcher
 from openbb_core.provider.abstract.provider import Provider
+from openbb_core.provider.utils.rate_limiter import RateLimit
 
 cftc_provider = Provider(
     name="cftc",
@@ -14,6 +15,8 @@ cftc_provider = Provider(
         "COT": CftcCotFetcher,
         "COTSearch": CftcCotSearchFetcher,
     },
+    # Requests without an app token are throttled by the Socrata API.
+    rate_limit=RateLimit(5, max_concurrency=4, hosts=["cftc.gov"]),
     repr_name="Commodity Futures Trading Commission (CFTC) Public Reporting API",
     instructions="""Credentials are not required, but your IP address may be subject to throttling limits.
     API requests made using an application token are not throttled.
@@ -7,6 +7,7 @@ from datetime import (
 )
 from typing import Any, Literal
 
+from openbb_cftc.utils.socrata import ColumnarBuffer
 from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.cot import COTData, COTQueryParams
@@ -84,20 +85,29 @@ class CftcCotFetcher(Fetcher[CftcCotQueryParams, list[CftcCotData]]):
         query: CftcCotQueryParams,
         credentials: dict[str, str] | None,
         **kwargs: Any,
-    ) -> list[dict]:
-        """Extract the data from the CFTC API."""
+    ) -> ColumnarBuffer:
+        """Extract the data from the CFTC API.
+
+        The history of a CFTC contract code is served from the on-disk store,
+        downloading only the reports published since the last request. Other
+        queries are paged concurrently from the API.
+        """
         # pylint: disable=import-outside-toplevel
         from datetime import timedelta  # noqa
-        from openbb_core.provider.utils.helpers import amake_request
+        from openbb_cftc.utils.cot_store import DATE_FIELD, get_contract_history
+        from openbb_cftc.utils.socrata import socrata_query
 
         app_token = credentials.get("cftc_app_token") if credentials else ""
 
         today = datetime.now()
+        is_code = query.id not in (500, "500") and query.id[:3].isdigit()
         # If the ID is a CFTC code, we'll get the complete history by default.
         _start = (
-            (today - timedelta(days=(today.weekday() - 1) % 7)).strftime("%Y-%m-%d")
-            if query.id in (500, "500") or not query.id[:3].isdigit()
-            else "1995-01-01"
+            "1995-01-01"
+            if is_code
+            else (today - timedelta(days=(today.weekday() - 1) % 7)).strftime(
+                "%Y-%m-%d"
+            )
         )
         start_date = (
             query.start_date.strftime("%Y-%m-%d") if query.start_date else _start
@@ -107,9 +117,6 @@ class CftcCotFetcher(Fetcher[CftcCotQueryParams, list[CftcCotData]]):
             if query.end_date
             else f"{today.year}-12-31"
         )
-        date_range = (
-            f"$where=Report_Date_as_YYYY_MM_DD between '{start_date}' AND '{end_date}'"
-        )
         report_type = query.report_type.replace("financial", "tff")
         if query.futures_only is True and report_type != "supplemental":
             report_type += "_futures_only"
@@ -117,46 +124,49 @@ class CftcCotFetcher(Fetcher[CftcCotQueryParams, list[CftcCotData]]):
             report_type += "_combined"
 
         query.id = "" if query.id == "all" else query.id
-        if not query.id[:3].isdigit():
-            query.id = f"%{query.id}%"
-        query.id = query.id.replace("+", "%2B").replace("&", "%26")
-        base_url = f"https://publicreporting.cftc.gov/resource/{reports_dict[report_type]}.json?$limit=1000000&{date_range}"
-        order = "&$order=Report_Date_as_YYYY_MM_DD ASC"
-        url = (
-            (
-                f"{base_url}"
-                f" AND (UPPER(contract_market_name) like UPPER('{query.id}') "
-                f"OR UPPER(commodity) like UPPER('{query.id}') "
-                f"OR UPPER(cftc_contract_market_code) like UPPER('{query.id}') "
-                f"OR UPPER(commodity_group_name) like UPPER('{query.id}') "
-                f"OR UPPER(commodity_subgroup_name) like UPPER('{query.id}'))"
-            )
-            if query.id
-            else base_url
-        )
-        url = f"{url}{order}"
-
-        if app_token:
-            url += f"&$$app_token={app_token}"
 
         try:
-            response = await amake_request(url, **kwargs)
+            if is_code:
+                response = await get_contract_history(
+                    report_type,
+                    reports_dict[report_type],
+                    query.id,
+                    start_date,
+                    end_date,
+                    app_token,
+                )
+            else:
+                where = f"{DATE_FIELD} between '{start_date}' AND '{end_date}'"
+                if query.id:
+                    pattern = f"%{query.id}%".replace("'", "''")
+                    where += (
+                        f" AND (UPPER(contract_market_name) like UPPER('{pattern}') "
+                        f"OR UPPER(commodity) like UPPER('{pattern}') "
+                        f"OR UPPER(cftc_contract_market_code) like UPPER('{pattern}') "
+                        f"OR UPPER(commodity_group_name) like UPPER('{pattern}') "
+                        f"OR UPPER(commodity_subgroup_name) like UPPER('{pattern}'))"
+                    )
+                response = await socrata_query(
+                    reports_dict[report_type],
+                    where,
+                    f"{DATE_FIELD} ASC, :id ASC",
+                    app_token,
+                )
         except OpenBBError as error:
             raise error from error
 
         if not response:
-            raise EmptyDataError(f"No data found for {query.id.replace('%', '')}.")
+            raise EmptyDataError(f"No data found for {query.id}.")
 
-        return response  # type: ignore
+        return response
 
     @staticmethod
     def transform_data(
         query: CftcCotQueryParams,
-        data: list[dict],
+        data: ColumnarBuffer,
         **kwargs: Any,
     ) -> list[CftcCotData]:
         """Transform and validate the data."""
-        response = data.copy()
         string_cols = [
             "market_and_exchange_names",
             "cftc_contract_market_code",
@@ -178,7 +188,7 @@ class CftcCotFetcher(Fetcher[CftcCotQueryParams, list[CftcCotData]]):
             "futonly_or_combined",
         ]
         results: list[CftcCotData] = []
-        for values in response:
+        for values in data:
             new_values: dict = {}
             for key, value in values.items():
                 if key in string_cols and value:
@@ -0,0 +1,236 @@
+"""Incremental on-disk history of Commitments of Traders reports.
+
+The reports of a contract are published once a week and never change, so
+the complete history of a contract is downloaded once and kept in a SQLite
+database. Afterwards, only the reports newer than the last stored one are
+requested from the API.
+
+The history is keyed by the report type (the Socrata dataset) and the CFTC
+contract market code.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import asyncio
+import json
+import sqlite3
+import time
+import warnings
+from contextlib import closing
+from datetime import date as dateType, timedelta
+
+from openbb_cftc.utils.socrata import ColumnarBuffer, socrata_pages
+
+# Bumped when the schema changes, so the store is rebuilt.
+STORE_VERSION = 1
+# Minimum seconds between two checks for a new report of a contract.
+REFRESH_INTERVAL = 3600
+DATE_FIELD = "Report_Date_as_YYYY_MM_DD"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    report_type TEXT NOT NULL,
+    contract_code TEXT NOT NULL,
+    report_date TEXT NOT NULL,
+    id TEXT NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (report_type, contract_code, report_date, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS contracts (
+    report_type TEXT NOT NULL,
+    contract_code TEXT NOT NULL,
+    last_report_date TEXT,
+    checked_at REAL NOT NULL,
+    PRIMARY KEY (report_type, contract_code)
+) WITHOUT ROWID;
+"""
+
+
+def get_db_path():
+    """Return the path to the database."""
+    from pathlib import Path
+
+    from openbb_core.app.utils import get_user_cache_directory
+
+    db_path = Path(get_user_cache_directory()) / "caches/cftc_cot.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    return db_path
+
+
+def connect() -> sqlite3.Connection:
+    """Open a connection to the store, creating its schema if needed."""
+    cnx = sqlite3.connect(
+        get_db_path(), timeout=30, isolation_level=None, check_same_thread=False
+    )
+    cnx.execute("PRAGMA journal_mode = WAL")
+    cnx.execute("PRAGMA synchronous = NORMAL")
+    if cnx.execute("PRAGMA user_version").fetchone()[0] != STORE_VERSION:
+        cnx.executescript(
+            "DROP TABLE IF EXISTS reports; DROP TABLE IF EXISTS contracts;"
+        )
+        cnx.execute(f"PRAGMA user_version = {STORE_VERSION}")
+    cnx.executescript(_SCHEMA)
+    return cnx
+
+
+def latest_report_date(today: dateType | None = None) -> str:
+    """Return the date of the latest report that may be published.
+
+    Reports are as of Tuesday and released on Friday.
+    """
+    today = today or dateType.today()
+    # The Friday release covers the Tuesday of the same week.
+    released = today - timedelta(days=(today.weekday() - 4) % 7)
+    return (released - timedelta(days=3)).isoformat()
+
+
+def _get_contract(cnx: sqlite3.Connection, report_type: str, code: str):
+    """Return the last stored report date and last check time of a contract."""
+    return cnx.execute(
+        "SELECT last_report_date, checked_at FROM contracts"
+        " WHERE report_type = ? AND contract_code = ?",
+        (report_type, code),
+    ).fetchone()
+
+
+def _store_page(
+    cnx: sqlite3.Connection, report_type: str, code: str, page: list[dict]
+) -> None:
+    """Write a page of reports."""
+    cnx.execute("BEGIN IMMEDIATE")
+    try:
+        cnx.executemany(
+            "INSERT OR REPLACE INTO reports"
+            " (report_type, contract_code, report_date, id, record)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    report_type,
+                    code,
+                    str(row.get("report_date_as_yyyy_mm_dd", "")).split("T")[0],
+                    str(row.get("id", "")),
+                    json.dumps(row, separators=(",", ":")),
+                )
+                for row in page
+            ],
+        )
+        cnx.execute("COMMIT")
+    except BaseException:
+        cnx.execute("ROLLBACK")
+        raise
+
+
+def _store_checked(cnx: sqlite3.Connection, report_type: str, code: str) -> None:
+    """Record that a contract is up to date."""
+    cnx.execute(
+        "INSERT OR REPLACE INTO contracts"
+        " (report_type, contract_code, last_report_date, checked_at)"
+        " SELECT ?, ?, MAX(report_date), ? FROM reports"
+        " WHERE report_type = ? AND contract_code = ?",
+        (report_type, code, time.time(), report_type, code),
+    )
+
+
+def needs_update(last_report_date: str | None, checked_at: float | None) -> bool:
+    """Check if new reports of a contract may have been published."""
+    if last_report_date is None or checked_at is None:
+        return True
+    if last_report_date >= latest_report_date():
+        return False
+    return time.time() - checked_at > REFRESH_INTERVAL
+
+
+async def update_contract(
+    report_type: str, dataset: str, code: str, app_token: str | None = None
+) -> int:
+    """Download the reports of a contract newer than the last stored one.
+
+    Parameters
+    ----------
+    report_type : str
+        The report type key, e.g. 'legacy_futures_only'.
+    dataset : str
+        The Socrata dataset ID of the report type.
+    code : str
+        The CFTC contract market code.
+    app_token : str | None
+        The Socrata application token.
+
+    Returns
+    -------
+    int
+        The number of reports downloaded.
+    """
+    with closing(connect()) as cnx:
+        contract = await asyncio.to_thread(_get_contract, cnx, report_type, code)
+        last_report_date, checked_at = contract or (None, None)
+        if not needs_update(last_report_date, checked_at):
+            return 0
+
+        quoted = code.replace("'", "''")
+        where = f"cftc_contract_market_code = '{quoted}'"
+        if last_report_date:
+            where += f" AND {DATE_FIELD} > '{last_report_date}'"
+        count = 0
+        async for page in socrata_pages(
+            dataset, where, f"{DATE_FIELD} ASC, :id ASC", app_token
+        ):
+            # Store each page as it arrives, so a partial download is kept.
+            await asyncio.to_thread(_store_page, cnx, report_type, code, page)
+            count += len(page)
+        await asyncio.to_thread(_store_checked, cnx, report_type, code)
+
+    return count
+
+
+def read_contract(
+    report_type: str,
+    code: str,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> ColumnarBuffer:
+    """Read the stored reports of a contract, in a date range."""
+    conditions = ["report_type = ?", "contract_code = ?"]
+    params: list = [report_type, code]
+    if start_date:
+        conditions.append("report_date >= ?")
+        params.append(start_date)
+    if end_date:
+        conditions.append("report_date <= ?")
+        params.append(end_date)
+
+    buffer = ColumnarBuffer()
+    with closing(connect()) as cnx:
+        cursor = cnx.execute(
+            f"SELECT record FROM reports WHERE {' AND '.join(conditions)}"  # noqa: S608
+            " ORDER BY report_date, id",
+            params,
+        )
+        for (record,) in cursor:
+            buffer.append(json.loads(record))
+    return buffer
+
+
+async def get_contract_history(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    report_type: str,
+    dataset: str,
+    code: str,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    app_token: str | None = None,
+) -> ColumnarBuffer:
+    """Get the reports of a contract, updating the store first.
+
+    If the update fails and the contract is already stored, the stored
+    reports are returned with a warning.
+    """
+    try:
+        await update_contract(report_type, dataset, code, app_token)
+    except Exception as e:  # pylint: disable=broad-except
+        with closing(connect()) as cnx:
+            if _get_contract(cnx, report_type, code) is None:
+                raise
+        warnings.warn(f"Could not update the COT history of {code}: {e}")
+
+    return await asyncio.to_thread(read_contract, report_type, code, start_date, end_date)
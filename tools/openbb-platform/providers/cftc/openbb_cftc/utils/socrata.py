@@ -0,0 +1,156 @@
+"""Streaming client for the CFTC Socrata API.
+
+Socrata datasets are queried page by page with `$limit` and `$offset`. The
+number of rows is counted first, so that the pages can be requested
+concurrently, within the provider's rate limit. Pages are requested in a
+bounded window and appended in order to a `ColumnarBuffer` as they arrive,
+so only a few pages of JSON are held in memory at once.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+SOCRATA_BASE_URL = "https://publicreporting.cftc.gov/resource"
+PAGE_SIZE = 50000
+MAX_CONCURRENCY = 4
+
+
+class ColumnarBuffer:
+    """Rows stored as one list per column.
+
+    A list of dictionaries repeats every key in every row. Storing the
+    values by column avoids that, and repeated strings, such as market
+    names, are stored once per column.
+    """
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self.columns: dict[str, list] = {}
+        self._pools: dict[str, dict] = {}
+        self._length = 0
+
+    def append(self, row: dict) -> None:
+        """Append a row."""
+        for key in row.keys() - self.columns.keys():
+            self.columns[key] = [None] * self._length
+            self._pools[key] = {}
+        for key, column in self.columns.items():
+            value = row.get(key)
+            if isinstance(value, str):
+                value = self._pools[key].setdefault(value, value)
+            column.append(value)
+        self._length += 1
+
+    def extend(self, rows: list[dict]) -> None:
+        """Append the rows of a page."""
+        for row in rows:
+            self.append(row)
+
+    def row(self, index: int) -> dict:
+        """Return a row as a dictionary, without its missing values."""
+        return {
+            key: column[index]
+            for key, column in self.columns.items()
+            if column[index] is not None
+        }
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._length
+
+    def __getitem__(self, index: int) -> dict:
+        """Return a row as a dictionary."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[dict]:
+        """Iterate over the rows as dictionaries."""
+        for index in range(self._length):
+            yield self.row(index)
+
+
+async def _get_json(url: str, params: dict, session) -> Any:
+    """Request a Socrata resource."""
+    from openbb_core.provider.utils.helpers import amake_request
+
+    return await amake_request(url, params=params, session=session, timeout=60)
+
+
+async def socrata_count(
+    dataset: str, where: str | None, app_token: str | None = None, session=None
+) -> int:
+    """Count the rows of a dataset matching a SoQL `$where` clause."""
+    params: dict = {"$select": "count(*) AS count"}
+    if where:
+        params["$where"] = where
+    if app_token:
+        params["$$app_token"] = app_token
+    response = await _get_json(f"{SOCRATA_BASE_URL}/{dataset}.json", params, session)
+    return int(response[0].get("count", 0)) if response else 0  # type: ignore
+
+
+async def socrata_pages(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    dataset: str,
+    where: str | None = None,
+    order: str = ":id",
+    app_token: str | None = None,
+    page_size: int = PAGE_SIZE,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> AsyncIterator[list[dict]]:
+    """Yield the pages of a query, in order.
+
+    Up to `max_concurrency` pages are requested at once. The `order` must be
+    unique for the pages to be consistent, so it should end with `:id`.
+    """
+    from openbb_core.provider.utils.helpers import get_async_requests_session
+
+    params: dict = {"$order": order, "$limit": page_size}
+    if where:
+        params["$where"] = where
+    if app_token:
+        params["$$app_token"] = app_token
+    url = f"{SOCRATA_BASE_URL}/{dataset}.json"
+    pending: list[asyncio.Task] = []
+    session = await get_async_requests_session()
+
+    try:
+        total = await socrata_count(dataset, where, app_token, session)
+
+        for offset in range(0, total, page_size):
+            pending.append(
+                asyncio.create_task(
+                    _get_json(url, {**params, "$offset": offset}, session)
+                )
+            )
+            # Keep a bounded window of requests ahead of the consumer.
+            if len(pending) >= max_concurrency:
+                yield await pending.pop(0) or []
+        while pending:
+            yield await pending.pop(0) or []
+    finally:
+        for task in pending:
+            task.cancel()
+        await session.close()
+
+
+async def socrata_query(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    dataset: str,
+    where: str | None = None,
+    order: str = ":id",
+    app_token: str | None = None,
+    page_size: int = PAGE_SIZE,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> ColumnarBuffer:
+    """Run a query, collecting all its pages into a `ColumnarBuffer`."""
+    buffer = ColumnarBuffer()
+    async for page in socrata_pages(
+        dataset, where, order, app_token, page_size, max_concurrency
+    ):
+        buffer.extend(page)
+    return buffer
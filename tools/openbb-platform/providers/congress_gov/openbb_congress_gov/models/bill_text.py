@@ -46,6 +46,11 @@ class CongressBillTextData(Data):
         default=None,
         description="Data format information, including data type and filename.",
     )
+    sha256: str | None = Field(
+        default=None,
+        description="SHA-256 digest of the downloaded file."
+        + " The API streams the raw file from `/blobs/{sha256}`.",
+    )
 
 
 class CongressBillTextFetcher(
@@ -71,21 +76,24 @@ class CongressBillTextFetcher(
     ) -> list:
         """Extract data from the query."""
         # pylint: disable=import-outside-toplevel
-        import base64  # noqa
-        from io import BytesIO
-        from openbb_core.provider.utils.helpers import make_request
+        from openbb_core.provider.utils.blob_cache import fetch_blobs
 
         urls = (
             query.urls.get("urls", [])
             if isinstance(query.urls, dict)
             else (query.urls if isinstance(query.urls, list) else query.urls.split(","))
         )
+        urls = [url.strip() for url in urls]
+        valid_urls = [url for url in urls if "congress.gov" in url]
+        blobs = dict(
+            zip(valid_urls, await fetch_blobs(valid_urls, return_exceptions=True))
+        )
         results: list = []
 
         for url in urls:
             filename = url.split("/")[-1]
 
-            if "congress.gov" not in url.strip():
+            if url not in blobs:
                 results.append(
                     {
                         "error_type": "invalid_url",
@@ -94,44 +102,33 @@ class CongressBillTextFetcher(
                     }
                 )
                 continue
-            try:
-                response = make_request(url)
-                response.raise_for_status()
-                datatype = filename.split(".")[-1].lower()
-
-                if datatype == "pdf":
-                    pdf_content = base64.b64encode(
-                        BytesIO(response.content).read()
-                    ).decode("utf-8")
-                    results.append(
-                        {
-                            "content": pdf_content,
-                            "data_format": {
-                                "data_type": "pdf",
-                                "filename": url.split("/")[-1],
-                            },
-                        }
-                    )
-                else:
-                    results.append(
-                        {
-                            "content": response.text,
-                            "data_format": {
-                                "data_type": "text",
-                                "filename": filename,
-                            },
-                        }
-                    )
-            except Exception as exc:  # pylint: disable=broad-except
+
+            blob = blobs[url]
+
+            if isinstance(blob, BaseException):
                 results.append(
                     {
                         "error_type": "download_error",
-                        "content": f"{exc.__class__.__name__}: {exc.args[0]}",
-                        "filename": url.split("/")[-1],
+                        "content": f"{blob.__class__.__name__}: {blob.args[0] if blob.args else blob}",
+                        "filename": filename,
                     }
                 )
                 continue
 
+            datatype = filename.split(".")[-1].lower()
+            results.append(
+                {
+                    "content": (
+                        blob.to_base64() if datatype == "pdf" else blob.read_text()
+                    ),
+                    "data_format": {
+                        "data_type": "pdf" if datatype == "pdf" else "text",
+                        "filename": filename,
+                    },
+                    "sha256": blob.sha256,
+                }
+            )
+
         return results
 
     @staticmethod
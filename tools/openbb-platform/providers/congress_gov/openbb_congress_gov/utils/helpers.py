@@ -59,6 +59,9 @@ def download_bills(urls: list[str]) -> list:
     OpenBB Workspace uses this, as a POST endpoint, to download
     the selected bill(s) in PDF format. Results are returned as base64-encoded PDF content.
 
+    The bills are downloaded concurrently, through the blob cache,
+    and are only downloaded again when they have changed.
+
     Parameters
     ----------
     urls: list[str]
@@ -76,6 +79,7 @@ def download_bills(urls: list[str]) -> list:
                         "data_type": "pdf",
                         "filename": str,  # The filename of the downloaded PDF
                     },
+                    "sha256": str,  # The digest of the PDF, served at /blobs/{sha256}
                 },
                 ...
             ]
@@ -91,14 +95,20 @@ def download_bills(urls: list[str]) -> list:
             ]
     """
     # pylint: disable=import-outside-toplevel
-    import base64  # noqa
-    from io import BytesIO
-    from openbb_core.provider.utils.helpers import make_request
-
+    from openbb_core.provider.utils.blob_cache import fetch_blobs
+    from openbb_core.provider.utils.helpers import run_async
+
+    valid_urls = [url for url in urls if "congress.gov" in url]
+    blobs = dict(
+        zip(
+            valid_urls,
+            run_async(fetch_blobs, valid_urls, return_exceptions=True),
+        )
+    )
     results: list = []
 
     for url in urls:
-        if "congress.gov" not in url:
+        if url not in blobs:
             results.append(
                 {
                     "error_type": "invalid_url",
@@ -107,33 +117,30 @@ def download_bills(urls: list[str]) -> list:
                 }
             )
             continue
-        try:
-            response = make_request(url)
-            response.raise_for_status()
-            pdf = (
-                base64.b64encode(BytesIO(response.content).getvalue()).decode("utf-8")
-                if isinstance(response.content, bytes)
-                else response.content
-            )
-            results.append(
-                {
-                    "content": pdf,
-                    "data_format": {
-                        "data_type": "pdf",
-                        "filename": url.split("/")[-1],
-                    },
-                }
-            )
-        except Exception as exc:  # pylint: disable=broad-except
+
+        blob = blobs[url]
+
+        if isinstance(blob, BaseException):
             results.append(
                 {
                     "error_type": "download_error",
-                    "content": f"{exc.__class__.__name__}: {exc.args[0]}",
+                    "content": f"{blob.__class__.__name__}: {blob.args[0] if blob.args else blob}",
                     "filename": url.split("/")[-1],
                 }
             )
             continue
 
+        results.append(
+            {
+                "content": blob.to_base64(),
+                "data_format": {
+                    "data_type": "pdf",
+                    "filename": url.split("/")[-1],
+                },
+                "sha256": blob.sha256,
+            }
+        )
+
     return results
 
 
@@ -2,8 +2,8 @@
 
 from typing import Literal
 
-from async_lru import alru_cache
 from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.provider.utils.reference_data import register_dataset
 
 DERIBIT_OPTIONS_SYMBOLS = ["BTC", "ETH", "SOL", "XRP", "BNB", "PAXG"]
 OptionsSymbols = Literal["BTC", "ETH", "SOL", "XRP", "BNB", "PAXG"]
@@ -48,7 +48,6 @@ INTERVAL_MAP = {
 }
 
 
-@alru_cache(maxsize=64)
 async def get_instruments(
     currency: Currencies = "BTC",
     derivative_type: DerivativeTypes | None = None,
@@ -69,9 +68,6 @@ async def get_instruments(
     list[dict]
         A list of instrument dictionaries.
     """
-    # pylint: disable=import-outside-toplevel
-    from openbb_core.provider.utils.helpers import amake_request
-
     if currency != "all" and currency.upper() not in CURRENCIES:
         raise ValueError(
             f"Currency {currency} not supported. Supported currencies are: {', '.join(CURRENCIES)}"
@@ -81,6 +77,16 @@ async def get_instruments(
             f"Kind {derivative_type} not supported. Supported kinds are: {', '.join(DERIVATIVE_TYPES)}"
         )
 
+    return await DERIBIT_INSTRUMENTS.get(currency, derivative_type, expired)
+
+
+async def _load_instruments(
+    currency: Currencies, derivative_type: DerivativeTypes | None, expired: bool
+) -> list[dict]:
+    """Load Deribit instruments from the API."""
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.provider.utils.helpers import amake_request
+
     url = f"{BASE_URL}/api/v2/public/get_instruments?currency={currency.upper() if currency != 'all' else 'any'}"
 
     if derivative_type is not None:
@@ -98,6 +104,12 @@ async def get_instruments(
         ) from e
 
 
+# Instruments are listed and expire daily, so the lists are refreshed hourly.
+DERIBIT_INSTRUMENTS = register_dataset(
+    "deribit_instruments", _load_instruments, ttl=3600
+)
+
+
 async def get_options_symbols(symbol: OptionsSymbols = "BTC") -> dict:
     """
     Get a dictionary of contract symbols by expiry.
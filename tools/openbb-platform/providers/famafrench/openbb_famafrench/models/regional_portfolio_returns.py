@@ -144,8 +144,8 @@ class FamaFrenchRegionalPortfolioReturnsFetcher(
         # Values of -99.99  or -999 indicate no data,
         # Drop columns that have no data.
         for col in returns_data.columns:
-            if all(returns_data[col].values == "-99.99") or all(
-                returns_data[col].values == "-999"
+            if all(returns_data[col].values == -99.99) or all(
+                returns_data[col].values == -999
             ):
                 returns_data = returns_data.drop(columns=[col])
             else:
@@ -0,0 +1,286 @@
+"""On-disk cache of parsed Fama-French datasets.
+
+The data library publishes each dataset as a zip file, updated about once a
+month. A zip file is downloaded once, every file in it is parsed, and the
+tables are stored under the user cache directory:
+
+    <cache>/famafrench/<zip name>/
+        source.json         # Cache version, ETag and Last-Modified of the zip
+        <file>.json         # Descriptions and column labels of the tables
+        <file>.npz          # Index and values of the tables, as NumPy arrays
+
+After `REVALIDATE_AFTER` seconds, the zip file is requested again
+conditionally, and only downloaded and parsed again if it changed. If the
+request fails, the stored tables are used.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+from collections.abc import Callable
+
+# Bumped when the parsed format changes, so that stored datasets are parsed again.
+CACHE_VERSION = 1
+
+# Seconds after which a stored dataset is checked against the data library.
+REVALIDATE_AFTER = 86400
+
+
+def get_cache_dir() -> str:
+    """Return the directory of the dataset cache, in the user cache directory."""
+    from openbb_core.app.utils import get_user_cache_directory
+
+    return f"{get_user_cache_directory()}/famafrench"
+
+
+def _write_atomic(path: str, content: bytes) -> None:
+    """Write a file, so that readers see either the old or the new content."""
+    import os
+    import tempfile
+
+    fd, temp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".partial-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def _member_path(directory: str, member: str) -> str:
+    """Return the path of the stored tables of a file in a zip file."""
+    return f"{directory}/{member.replace('/', '_')}"
+
+
+def write_tables(path: str, dataframes: list, metadata: list) -> None:
+    """Store parsed tables, as `<path>.npz` and `<path>.json`.
+
+    Parameters
+    ----------
+    path : str
+        The path of the files, without extension.
+    dataframes : list[DataFrame]
+        The tables, with numeric values.
+    metadata : list[dict]
+        The description of each table.
+    """
+    import json
+    from io import BytesIO
+
+    from numpy import savez
+
+    arrays: dict = {}
+    tables: list = []
+    for i, (df, meta) in enumerate(zip(dataframes, metadata)):
+        for level in range(df.index.nlevels):
+            values = df.index.get_level_values(level)
+            # Dates and other labels are stored as fixed-width unicode arrays.
+            arrays[f"t{i}_index{level}"] = values.to_numpy(
+                dtype=values.dtype if values.dtype.kind in "biuf" else str
+            )
+        arrays[f"t{i}_values"] = df.to_numpy(dtype="float64")
+        tables.append(
+            {
+                "index": list(df.index.names),
+                "columns": [
+                    list(col) if isinstance(col, tuple) else col for col in df.columns
+                ],
+                "column_levels": df.columns.nlevels,
+                "metadata": meta,
+            }
+        )
+
+    buffer = BytesIO()
+    savez(buffer, **arrays)
+    _write_atomic(path + ".npz", buffer.getvalue())
+    _write_atomic(path + ".json", json.dumps(tables).encode())
+
+
+def read_tables(path: str) -> tuple[list, list]:
+    """Load the tables stored by `write_tables`."""
+    import json
+
+    from numpy import load
+    from pandas import DataFrame, Index, MultiIndex
+
+    with open(path + ".json", encoding="utf-8") as file:
+        tables = json.load(file)
+
+    dataframes: list = []
+    metadata: list = []
+    with load(path + ".npz", allow_pickle=False) as arrays:
+        for i, table in enumerate(tables):
+            levels = [arrays[f"t{i}_index{k}"] for k in range(len(table["index"]))]
+            index = (
+                MultiIndex.from_arrays(levels, names=table["index"])
+                if len(levels) > 1
+                else Index(levels[0], name=table["index"][0])
+            )
+            columns = (
+                MultiIndex.from_tuples([tuple(c) for c in table["columns"]])
+                if table["column_levels"] > 1
+                else table["columns"]
+            )
+            dataframes.append(
+                DataFrame(arrays[f"t{i}_values"], index=index, columns=columns)
+            )
+            metadata.append(table["metadata"])
+
+    return dataframes, metadata
+
+
+def _read_source(directory: str) -> dict | None:
+    """Return the version of a stored zip file, or None if it is not usable."""
+    import json
+
+    try:
+        with open(f"{directory}/source.json", encoding="utf-8") as file:
+            source = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(source, dict) or source.get("cache_version") != CACHE_VERSION:
+        return None
+    return source
+
+
+def _write_source(directory: str, source: dict) -> None:
+    """Record the version of a stored zip file."""
+    import json
+
+    _write_atomic(f"{directory}/source.json", json.dumps(source).encode())
+
+
+def fetch_zip(url: str, source: dict | None = None) -> tuple[dict | None, dict]:
+    """Download a zip file and decode its files.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the zip file.
+    source : dict | None
+        The version of a stored copy, to request the file only if it changed.
+
+    Returns
+    -------
+    tuple[dict | None, dict]
+        The text of each file in the zip, by name, or None if it is unchanged,
+        and the ETag and Last-Modified headers of the response.
+    """
+    import zipfile
+    from io import BytesIO
+
+    from openbb_core.provider.utils.helpers import get_requests_session
+
+    headers: dict = {}
+    if source and source.get("etag"):
+        headers["If-None-Match"] = source["etag"]
+    if source and source.get("last_modified"):
+        headers["If-Modified-Since"] = source["last_modified"]
+
+    with get_requests_session() as session:
+        response = session.get(url, headers=headers)
+        if response.status_code == 304:
+            return None, {}
+        response.raise_for_status()
+
+    files: dict = {}
+    with zipfile.ZipFile(BytesIO(response.content)) as archive:
+        for name in archive.namelist():
+            content = archive.read(name)
+            try:
+                files[name] = content.decode("utf-8")
+            except UnicodeDecodeError:
+                files[name] = content.decode("latin-1")
+
+    return files, {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+
+
+def load_dataset(
+    url: str,
+    parse: Callable[[str], tuple[list, list]],
+    member: str | None = None,
+) -> tuple[list, list]:
+    """Return the parsed tables of a file in a zip file of the data library.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the zip file.
+    parse : Callable[[str], tuple[list, list]]
+        Function parsing the text of a file into tables and their metadata.
+    member : str | None
+        The file in the zip. Defaults to the first one.
+
+    Returns
+    -------
+    tuple[list, list]
+        The tables, as DataFrames, and their metadata.
+    """
+    import os
+    import time
+    import warnings
+
+    from openbb_core.app.model.abstract.warning import OpenBBWarning
+
+    name = url.rsplit("/", 1)[-1]
+    directory = f"{get_cache_dir()}/{name.removesuffix('.zip')}"
+    source = _read_source(directory)
+    if source is not None:
+        member = member or source["files"][0]
+        if member not in source["files"]:
+            raise ValueError(f"{member} not found in {name}: {source['files']}")
+        try:
+            tables = read_tables(_member_path(directory, member))
+        except (OSError, ValueError, KeyError):
+            # The stored tables are missing or damaged; download the zip again.
+            source = None
+        else:
+            if time.time() - source["fetched_at"] < REVALIDATE_AFTER:
+                return tables
+
+    try:
+        files, version = fetch_zip(url, source)
+    except Exception as e:  # pylint: disable=broad-except
+        if source is None:
+            raise
+        warnings.warn(
+            f"Using the stored copy of {name}, which could not be checked -> {e}",
+            category=OpenBBWarning,
+        )
+        return tables
+
+    if files is None:
+        source = {**source, "fetched_at": time.time()}  # type: ignore[dict-item]
+        _write_source(directory, source)
+        return tables
+
+    member = member or next(iter(files), None)
+    if member not in files:
+        raise ValueError(f"{member} not found in {name}: {list(files)}")
+
+    os.makedirs(directory, exist_ok=True)
+    parsed: dict = {}
+    for file_name, text in files.items():
+        try:
+            parsed[file_name] = parse(text)
+        except Exception:  # pylint: disable=broad-except
+            if file_name == member:
+                raise
+            continue
+        write_tables(_member_path(directory, file_name), *parsed[file_name])
+
+    _write_source(
+        directory,
+        {
+            "cache_version": CACHE_VERSION,
+            "url": url,
+            "fetched_at": time.time(),
+            "files": list(parsed),
+            **version,
+        },
+    )
+
+    return parsed[member]
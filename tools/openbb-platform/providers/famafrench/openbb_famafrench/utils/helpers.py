@@ -2,8 +2,6 @@
 
 # pylint: disable=R0912,R0913,R0914,R0917,R1702,W0612,W0613
 
-from functools import lru_cache
-
 from openbb_famafrench.utils.constants import (
     BASE_URL,
     BREAKPOINT_FILES,
@@ -146,18 +144,8 @@ async def get_factor_choices(
     return [{"label": "No choices found. Try a new parameter.", "value": None}]
 
 
-@lru_cache(maxsize=64)
-def download_file(dataset) -> str:
-    """Download the specified dataset file from the Ken French data library.
-
-    Note: This function is not intended for direct use, it is called by `get_portfolio_data`.
-    """
-    # pylint: disable=import-outside-toplevel
-    import zipfile
-    from io import BytesIO
-
-    from openbb_core.provider.utils.helpers import get_requests_session
-
+def get_dataset_url(dataset: str) -> str:
+    """Return the URL of the zip file of a dataset, by label or file name."""
     url_map = {item["label"]: item["value"] for item in DATASET_CHOICES}
 
     if dataset.replace("_", " ") not in list(url_map) and dataset not in list(
@@ -167,65 +155,58 @@ def download_file(dataset) -> str:
             f"Dataset {dataset} not found in available datasets: {list(url_map)}"
         )
 
-    url = (
+    return (
         BASE_URL + dataset
         if dataset.endswith(".zip")
         else BASE_URL + url_map[dataset.replace("_", " ")]
     )
 
-    with get_requests_session() as session:
-        response = session.get(url)
-        response.raise_for_status()
-
-    data = ""
-
-    with zipfile.ZipFile(BytesIO(response.content)) as f:
-        with f.open(f.namelist()[0]) as file:  # type: ignore
-            data = file.read()  # type: ignore
-        try:
-            data = data.decode("utf-8")  # type: ignore
-        except UnicodeDecodeError:
-            data = data.decode("latin-1")  # type: ignore
 
-    return data
+def format_dates(dates):
+    """Convert a Series of YYYYMMDD, YYYYMM or YYYY dates to YYYY-MM-DD strings.
 
+    Monthly dates are the first day of the month, annual dates the last day of the year.
+    Other values are returned as-is.
 
-@lru_cache(maxsize=64)
-def download_international_portfolios(url):
-    """Download the international index portfolios file.
-
-    Note: This function is not intended for direct use,
-    it is called by `get_international_portfolio`.
+    The dates are split with integer arithmetic and formatted by NumPy, rather than
+    with string operations, which run in Python for each value.
     """
     # pylint: disable=import-outside-toplevel
-    from openbb_core.provider.utils.helpers import get_requests_session
-
-    with get_requests_session() as session:
-        response = session.get(url)
-        response.raise_for_status()
-
-    return response
-
-
-def apply_date(x):
-    """Pandas Apply helper to convert various date formats to a standard YYYY-MM-DD format."""
-    # pylint: disable=import-outside-toplevel
-    from pandas import to_datetime
+    from numpy import datetime_as_string, floor, isfinite, where
+    from pandas import Series, to_numeric
+
+    codes = to_numeric(dates, errors="coerce").to_numpy(dtype=float)
+    valid = isfinite(codes) & (codes == floor(codes))
+    daily = valid & (codes >= 1e7) & (codes < 1e8)
+    monthly = valid & (codes >= 1e5) & (codes < 1e6)
+    annual = valid & (codes >= 1e3) & (codes < 1e4)
+    codes = where(daily | monthly | annual, codes, 2000).astype("int64")
+
+    year = where(daily, codes // 10000, where(monthly, codes // 100, codes))
+    month = where(daily, codes // 100 % 100, where(monthly, codes % 100, 12))
+    day = where(daily, codes % 100, where(monthly, 1, 31))
+    formatted = datetime_as_string(
+        (
+            (year - 1970).astype("datetime64[Y]")
+            + (month - 1).astype("timedelta64[M]")
+        ).astype("datetime64[D]")
+        + (day - 1).astype("timedelta64[D]"),
+        unit="D",
+    ).astype(object)
+
+    other = ~(daily | monthly | annual)
+    if other.any():
+        formatted[other] = (
+            Series(dates).astype(str).str.replace(" ", "").to_numpy()[other]
+        )
 
-    date = str(x).replace(" ", "")
-    if len(date) == 6:
-        date = date[:4] + "-" + date[4:]
-        date = to_datetime(date, format="%Y-%m")
-        date = date.date().strftime("%Y-%m-%d")
-    elif len(date) == 8:
-        date = date[:4] + "-" + date[4:6] + "-" + date[6:]
-    elif len(date) == 4:
-        date = date + "-12-31"
-    return date
+    return Series(formatted, index=getattr(dates, "index", None), dtype=str)
 
 
 def read_csv_file(data: str):
-    """Parse the raw data from a .csv file into a list of dictionaries representing tables.
+    """Split the raw data from a .csv file into a list of dictionaries representing tables.
+
+    The rows of each table are kept as lines of text, parsed by `process_csv_tables`.
 
     Note: This function is not intended for direct use, it is called by `get_portfolio_data`.
     """
@@ -279,34 +260,20 @@ def read_csv_file(data: str):
                     break
                 j -= 1
 
-            # Parse headers
-            header_line = lines[i].strip()
-            headers = ["Date"] + header_line.split(",")[1:]
-
-            # Move past header row
-            i += 1
-
-            # Collect data rows
-            data_rows = []
-
-            # Look for data rows until we hit the next header or end of file
-            while i < len(lines):
-                line = lines[i].strip()
-                if not line:
-                    break
-                values = line.split(",")
-                if values:
-                    data_rows.append([d.strip() for d in values])
+            headers = ["Date"] + lines[i].strip().split(",")[1:]
 
+            # The rows run until the next empty line
+            start = i + 1
+            i = start
+            while i < len(lines) and lines[i].strip():
                 i += 1
 
-            # Add table if it has data
-            if data_rows:
+            if i > start:
                 tables.append(
                     {
                         "meta": metadata,
                         "headers": headers,
-                        "rows": data_rows,
+                        "rows": lines[start:i],
                         "is_annual": "Annual" in metadata,
                     }
                 )
@@ -326,50 +293,43 @@ def read_csv_file(data: str):
 
 
 def process_csv_tables(tables, general_description="") -> tuple:
-    """Convert parsed table dictionaries from CSV files to pandas DataFrames.
+    """Parse the tables split by `read_csv_file` into pandas DataFrames of floats.
+
+    Each table is parsed in one call to `pandas.read_csv`, and its dates converted
+    by `format_dates`.
 
     Note: This function is not intended for direct use, it is called by `get_portfolio_data`.
     """
     # pylint: disable=import-outside-toplevel
-    import warnings  # noqa
-    from pandas import DataFrame
+    from io import StringIO  # noqa
+    from pandas import read_csv, to_numeric
 
     dataframes: list = []
     metadata: list = []
 
-    for table_idx, table in enumerate(tables):
-        # Skip empty tables
-        if not table["rows"]:
+    for table in tables:
+        rows = table.get("rows", [])
+        if not rows:
             continue
 
-        # Create DataFrame from rows
-        rows_data = table.get("rows", [])
-        headers = table["headers"]
-
-        # Check if we have enough headers
-        max_cols = max(len(row) for row in rows_data)
-        if len(headers) < max_cols:
-            headers.extend([f"Column_{i}" for i in range(len(headers), max_cols)])
-
-        # Create dataframe with proper dimensions and headers
-        df = DataFrame(rows_data)
-
-        if df.empty or df.shape[1] == 0:
-            continue
-
-        # Set column names
-        df.columns = headers[: df.shape[1]]
-
-        # Convert Date column to datetime
-        try:
-            # Convert YYYYMM format to datetime
-            df["Date"] = df.Date.apply(apply_date)
-        except Exception as e:  # pylint: disable=W0718
-            warnings.warn(f"Error parsing dates: {e}")
-            df["Date"] = df["Date"].astype(str)
-
-        # Set Date as index
-        df = df.set_index("Date")
+        headers = list(table["headers"])
+        n_cols = max(row.count(",") for row in rows) + 1
+        if len(headers) < n_cols:
+            headers.extend([f"Column_{i}" for i in range(len(headers), n_cols)])
+
+        df = read_csv(
+            StringIO("\n".join(rows)),
+            header=None,
+            names=list(range(n_cols)),
+            dtype={0: str},
+            skipinitialspace=True,
+        )
+        dates = df.pop(0)
+        # Lines that are not data, such as a copyright notice, have no date.
+        is_row = to_numeric(dates, errors="coerce").notna().to_numpy()
+        df = df[is_row].apply(to_numeric, errors="coerce").astype(float)
+        df.columns = headers[1:n_cols]
+        df.index = format_dates(dates[is_row]).rename("Date")
         df = df.sort_index()
         dataframes.append(df)
 
@@ -394,6 +354,11 @@ def process_csv_tables(tables, general_description="") -> tuple:
     return dataframes, metadata
 
 
+def parse_csv_dataset(data: str) -> tuple:
+    """Parse the raw data from a .csv file into DataFrames and their metadata."""
+    return process_csv_tables(*read_csv_file(data))
+
+
 def read_dat_file(data: str) -> list:
     """Parse the raw data from a .dat file into a list of dictionaries representing tables.
 
@@ -512,21 +477,16 @@ def read_dat_file(data: str) -> list:
     return tables
 
 
-def get_international_portfolio_data(
+def get_international_portfolio_file(
     index: str | None = None,
     country: str | None = None,
     dividends: bool = True,
-) -> str:
-    """Download and extract the international index or country portfolio data.
+) -> tuple[str, str]:
+    """Return the URL of the zip file and the name of the file of an index or country.
 
     Note: Not intended for direct use, this function is called by `get_international_portfolio`.
     """
-    # pylint: disable=import-outside-toplevel
-    import zipfile
-    from io import BytesIO
-
     url: str = ""
-    data: str = ""
     if not index and not country:
         raise ValueError("Please provide either an index or a country.")
     if index and country:
@@ -555,25 +515,7 @@ def get_international_portfolio_data(
         url = BASE_URL + COUNTRY_PORTFOLIOS_URLS["dividends" if dividends else "ex"]
         index = COUNTRY_PORTFOLIO_FILES[country]
 
-    response = download_international_portfolios(url)
-
-    with zipfile.ZipFile(BytesIO(response.content)) as f:
-        filenames = f.namelist()
-
-        if index in filenames:
-            try:
-                with f.open(index) as file:
-                    data = file.read().decode("utf-8")
-            except UnicodeDecodeError:
-                # Fallback to latin-1 encoding if utf-8 fails
-                with f.open(index) as file:
-                    data = file.read().decode("latin-1")
-        else:
-            raise ValueError(
-                f"Index {index} not found in available indexes: {filenames}"
-            )
-
-    return data
+    return url, index  # type: ignore[return-value]
 
 
 def process_international_portfolio_data(tables: list, dividends: bool = True) -> tuple:
@@ -583,8 +525,7 @@ def process_international_portfolio_data(tables: list, dividends: bool = True) -
     """
     # pylint: disable=import-outside-toplevel
     import re  # noqa
-    import warnings
-    from pandas import DataFrame, MultiIndex
+    from pandas import DataFrame, MultiIndex, to_numeric
 
     dataframes: list = []
     metadata: list = []
@@ -608,12 +549,11 @@ def process_international_portfolio_data(tables: list, dividends: bool = True) -
         # Check if this is a special case table with "Firms" column
         has_firms_column = "Firms" in df.columns
 
-        # Parse and set Date column
-        try:
-            df["Date"] = df["Date"].apply(apply_date)
-        except Exception as e:  # pylint: disable=W0718
-            warnings.warn(f"Error parsing dates. Using string conversion. -> {e}")
-            df["Date"] = df["Date"].astype(str)
+        # Convert the dates and values, a column at a time
+        df["Date"] = format_dates(df["Date"])
+        for i, col in enumerate(df.columns):
+            if col != "Date":
+                df.isetitem(i, to_numeric(df.iloc[:, i], errors="coerce"))
 
         # Set Date as index (or Date and Mkt if applicable)
         df = (
@@ -682,7 +622,11 @@ def process_international_portfolio_data(tables: list, dividends: bool = True) -
     return dataframes, metadata
 
 
-@lru_cache(maxsize=64)
+def parse_dat_dataset(data: str, dividends: bool = True) -> tuple:
+    """Parse the raw data from a .dat file into DataFrames and their metadata."""
+    return process_international_portfolio_data(read_dat_file(data), dividends)
+
+
 def get_international_portfolio(
     index: str | None = None,
     country: str | None = None,
@@ -723,10 +667,15 @@ def get_international_portfolio(
     ValueError
         When an invalid combination of parameters or unsupported values are supplied.
     """
+    # pylint: disable=import-outside-toplevel
+    from functools import partial  # noqa
+    from openbb_famafrench.utils.dataset_cache import load_dataset
+
     measure = measure.lower() if measure is not None else "usd"
-    data = get_international_portfolio_data(index, country, dividends)
-    tables = read_dat_file(data)
-    dataframes, metadata = process_international_portfolio_data(tables, dividends)
+    url, file = get_international_portfolio_file(index, country, dividends)
+    dataframes, metadata = load_dataset(
+        url, partial(parse_dat_dataset, dividends=dividends), member=file
+    )
 
     if measure and measure not in ["usd", "local", "ratios"]:
         raise ValueError(
@@ -777,7 +726,6 @@ def get_international_portfolio(
     return dfs, dfs_meta
 
 
-@lru_cache(maxsize=64)
 def get_portfolio_data(
     dataset: str, frequency: str | None = None, measure: str | None = None
 ) -> tuple:
@@ -819,12 +767,13 @@ def get_portfolio_data(
         raise ValueError(
             f"Measure '{measure}' is only available for monthly frequency."
         )
+    # pylint: disable=import-outside-toplevel
+    from openbb_famafrench.utils.dataset_cache import load_dataset
+
     if "Factor" in dataset:
         measure = None
 
-    file = download_file(dataset)
-    table, desc = read_csv_file(file)
-    dfs, metadata = process_csv_tables(table, desc)
+    dfs, metadata = load_dataset(get_dataset_url(dataset), parse_csv_dataset)
 
     if frequency:
         out_dfs = [
@@ -879,21 +828,10 @@ def get_portfolio_data(
     return out_dfs, out_metadata
 
 
-@lru_cache(maxsize=8)
-def get_breakpoint_data(
-    breakpoint_type: str,
-) -> tuple:
-    """Get US breakpoint data for a given dataset.
+def parse_breakpoint_file(data: str, breakpoint_type: str) -> tuple:
+    """Parse the raw data from a breakpoints .csv file into a DataFrame and its metadata.
 
-    Parameters
-    ----------
-    breakpoint_type : str
-        The breakpoint to retrieve. Must be one of the available breakpoints in BREAKPOINT_FILES.
-
-    Returns
-    -------
-    tuple
-        A tuple containing a pandas DataFrames a metadata dictionary.
+    The DataFrame is indexed by date, and the metadata is the description of the file.
     """
     # pylint: disable=import-outside-toplevel
     from io import StringIO  # noqa
@@ -922,11 +860,9 @@ def get_breakpoint_data(
         "percentile_95",
         "percentile_100",
     ]
-    breakpoint_file = BREAKPOINT_FILES.get(breakpoint_type)
-    file = download_file(breakpoint_file)
     metadata = ""
 
-    for line in file.splitlines()[:3]:
+    for line in data.splitlines()[:3]:
         if not line.strip() or line.strip().startswith("19"):
             break
         metadata += line.strip() + " "
@@ -945,7 +881,7 @@ def get_breakpoint_data(
             1:
         ]
 
-    breakpoint_data = StringIO(file)
+    breakpoint_data = StringIO(data)
     df = read_csv(
         breakpoint_data,
         skiprows=1 if breakpoint_type == "me" else 3,
@@ -964,4 +900,36 @@ def get_breakpoint_data(
         )
     )
 
-    return [df], [metadata]
+    return [df.set_index("date")], [metadata]
+
+
+def get_breakpoint_data(
+    breakpoint_type: str,
+) -> tuple:
+    """Get US breakpoint data for a given dataset.
+
+    Parameters
+    ----------
+    breakpoint_type : str
+        The breakpoint to retrieve. Must be one of the available breakpoints in BREAKPOINT_FILES.
+
+    Returns
+    -------
+    tuple
+        A tuple containing a pandas DataFrames a metadata dictionary.
+    """
+    # pylint: disable=import-outside-toplevel
+    from functools import partial  # noqa
+    from openbb_famafrench.utils.dataset_cache import load_dataset
+
+    breakpoint_file = BREAKPOINT_FILES.get(breakpoint_type)
+    dfs, metadata = load_dataset(
+        get_dataset_url(breakpoint_file),  # type: ignore[arg-type]
+        partial(parse_breakpoint_file, breakpoint_type=breakpoint_type),
+    )
+    df = dfs[0].reset_index()
+    # The tables are stored as floats; the counts of firms are integers.
+    counts = [col for col in df.columns if col.startswith("num_firms")]
+    df[counts] = df[counts].astype("int64")
+
+    return [df], metadata
@@ -0,0 +1 @@
+"""The Fama-French provider tests."""
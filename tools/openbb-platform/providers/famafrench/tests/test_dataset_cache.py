@@ -0,0 +1,102 @@
+"""Tests for the Fama-French dataset cache."""
+
+import pytest
+from openbb_famafrench.utils import dataset_cache
+from openbb_famafrench.utils.dataset_cache import read_tables, write_tables
+from openbb_famafrench.utils.helpers import format_dates, get_breakpoint_data
+from pandas import DataFrame, Index, MultiIndex, Series
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+# pylint: disable=redefined-outer-name
+
+PERCENTILES = ",".join(str(p) for p in range(5, 105, 5))
+
+OP_BREAKPOINTS = "\n".join(
+    [
+        "This file was created using the 202401 Compustat and CRSP databases.",
+        "It contains operating profitability breakpoints for all NYSE stocks.",
+        "",
+        f",Count,{PERCENTILES}",
+        "196306,1000," + ",".join(f"{p / 100:.2f}" for p in range(5, 105, 5)),
+        "196307,1010," + ",".join(f"{p / 50:.2f}" for p in range(5, 105, 5)),
+        "1964,1020," + ",".join(f"{p / 25:.2f}" for p in range(5, 105, 5)),
+        "Copyright 2024 Eugene F. Fama and Kenneth R. French",
+    ]
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Store the datasets in a temporary directory."""
+    monkeypatch.setattr(dataset_cache, "get_cache_dir", lambda: str(tmp_path))
+    return tmp_path
+
+
+def test_write_read_tables(tmp_path):
+    """Test that stored tables are read back unchanged."""
+    monthly = DataFrame(
+        {"Mkt-RF": [2.96, 2.64], "SMB": [-2.56, -1.17]},
+        index=Index(["1926-07-01", "1926-08-01"], name="Date"),
+    )
+    portfolios = DataFrame(
+        [[1.5, 2.5, 3.5, 4.5]],
+        index=Index(["1927-12-31"], name="Date"),
+        columns=MultiIndex.from_tuples(
+            [("Small", "Lo"), ("Small", "Hi"), ("Big", "Lo"), ("Big", "Hi")]
+        ),
+    )
+    metadata = [
+        {"description": "Monthly factors", "frequency": "monthly"},
+        {"description": "Annual portfolios", "frequency": "annual"},
+    ]
+    path = str(tmp_path / "F-F_Research_Data_Factors.csv")
+
+    write_tables(path, [monthly, portfolios], metadata)
+    dataframes, stored_metadata = read_tables(path)
+
+    assert stored_metadata == metadata
+    assert_frame_equal(dataframes[0], monthly, check_index_type=False)
+    assert_frame_equal(dataframes[1], portfolios, check_index_type=False)
+
+
+def test_format_dates():
+    """Test the conversion of daily, monthly and annual dates."""
+    dates = Series(["19260701", "192607", "1927", " 1927 ", "Annual"])
+
+    assert_series_equal(
+        format_dates(dates),
+        Series(
+            ["1926-07-01", "1926-07-01", "1927-12-31", "1927-12-31", "Annual"],
+            dtype=str,
+        ),
+    )
+
+
+def test_get_breakpoint_data(cache_dir, monkeypatch):
+    """Test that breakpoint files are parsed once and then read from the cache."""
+    requests: list = []
+
+    def fetch_zip(url, source=None):
+        requests.append(url)
+        return {"OP_Breakpoints.csv": OP_BREAKPOINTS}, {"etag": '"1"'}
+
+    monkeypatch.setattr(dataset_cache, "fetch_zip", fetch_zip)
+
+    for _ in range(2):
+        dfs, metadata = get_breakpoint_data("op")
+        df = dfs[0]
+
+        assert df["date"].tolist() == ["1963-06-30", "1963-07-31", "1964-12-31"]
+        assert df["num_firms"].tolist() == [1000, 1010, 1020]
+        assert df["num_firms"].dtype == "int64"
+        assert df["percentile_100"].tolist() == [1.0, 2.0, 4.0]
+        assert metadata == [
+            (
+                "This file was created using the 202401 Compustat and CRSP "
+                "databases. It contains operating profitability breakpoints for "
+                "all NYSE stocks."
+            )
+        ]
+
+    assert len(requests) == 1
+    assert (cache_dir / "OP_Breakpoints_CSV" / "source.json").exists()
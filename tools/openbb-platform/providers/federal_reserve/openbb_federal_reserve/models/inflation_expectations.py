@@ -19,7 +19,7 @@ URL = (
 )
 
 
-@ttl_cache(ttl=86400)
+@ttl_cache(maxsize=1, ttl=86400, stale_ttl=3600, shared=True)
 def download_inflation_excel() -> bytes:
     """Download the Inflation Expectations Excel file from the Philadelphia Fed.
 
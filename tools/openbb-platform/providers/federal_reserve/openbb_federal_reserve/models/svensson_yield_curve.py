@@ -130,7 +130,7 @@ SERIES_TYPE = Literal[
 ]
 
 
-@ttl_cache(ttl=86400)
+@ttl_cache(maxsize=1, ttl=86400, stale_ttl=3600, shared=True)
 def download_csv() -> str:
     """Download the Federal Reserve Svensson Yield Curve CSV data.
 
@@ -97,7 +97,7 @@ TIME_SERIES_FIELDS = {"date", *NUMERIC_FIELDS}
 SUMMARY_RECORD_FIELDS = {"variable", "variable_title", *SUMMARY_FIELDS}
 
 
-@ttl_cache(ttl=86400)
+@ttl_cache(maxsize=1, ttl=86400, stale_ttl=3600, shared=True)
 def download_tfp_excel() -> bytes:
     """Download the TFP Excel file from the San Francisco Federal Reserve.
 
@@ -1,6 +1,7 @@
 """FINRA provider module."""
 
 from openbb_core.provider.abstract.provider import Provider
+from openbb_core.provider.utils.rate_limiter import RateLimit
 from openbb_finra.models.equity_short_interest import FinraShortInterestFetcher
 from openbb_finra.models.otc_aggregate import FinraOTCAggregateFetcher
 
@@ -15,4 +16,5 @@ makes available to the public, media, researchers and member firms.""",
         "EquityShortInterest": FinraShortInterestFetcher,
     },
     repr_name="Financial Industry Regulatory Authority (FINRA)",
+    rate_limit=RateLimit(10, max_concurrency=8, hosts=["finra.org"]),
 )
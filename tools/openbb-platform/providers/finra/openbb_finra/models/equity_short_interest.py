@@ -2,6 +2,7 @@
 
 # pylint: disable=unused-argument
 
+from datetime import date as dateType
 from typing import Any
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -9,11 +10,26 @@ from openbb_core.provider.standard_models.equity_short_interest import (
     ShortInterestData,
     ShortInterestQueryParams,
 )
+from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
+from pydantic import Field
 
 
 class FinraShortInterestQueryParams(ShortInterestQueryParams):
     """FINRA Equity Short Interest Query."""
 
+    __json_schema_extra__ = {"symbol": {"multiple_items_allowed": True}}
+
+    start_date: dateType | None = Field(
+        default=None,
+        description=QUERY_DESCRIPTIONS.get("start_date", "")
+        + " Filters on the settlement date.",
+    )
+    end_date: dateType | None = Field(
+        default=None,
+        description=QUERY_DESCRIPTIONS.get("end_date", "")
+        + " Filters on the settlement date.",
+    )
+
 
 class FinraShortInterestData(ShortInterestData):
     """FINRA Equity Short Interest Data."""
@@ -43,42 +59,27 @@ class FinraShortInterestFetcher(
         return FinraShortInterestQueryParams(**params)
 
     @staticmethod
-    def extract_data(
+    async def aextract_data(
         query: FinraShortInterestQueryParams,
         credentials: dict[str, str] | None,
         **kwargs: Any,
     ) -> list[dict]:
         """Extract the data from the Finra endpoint."""
         # pylint: disable=import-outside-toplevel
-        import sqlite3  # noqa
-        from openbb_finra.utils.data_storage import get_db_path, prepare_data  # noqa
+        import asyncio  # noqa
+        from openbb_finra.utils.data_storage import (  # noqa
+            prepare_data,
+            query_short_interest,
+        )
 
-        DB_PATH = get_db_path()
-        # Put the data in the cache
-        prepare_data()
+        # Fill a cold cache, or refresh it in the background.
+        await prepare_data()
         # Get the data from the cache
-        cnx = sqlite3.connect(DB_PATH)
-        cursor = cnx.cursor()
-        cursor.execute(
-            "SELECT * FROM short_interest where symbolCode = ?", (query.symbol,)
+        symbols = [s.strip().upper() for s in query.symbol.split(",") if s.strip()]
+
+        return await asyncio.to_thread(
+            query_short_interest, symbols, query.start_date, query.end_date
         )
-        # TODO: Check if we should allow general queries, it's more than 500k rows
-        # cursor.execute("SELECT * FROM short_interest")
-        result = cursor.fetchall()
-
-        titles = [
-            "symbolCode",
-            "issueName",
-            "marketClassCode",
-            "currentShortPositionQuantity",
-            "previousShortPositionQuantity",
-            "averageDailyVolumeQuantity",
-            "daysToCoverQuantity",
-            "changePercent",
-            "changePreviousNumber",
-            "settlementDate",
-        ]
-        return [dict(zip(titles, list(row)[1:])) for row in result]
 
     @staticmethod
     def transform_data(
@@ -7,12 +7,15 @@ from openbb_core.provider.standard_models.otc_aggregate import (
     OTCAggregateData,
     OTCAggregateQueryParams,
 )
+from openbb_core.provider.utils.descriptions import DATA_DESCRIPTIONS
 from pydantic import Field
 
 
 class FinraOTCAggregateQueryParams(OTCAggregateQueryParams):
     """FINRA OTC Aggregate Query."""
 
+    __json_schema_extra__ = {"symbol": {"multiple_items_allowed": True}}
+
     tier: Literal["T1", "T2", "OTCE"] = Field(
         default="T1",
         description=""""T1 - Securities included in the S&P 500, Russell 1000 and selected exchange-traded products;
@@ -27,11 +30,16 @@ class FinraOTCAggregateData(OTCAggregateData):
     """FINRA OTC Aggregate Data."""
 
     __alias_dict__ = {
+        "symbol": "issueSymbolIdentifier",
         "share_quantity": "totalWeeklyShareQuantity",
         "trade_quantity": "totalWeeklyTradeCount",
         "update_date": "lastUpdateDate",
     }
 
+    symbol: str | None = Field(
+        default=None, description=DATA_DESCRIPTIONS.get("symbol", "")
+    )
+
 
 class FinraOTCAggregateFetcher(
     Fetcher[FinraOTCAggregateQueryParams, list[FinraOTCAggregateData]]
@@ -45,16 +53,16 @@ class FinraOTCAggregateFetcher(
 
     # pylint: disable=unused-argument
     @staticmethod
-    def extract_data(
+    async def aextract_data(
         query: FinraOTCAggregateQueryParams,
         credentials: dict[str, str] | None,
         **kwargs: Any,
     ) -> list[dict]:
         """Extract the data from the FINRA endpoint."""
         # pylint: disable=import-outside-toplevel
-        from openbb_finra.utils.helpers import get_full_data
+        from openbb_finra.utils.helpers import aget_full_data
 
-        return get_full_data(query.symbol, query.tier, query.is_ats)
+        return await aget_full_data(query.symbol, query.tier, query.is_ats)
 
     @staticmethod
     def transform_data(
@@ -2,81 +2,304 @@
 
 This was created as a way to handle short interest data from the FINRA.
 The files do not change, so there is no need to download them every time.
+
+The biweekly files are stored in a SQLite database in WAL mode, indexed by
+symbol and settlement date. Missing files are downloaded concurrently. Only
+a cold store is filled on the request path; afterwards, new settlement dates
+are loaded by a background refresh while queries are served from the store.
 """
 
+# pylint: disable=import-outside-toplevel
+
+import asyncio
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import date as dateType
+
 from openbb_core.app.utils import get_user_cache_directory
 from openbb_finra.utils.helpers import get_short_interest_dates
 
+# Bumped when the schema changes, so the store is rebuilt.
+STORE_VERSION = 1
+# Concurrent downloads when backfilling the store.
+MAX_CONCURRENCY = 8
+# Dates whose file was not published yet are retried after this many seconds.
+MISSING_RETRY_AFTER = 6 * 3600
+# Minimum seconds between two background refreshes.
+REFRESH_INTERVAL = 3600
+
+COLUMNS = [
+    "symbolCode",
+    "issueName",
+    "marketClassCode",
+    "currentShortPositionQuantity",
+    "previousShortPositionQuantity",
+    "averageDailyVolumeQuantity",
+    "daysToCoverQuantity",
+    "changePercent",
+    "changePreviousNumber",
+    "settlementDate",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS short_interest (
+    symbolCode TEXT NOT NULL,
+    issueName TEXT,
+    marketClassCode TEXT,
+    currentShortPositionQuantity REAL,
+    previousShortPositionQuantity REAL,
+    averageDailyVolumeQuantity REAL,
+    daysToCoverQuantity REAL,
+    changePercent REAL,
+    changePreviousNumber REAL,
+    settlementDate TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS short_interest_symbol_date
+    ON short_interest (symbolCode, settlementDate);
+CREATE INDEX IF NOT EXISTS short_interest_date ON short_interest (settlementDate);
+CREATE TABLE IF NOT EXISTS settlement_dates (
+    settlementDate TEXT PRIMARY KEY,
+    rows INTEGER,
+    checked_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+_refresh_lock = threading.Lock()
+_refresh_thread: threading.Thread | None = None
+_last_refresh = 0.0
+
 
 def get_db_path():
     """Return the path to the database."""
     # pylint: disable=import-outside-toplevel
     from pathlib import Path
 
-    DB_PATH = Path(get_user_cache_directory()) / "caches/finra_short_volume.db"
+    DB_PATH = Path(get_user_cache_directory()) / "caches/finra_short_interest.db"
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     return DB_PATH
 
 
-def get_cached_dates() -> list:
-    """Return the dates that are cached in the DB file."""
-    # pylint: disable=import-outside-toplevel
-    import sqlite3  # noqa
+def connect() -> sqlite3.Connection:
+    """Open a connection to the store, creating its schema if needed."""
+    cnx = sqlite3.connect(
+        get_db_path(), timeout=30, isolation_level=None, check_same_thread=False
+    )
+    cnx.execute("PRAGMA journal_mode = WAL")
+    cnx.execute("PRAGMA synchronous = NORMAL")
+    if cnx.execute("PRAGMA user_version").fetchone()[0] != STORE_VERSION:
+        cnx.executescript(
+            "DROP TABLE IF EXISTS short_interest;"
+            "DROP TABLE IF EXISTS settlement_dates;"
+        )
+        cnx.execute(f"PRAGMA user_version = {STORE_VERSION}")
+    cnx.executescript(_SCHEMA)
+    return cnx
 
-    DB_PATH = get_db_path()
-    cnx = sqlite3.connect(DB_PATH)
-    cursor = cnx.cursor()
 
-    # Check if the table exists
-    cursor.execute(
-        "SELECT * FROM sqlite_master WHERE type='table' AND name='short_interest'"
-    )
-    if cursor.fetchone() is None:
-        # The table does not exist
-        return []
+def _to_iso(date: str) -> str:
+    """Convert a YYYYMMDD date to YYYY-MM-DD."""
+    return f"{date[:4]}-{date[4:6]}-{date[6:]}"
 
-    # If the table exists, fetch the data
-    cursor.execute("SELECT distinct settlementDate FROM short_interest")
-    result = cursor.fetchall()
-    return [row[0] for row in result]
 
+def get_cached_dates() -> list:
+    """Return the settlement dates that are loaded in the store."""
+    with closing(connect()) as cnx:
+        return [
+            row[0]
+            for row in cnx.execute(
+                "SELECT settlementDate FROM settlement_dates WHERE rows IS NOT NULL"
+            )
+        ]
 
-def get_data_from_date_and_store(date):
-    """Get data from a specific date and place it in the cache."""
-    # pylint: disable=import-outside-toplevel
-    import random  # noqa
-    import sqlite3  # noqa
+
+def get_missing_dates() -> list[str]:
+    """Return the published dates (YYYYMMDD) not loaded in the store yet."""
+    now = time.time()
+    with closing(connect()) as cnx:
+        checked = dict(
+            cnx.execute(
+                "SELECT settlementDate, CASE WHEN rows IS NOT NULL THEN 1 "
+                "WHEN checked_at > ? THEN 1 ELSE 0 END FROM settlement_dates",
+                (now - MISSING_RETRY_AFTER,),
+            ).fetchall()
+        )
+    return [d for d in get_short_interest_dates() if not checked.get(_to_iso(d))]
+
+
+def parse_short_interest_file(text: str) -> list[tuple]:
+    """Parse a biweekly short interest file into rows of the store."""
     from io import StringIO  # noqa
-    from openbb_core.provider.utils.helpers import make_request  # noqa
     from pandas import read_csv  # noqa
 
-    DB_PATH = get_db_path()
+    data = read_csv(StringIO(text), delimiter="|", dtype={"symbolCode": str})
+    data = data[[c for c in COLUMNS if c in data.columns]].reindex(columns=COLUMNS)
+    data = data.dropna(subset=["symbolCode"])
+    data = data.astype(object).where(data.notna(), None)
+
+    return list(data.itertuples(index=False, name=None))
+
+
+async def _download_date(date: str, session) -> tuple[str, list[tuple] | None]:
+    """Download and parse the file of a settlement date (YYYYMMDD).
+
+    The rows are None if the file is not published yet. Other failures raise.
+    """
+    import random  # noqa
+    from openbb_core.provider.utils.helpers import amake_request  # noqa
+
     url = f"https://cdn.finra.org/equity/otcmarket/biweekly/shrt{date}.csv"
     # add a random string to user agent to avoid getting blocked
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         + str(random.randint(0, 9))  # noqa: S311
     }
-    req = make_request(url, headers=headers, timeout=1)
-    if req.status_code != 200:
-        return
-    data = read_csv(StringIO(req.text), delimiter="|")
-    data = data.drop(
-        columns=[
-            "accountingYearMonthNumber",
-            "issuerServicesGroupExchangeCode",
-            "stockSplitFlag",
-            "revisionFlag",
-        ]
+
+    async def callback(response, _):
+        # A file that is not published yet is not found; other errors raise.
+        if response.status in (403, 404):
+            return None
+        response.raise_for_status()
+        return await response.text()
+
+    text = await amake_request(
+        url, headers=headers, timeout=30, session=session, response_callback=callback
     )
-    data.to_sql("short_interest", sqlite3.connect(DB_PATH), if_exists="append")
+    if not text:
+        return date, None
+
+    return date, await asyncio.to_thread(parse_short_interest_file, text)  # type: ignore[arg-type]
+
+
+def _store_date(cnx: sqlite3.Connection, date: str, rows: list[tuple] | None) -> None:
+    """Write the rows of a settlement date, replacing any previous load."""
+    iso_date = _to_iso(date)
+    cnx.execute("BEGIN IMMEDIATE")
+    try:
+        if rows is not None:
+            cnx.execute(
+                "DELETE FROM short_interest WHERE settlementDate = ?", (iso_date,)
+            )
+            cnx.executemany(
+                f"INSERT INTO short_interest ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(COLUMNS))})",
+                rows,
+            )
+        cnx.execute(
+            "INSERT OR REPLACE INTO settlement_dates (settlementDate, rows, checked_at)"
+            " VALUES (?, ?, ?)",
+            (iso_date, len(rows) if rows is not None else None, time.time()),
+        )
+        cnx.execute("COMMIT")
+    except BaseException:
+        cnx.execute("ROLLBACK")
+        raise
+
+
+async def backfill(
+    dates: list[str] | None = None, max_concurrency: int = MAX_CONCURRENCY
+) -> int:
+    """Download the missing settlement dates into the store, concurrently.
+
+    Parameters
+    ----------
+    dates : list[str] | None
+        Dates to load, as YYYYMMDD. Defaults to all the missing dates.
+    max_concurrency : int
+        Maximum number of files downloaded at once.
+
+    Returns
+    -------
+    int
+        The number of dates loaded.
+    """
+    from openbb_core.provider.utils.helpers import get_async_requests_session
+
+    dates = get_missing_dates() if dates is None else dates
+    if not dates:
+        return 0
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    session = await get_async_requests_session()
+    loaded = 0
+
+    async def download(date: str):
+        async with semaphore:
+            try:
+                return await _download_date(date, session)
+            except Exception:  # pylint: disable=broad-except
+                # Not recorded as missing, so the next backfill tries it again.
+                return None
+
+    try:
+        with closing(connect()) as cnx:
+            # Store each file as soon as it arrives, so progress is never lost.
+            for task in asyncio.as_completed([download(d) for d in dates]):
+                if (result := await task) is None:
+                    continue
+                date, rows = result
+                await asyncio.to_thread(_store_date, cnx, date, rows)
+                loaded += rows is not None
+    finally:
+        await session.close()
+
+    return loaded
+
+
+def refresh_in_background() -> None:
+    """Load new settlement dates in a background thread, at most once an hour."""
+    global _refresh_thread, _last_refresh  # noqa: PLW0603  # pylint: disable=global-statement
+    from openbb_core.provider.utils.helpers import run_async
+
+    with _refresh_lock:
+        if (_refresh_thread and _refresh_thread.is_alive()) or (
+            time.time() - _last_refresh < REFRESH_INTERVAL
+        ):
+            return
+        _last_refresh = time.time()
+        _refresh_thread = threading.Thread(
+            target=run_async, args=(backfill,), name="finra-refresh", daemon=True
+        )
+        _refresh_thread.start()
+
+
+async def prepare_data() -> None:
+    """Prepare the data.
+
+    A cold store is filled before returning. Otherwise, missing dates are
+    loaded in the background.
+    """
+    if not get_cached_dates():
+        await backfill()
+    else:
+        refresh_in_background()
+
 
+def query_short_interest(
+    symbols: list[str] | None = None,
+    start_date: dateType | None = None,
+    end_date: dateType | None = None,
+) -> list[dict]:
+    """Query the store by symbols and settlement date range, using its indexes."""
+    conditions: list[str] = []
+    params: list = []
+    if symbols:
+        conditions.append(f"symbolCode IN ({', '.join('?' * len(symbols))})")
+        params.extend(symbols)
+    if start_date:
+        conditions.append("settlementDate >= ?")
+        params.append(start_date.isoformat())
+    if end_date:
+        conditions.append("settlementDate <= ?")
+        params.append(end_date.isoformat())
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
 
-def prepare_data():
-    """Prepare the data."""
-    date_list = get_short_interest_dates()
-    cached_urls = get_cached_dates()
-    for date in date_list:
-        if f"{date[:4]}-{date[4:6]}-{date[6:]}" not in cached_urls:
-            get_data_from_date_and_store(date)
+    with closing(connect()) as cnx:
+        cursor = cnx.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM short_interest{where}"  # noqa: S608
+            " ORDER BY settlementDate, symbolCode",
+            params,
+        )
+        return [dict(zip(COLUMNS, row)) for row in cursor]
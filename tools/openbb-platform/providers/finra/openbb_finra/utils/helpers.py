@@ -5,19 +5,31 @@ import datetime
 # pylint: disable=W0621
 
 
-def get_finra_weeks(tier: str = "T1", is_ats: bool = True):
-    """Fetch the available weeks from FINRA that can be used."""
-    # pylint: disable=import-outside-toplevel
-    from openbb_core.provider.utils.helpers import make_request
-
-    request_header = {"Accept": "application/json", "Content-Type": "application/json"}
-
-    request_data = {
+FINRA_API_URL = "https://api.finra.org/data/group/otcMarket/name"
+FINRA_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) ",
+}
+# Concurrent weekly requests made by `aget_full_data`.
+MAX_CONCURRENCY = 8
+# Shared cache namespace of the weekly data, which never changes once published.
+WEEKLY_CACHE_NAMESPACE = "finra_weekly_summary"
+
+
+def _summary_type(is_ats: bool) -> str:
+    """Return the summary type code of ATS or non-ATS data."""
+    return "ATS_W_SMBL" if is_ats else "OTC_W_SMBL"
+
+
+def _weeks_request(tier: str, is_ats: bool) -> dict:
+    """Build the request body listing the available weeks."""
+    return {
         "compareFilters": [
             {
                 "compareType": "EQUAL",
                 "fieldName": "summaryTypeCode",
-                "fieldValue": "ATS_W_SMBL" if is_ats else "OTC_W_SMBL",
+                "fieldValue": _summary_type(is_ats),
             },
             {
                 "compareType": "EQUAL",
@@ -32,29 +44,12 @@ def get_finra_weeks(tier: str = "T1", is_ats: bool = True):
         "sortFields": ["-weekStartDate"],
     }
 
-    response = make_request(
-        method="POST",
-        url="https://api.finra.org/data/group/otcMarket/name/weeklyDownloadDetails",
-        headers=request_header,
-        json=request_data,
-        timeout=3,
-    )
-
-    return response.json() if response.status_code == 200 else []
-
-
-def get_finra_data(symbol, week_start, tier: str = "T1", is_ats: bool = True):
-    """Get the data for a symbol from FINRA."""
-    # pylint: disable=import-outside-toplevel
-    from openbb_core.provider.utils.helpers import make_request
-
-    req_hdr = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) ",
-    }
 
-    filters = [
+def _weekly_summary_request(
+    symbols: list[str] | None, week_start: str, tier: str, is_ats: bool
+) -> dict:
+    """Build the request body of the weekly summary of one or more symbols."""
+    filters: list[dict] = [
         {
             "compareType": "EQUAL",
             "fieldName": "weekStartDate",
@@ -65,54 +60,232 @@ def get_finra_data(symbol, week_start, tier: str = "T1", is_ats: bool = True):
             "compareType": "EQUAL",
             "description": "",
             "fieldName": "summaryTypeCode",
-            "fieldValue": "ATS_W_SMBL" if is_ats else "OTC_W_SMBL",
+            "fieldValue": _summary_type(is_ats),
         },
     ]
+    request: dict = {"compareFilters": filters}
 
-    if symbol:
+    if symbols and len(symbols) == 1:
         filters.append(
             {
                 "compareType": "EQUAL",
                 "fieldName": "issueSymbolIdentifier",
-                "fieldValue": symbol,
+                "fieldValue": symbols[0],
             }
         )
+    elif symbols:
+        # Several symbols are batched in one request with an IN filter.
+        request["domainFilters"] = [
+            {"fieldName": "issueSymbolIdentifier", "values": symbols}
+        ]
+
+    request.update(
+        {
+            "delimiter": "|",
+            "fields": [
+                "issueSymbolIdentifier",
+                "totalWeeklyShareQuantity",
+                "totalWeeklyTradeCount",
+                "lastUpdateDate",
+            ],
+            "limit": 5000,
+            "quoteValues": False,
+            "sortFields": ["totalWeeklyShareQuantity"],
+        }
+    )
+
+    return request
+
+
+def get_finra_weeks(tier: str = "T1", is_ats: bool = True):
+    """Fetch the available weeks from FINRA that can be used."""
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.provider.utils.helpers import make_request
+
+    request_header = {"Accept": "application/json", "Content-Type": "application/json"}
+
+    response = make_request(
+        method="POST",
+        url=f"{FINRA_API_URL}/weeklyDownloadDetails",
+        headers=request_header,
+        json=_weeks_request(tier, is_ats),
+        timeout=3,
+    )
+
+    return response.json() if response.status_code == 200 else []
+
+
+def get_finra_data(symbol, week_start, tier: str = "T1", is_ats: bool = True):
+    """Get the data for a symbol from FINRA."""
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.provider.utils.helpers import make_request
 
-    req_data = {
-        "compareFilters": filters,
-        "delimiter": "|",
-        "fields": [
-            "issueSymbolIdentifier",
-            "totalWeeklyShareQuantity",
-            "totalWeeklyTradeCount",
-            "lastUpdateDate",
-        ],
-        "limit": 5000,
-        "quoteValues": False,
-        "sortFields": ["totalWeeklyShareQuantity"],
-    }
     response = make_request(
-        url="https://api.finra.org/data/group/otcMarket/name/weeklySummary",
+        url=f"{FINRA_API_URL}/weeklySummary",
         method="POST",
-        headers=req_hdr,
-        json=req_data,
+        headers=FINRA_HEADERS,
+        json=_weekly_summary_request(
+            [symbol] if symbol else None, week_start, tier, is_ats
+        ),
         timeout=20,
     )
     return response
 
 
+async def _json_response(response, _) -> list:
+    """Return the JSON body of a response, raising if the request failed.
+
+    A successful response without content is an empty list.
+    """
+    response.raise_for_status()
+    if response.status == 204:
+        return []
+    return await response.json(content_type=None) or []
+
+
+async def aget_finra_weeks(
+    tier: str = "T1", is_ats: bool = True, session=None
+) -> list[dict]:
+    """Fetch the available weeks from FINRA, asynchronously."""
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.provider.utils.helpers import amake_request
+
+    return await amake_request(  # type: ignore[return-value]
+        f"{FINRA_API_URL}/weeklyDownloadDetails",
+        method="POST",
+        headers=FINRA_HEADERS,
+        json=_weeks_request(tier, is_ats),
+        timeout=10,
+        response_callback=_json_response,
+        **({"session": session} if session else {}),
+    )
+
+
+async def aget_finra_data(
+    symbols: list[str] | None,
+    week_start: str,
+    tier: str = "T1",
+    is_ats: bool = True,
+    session=None,
+) -> list[dict]:
+    """Get the weekly summary of one or more symbols from FINRA, asynchronously."""
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.provider.utils.helpers import amake_request
+
+    return await amake_request(  # type: ignore[return-value]
+        f"{FINRA_API_URL}/weeklySummary",
+        method="POST",
+        headers=FINRA_HEADERS,
+        json=_weekly_summary_request(symbols, week_start, tier, is_ats),
+        timeout=20,
+        response_callback=_json_response,
+        **({"session": session} if session else {}),
+    )
+
+
+async def aget_full_data(
+    symbol: str | None,
+    tier: str = "T1",
+    is_ats: bool = True,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> list[dict]:
+    """Get the weekly data of one or more comma-separated symbols from FINRA.
+
+    The weeks are requested concurrently over one session, with all the
+    symbols batched in each request. Published weeks never change, so all
+    but the most recent one are kept in the shared cache on disk. A week whose
+    request fails is left out of the results, with a warning, and not cached.
+
+    Parameters
+    ----------
+    symbol : str | None
+        Symbol, or comma-separated symbols. None gets the first row of each week.
+    tier : str
+        The tier of the securities, by default "T1".
+    is_ats : bool
+        ATS data if True, non-ATS otherwise.
+    max_concurrency : int
+        Maximum number of weeks requested at once.
+
+    Returns
+    -------
+    list[dict]
+        The weekly records, from the most recent week.
+    """
+    # pylint: disable=import-outside-toplevel
+    import asyncio  # noqa
+    import warnings
+    from openbb_core.app.model.abstract.warning import OpenBBWarning
+    from openbb_core.provider.utils.helpers import get_async_requests_session  # noqa
+    from openbb_core.provider.utils.shared_cache import get_shared_cache  # noqa
+
+    symbols = (
+        [s.strip().upper() for s in symbol.split(",") if s.strip()] if symbol else []
+    )
+    cache = get_shared_cache(WEEKLY_CACHE_NAMESPACE)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    session = await get_async_requests_session()
+
+    failed: list[str] = []
+
+    def cache_key(week: str, key: str) -> str:
+        return f"{tier}:{_summary_type(is_ats)}:{week}:{key}"
+
+    async def get_week(week: str, is_final: bool) -> list[dict]:
+        keys = symbols or [""]
+        cached = {k: cache.get(cache_key(week, k)) for k in keys} if is_final else {}
+        missing = [k for k in keys if cached.get(k) is None]
+
+        if missing:
+            try:
+                async with semaphore:
+                    rows = await aget_finra_data(
+                        [k for k in missing if k] or None, week, tier, is_ats, session
+                    )
+            except Exception:  # pylint: disable=broad-except
+                # Nothing is cached, so the week is requested again next time.
+                failed.append(week)
+            else:
+                # Keep the first row of each symbol, or of the week without symbols.
+                by_symbol: dict[str, list] = {k: [] for k in missing}
+                for row in rows:
+                    key = row.get("issueSymbolIdentifier", "") if symbols else ""
+                    if key in by_symbol and not by_symbol[key]:
+                        by_symbol[key].append(row)
+                for key, value in by_symbol.items():
+                    cached[key] = value
+                    if is_final:
+                        cache.set(cache_key(week, key), value)
+
+        return [row for k in keys for row in cached.get(k) or []]
+
+    try:
+        weeks = [
+            week["weekStartDate"]
+            for week in await aget_finra_weeks(tier, is_ats, session)
+        ]
+        # The most recent week may still be revised; earlier weeks are final.
+        results = await asyncio.gather(
+            *[get_week(week, i > 0) for i, week in enumerate(weeks)]
+        )
+    finally:
+        await session.close()
+
+    if failed:
+        warnings.warn(
+            f"FINRA data could not be retrieved for the weeks of {', '.join(failed)}.",
+            category=OpenBBWarning,
+        )
+
+    return [row for week_rows in results for row in week_rows]
+
+
 def get_full_data(symbol, tier: str = "T1", is_ats: bool = True):
     """Get the full data for a symbol from FINRA."""
-    weeks = [week["weekStartDate"] for week in get_finra_weeks(tier, is_ats)]
-
-    data = []
-    for week in weeks:
-        response = get_finra_data(symbol, week, tier, is_ats)
-        r_json = response.json()
-        if response.status_code == 200 and r_json:
-            data.append(response.json()[0])
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.provider.utils.helpers import run_async
 
-    return data
+    return run_async(aget_full_data, symbol, tier, is_ats)
 
 
 def get_adjusted_date(year, month, day):
@@ -169,47 +169,76 @@ def get_interval(value: str) -> str:
     return f"{value[:-1]}{intervals[value[-1]]}"
 
 
+# FMP endpoint of each interval.
+HISTORICAL_INTERVALS = {
+    "1m": "1min",
+    "5m": "5min",
+    "15m": "15min",
+    "30m": "30min",
+    "1h": "1hour",
+    "4h": "4hour",
+}
+# Maximum number of days requested at once for each interval. Longer ranges
+# are downloaded in windows, concurrently.
+HISTORICAL_WINDOWS = {
+    "1m": 3,
+    "5m": 15,
+    "15m": 45,
+    "30m": 90,
+    "1h": 180,
+    "4h": 365,
+    "1d": 1825,
+}
+
+
 async def get_historical_ohlc(query, credentials, **kwargs: Any) -> list[dict]:
-    """Return the raw data from the FMP endpoint."""
+    """Return the raw data from the FMP endpoint.
+
+    Long ranges are split into windows, according to `HISTORICAL_WINDOWS`,
+    which are requested concurrently for all the symbols.
+    """
     # pylint: disable=import-outside-toplevel
-    import asyncio  # noqa
-    from openbb_core.provider.utils.helpers import (
-        amake_request,
-    )
+    from openbb_core.provider.utils.helpers import amake_request
+    from openbb_core.provider.utils.historical import download_history
     from warnings import warn
 
     api_key = credentials.get("fmp_api_key") if credentials else ""
 
     base_url = "https://financialmodelingprep.com/stable/"
+    adjustment = getattr(query, "adjustment", None)
 
-    if hasattr(query, "adjustment") and query.adjustment == "unadjusted":
+    if adjustment == "unadjusted":
         base_url += "historical-price-eod/non-split-adjusted?"
-    elif hasattr(query, "adjustment") and query.adjustment == "splits_and_dividends":
+    elif adjustment == "splits_and_dividends":
         base_url += "historical-price-eod/dividend-adjusted?"
     elif query.interval == "1d":
         base_url += "historical-price-eod/full?"
-    elif query.interval == "1m":
-        base_url += "historical-chart/1min?"
-    elif query.interval == "5m":
-        base_url += "historical-chart/5min?"
-    elif query.interval in ["60m", "1h"]:
-        query.interval = "60m"
-        base_url += "historical-chart/1hour?"
+    else:
+        base_url += f"historical-chart/{HISTORICAL_INTERVALS[query.interval]}?"
 
     query_str = get_querystring(
-        query.model_dump(), ["symbol", "adjustment", "interval"]
+        query.model_dump(), ["symbol", "adjustment", "interval", "from", "to"]
     )
     symbols = query.symbol.split(",")
-
-    results: list = []
+    window = (
+        HISTORICAL_WINDOWS["1d"]
+        if adjustment in ("unadjusted", "splits_and_dividends")
+        else HISTORICAL_WINDOWS.get(query.interval)
+    )
+    request_kwargs = {k: v for k, v in kwargs.items() if k != "session"}
     messages: list = []
 
-    async def get_one(symbol):
-        """Get data for one symbol."""
-        url = f"{base_url}symbol={symbol}&{query_str}&apikey={api_key}"
-        data: list = []
+    async def get_window(symbol, start_date, end_date, session):
+        """Get the data of one symbol in one window."""
+        dates = "&".join(
+            f"{param}={value}"
+            for param, value in (("from", start_date), ("to", end_date))
+            if value is not None
+        )
+        params = "&".join(p for p in (dates, query_str) if p)
+        url = f"{base_url}symbol={symbol}&{params}&apikey={api_key}"
         response = await amake_request(
-            url, response_callback=response_callback, **kwargs
+            url, response_callback=response_callback, session=session, **request_kwargs
         )
 
         if isinstance(response, dict) and response.get("Error Message"):
@@ -219,30 +248,35 @@ async def get_historical_ohlc(query, credentials, **kwargs: Any) -> list[dict]:
             warn(message)
             messages.append(message)
 
-        if isinstance(response, list) and len(response) > 0:
-            data = response
+        if isinstance(response, list):
+            return response
 
-        elif isinstance(response, dict) and response.get("historical"):
-            data = response.get("historical", [])
+        if isinstance(response, dict):
+            return response.get("historical", [])
 
-        if not data:
+        return []
+
+    bars = await download_history(
+        symbols,
+        query.start_date,
+        query.end_date,
+        get_window,
+        window,
+        **kwargs,
+    )
+
+    for symbol in symbols:
+        if not bars.counts.get(symbol):
             message = f"No data found for {symbol}."
             warn(message)
             messages.append(message)
 
-        elif data:
-            for d in data:
-                d["symbol"] = symbol
-                results.append(d)
-
-    await asyncio.gather(*[get_one(symbol) for symbol in symbols])
-
-    if not results:
+    if not bars:
         raise EmptyDataError(
             f"{str(','.join(messages)).replace(',', ' ') if messages else 'No data found'}"
         )
 
-    return results
+    return bars.to_records()
 
 
 @lru_cache(maxsize=1)
@@ -5,6 +5,7 @@ from datetime import date
 
 import pytest
 from openbb_core.app.service.user_service import UserService
+from openbb_core.provider.utils.rate_limiter import rate_limits_disabled
 from openbb_fmp.models.analyst_estimates import FMPAnalystEstimatesFetcher
 from openbb_fmp.models.available_indices import FMPAvailableIndicesFetcher
 from openbb_fmp.models.balance_sheet import FMPBalanceSheetFetcher
@@ -102,6 +103,13 @@ def vcr_config():
     }
 
 
+@pytest.fixture(autouse=True, scope="module")
+def no_rate_limits():
+    """Replay the recorded responses without rate limiting or backoff."""
+    with rate_limits_disabled():
+        yield
+
+
 @pytest.mark.record_http
 def test_fmp_company_filings_fetcher(credentials=test_credentials):
     """Test FMP company filings fetcher."""
@@ -1,6 +1,7 @@
 """FRED provider module."""
 
 from openbb_core.provider.abstract.provider import Provider
+from openbb_core.provider.utils.rate_limiter import RateLimit
 from openbb_fred.models.ameribor import FredAmeriborFetcher
 from openbb_fred.models.balance_of_payments import FredBalanceOfPaymentsFetcher
 from openbb_fred.models.bond_indices import FredBondIndicesFetcher
@@ -104,4 +105,5 @@ Research division of the Federal Reserve Bank of St. Louis that has more than
     repr_name="Federal Reserve Economic Data | St. Louis FED (FRED)",
     deprecated_credentials={"API_FRED_KEY": "fred_api_key"},
     instructions='Go to: https://fred.stlouisfed.org\n\n![FRED](https://user-images.githubusercontent.com/46355364/207827137-d143ba4c-72cb-467d-a7f4-5cc27c597aec.png)\n\nClick on, "My Account", create a new account or sign in with Google:\n\n![FRED](https://user-images.githubusercontent.com/46355364/207827011-65cdd501-27e3-436f-bd9d-b0d8381d46a7.png)\n\nAfter completing the sign-up, go to "My Account", and select "API Keys". Then, click on, "Request API Key".\n\n![FRED](https://user-images.githubusercontent.com/46355364/207827577-c869f989-4ef4-4949-ab57-6f3931f2ae9d.png)\n\nFill in the box for information about the use-case for FRED, and by clicking, "Request API key", at the bottom of the page, the API key will be issued.\n\n![FRED](https://user-images.githubusercontent.com/46355364/207828032-0a32d3b8-1378-4db2-9064-aa1eb2111632.png)',  # noqa: E501  pylint: disable=line-too-long
+    rate_limit=RateLimit.per_minute(120, hosts=["stlouisfed.org"]),
 )
@@ -2,6 +2,7 @@
 
 # pylint: disable=unused-argument
 
+from datetime import date as dateType
 from typing import Any, Literal
 
 from openbb_core.app.model.abstract.error import OpenBBError
@@ -90,6 +91,15 @@ class FredSeriesQueryParams(SeriesQueryParams):
     log = Natural Log""",
     )
     limit: int = Field(description=QUERY_DESCRIPTIONS.get("limit", ""), default=100000)
+    realtime_start: dateType | None = Field(
+        default=None,
+        description="The start of the real-time period, for ALFRED vintage data."
+        + " Past vintages are stored locally once downloaded.",
+    )
+    realtime_end: dateType | None = Field(
+        default=None,
+        description="The end of the real-time period, for ALFRED vintage data.",
+    )
 
 
 class FredSeriesData(SeriesData):
@@ -117,101 +127,46 @@ class FredSeriesFetcher(
     ) -> list[dict]:
         """Extract data."""
         # pylint: disable=import-outside-toplevel
-        from openbb_core.provider.utils.helpers import (
-            ClientResponse,
-            ClientSession,
-            amake_requests,
-            get_querystring,
-        )
-        from pandas import DataFrame
+        from openbb_core.provider.utils.helpers import get_querystring
+        from openbb_fred.utils.fred_batch import fetch_series_batch
 
         api_key = credentials.get("fred_api_key") if credentials else ""
-
-        base_url = "https://api.stlouisfed.org/fred/series/observations"
-        metadata_url = "https://api.stlouisfed.org/fred/series"
-
-        querystring = get_querystring(query.model_dump(), ["series_id"])
+        params = query.model_dump()
+        querystring = get_querystring(dict(params), ["series_id"])
         series_ids = query.symbol.split(",") if "," in query.symbol else [query.symbol]
 
-        urls = [
-            f"{base_url}?series_id={series_id}&{querystring}&file_type=json&api_key={api_key}"
-            for series_id in series_ids
-        ]
-
-        async def callback(response: ClientResponse, session: ClientSession) -> dict:
-            observations_response = await response.json()
-            series_id = response.url.query.get("series_id")
-
-            metadata_response = await session.get_json(
-                f"{metadata_url}?series_id={series_id}&file_type=json&api_key={api_key}",
-                timeout=5,
-            )
-
-            # seriess is not a typo, it's the actual key in the response
-            _metadata = (
-                metadata_response.get("seriess", [{}])[0]
-                if isinstance(metadata_response, dict)
-                else {}
-            ) or {}
-            observations = (
-                observations_response.get("observations")
-                if isinstance(observations_response, dict)
-                else []
-            ) or []
-            try:
-                for d in observations:
-                    d.pop("realtime_start")
-                    d.pop("realtime_end")
-
-                data = (
-                    DataFrame(observations)
-                    .replace(".", None)
-                    .set_index("date")["value"]
-                    .astype(float)
-                    .dropna()
-                    .to_dict()
-                )
-            except (KeyError, TypeError):
-                return {}
-
-            return {
-                series_id: {
-                    "title": _metadata.get("title"),
-                    "units": _metadata.get("units"),
-                    "frequency": _metadata.get("frequency"),
-                    "seasonal_adjustment": _metadata.get("seasonal_adjustment"),
-                    "notes": _metadata.get("notes"),
-                    "data": data,
-                }
-            }
-
         try:
-            results = await amake_requests(
-                urls, response_callback=callback, timeout=5, **kwargs
+            results = await fetch_series_batch(
+                series_ids, querystring, params, api_key  # type: ignore
             )
-            return results
         except Exception as e:
             raise OpenBBError(e) from e
 
+        return [{series_id: result} for series_id, result in results.items()]
+
     @staticmethod
     def transform_data(
         query: FredSeriesQueryParams, data: list[dict], **kwargs: Any
     ) -> AnnotatedResult[list[FredSeriesData]]:
         """Transform data."""
         # pylint: disable=import-outside-toplevel
-        from pandas import DataFrame  # noqa
+        from pandas import DataFrame, to_datetime  # noqa
         from numpy import nan
 
         series = {_id: s.pop("data", {}) for d in data for _id, s in d.items()}
         metadata = {_id: m for d in data for _id, m in d.items()}
-        records = (
+        frame = (
             DataFrame(series)
-            .filter(items=query.symbol.split(","), axis=1)
+            .filter(items=list(dict.fromkeys(query.symbol.split(","))), axis=1)
             .sort_index()
-            .reset_index()
-            .rename(columns={"index": "date"})
+        )
+        frame.index = to_datetime(frame.index).date
+        records = (
+            frame.reset_index(names="date")
+            .astype(object)
             .replace({nan: None})
             .to_dict("records")
         )
-        validated = [FredSeriesData.model_validate(r) for r in records]
-        return AnnotatedResult(result=validated, metadata=metadata)
+        # The frame is already aligned and typed, so the records are not validated again.
+        results = [FredSeriesData.model_construct(**r) for r in records]
+        return AnnotatedResult(result=results, metadata=metadata)
@@ -0,0 +1,205 @@
+"""Batched requests of FRED and ALFRED series.
+
+Many FRED models request several series at once, and the same series are
+often requested by concurrent queries. This module fetches a batch of series
+with:
+
+    - One request per distinct series and parameters. Concurrent requests
+      for the same observations share one upstream request.
+    - Metadata and observations requested concurrently, throttled by the
+      provider's rate limit of 120 requests per minute.
+    - Series metadata kept in memory for a day, and observations for a
+      minute.
+    - Observations of past vintages, i.e. ALFRED queries with a
+      `realtime_end` before today, kept on disk. They never change, so
+      point-in-time queries are answered locally once downloaded.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import asyncio
+from datetime import date as dateType
+from typing import Any
+
+from openbb_core.provider.utils.lru import ttl_cache
+from openbb_core.provider.utils.reference_data import register_dataset
+
+FRED_API_URL = "https://api.stlouisfed.org/fred"
+# Seconds the metadata of a series is kept.
+METADATA_TTL = 86400
+# Seconds the observations of a series are kept in memory.
+OBSERVATIONS_TTL = 60
+# Namespace of the stored vintages in the shared cache.
+VINTAGE_CACHE = "fred_vintages"
+
+
+async def _load_metadata(series_id: str, api_key: str) -> dict:
+    """Load the metadata of a series."""
+    from openbb_core.provider.utils.helpers import amake_request
+
+    response = await amake_request(
+        f"{FRED_API_URL}/series?series_id={series_id}&file_type=json&api_key={api_key}",
+        timeout=5,
+    )
+    # seriess is not a typo, it's the actual key in the response
+    metadata = (
+        response.get("seriess", [{}])[0] if isinstance(response, dict) else {}
+    ) or {}
+
+    return {
+        "title": metadata.get("title"),
+        "units": metadata.get("units"),
+        "frequency": metadata.get("frequency"),
+        "seasonal_adjustment": metadata.get("seasonal_adjustment"),
+        "notes": metadata.get("notes"),
+    }
+
+
+SERIES_METADATA = register_dataset(
+    "fred_series_metadata", _load_metadata, ttl=METADATA_TTL
+)
+
+
+async def get_metadata(series_id: str, api_key: str) -> dict:
+    """Get the metadata of a series, or empty values if it is unavailable."""
+    try:
+        return dict(await SERIES_METADATA.get(series_id, api_key))
+    except Exception:  # noqa  # pylint: disable=broad-except
+        return dict.fromkeys(
+            ["title", "units", "frequency", "seasonal_adjustment", "notes"]
+        )
+
+
+def is_past_vintage(params: dict) -> bool:
+    """Check if the observations of a query are a closed, past vintage."""
+    realtime_end = params.get("realtime_end")
+    if not realtime_end:
+        return False
+    if isinstance(realtime_end, str):
+        if realtime_end == "9999-12-31":
+            return False
+        realtime_end = dateType.fromisoformat(realtime_end)
+    return realtime_end < dateType.today()
+
+
+def _parse_observations(response: Any) -> dict | None:
+    """Convert an observations response to a {date: value} dictionary.
+
+    Missing values are dropped. Returns None if the response has no observations.
+    """
+    observations = response.get("observations") if isinstance(response, dict) else None
+    if not observations:
+        return None
+    data: dict = {}
+    for observation in observations:
+        value = observation.get("value")
+        if value in (None, "", "."):
+            continue
+        try:
+            data[observation["date"]] = float(value)
+        except (KeyError, TypeError, ValueError):
+            continue
+    return data
+
+
+@ttl_cache(maxsize=512, ttl=OBSERVATIONS_TTL, namespace="fred_observations")
+async def _load_observations(
+    series_id: str, querystring: str, api_key: str, past_vintage: bool
+) -> dict | None:
+    """Load the observations of a series, reading past vintages from disk."""
+    from openbb_core.provider.utils.helpers import amake_request
+    from openbb_core.provider.utils.shared_cache import get_shared_cache
+
+    cache_key = f"{series_id}?{querystring}"
+    cache = get_shared_cache(VINTAGE_CACHE) if past_vintage else None
+    if cache is not None and (cached := cache.get(cache_key)) is not None:
+        return cached
+
+    # The load is shared by concurrent callers, so it opens its own session
+    # rather than one that a cancelled caller would close.
+    response = await amake_request(
+        f"{FRED_API_URL}/series/observations?series_id={series_id}"
+        f"&{querystring}&file_type=json&api_key={api_key}",
+        response_callback=lambda r, _: r.json(),
+        timeout=5,
+    )
+    data = _parse_observations(response)
+    if cache is not None and data is not None:
+        cache.set(cache_key, data)
+    return data
+
+
+async def get_observations(
+    series_id: str, querystring: str, params: dict, api_key: str
+) -> dict | None:
+    """Get the observations of a series as a {date: value} dictionary.
+
+    Parameters
+    ----------
+    series_id : str
+        The FRED series ID.
+    querystring : str
+        The query parameters of the observations endpoint, without the series ID.
+    params : dict
+        The same parameters, used to check if the query is a past vintage.
+    api_key : str
+        The FRED API key.
+
+    Returns
+    -------
+    dict | None
+        The observations, or None if the series has none.
+    """
+    return await _load_observations(
+        series_id, querystring, api_key, is_past_vintage(params)
+    )
+
+
+async def fetch_series_batch(
+    series_ids: list[str], querystring: str, params: dict, api_key: str
+) -> dict[str, dict]:
+    """Fetch the metadata and observations of several series, concurrently.
+
+    Parameters
+    ----------
+    series_ids : list[str]
+        The FRED series IDs. Duplicates are requested once.
+    querystring : str
+        The query parameters of the observations endpoint, without the series ID.
+    params : dict
+        The same parameters, used to check if the query is a past vintage.
+    api_key : str
+        The FRED API key.
+
+    Returns
+    -------
+    dict[str, dict]
+        The metadata of each series with observations, and its observations
+        as a {date: value} dictionary under the `data` key.
+    """
+    from openbb_core.provider.utils.errors import UnauthorizedError
+
+    unique_ids = list(dict.fromkeys(series_ids))
+
+    metadata, observations = await asyncio.gather(
+        asyncio.gather(*[get_metadata(s, api_key) for s in unique_ids]),
+        asyncio.gather(
+            *[get_observations(s, querystring, params, api_key) for s in unique_ids],
+            return_exceptions=True,
+        ),
+    )
+
+    # Like `amake_requests`, a failed series is dropped unless they all failed.
+    exceptions = [e for e in observations if isinstance(e, Exception)]
+    for e in exceptions:
+        if isinstance(e, UnauthorizedError):
+            raise e
+    results = {
+        series_id: {**meta, "data": data}
+        for series_id, meta, data in zip(unique_ids, metadata, observations)
+        if data is not None and not isinstance(data, BaseException)
+    }
+    if exceptions and not results:
+        raise exceptions[0]
+
+    return results
@@ -0,0 +1,149 @@
+"""Test the batched requests of FRED series."""
+
+import asyncio
+
+import pytest
+from openbb_core.provider.utils import helpers, shared_cache
+from openbb_core.provider.utils.errors import UnauthorizedError
+from openbb_core.provider.utils.shared_cache import SharedCache
+from openbb_fred.utils import fred_batch
+from openbb_fred.utils.fred_batch import fetch_series_batch
+
+# pylint: disable=redefined-outer-name
+
+LIVE = "observation_start=2024-01-01"
+VINTAGE = "realtime_end=2020-01-01"
+
+
+class Upstream:
+    """FRED API replaying one observation per series, recording its requests."""
+
+    def __init__(self):
+        """Initialize the requests."""
+        self.requests: list = []
+        self.delay = 0.0
+        self.errors: dict = {}
+
+    async def __call__(self, url: str, **kwargs) -> dict:
+        """Return the metadata or the observations of a series."""
+        series_id = url.split("series_id=")[1].split("&")[0]
+        endpoint = "observations" if "/observations" in url else "series"
+        self.requests.append((endpoint, series_id))
+        await asyncio.sleep(self.delay)
+        if series_id in self.errors:
+            raise self.errors[series_id]
+        if endpoint == "series":
+            return {"seriess": [{"title": f"{series_id} title"}]}
+        return {
+            "observations": [
+                {"date": "2024-01-01", "value": "1.5"},
+                {"date": "2024-02-01", "value": "."},
+            ]
+        }
+
+    def count(self, endpoint: str) -> int:
+        """Count the requests to an endpoint."""
+        return sum(1 for e, _ in self.requests if e == endpoint)
+
+
+@pytest.fixture
+def upstream(tmp_path, monkeypatch):
+    """Replace the FRED API and the shared cache, and clear the caches."""
+    fake = Upstream()
+    vintages = SharedCache(fred_batch.VINTAGE_CACHE, path=tmp_path / "cache.db")
+    monkeypatch.setattr(helpers, "amake_request", fake)
+    monkeypatch.setattr(shared_cache, "get_shared_cache", lambda *args: vintages)
+    fred_batch.SERIES_METADATA.invalidate()
+    fred_batch._load_observations.cache_clear()  # pylint: disable=protected-access
+    fake.vintages = vintages  # type: ignore[attr-defined]
+    yield fake
+    fred_batch.SERIES_METADATA.invalidate()
+    fred_batch._load_observations.cache_clear()  # pylint: disable=protected-access
+
+
+def fetch(series_ids: list, querystring: str = LIVE, params: dict | None = None):
+    """Fetch a batch of series."""
+    return fetch_series_batch(series_ids, querystring, params or {}, "key")
+
+
+def test_batch_requests_each_series_once(upstream):
+    """Test that duplicate series in a batch are requested once."""
+    results = asyncio.run(fetch(["GDP", "CPI", "GDP"]))
+
+    assert list(results) == ["GDP", "CPI"]
+    assert results["GDP"]["title"] == "GDP title"
+    assert results["GDP"]["data"] == {"2024-01-01": 1.5}
+    assert sorted(upstream.requests) == [
+        ("observations", "CPI"),
+        ("observations", "GDP"),
+        ("series", "CPI"),
+        ("series", "GDP"),
+    ]
+
+
+def test_concurrent_batches_share_requests(upstream):
+    """Test that concurrent queries for the same series share the requests."""
+    upstream.delay = 0.05
+
+    async def run():
+        return await asyncio.gather(fetch(["GDP", "CPI"]), fetch(["CPI"]))
+
+    first, second = asyncio.run(run())
+
+    assert first["CPI"] == second["CPI"]
+    assert upstream.count("observations") == 2
+    assert upstream.count("series") == 2
+
+
+def test_cancelled_caller_does_not_fail_the_others(upstream):
+    """Test that a shared request survives the cancellation of a caller."""
+    upstream.delay = 0.05
+
+    async def run():
+        first = asyncio.create_task(fetch(["GDP"]))
+        second = asyncio.create_task(fetch(["GDP"]))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run())["GDP"]["data"] == {"2024-01-01": 1.5}
+    assert upstream.count("observations") == 1
+
+
+def test_past_vintages_are_stored(upstream):
+    """Test that past vintages are read from disk once downloaded."""
+    params = {"realtime_end": "2020-01-01"}
+
+    asyncio.run(fetch(["GDP"], VINTAGE, params))
+    fred_batch._load_observations.cache_clear()  # pylint: disable=protected-access
+    results = asyncio.run(fetch(["GDP"], VINTAGE, params))
+
+    assert results["GDP"]["data"] == {"2024-01-01": 1.5}
+    assert upstream.count("observations") == 1
+    assert upstream.vintages.get(f"GDP?{VINTAGE}") == {"2024-01-01": 1.5}
+
+
+def test_current_observations_are_not_stored(upstream):
+    """Test that the observations of the current vintage are not kept on disk."""
+    params = {"realtime_end": "9999-12-31"}
+
+    asyncio.run(fetch(["GDP"], LIVE, params))
+    fred_batch._load_observations.cache_clear()  # pylint: disable=protected-access
+    asyncio.run(fetch(["GDP"], LIVE, params))
+
+    assert upstream.count("observations") == 2
+    assert upstream.vintages.get(f"GDP?{LIVE}") is None
+
+
+def test_failed_series_are_dropped(upstream):
+    """Test that a failed series is dropped, unless every series failed."""
+    upstream.errors["CPI"] = ValueError("Bad series.")
+
+    assert list(asyncio.run(fetch(["GDP", "CPI"]))) == ["GDP"]
+    with pytest.raises(ValueError, match="Bad series."):
+        asyncio.run(fetch(["CPI"]))
+
+    upstream.errors["GDP"] = UnauthorizedError("Invalid API key.")
+    fred_batch._load_observations.cache_clear()  # pylint: disable=protected-access
+    with pytest.raises(UnauthorizedError):
+        asyncio.run(fetch(["GDP"]))
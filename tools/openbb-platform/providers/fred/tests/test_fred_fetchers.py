@@ -4,6 +4,7 @@ import datetime
 
 import pytest
 from openbb_core.app.service.user_service import UserService
+from openbb_core.provider.utils.rate_limiter import rate_limits_disabled
 from openbb_fred.models.ameribor import FredAmeriborFetcher
 from openbb_fred.models.balance_of_payments import FredBalanceOfPaymentsFetcher
 from openbb_fred.models.bond_indices import FredBondIndicesFetcher
@@ -75,6 +76,13 @@ def vcr_config():
     }
 
 
+@pytest.fixture(autouse=True, scope="module")
+def no_rate_limits():
+    """Replay the recorded responses without rate limiting or backoff."""
+    with rate_limits_disabled():
+        yield
+
+
 @pytest.mark.record_http
 def test_fredcpi_fetcher(credentials=test_credentials):
     """Test FREDConsumerPriceIndexFetcher."""
@@ -152,6 +152,7 @@ class GovernmentUsCommodityPsdDataQueryParams(CommodityPsdDataQueryParams):
     commodity: str | None = Field(
         default=None,
         description="Commodity name to filter the data. If provided, retrieves time series data for the given commodity. "
+        + "Multiple comma separated commodities are fetched concurrently. "
         + "Supplying both 'report_id' and 'commodity' will prioritize 'commodity' for time series data. "
         + "Valid commodities are:\n    "
         + ", ".join(sorted(list(COMMODITIES)))
@@ -211,12 +212,18 @@ class GovernmentUsCommodityPsdDataQueryParams(CommodityPsdDataQueryParams):
         """Validate commodity."""
         if not v:
             return None
-        if v and v not in COMMODITIES:
+        commodities = (
+            [c.strip() for c in v.split(",")]
+            if isinstance(v, str)
+            else [c.strip() for item in v for c in str(item).split(",")]
+        )
+        invalid = [c for c in commodities if c not in COMMODITIES]
+        if invalid:
             raise ValueError(
-                f"Invalid commodity '{v}'. Valid commodities are: "
+                f"Invalid commodity '{', '.join(invalid)}'. Valid commodities are: "
                 + ", ".join(sorted(list(COMMODITIES)))
             )
-        return v
+        return ",".join(commodities)
 
     @field_validator("attribute", mode="before", check_fields=False)
     @classmethod
@@ -370,7 +377,7 @@ class GovernmentUsCommodityPsdDataFetcher(
         if query.commodity is not None:
             # Time series data
             try:
-                timeseries_data = get_timeseries(
+                timeseries_data = await get_timeseries(
                     commodity=query.commodity,
                     attribute=query.attribute,
                     country=query.country,
@@ -29,6 +29,11 @@ class GovernmentUsWeatherBulletinDownloadData(WeatherBulletinDownloadData):
     """US Government Weather Bulletin Download Data."""
 
     data_format: dict[str, str] = Field(description="Data format information.")
+    sha256: str | None = Field(
+        default=None,
+        description="SHA-256 digest of the document."
+        + " The API streams the raw file from `/blobs/{sha256}`.",
+    )
 
 
 class GovernmentUsWeatherBulletinDownloadFetcher(
@@ -51,12 +56,12 @@ class GovernmentUsWeatherBulletinDownloadFetcher(
         query: GovernmentUsWeatherBulletinDownloadQueryParams,
         credentials: dict[str, Any] | None,
         **kwargs: Any,
-    ) -> dict:
-        """Extract the raw PDF content."""
+    ) -> list:
+        """Download the PDF documents, concurrently, through the blob cache."""
         # pylint: disable=import-outside-toplevel
+        from openbb_core.provider.utils.blob_cache import fetch_blobs
         from openbb_core.provider.utils.helpers import get_async_requests_session
 
-        results: dict = {}
         urls = query.urls
 
         # Verify that all URLs are going to be valid USDA URLs
@@ -77,44 +82,22 @@ class GovernmentUsWeatherBulletinDownloadFetcher(
         try:
             async with await get_async_requests_session() as session:
                 session._max_field_size = 32768  # pylint: disable=protected-access
-
-                for url in urls:
-                    async with await session.get(url) as response:
-                        if response.status != 200:
-                            raise OpenBBError(
-                                ValueError(
-                                    f"Failed to download document from {url}. Status code: {response.status}"
-                                )
-                            )
-                        content_bytes = await response.read()
-                        results[url] = content_bytes
-
-            return results
+                return await fetch_blobs(urls, session=session)
         except Exception as e:
             raise OpenBBError(e) from e
 
     @staticmethod
     def transform_data(
         query: GovernmentUsWeatherBulletinDownloadQueryParams,
-        data: dict,
+        data: list,
         **kwargs: Any,
     ) -> list[GovernmentUsWeatherBulletinDownloadData]:
-        """Transform the raw PDF content into the data model."""
-        # pylint: disable=import-outside-toplevel
-        import base64
-
-        output: list[GovernmentUsWeatherBulletinDownloadData] = []
-
-        for url, content in data.items():
-            content_b64 = base64.b64encode(content).decode("utf-8")
-            data_format = {
-                "data_type": "pdf",
-                "filename": url.split("/")[-1],
-            }
-            bulletin_data = GovernmentUsWeatherBulletinDownloadData(
-                content=content_b64,
-                data_format=data_format,
+        """Transform the downloaded documents into the data model."""
+        return [
+            GovernmentUsWeatherBulletinDownloadData(
+                content=blob.to_base64(),
+                data_format={"data_type": "pdf", "filename": blob.filename},
+                sha256=blob.sha256,
             )
-            output.append(bulletin_data)
-
-        return output
+            for blob in data
+        ]
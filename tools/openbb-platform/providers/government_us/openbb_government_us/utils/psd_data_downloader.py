@@ -2,6 +2,7 @@
 
 from typing import Literal
 
+from openbb_core.provider.utils.reference_data import register_dataset
 from openbb_government_us.utils.psd_codes import (
     ATTRIBUTES,
     COMMODITIES,
@@ -145,172 +146,152 @@ async def get_psd_report_data(report_id: int) -> dict:
     return parse_report(template_id, lines, html)
 
 
-def _get_commodity_attributes(commodity_code: str) -> list[str]:
-    """Fetch valid attribute names for a commodity using the metadata API."""
+PSD_API_URL = "https://apps.fas.usda.gov/PSDOnlineApi/api"
+QUERY_URL = f"{PSD_API_URL}/query/RunQuery"
+# Attributes per query. 20 attributes per request is optimal.
+BATCH_SIZE = 20
+# Market years older than this many years are considered final. USDA revises
+# the estimates of the current and the previous market years.
+FINAL_YEAR_LAG = 3
+# Seconds the results of final market years and the code tables are kept.
+FINAL_YEARS_TTL = 30 * 86400
+CODE_TABLES_TTL = 7 * 86400
+
+
+async def _get_json(url: str):
+    """Request a PSD metadata endpoint."""
     # pylint: disable=import-outside-toplevel
-    from openbb_core.provider.utils.helpers import make_request
+    from openbb_core.provider.utils.helpers import amake_request
 
-    try:
-        resp = make_request(
-            f"https://apps.fas.usda.gov/PSDOnlineApi/api/query/GetMultiCommodityAttributes?commodityCodes={commodity_code},"
-        )
-        if resp.status_code == 200:
-            data = resp.json()
-            id_to_key = {v: k for k, v in ATTRIBUTES.items()}
-            valid_keys = set()
-
-            for item in data:
-                attr_id = item.get("attributeId")
-                if attr_id and attr_id in id_to_key:
-                    valid_keys.add(id_to_key[attr_id])
-            if valid_keys:
-                return sorted(list(valid_keys))
-    except Exception:  # noqa  # pylint: disable=broad-except
-        pass
-    # Fallback: return all attributes
-    return list(ATTRIBUTES.keys())
+    return await amake_request(url)
 
 
-def _get_commodity_countries(commodity_code: str) -> dict[str, str]:
-    """Fetch valid country names for a commodity using the metadata API.
+async def _load_commodity_attributes(commodity_code: str) -> list[str]:
+    """Load the valid attribute names for a commodity from the metadata API."""
+    data = await _get_json(
+        f"{PSD_API_URL}/query/GetMultiCommodityAttributes?commodityCodes={commodity_code},"
+    )
+    id_to_key = {v: k for k, v in ATTRIBUTES.items()}
+    valid_keys = {
+        id_to_key[item["attributeId"]]
+        for item in data or []
+        if item.get("attributeId") in id_to_key
+    }
+    if not valid_keys:
+        raise ValueError(f"No attributes returned for commodity {commodity_code}.")
 
-    Parameters
-    ----------
-    commodity_code : str
-        Commodity code (e.g., '0440000' for corn)
+    return sorted(valid_keys)
 
-    Returns
-    -------
-    dict[str, str]
-        Mapping of country name -> country code
+
+async def _load_commodity_countries(commodity_code: str) -> dict[str, str]:
+    """Load the valid countries for a commodity from the metadata API.
+
+    Returns a mapping of country name -> country code.
     """
-    # pylint: disable=import-outside-toplevel
-    from openbb_core.provider.utils.helpers import make_request
+    data = await _get_json(
+        f"{PSD_API_URL}/CompositeVisualization/GetCountries?regionCode=R00&commodityCode={commodity_code}"
+    )
+    name_to_code = {}
+    for item in data or []:
+        code = item.get("value")
+        name = item.get("text", "").strip()
+        if code and name and code != "00":  # Skip "All Countries" (00)
+            name_to_code[name] = code
+    if not name_to_code:
+        raise ValueError(f"No countries returned for commodity {commodity_code}.")
+
+    return name_to_code
+
+
+# Code tables of each commodity, shared by all the workers and kept on disk.
+PSD_COMMODITY_ATTRIBUTES = register_dataset(
+    "usda_psd_commodity_attributes",
+    _load_commodity_attributes,
+    ttl=CODE_TABLES_TTL,
+    shared=True,
+)
+PSD_COMMODITY_COUNTRIES = register_dataset(
+    "usda_psd_commodity_countries",
+    _load_commodity_countries,
+    ttl=CODE_TABLES_TTL,
+    shared=True,
+)
 
-    base_url = "https://apps.fas.usda.gov/PSDOnlineApi/api/CompositeVisualization/GetCountries?regionCode=R00&commodityCode="
 
+async def _get_commodity_attributes(commodity_code: str) -> list[str]:
+    """Get valid attribute names for a commodity, or all attributes if unavailable."""
     try:
-        resp = make_request(
-            f"{base_url}{commodity_code}",
-        )
-        if resp.status_code == 200:
-            data = resp.json()
-            name_to_code = {}
-            for item in data:
-                code = item.get("value")
-                name = item.get("text", "").strip()
-                if code and name and code != "00":  # Skip "All Countries" (00)
-                    name_to_code[name] = code
-            if name_to_code:
-                return name_to_code
+        return await PSD_COMMODITY_ATTRIBUTES.get(commodity_code)
     except Exception:  # noqa  # pylint: disable=broad-except
-        pass
-    # Fallback: return empty (will use global COUNTRIES list)
-    return {}
+        return list(ATTRIBUTES.keys())
 
 
-def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
-    commodity: str,
-    attribute: str | list[str] | None = None,
-    country: str | list[str] | None = None,
-    start_year: int | None = None,
-    end_year: int | None = None,
-    aggregate_region: bool = False,
-) -> list:
-    """
-    Get time series for a commodity/attribute using ASYNC parallel requests.
+async def _get_commodity_countries(commodity_code: str) -> dict[str, str]:
+    """Get valid country names for a commodity.
 
     Parameters
     ----------
-    commodity : str
-        Commodity name (e.g., 'cotton', 'wheat', 'corn', 'cattle')
-    attribute : str | list[str] | None
-        Attribute name(s). Can be:
-        - Single string: 'production', 'exports'
-        - Comma-separated: 'production, exports, ending_stocks'
-        - List: ['production', 'exports', 'ending_stocks']
-        If None, returns ALL attributes for this commodity.
-    country : str | list[str] | None
-        Country/region name(s). Can be:
-        - Single string: 'United States', 'Brazil', 'EU', 'world'
-        - Comma-separated: 'US, China, Brazil'
-        - List: ['US', 'China', 'Brazil']
-        If None, returns ALL countries.
-    start_year : int | None
-        First marketing year to include.
-    end_year : int | None
-        Last marketing year to include.
-    aggregate_region : bool, optional
-        If True, also include World + regional aggregates.
-        Default False.
+    commodity_code : str
+        Commodity code (e.g., '0440000' for corn)
 
     Returns
     -------
-    DataFrame
-        Columns: region, country, commodity, attribute, marketing_year, value, unit
-        Sorted by marketing_year, then value descending.
-
-    Examples
-    --------
-    >>> get_timeseries('wheat', 'production')
-    >>> get_timeseries('corn', 'exports', start_year=2020, end_year=2025)
-    >>> get_timeseries('wheat', 'production', country='United States')
-    >>> get_timeseries('wheat', 'production', country=['US', 'China', 'Brazil'])
-    >>> get_timeseries('wheat', 'production', country='US, China, Brazil')
-    >>> get_timeseries('wheat', 'production, exports, ending_stocks')  # Multiple attributes
-    >>> get_timeseries('wheat', ['production', 'exports'])  # List of attributes
-    >>> get_timeseries('wheat', 'production', aggregate_region=True)  # World + regions only
-    >>> get_timeseries('wheat')  # ALL attributes for wheat
+    dict[str, str]
+        Mapping of country name -> country code.
+        Empty if unavailable, in which case the global COUNTRIES list is used.
     """
-    # pylint: disable=import-outside-toplevel
-    import asyncio  # noqa
-    from datetime import datetime
-    from aiohttp import ClientError, ClientSession
-    from openbb_core.app.model.abstract.error import OpenBBError
-    from openbb_core.provider.utils.helpers import get_async_requests_session, run_async
-    from pandas import DataFrame, notna
+    try:
+        return await PSD_COMMODITY_COUNTRIES.get(commodity_code)
+    except Exception:  # noqa  # pylint: disable=broad-except
+        return {}
 
-    QUERY_URL = "https://apps.fas.usda.gov/PSDOnlineApi/api/query/RunQuery"
-    key = commodity.lower().replace(" ", "_").replace("-", "_")
 
-    if key not in COMMODITIES:
-        raise ValueError(
-            f"Unknown commodity: {commodity} -> Valid choices: {list(COMMODITIES.keys())}"
-        )
+def _split_items(value: str | list[str] | None) -> list[str]:
+    """Split a comma-separated string, or a list of them, into items."""
+    if value is None:
+        return []
+    values = [value] if isinstance(value, str) else list(value)
+    return [v.strip() for item in values for v in str(item).split(",") if v.strip()]
 
-    commodity_code = COMMODITIES[key]
-    valid_attrs = _get_commodity_attributes(commodity_code)
-    # Resolve attribute - None means ALL, can be single, list, or comma-separated
+
+def _resolve_attributes(
+    commodity: str, valid_attrs: list[str], attribute: str | list[str] | None
+) -> list[int]:
+    """Resolve the attribute IDs of a query - None means ALL."""
     if attribute is None:
-        attr_ids = [ATTRIBUTES[a] for a in valid_attrs]
-    else:
-        # Normalize to list
-        if isinstance(attribute, str):
-            attr_list = [a.strip() for a in attribute.split(",") if a.strip()]
-        else:
-            attr_list = list(attribute)
-
-        # Validate each attribute
-        attr_ids = []
-        for attr in attr_list:
-            attr_key = attr.lower().replace(" ", "_").replace("-", "_")
-            if attr_key not in ATTRIBUTES:
-                raise ValueError(
-                    f"Unknown attribute: '{attr}' for {commodity}. Valid attributes: {valid_attrs}"
-                )
-            if attr_key not in valid_attrs:
-                raise ValueError(
-                    f"Attribute '{attr}' is not available for {commodity}. Valid attributes: {valid_attrs}"
-                )
-            attr_ids.append(ATTRIBUTES[attr_key])
+        return [ATTRIBUTES[a] for a in valid_attrs]
+
+    attr_ids = []
+    for attr in _split_items(attribute):
+        attr_key = attr.lower().replace(" ", "_").replace("-", "_")
+        if attr_key not in ATTRIBUTES:
+            raise ValueError(
+                f"Unknown attribute: '{attr}' for {commodity}. Valid attributes: {valid_attrs}"
+            )
+        if attr_key not in valid_attrs:
+            raise ValueError(
+                f"Attribute '{attr}' is not available for {commodity}. Valid attributes: {valid_attrs}"
+            )
+        attr_ids.append(ATTRIBUTES[attr_key])
+
+    return attr_ids
 
-    # Resolve country/region - None means ALL
-    # Accepts: lower_snake_case ("united_states"), codes ("US", "R05"), list, comma-separated, or None for all
+
+def _resolve_countries(  # pylint: disable=R0912  # noqa: PLR0912
+    commodity: str,
+    valid_countries_map: dict[str, str],
+    country: str | list[str] | None,
+    aggregate_region: bool,
+) -> list[str]:
+    """Resolve the country and region codes of a query - None means ALL.
+
+    Accepts: lower_snake_case ("united_states"), codes ("US", "R05"), list,
+    comma-separated, or None for all.
+    """
     selected_region_codes: list[str] = []  # Track selected regions
     selected_country_codes: list[str] = []  # Track selected countries
-    valid_countries_map = _get_commodity_countries(commodity_code)
     valid_country_codes = set(valid_countries_map.values())
-    code_to_key = {}
+    code_to_key: dict = {}
 
     for key, code in COUNTRIES.items():
         if code not in code_to_key:
@@ -325,21 +306,9 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
     if country is None:
         country_codes = list(valid_country_codes) if valid_country_codes else ["ALL"]
     else:
-        country_list = (
-            [c.strip() for c in country.split(",") if c.strip()]
-            if isinstance(country, str)
-            else [
-                c.strip()
-                for c in country[0].split(",")
-                if isinstance(country, list)
-                and len(country) == 1
-                and isinstance(c, str)
-                and c.strip()
-            ]
-        )
         country_codes = []
 
-        for c in country_list:
+        for c in _split_items(country):
             country_key = c.lower().replace(" ", "_").replace("-", "_")
             # Check if it's a region code (R00, R01, etc.)
             if c.upper() in REGION_DISPLAY:
@@ -354,20 +323,11 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
             elif country_key == "eu":
                 selected_region_codes.append("R05")
                 country_codes.append("R05")
-            # Check if it's a country code
-            elif c.upper() in COUNTRY_TO_REGION:
-                code = c.upper()
-                # Validate against commodity-specific countries
-                if valid_country_codes and code not in valid_country_codes:
-                    valid_keys = get_valid_country_keys()
-                    raise ValueError(
-                        f"Country '{c}' is not available for {commodity}. Valid countries: {valid_keys}"
-                    )
-                selected_country_codes.append(code)
-                country_codes.append(code)
-            # Check if it's a country name (snake_case)
-            elif country_key in COUNTRIES:
-                code = COUNTRIES[country_key]
+            # Check if it's a country code, or a country name (snake_case)
+            elif c.upper() in COUNTRY_TO_REGION or country_key in COUNTRIES:
+                code = (
+                    c.upper() if c.upper() in COUNTRY_TO_REGION else COUNTRIES[country_key]
+                )
                 # Validate against commodity-specific countries
                 if valid_country_codes and code not in valid_country_codes:
                     valid_keys = get_valid_country_keys()
@@ -387,178 +347,359 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
                     + f"Valid countries: {valid_keys}. Valid regions: {valid_regions}"
                 )
 
-    # If aggregate_region is True, expand appropriately
-    if aggregate_region:
-        if "R00" in selected_region_codes:
-            # "world" selected - fetch all regional aggregates + any specific countries
-            country_codes = (
-                list(REGIONS.values()) + selected_country_codes
-            )  # R00, R01, ... R18 + specific countries
-            country_codes = list(set(country_codes))  # Dedupe
-        elif selected_region_codes:
-            # Specific regions selected - add World + those regions + any countries
-            country_codes = ["R00"] + selected_region_codes + selected_country_codes
-            country_codes = list(set(country_codes))  # Dedupe
-        elif selected_country_codes:
-            # Only countries selected - add World + their regions
-            regions_for_countries = set()
-            for cc in selected_country_codes:
-                if cc in COUNTRY_TO_REGION:
-                    regions_for_countries.add(COUNTRY_TO_REGION[cc])
-            country_codes = (
-                ["R00"] + list(regions_for_countries) + selected_country_codes
-            )
-            country_codes = list(set(country_codes))  # Dedupe
-        elif country is None:
-            region_codes = set(REGIONS.values())
-            # Exclude E4 (EU as country) since we're requesting R05 (EU as region)
-            country_only_codes = [
-                c for c in valid_country_codes if c not in region_codes and c != "E4"
-            ]
-            country_codes = list(REGIONS.values()) + country_only_codes
-            country_codes = list(set(country_codes))
+    if not aggregate_region:
+        return country_codes
+
+    # Expand with the World and regional aggregates.
+    if "R00" in selected_region_codes:
+        # "world" selected - fetch all regional aggregates + any specific countries
+        return list(set(list(REGIONS.values()) + selected_country_codes))
+    if selected_region_codes:
+        # Specific regions selected - add World + those regions + any countries
+        return list(set(["R00"] + selected_region_codes + selected_country_codes))
+    if selected_country_codes:
+        # Only countries selected - add World + their regions
+        regions_for_countries = {
+            COUNTRY_TO_REGION[cc]
+            for cc in selected_country_codes
+            if cc in COUNTRY_TO_REGION
+        }
+        return list(
+            set(["R00"] + list(regions_for_countries) + selected_country_codes)
+        )
+    if country is None:
+        region_codes = set(REGIONS.values())
+        # Exclude E4 (EU as country) since we're requesting R05 (EU as region)
+        country_only_codes = [
+            c for c in valid_country_codes if c not in region_codes and c != "E4"
+        ]
+        return list(set(list(REGIONS.values()) + country_only_codes))
+
+    return country_codes
+
+
+def _query_payload(
+    commodity_code: str, attr_ids: list[int], country_codes: list[str], years: list
+) -> dict:
+    """Build the payload of a RunQuery request."""
+    return {
+        "queryId": 0,
+        "commodityGroupCode": None,
+        "commodities": [commodity_code],
+        "attributes": attr_ids,
+        "countries": country_codes,
+        "marketYears": years,
+        "chkCommoditySummary": False,
+        "chkAttribSummary": False,
+        "chkCountrySummary": False,
+        "commoditySummaryText": "",
+        "attribSummaryText": "",
+        "countrySummaryText": "",
+        "optionColumn": "year",
+        "chkTopCountry": False,
+        "topCountryCount": "",
+        "chkfileFormat": False,
+        "chkPrevMonth": False,
+        "chkMonthChange": False,
+        "chkCodes": False,
+        "chkYearChange": False,
+        "queryName": "",
+        "sortOrder": "Commodity/Attribute/Country",
+        "topCountryState": False,
+    }
+
+
+async def _run_query(session, payload: dict) -> list | None:
+    """Run a query, returning None if it failed."""
+    # pylint: disable=import-outside-toplevel
+    from aiohttp import ClientError  # noqa
+    from openbb_core.app.model.abstract.error import OpenBBError
 
-    # Determine year range
-    current_year = datetime.now().year
-    years = list(range(start_year or 1960, (end_year or current_year + 1) + 1))
+    try:
+        async with await session.post(QUERY_URL, json=payload) as resp:
+            if resp.status != 200:
+                return None
+            data = await resp.json()
+            return data.get("queryResult", [])
+    except ClientError as e:
+        raise OpenBBError(e) from e
+    except Exception:  # noqa  # pylint: disable=broad-except
+        return None
 
-    # Split attrs into batches for parallel fetching (20 attrs per request is optimal)
-    BATCH_SIZE = 20
-    attr_batches = [
-        attr_ids[i : i + BATCH_SIZE] for i in range(0, len(attr_ids), BATCH_SIZE)
-    ]
 
-    async def fetch_batch(session: ClientSession, batch_attrs: list) -> list:
-        """Fetch one batch of attributes."""
-        payload = {
-            "queryId": 0,
-            "commodityGroupCode": None,
-            "commodities": [commodity_code],
-            "attributes": batch_attrs,
-            "countries": country_codes,
-            "marketYears": years,
-            "chkCommoditySummary": False,
-            "chkAttribSummary": False,
-            "chkCountrySummary": False,
-            "commoditySummaryText": "",
-            "attribSummaryText": "",
-            "countrySummaryText": "",
-            "optionColumn": "year",
-            "chkTopCountry": False,
-            "topCountryCount": "",
-            "chkfileFormat": False,
-            "chkPrevMonth": False,
-            "chkMonthChange": False,
-            "chkCodes": False,
-            "chkYearChange": False,
-            "queryName": "",
-            "sortOrder": "Commodity/Attribute/Country",
-            "topCountryState": False,
-        }
-        try:
-            async with await session.post(QUERY_URL, json=payload) as resp:
-                if resp.status != 200:
-                    return []
-                data = await resp.json()
-                return data.get("queryResult", [])
-        except ClientError as e:
-            raise OpenBBError(e) from e
-        except Exception:
+async def _fetch_batch(
+    session, commodity_code: str, attr_ids: list[int], country_codes: list[str], years
+) -> list[list]:
+    """Fetch a batch of attributes, in two parts.
+
+    The final market years are served from the shared cache when possible,
+    and only the recent years, which may still be revised, are requested.
+    """
+    # pylint: disable=import-outside-toplevel
+    import asyncio  # noqa
+    import json
+    from datetime import datetime
+    from openbb_core.provider.utils.shared_cache import get_shared_cache
+
+    last_final_year = datetime.now().year - FINAL_YEAR_LAG
+    final_years = [y for y in years if y <= last_final_year]
+    recent_years = [y for y in years if y > last_final_year]
+    cache = get_shared_cache("usda_psd")
+    cache_key = json.dumps(
+        [commodity_code, sorted(attr_ids), sorted(country_codes), final_years]
+    )
+    cached = cache.get(cache_key) if final_years else None
+
+    async def fetch_final():
+        """Fetch the final years, caching the result."""
+        if not final_years:
+            return []
+        if cached is not None:
+            return cached
+        result = await _run_query(
+            session, _query_payload(commodity_code, attr_ids, country_codes, final_years)
+        )
+        if result is None:
             return []
+        cache.set(cache_key, result, ttl=FINAL_YEARS_TTL)
+        return result
 
-    async def fetch_all_batches():
-        """Fetch all batches concurrently."""
-        async with await get_async_requests_session() as session:
-            tasks = [fetch_batch(session, batch) for batch in attr_batches]
-            results = await asyncio.gather(*tasks)
-            # Flatten results
-            all_results = []
-            for r in results:
-                all_results.extend(r)
-            return all_results
-
-    # Run async fetch
-    result = run_async(fetch_all_batches)
-
-    if not result:
-        raise OpenBBError(
-            "No data available for the given parameters. -> "
-            + f"{commodity} | {attribute} | {country} | {start_year}-{end_year}"
+    async def fetch_recent():
+        """Fetch the recent years."""
+        if not recent_years:
+            return []
+        result = await _run_query(
+            session,
+            _query_payload(commodity_code, attr_ids, country_codes, recent_years),
         )
+        return result or []
 
-    df = DataFrame(result)
+    return list(await asyncio.gather(fetch_final(), fetch_recent()))
 
-    # API only fills commodity/attribute on first row of each group - forward fill
-    df["commodity"] = df["commodity"].ffill()
-    df["attribute"] = df["attribute"].ffill()
+
+def _normalize_rows(  # pylint: disable=R0914
+    responses: list[tuple[str, list]],
+    name_to_code: dict[str, str],
+    aggregate_region: bool,
+):
+    """Convert the query results to a long DataFrame.
+
+    Parameters
+    ----------
+    responses : list[tuple[str, list]]
+        The commodity key and the `queryResult` rows of each response.
+    name_to_code : dict[str, str]
+        Mapping of country name -> country code.
+    aggregate_region : bool
+        Whether the "European Union" rows are regional aggregates.
+
+    Returns
+    -------
+    DataFrame
+        Columns: region, country, commodity, attribute, marketing_year, value, unit
+    """
+    # pylint: disable=import-outside-toplevel
+    from pandas import DataFrame, concat
+
+    columns = ["region", "country", "commodity", "attribute", "marketing_year"]
+    frames = []
+    for key, rows in responses:
+        if not rows:
+            continue
+        frame = DataFrame(rows)
+        # API only fills commodity/attribute on first row of each group - forward fill
+        for column in ("commodity", "attribute"):
+            if column not in frame:
+                frame[column] = None
+            frame[column] = frame[column].ffill()
+        frame["commodity"] = (
+            frame["commodity"].fillna("").replace("", key.replace("_", " ").title())
+        )
+        frames.append(frame)
+
+    if not frames:
+        return DataFrame(columns=[*columns, "value", "unit"])
+
+    df = concat(frames, ignore_index=True)
+    # Skip rows with no country name
+    df = df[df["country"].notna() & (df["country"] != "")]
+    if "unit Description" not in df:
+        df["unit Description"] = ""
 
     # Find year columns (format: 2024/2025)
     year_cols = [c for c in df.columns if "/" in c and c[0:4].isdigit()]
-    name_to_code = {name.strip(): code for name, code in valid_countries_map.items()}
-    # Also add region display names for lookup
-    for region_code, region_name in REGION_DISPLAY.items():
-        name_to_code[region_name] = region_code
+    df_long = df.melt(
+        id_vars=["commodity", "attribute", "country", "unit Description"],
+        value_vars=year_cols,
+        var_name="marketing_year",
+        value_name="value",
+    ).dropna(subset=["value"])
 
     # Build region name lookup (for detecting when "country" is actually a region)
     region_names = {v: k for k, v in REGION_DISPLAY.items()}  # "North America" -> "R01"
+    lookup = {**name_to_code, **region_names}
+
+    def is_region(country_name: str) -> bool:
+        """Check if the country name is actually a region aggregate."""
+        # When aggregate_region=True, "European Union" is always a region aggregate
+        if country_name == "European Union":
+            return aggregate_region
+        # "Other" is a region aggregate, not a country
+        return country_name == "Other" or country_name in region_names
 
     def get_region(country_name: str) -> str:
-        """Check if this is actually a region (excluding EU)"""
-        if country_name in region_names and country_name != "European Union":
-            return country_name  # It's a region name, return as-is
+        """Get the region of a country (excluding EU)."""
         # European Union is treated as a country in the EU region
         if country_name == "European Union":
             return "European Union"
-        code = name_to_code.get(country_name)
+        code = lookup.get(country_name)
         if code and code in COUNTRY_TO_REGION:
             return REGION_DISPLAY.get(COUNTRY_TO_REGION[code], "Other")
         return "Other"
 
-    def is_region(country_name: str) -> bool:
-        """Check if the country name is actually a region aggregate."""
-        # When aggregate_region=True, "European Union" is always a region aggregate
-        if aggregate_region and country_name == "European Union":
-            return True
-        if country_name == "European Union":
-            return False  # EU is a country otherwise
-        # "Other" is a region aggregate, not a country
-        if country_name == "Other":
-            return True
-        return country_name in region_names
-
-    # Melt to long format - include attribute per row from API response
-    rows = []
-    for _, row in df.iterrows():
-        country_name = row["country"]
-        # Skip rows with no country name
-        if not notna(country_name) or not country_name:
-            continue
-        commodity_display = row["commodity"] if row["commodity"] else commodity.title()
-        attr_display = row["attribute"] if row["attribute"] else ""
-        unit = row.get("unit Description", "") or ""
-        for yr_col in year_cols:
-            val = row[yr_col]
-            if notna(val):
-                # If country_name is actually a region, set region=name and country=""
-                if is_region(country_name):
-                    region_val = country_name
-                    country_val = "--"
-                else:
-                    region_val = get_region(country_name)
-                    country_val = country_name
-                rows.append(
-                    {
-                        "region": region_val,
-                        "country": country_val,
-                        "commodity": commodity_display,
-                        "attribute": attr_display,
-                        "marketing_year": yr_col,
-                        "value": val,
-                        "unit": unit.strip().strip("()"),
-                    }
-                )
+    # Map each distinct country name once.
+    names = df_long["country"].unique()
+    regions = {
+        name: name if is_region(name) else get_region(name) for name in names
+    }
+    countries = {name: "--" if is_region(name) else name for name in names}
+
+    df_long["region"] = df_long["country"].map(regions)
+    df_long["country"] = df_long["country"].map(countries)
+    df_long["attribute"] = df_long["attribute"].fillna("")
+    df_long["unit"] = (
+        df_long["unit Description"].fillna("").astype(str).str.strip().str.strip("()")
+    )
+
+    return df_long[[*columns, "value", "unit"]].reset_index(drop=True)
+
+
+async def get_timeseries(  # pylint: disable=R0913,R0914,R0917
+    commodity: str | list[str],
+    attribute: str | list[str] | None = None,
+    country: str | list[str] | None = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    aggregate_region: bool = False,
+) -> list:
+    """
+    Get time series for one or more commodities, with concurrent requests.
+
+    All the attribute batches of all the commodities are requested at once
+    over one session. The results of final market years are cached on disk.
+
+    Parameters
+    ----------
+    commodity : str | list[str]
+        Commodity name(s) (e.g., 'cotton', 'wheat', 'corn', 'cattle').
+        Can be comma-separated or a list.
+    attribute : str | list[str] | None
+        Attribute name(s). Can be:
+        - Single string: 'production', 'exports'
+        - Comma-separated: 'production, exports, ending_stocks'
+        - List: ['production', 'exports', 'ending_stocks']
+        If None, returns ALL attributes for each commodity.
+    country : str | list[str] | None
+        Country/region name(s). Can be:
+        - Single string: 'United States', 'Brazil', 'EU', 'world'
+        - Comma-separated: 'US, China, Brazil'
+        - List: ['US', 'China', 'Brazil']
+        If None, returns ALL countries.
+    start_year : int | None
+        First marketing year to include.
+    end_year : int | None
+        Last marketing year to include.
+    aggregate_region : bool, optional
+        If True, also include World + regional aggregates.
+        Default False.
 
-    df_long = DataFrame(rows)
+    Returns
+    -------
+    list[dict]
+        Records with: region, country, commodity, attribute, marketing_year, value, unit
+        Sorted by commodity, attribute, marketing_year, then value descending.
+
+    Examples
+    --------
+    >>> await get_timeseries('wheat', 'production')
+    >>> await get_timeseries('corn', 'exports', start_year=2020, end_year=2025)
+    >>> await get_timeseries('wheat', 'production', country='US, China, Brazil')
+    >>> await get_timeseries('wheat', ['production', 'exports'])  # List of attributes
+    >>> await get_timeseries('wheat, corn, rice', 'production', country='world', aggregate_region=True)
+    >>> await get_timeseries('wheat')  # ALL attributes for wheat
+    """
+    # pylint: disable=import-outside-toplevel
+    import asyncio  # noqa
+    from datetime import datetime
+    from openbb_core.app.model.abstract.error import OpenBBError
+    from openbb_core.provider.utils.helpers import get_async_requests_session
+
+    keys = []
+    for item in _split_items(commodity):
+        key = item.lower().replace(" ", "_").replace("-", "_")
+        if key not in COMMODITIES:
+            raise ValueError(
+                f"Unknown commodity: {item} -> Valid choices: {list(COMMODITIES.keys())}"
+            )
+        if key not in keys:
+            keys.append(key)
+    if not keys:
+        raise ValueError("At least one commodity is required.")
+
+    codes = [COMMODITIES[key] for key in keys]
+    tables = await asyncio.gather(
+        *[_get_commodity_attributes(code) for code in codes],
+        *[_get_commodity_countries(code) for code in codes],
+    )
+    valid_attrs = tables[: len(codes)]
+    valid_countries = tables[len(codes) :]
+
+    # Determine year range
+    current_year = datetime.now().year
+    years = list(range(start_year or 1960, (end_year or current_year + 1) + 1))
+
+    requests: list[tuple[str, str, list[int], list[str]]] = []
+    for key, code, attrs, countries_map in zip(
+        keys, codes, valid_attrs, valid_countries
+    ):
+        attr_ids = _resolve_attributes(key, attrs, attribute)  # type: ignore
+        country_codes = _resolve_countries(
+            key, countries_map, country, aggregate_region  # type: ignore
+        )
+        # Split attrs into batches for parallel fetching
+        requests.extend(
+            (key, code, attr_ids[i : i + BATCH_SIZE], country_codes)
+            for i in range(0, len(attr_ids), BATCH_SIZE)
+        )
+
+    async with await get_async_requests_session() as session:
+        results = await asyncio.gather(
+            *[
+                _fetch_batch(session, code, batch, country_codes, years)
+                for _, code, batch, country_codes in requests
+            ]
+        )
+
+    responses = [
+        (request[0], rows)
+        for request, parts in zip(requests, results)
+        for rows in parts
+        if rows
+    ]
+
+    if not responses:
+        raise OpenBBError(
+            "No data available for the given parameters. -> "
+            + f"{commodity} | {attribute} | {country} | {start_year}-{end_year}"
+        )
+
+    name_to_code: dict = {}
+    for countries_map in valid_countries:
+        name_to_code.update(
+            {name.strip(): code for name, code in countries_map.items()}  # type: ignore
+        )
+
+    df_long = _normalize_rows(responses, name_to_code, aggregate_region)
 
     if df_long.empty:
         raise OpenBBError(
@@ -568,49 +709,28 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
 
     # Filter by year range (marketing_year is full format like "2024/2025")
     if start_year is not None or end_year is not None:
-        df_long["_year"] = df_long["marketing_year"].str.split("/").str[0].astype(int)
-
-        if start_year is not None:
-            df_long = df_long[df_long["_year"] >= start_year]
-        if end_year is not None:
-            df_long = df_long[df_long["_year"] <= end_year]
-
-        df_long = df_long.drop(columns=["_year"])
-
-    # Reorder columns
-    df_long = df_long[
-        [
-            "region",
-            "country",
-            "commodity",
-            "attribute",
-            "marketing_year",
-            "value",
-            "unit",
-        ]
-    ]
+        year = df_long["marketing_year"].str[:4].astype(int)
+        mask = (year >= (start_year or 0)) & (year <= (end_year or 9999))
+        df_long = df_long[mask]
 
     # Hierarchical sorting: World first, then regions by value, then countries by value
     if not df_long[df_long["country"] == "--"].empty:
+        group = ["commodity", "region", "attribute", "marketing_year"]
         # Get region totals for sorting regions by value (per attribute + year)
         region_totals = (
             df_long[df_long["country"] == "--"]
-            .groupby(["region", "attribute", "marketing_year"])["value"]
+            .groupby(group)["value"]
             .first()
             .reset_index()
+            .rename(columns={"value": "_region_value"})
         )
-        region_totals = region_totals.rename(columns={"value": "_region_value"})
         # Merge region totals for sorting
-        df_long = df_long.merge(
-            region_totals, on=["region", "attribute", "marketing_year"], how="left"
-        )
+        df_long = df_long.merge(region_totals, on=group, how="left")
         # World always sorts first
         df_long.loc[df_long["region"] == "World", "_region_value"] = float("inf")
 
         # Sort: region by value desc, then empty country first (aggregate), then countries by value desc
-        df_long["_is_aggregate"] = (df_long["country"] == "--").astype(
-            int
-        )  # 1 for aggregate, 0 for country
+        df_long["_is_aggregate"] = (df_long["country"] == "--").astype(int)
         df_long = (
             df_long.sort_values(
                 by=[
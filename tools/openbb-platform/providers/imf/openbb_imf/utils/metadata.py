@@ -55,11 +55,53 @@ class ImfMetadata:
             self.hierarchies = {}
             self._hierarchy_to_codelist_map = {}
             self._codelist_to_hierarchies_map = {}
+            self._store = None
             _ = self._load_from_cache()
             self._initialized = True
 
     def _load_from_cache(self) -> bool:
-        """Load metadata from the local cache file."""
+        """Load metadata from the local cache.
+
+        Sections are served lazily from the indexed metadata store, so entries
+        are only deserialized when they are first accessed. If the store can't
+        be opened or built, the pickled snapshot is loaded in full instead.
+        """
+        # pylint: disable=import-outside-toplevel
+        from openbb_imf.utils.metadata_store import LazySection, get_metadata_store
+
+        try:
+            store = get_metadata_store()
+        except Exception as e:
+            warnings.warn(f"Error opening metadata store: {e}", OpenBBWarning)
+            store = None
+
+        if store is None:
+            return self._load_from_snapshot()
+
+        self._store = store
+        self.dataflows = LazySection(store, "dataflows")
+        self.datastructures = LazySection(store, "datastructures")
+        self.conceptschemes = LazySection(store, "conceptschemes")
+        self.dataflow_groups = LazySection(store, "dataflow_groups")
+        self._metadata_cache = LazySection(store, "metadata_cache")
+        self._constraints_cache = LazySection(store, "constraints_cache")
+        self._codelist_cache = LazySection(store, "codelist_cache")
+        self._codelist_descriptions = LazySection(store, "codelist_descriptions")
+        self._dataflow_parameters_cache = LazySection(store, "dataflow_parameters")
+        self._dataflow_indicators_cache = LazySection(store, "dataflow_indicators")
+        self.hierarchies = LazySection(store, "hierarchies")
+        # Lookup maps are precomputed when the store is built.
+        self._hierarchy_to_codelist_map = (
+            store.get("hierarchy_to_codelist_map", "") or {}
+        )
+        self._codelist_to_hierarchies_map = (
+            store.get("codelist_to_hierarchies_map", "") or {}
+        )
+
+        return True
+
+    def _load_from_snapshot(self) -> bool:
+        """Load metadata from the pickled snapshot file."""
         # pylint: disable=import-outside-toplevel
         import gzip
         import pickle
@@ -131,7 +173,20 @@ class ImfMetadata:
                 ValueError(f"Query string is empty or invalid -> '{query}'")
             )
 
-        for dataflow_obj in self.dataflows.values():
+        # The full-text index narrows the scan to matching dataflows when it can.
+        candidate_keys = (
+            self._store.match_dataflows(parsed_query) if self._store else None
+        )
+
+        # Only the candidates are loaded; iterating the keys doesn't load entries.
+        keys = (
+            list(self.dataflows)
+            if candidate_keys is None
+            else [key for key in self.dataflows if key in candidate_keys]
+        )
+
+        for key in keys:
+            dataflow_obj = self.dataflows[key]
             dataflow_id = dataflow_obj.get("id", "").lower()
             dataflow_name = dataflow_obj.get("name", "").lower()
             dataflow_description = dataflow_obj.get("description", "").lower()
@@ -0,0 +1,392 @@
+"""IMF Metadata Store.
+
+The IMF metadata snapshot ships as a gzipped pickle (``assets/imf_cache.pkl.gz``).
+Unpickling it on first use materializes every dataflow, codelist, constraint and
+hierarchy in memory, even when a single indicator is requested.
+
+This module converts the snapshot, once, into an indexed SQLite file where each
+section entry is stored as an individually pickled value.  Entries are loaded
+on demand through `LazySection`, and the file is opened read-only with memory
+mapping so that every worker process shares the same OS page cache instead of
+holding its own copy of the metadata.
+
+The store is built next to the snapshot when the package is bootstrapped:
+
+    python -m openbb_imf.utils.metadata_store
+
+When it is missing at runtime, it is built on first use in the assets folder,
+or in the user cache directory if the package location is not writable.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import pickle  # noqa: S403
+import sqlite3
+import threading
+from collections.abc import Iterator, MutableMapping
+from pathlib import Path
+from typing import Any
+
+ASSETS_PATH = Path(__file__).parent.parent / "assets"
+SNAPSHOT_PATH = ASSETS_PATH / "imf_cache.pkl.gz"
+STORE_FILENAME = "imf_metadata.db"
+STORE_VERSION = 1
+
+# Sections of the snapshot, in the attribute order used by ImfMetadata.
+SECTIONS = (
+    "dataflows",
+    "datastructures",
+    "conceptschemes",
+    "dataflow_groups",
+    "metadata_cache",
+    "constraints_cache",
+    "codelist_cache",
+    "codelist_descriptions",
+    "dataflow_parameters",
+    "dataflow_indicators",
+    "hierarchies",
+)
+# Lookup maps derived from the hierarchies, precomputed at build time.
+DERIVED_SECTIONS = (
+    "hierarchy_to_codelist_map",
+    "codelist_to_hierarchies_map",
+)
+# FTS5 trigram tokens are three characters long; shorter terms can't be matched.
+MIN_FTS_TERM_LENGTH = 3
+# Returned for a missing entry, since None can be a stored value.
+_MISSING = object()
+
+
+def _store_is_current(path: Path) -> bool:
+    """Check that the store at `path` exists and matches the snapshot it was built from."""
+    if not path.exists():
+        return False
+    try:
+        with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as conn:
+            info = dict(conn.execute("SELECT name, value FROM store_info").fetchall())
+    except sqlite3.Error:
+        return False
+    snapshot_mtime = (
+        str(SNAPSHOT_PATH.stat().st_mtime_ns) if SNAPSHOT_PATH.exists() else None
+    )
+    return info.get("version") == str(STORE_VERSION) and (
+        snapshot_mtime is None or info.get("snapshot_mtime") == snapshot_mtime
+    )
+
+
+def build_metadata_store(
+    source: Path | None = None, target: Path | None = None
+) -> Path:
+    """Build the indexed metadata store from the pickled snapshot.
+
+    Parameters
+    ----------
+    source : Path | None
+        Path to the gzipped pickle snapshot. Defaults to the packaged asset.
+    target : Path | None
+        Path of the SQLite file to write. Defaults to the assets folder.
+
+    Returns
+    -------
+    Path
+        The path to the written store.
+    """
+    import gzip
+    import os
+
+    from openbb_imf.utils.helpers import (
+        build_codelist_to_hierarchies_map,
+        build_hierarchy_to_codelist_map,
+    )
+
+    source = source or SNAPSHOT_PATH
+    target = target or ASSETS_PATH / STORE_FILENAME
+
+    with gzip.open(source, "rb") as f:
+        snapshot: dict = pickle.load(f)  # noqa: S301
+
+    hierarchies = snapshot.get("hierarchies", {})
+    snapshot["hierarchy_to_codelist_map"] = build_hierarchy_to_codelist_map(
+        hierarchies
+    )
+    snapshot["codelist_to_hierarchies_map"] = build_codelist_to_hierarchies_map(
+        hierarchies
+    )
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file and swap it in, so readers never see a partial store.
+    tmp_path = target.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA page_size = 8192")
+        conn.execute(
+            "CREATE TABLE store_info (name TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID"
+        )
+        conn.execute(
+            "CREATE TABLE entries ("
+            "section TEXT NOT NULL, key TEXT NOT NULL, position INTEGER NOT NULL, "
+            "value BLOB NOT NULL, PRIMARY KEY (section, key)) WITHOUT ROWID"
+        )
+        conn.execute("CREATE INDEX entries_position ON entries (section, position)")
+        for section in SECTIONS:
+            conn.executemany(
+                "INSERT INTO entries (section, key, position, value) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    (section, str(key), position, pickle.dumps(value, protocol=5))
+                    for position, (key, value) in enumerate(
+                        snapshot.get(section, {}).items()
+                    )
+                ),
+            )
+        for section in DERIVED_SECTIONS:
+            conn.execute(
+                "INSERT INTO entries (section, key, position, value) "
+                "VALUES (?, '', 0, ?)",
+                (section, pickle.dumps(snapshot[section], protocol=5)),
+            )
+
+        has_fts = True
+        try:
+            conn.execute(
+                "CREATE VIRTUAL TABLE dataflow_fts USING fts5("
+                "id UNINDEXED, id_text, name, description, tokenize='trigram')"
+            )
+        except sqlite3.OperationalError:
+            # SQLite builds older than 3.34 don't ship the trigram tokenizer.
+            has_fts = False
+
+        if has_fts:
+            conn.executemany(
+                "INSERT INTO dataflow_fts (id, id_text, name, description) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        key,
+                        value.get("id", "").lower(),
+                        value.get("name", "").lower(),
+                        value.get("description", "").lower(),
+                    )
+                    for key, value in snapshot.get("dataflows", {}).items()
+                ),
+            )
+
+        conn.executemany(
+            "INSERT INTO store_info (name, value) VALUES (?, ?)",
+            [
+                ("version", str(STORE_VERSION)),
+                ("snapshot_mtime", str(source.stat().st_mtime_ns)),
+                ("fts", "1" if has_fts else "0"),
+            ],
+        )
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    tmp_path.replace(target)
+
+    return target
+
+
+def _find_or_build_store() -> Path | None:
+    """Locate a current metadata store, building it if needed."""
+    from openbb_core.app.utils import get_user_cache_directory
+
+    packaged = ASSETS_PATH / STORE_FILENAME
+    user_cache = Path(get_user_cache_directory()) / "imf" / STORE_FILENAME
+
+    for candidate in (packaged, user_cache):
+        if _store_is_current(candidate):
+            return candidate
+
+    if not SNAPSHOT_PATH.exists():
+        return None
+
+    for candidate in (packaged, user_cache):
+        try:
+            return build_metadata_store(target=candidate)
+        except (OSError, sqlite3.Error):
+            continue
+
+    return None
+
+
+class ImfMetadataStore:
+    """Read-only access to the indexed IMF metadata store."""
+
+    # Map the whole file; pages are shared by all processes reading it.
+    MMAP_SIZE = 256 * 1024 * 1024
+
+    def __init__(self, path: Path):
+        """Initialize the store for the SQLite file at `path`."""
+        self.path = path
+        self._local = threading.local()
+        info = dict(self._conn.execute("SELECT name, value FROM store_info"))
+        self.has_fts = info.get("fts") == "1"
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection to the store."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+            )
+            conn.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE}")
+            self._local.conn = conn
+        return conn
+
+    def keys(self, section: str) -> list[str]:
+        """List the keys of a section, in snapshot insertion order."""
+        return [
+            row[0]
+            for row in self._conn.execute(
+                "SELECT key FROM entries WHERE section = ? ORDER BY position",
+                (section,),
+            )
+        ]
+
+    def get(self, section: str, key: str, default: Any = None) -> Any:
+        """Load a single entry, or `default` if it doesn't exist."""
+        row = self._conn.execute(
+            "SELECT value FROM entries WHERE section = ? AND key = ?",
+            (section, key),
+        ).fetchone()
+        return pickle.loads(row[0]) if row else default  # noqa: S301
+
+    def contains(self, section: str, key: str) -> bool:
+        """Check if a section has an entry for `key`."""
+        return (
+            self._conn.execute(
+                "SELECT 1 FROM entries WHERE section = ? AND key = ?",
+                (section, key),
+            ).fetchone()
+            is not None
+        )
+
+    def match_dataflows(self, parsed_query: list[list[str]]) -> set[str] | None:
+        """Find dataflow IDs matching OR-groups of AND-terms with the full-text index.
+
+        Every term is matched as a case-insensitive substring of the dataflow
+        ID, name, or description, the same semantics as a linear scan.
+
+        Returns
+        -------
+        set[str] | None
+            The matching dataflow IDs, or None if the index can't answer the query.
+        """
+        if not self.has_fts or not parsed_query:
+            return None
+
+        or_clauses: list = []
+        for or_group in parsed_query:
+            if any(len(term) < MIN_FTS_TERM_LENGTH for term in or_group):
+                return None
+            terms = [
+                '"' + term.lower().replace('"', '""') + '"' for term in or_group
+            ]
+            or_clauses.append("(" + " AND ".join(terms) + ")")
+
+        rows = self._conn.execute(
+            "SELECT id FROM dataflow_fts WHERE dataflow_fts MATCH ?",
+            (" OR ".join(or_clauses),),
+        )
+        return {row[0] for row in rows}
+
+
+class LazySection(MutableMapping):
+    """Dictionary view of a store section that loads entries on first access.
+
+    Loaded and newly assigned entries are kept in a local overlay, so objects
+    returned by the mapping can be mutated in place like a regular dict.
+    """
+
+    def __init__(self, store: ImfMetadataStore, section: str):
+        """Initialize the view for `section` of `store`."""
+        self._store = store
+        self._section = section
+        self._loaded: dict = {}
+        self._deleted: set = set()
+        self._keys: list[str] | None = None
+
+    def _stored_keys(self) -> list[str]:
+        """Return the keys available in the store, reading them once."""
+        if self._keys is None:
+            self._keys = self._store.keys(self._section)
+        return self._keys
+
+    def __getitem__(self, key):
+        """Return the entry for `key`, loading it from the store if needed."""
+        if key in self._loaded:
+            return self._loaded[key]
+        if key in self._deleted or not isinstance(key, str):
+            raise KeyError(key)
+        value = self._store.get(self._section, key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        self._loaded[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        """Set the entry for `key` in the local overlay."""
+        self._deleted.discard(key)
+        self._loaded[key] = value
+
+    def __delitem__(self, key):
+        """Hide the entry for `key`."""
+        if key not in self:
+            raise KeyError(key)
+        self._loaded.pop(key, None)
+        self._deleted.add(key)
+
+    def __contains__(self, key) -> bool:
+        """Check for `key` without loading its value."""
+        if key in self._loaded:
+            return True
+        if key in self._deleted or not isinstance(key, str):
+            return False
+        return self._store.contains(self._section, key)
+
+    def __iter__(self) -> Iterator:
+        """Iterate over stored keys followed by keys only set locally."""
+        stored = self._stored_keys()
+        stored_set = set(stored)
+        for key in stored:
+            if key not in self._deleted:
+                yield key
+        for key in list(self._loaded):
+            if key not in stored_set:
+                yield key
+
+    def __len__(self) -> int:
+        """Count the entries without loading them."""
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Return a short representation without loading entries."""
+        return f"LazySection({self._section!r}, {len(self)} entries)"
+
+
+_store: ImfMetadataStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_metadata_store() -> ImfMetadataStore | None:
+    """Return the process-wide metadata store, or None if it can't be built."""
+    global _store  # noqa: PLW0603  # pylint: disable=global-statement
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                path = _find_or_build_store()
+                if path is not None:
+                    _store = ImfMetadataStore(path)
+
+    return _store
+
+
+if __name__ == "__main__":
+    print(f"IMF metadata store written to: {build_metadata_store()}")  # noqa: T201
@@ -8,6 +8,18 @@ import warnings
 from openbb_imf.utils.metadata import ImfMetadata
 
 
+def _first_value(columns: dict, names: tuple, length: int, default=None) -> list:
+    """Return, for each observation, the first non-empty value of the named columns."""
+    found = [columns[name] for name in names if name in columns]
+    if not found:
+        return [default] * length
+    if len(found) == 1:
+        return [value or default for value in found[0]]
+    return [
+        next((value for value in values if value), default) for values in zip(*found)
+    ]
+
+
 class ImfQueryBuilder:
     """IMF Query Builder for constructing and executing SDMX REST queries."""
 
@@ -330,15 +342,23 @@ class ImfQueryBuilder:
             Dimension parameters
         """
         # pylint: disable=import-outside-toplevel
+        from xml.parsers.expat import ExpatError
+
+        from numpy import nan
         from openbb_core.app.model.abstract.error import OpenBBError
         from openbb_core.provider.utils.errors import EmptyDataError
         from openbb_core.provider.utils.helpers import make_request
+        from openbb_core.provider.utils.sdmx import (
+            SdmxColumns,
+            SdmxSeries,
+            iter_sdmx,
+        )
         from openbb_imf.utils.helpers import parse_time_period
         from openbb_imf.utils.table_presentation import (
             extract_unit_from_label,
             parse_unit_and_scale,
         )
-        from pandas import DataFrame, to_numeric
+        from pandas import to_numeric
         from requests.exceptions import RequestException
 
         # Validate dimension constraints before making the API call
@@ -358,76 +378,13 @@ class ImfQueryBuilder:
         try:
             response = make_request(url, headers=headers)
             response.raise_for_status()
-            xml_content = response.text
+            xml_content = response.content
         except RequestException as e:
             res_content = response.text if response else ""
             raise OpenBBError(
                 f"An error occurred during the HTTP request: {url} -> {e} -> {res_content}"
             ) from e
 
-        # Parse XML
-        try:
-            import defusedxml.ElementTree as DefusedET
-
-            root = DefusedET.fromstring(xml_content)
-        except Exception as e:  # pylint: disable=broad-except
-            raise OpenBBError(f"Failed to parse XML response: {url} -> {e}") from e
-
-        # Define namespaces used in IMF SDMX responses
-        namespaces = {
-            "message": "http://www.sdmx.org/resources/sdmxml/schemas/v3_0/message",
-            "ss": "http://www.sdmx.org/resources/sdmxml/schemas/v3_0/data/structurespecific",
-            "common": "http://www.sdmx.org/resources/sdmxml/schemas/v3_0/common",
-        }
-
-        # Find all Series elements
-        dataset = root.find(".//message:DataSet", namespaces)
-        if dataset is None:
-            # Try without namespace prefix
-            dataset = root.find(".//DataSet")
-        if dataset is None:
-            # Try with ss namespace
-            dataset = root.find(".//ss:DataSet", namespaces)
-        if dataset is None:
-            raise OpenBBError(
-                EmptyDataError(f"No data found in the response. URL: {url}")
-            )
-
-        # Parse Group elements to extract group-level attributes (UNIT, ACCOUNTING_ENTRY, etc.)
-        # Group structure: <Group INDICATOR="..." ns1:type="GROUP_INDICATOR">
-        #                    <Comp id="UNIT"><Value>USD</Value></Comp>
-        #                    <Comp id="ACCOUNTING_ENTRY"><Value>NETLA</Value></Comp>
-        #                  </Group>
-        group_attributes: dict[str, dict[str, str]] = {}
-
-        # Find all Group elements - they can have namespace prefix
-        for group in dataset.findall("Group") + dataset.findall("ss:Group", namespaces):
-            # The group key is typically the INDICATOR code or similar dimension
-            group_key = None
-            for attr_name, attr_value in group.attrib.items():
-                # Skip namespace type attributes like ns1:type
-                if "type" in attr_name.lower() and "group" in attr_value.lower():
-                    continue
-                # The first non-type attribute is the key (e.g., INDICATOR)
-                group_key = attr_value
-                break
-
-            if not group_key:
-                continue
-
-            # Extract Comp elements containing group-level attribute values
-            group_attrs: dict[str, str] = {}
-            for comp in group.findall("Comp") + group.findall("ss:Comp", namespaces):
-                comp_id = comp.attrib.get("id")
-                if comp_id:
-                    # Value is in a child <Value> element
-                    value_elem = comp.find("Value") or comp.find("ss:Value", namespaces)
-                    if value_elem is not None and value_elem.text:
-                        group_attrs[comp_id] = value_elem.text
-
-            if group_attrs:
-                group_attributes[group_key] = group_attrs
-
         # Get dataflow metadata
         dataflow_obj = self.metadata.dataflows.get(dataflow, {})
         # Build translation maps for dimension values
@@ -466,7 +423,6 @@ class ImfQueryBuilder:
                     indicator_dimension_order[dim_id] = idx
 
         # Process all Series elements
-        all_data_rows: list = []
         all_unique_indicators: set = set()
         all_series_derivation_types: dict = {}
 
@@ -490,22 +446,37 @@ class ImfQueryBuilder:
                             codelist_id
                         ]
 
-        # Find Series elements with multiple namespace approaches
-        series_elements = dataset.findall("Series") + dataset.findall(
-            "ss:Series", namespaces
-        )
+        # Group elements carry group-level attributes (UNIT, ACCOUNTING_ENTRY, etc.).
+        # Group structure: <Group INDICATOR="..." ns1:type="GROUP_INDICATOR">
+        #                    <Comp id="UNIT"><Value>USD</Value></Comp>
+        #                  </Group>
+        # They precede the series in the message, so they are collected while iterating.
+        group_attributes: dict[str, dict[str, str]] = {}
+
+        def iter_series():
+            """Stream the series of the response, collecting the group attributes."""
+            try:
+                for item in iter_sdmx(xml_content, "structure_specific"):
+                    if isinstance(item, SdmxSeries):
+                        yield item
+                        continue
+                    # The group key is the first non-type attribute (e.g., INDICATOR).
+                    group_key = next(
+                        (
+                            value
+                            for name, value in item.key.items()
+                            if not ("type" in name.lower() and "group" in value.lower())
+                        ),
+                        None,
+                    )
+                    if group_key and item.attributes:
+                        group_attributes[group_key] = item.attributes
+            except (ExpatError, ValueError) as e:
+                raise OpenBBError(f"Failed to parse XML response: {url} -> {e}") from e
+
+        rows = SdmxColumns(missing=nan)
 
-        # Remove duplicates while preserving order
-        seen_series = set()
-        unique_series = []
-        for s in series_elements:
-            s_id = id(s)
-            if s_id not in seen_series:
-                seen_series.add(s_id)
-                unique_series.append(s)
-        series_elements = unique_series
-
-        for series in series_elements:
+        for series in iter_series():
             # Extract series attributes (dimensions)
             series_meta: dict = {}
             indicator_code = None
@@ -528,7 +499,7 @@ class ImfQueryBuilder:
                 "OBS_STATUS",
             }
 
-            for attr_name, attr_value in series.attrib.items():
+            for attr_name, attr_value in series.key.items():
                 # Track ALL dimension codes for complete series_id
                 all_dimension_codes.append((attr_name, attr_value))
 
@@ -803,108 +774,94 @@ class ImfQueryBuilder:
                 # Fallback if no indicator codes list
                 series_meta["series_id"] = f"{dataflow}::{indicator_code}"
 
-            # Process observations with multiple namespace approaches
-            obs_elements = series.findall("Obs") + series.findall("ss:Obs", namespaces)
-            # Remove duplicates
-            seen_obs = set()
-            unique_obs = []
-            for o in obs_elements:
-                o_id = id(o)
-                if o_id not in seen_obs:
-                    seen_obs.add(o_id)
-                    unique_obs.append(o)
+            # Process observations, column by column
+            observations = series.observations
+            n_obs = len(series)
+            time_periods = _first_value(
+                observations, ("TIME_PERIOD", "TIME", "time"), n_obs, ""
+            )
+            obs_values = _first_value(
+                observations, ("OBS_VALUE", "OBSERVATION"), n_obs, None
+            )
+            obs_units = observations.get("UNIT")
+            obs_scales = observations.get("SCALE")
+            derivation_types = observations.get("DERIVATION_TYPE")
 
             derivation_types_in_series: set = set()
+            # Only add rows with actual values
+            kept = [
+                i
+                for i, value in enumerate(obs_values)
+                if value is not None and value not in {"", "D"}
+            ]
+            if not kept:
+                continue
 
-            for obs in unique_obs:
-                obs_row = series_meta.copy()
+            obs_columns: dict[str, list] = {
+                "TIME_PERIOD": [time_periods[i] for i in kept],
+                "value": [obs_values[i] for i in kept],
+            }
 
-                # TIME_PERIOD - try multiple attribute names
-                time_period = (
-                    obs.attrib.get("TIME_PERIOD")
-                    or obs.attrib.get("TIME")
-                    or obs.attrib.get("time")
-                    or ""
+            # Observation-level attributes (UNIT, SCALE, etc.) may override
+            # series-level attributes for specific observations.
+            if obs_units is not None and any(obs_units[i] for i in kept):
+                # Use proper codelist from DSD, not generic CL_UNIT
+                unit_codelist = attr_codelist_map.get(
+                    "UNIT", self.metadata._codelist_cache.get("CL_UNIT", {})
                 )
+                obs_columns["unit"] = [
+                    (
+                        unit_codelist.get(obs_units[i], obs_units[i])
+                        if obs_units[i]
+                        else series_meta.get("unit", nan)
+                    )
+                    for i in kept
+                ]
 
-                # Get observation value - SDMX 3.0 XML format
-                # Value can be in OBS_VALUE attribute or ObsValue child element
-                obs_value = obs.attrib.get("OBS_VALUE") or obs.attrib.get("OBSERVATION")
-
-                # If not in attributes, check child elements
-                if obs_value is None:
-                    # Try ObsValue element with namespace
-                    obs_value_elem = obs.find("ss:ObsValue", namespaces)
-                    if obs_value_elem is None:
-                        obs_value_elem = obs.find("ObsValue")
-                    if obs_value_elem is not None:
-                        obs_value = (
-                            obs_value_elem.attrib.get("value") or obs_value_elem.text
-                        )
-                    else:
-                        # Search all children for value-like elements
-                        for child in obs:
-                            local_tag = (
-                                child.tag.split("}")[-1]
-                                if "}" in child.tag
-                                else child.tag
-                            )
-                            if local_tag.upper() in ("OBSVALUE", "OBS_VALUE", "VALUE"):
-                                obs_value = child.attrib.get("value") or child.text
-                                if obs_value:
-                                    break
-
-                derivation_type = obs.attrib.get("DERIVATION_TYPE")
-                obs_row["TIME_PERIOD"] = time_period
-
-                # Extract observation-level attributes (UNIT, SCALE, etc.)
-                # These may override series-level attributes for specific observations
-                obs_unit = obs.attrib.get("UNIT")
-                if obs_unit:
-                    # Use proper codelist from DSD, not generic CL_UNIT
-                    if "UNIT" in attr_codelist_map:
-                        unit_codelist = attr_codelist_map["UNIT"]
-                        obs_row["unit"] = unit_codelist.get(obs_unit, obs_unit)
-                    else:
-                        cl_unit = self.metadata._codelist_cache.get("CL_UNIT", {})
-                        obs_row["unit"] = cl_unit.get(obs_unit, obs_unit)
-
-                obs_scale = obs.attrib.get("SCALE")
-                if obs_scale:
+            if obs_scales is not None and any(obs_scales[i] for i in kept):
+                multipliers: list = []
+                scales: list = []
+                for i in kept:
+                    obs_scale = obs_scales[i]
+                    if not obs_scale:
+                        multipliers.append(series_meta.get("unit_multiplier", nan))
+                        scales.append(series_meta.get("scale", nan))
+                        continue
                     try:
                         scale_int = int(obs_scale)
-                        obs_row["unit_multiplier"] = (
-                            1 if scale_int == 0 else 10**scale_int
-                        )
+                        multipliers.append(1 if scale_int == 0 else 10**scale_int)
                         # Use DSD-specific codelist if available
                         if "SCALE" in attr_codelist_map:
-                            scale_codelist = attr_codelist_map["SCALE"]
-                            obs_row["scale"] = scale_codelist.get(
-                                obs_scale, f"10^{obs_scale}"
+                            scales.append(
+                                attr_codelist_map["SCALE"].get(
+                                    obs_scale, f"10^{obs_scale}"
+                                )
                             )
                         elif cl_unit_mult := self.metadata._codelist_cache.get(
                             "CL_UNIT_MULT", {}
                         ):
-                            obs_row["scale"] = cl_unit_mult.get(
-                                obs_scale, f"10^{obs_scale}"
+                            scales.append(
+                                cl_unit_mult.get(obs_scale, f"10^{obs_scale}")
                             )
                         else:
-                            obs_row["scale"] = f"10^{obs_scale}"
+                            scales.append(f"10^{obs_scale}")
                     except ValueError:
-                        obs_row["scale"] = obs_scale
-
-                # Only add rows with actual values
-                if obs_value is not None and obs_value not in {"", "D"}:
-                    obs_row["value"] = obs_value
-
-                    if derivation_type:
-                        if "CL_DERIVATION_TYPE" in self.metadata._codelist_cache:
-                            derivation_type = self.metadata._codelist_cache[
-                                "CL_DERIVATION_TYPE"
-                            ].get(derivation_type, derivation_type)
-                        derivation_types_in_series.add(derivation_type)
+                        multipliers.append(series_meta.get("unit_multiplier", nan))
+                        scales.append(obs_scale)
+                obs_columns["unit_multiplier"] = multipliers
+                obs_columns["scale"] = scales
+
+            if derivation_types is not None:
+                derivation_codelist = self.metadata._codelist_cache.get(
+                    "CL_DERIVATION_TYPE", {}
+                )
+                for i in kept:
+                    if derivation_type := derivation_types[i]:
+                        derivation_types_in_series.add(
+                            derivation_codelist.get(derivation_type, derivation_type)
+                        )
 
-                    all_data_rows.append(obs_row)
+            rows.add(series_meta, obs_columns, len(kept))
 
             if indicator_code and derivation_types_in_series:
                 if len(derivation_types_in_series) == 1:
@@ -916,7 +873,7 @@ class ImfQueryBuilder:
                         sorted(derivation_types_in_series)
                     )
 
-        if not all_data_rows:
+        if not rows:
             # Build a more helpful error message with parameter info
             param_info = ", ".join(f"{k}={v}" for k, v in kwargs.items() if v)
             raise OpenBBError(
@@ -930,7 +887,7 @@ class ImfQueryBuilder:
             )
 
         # Create DataFrame and clean up
-        df = DataFrame(all_data_rows)
+        df = rows.to_dataframe()
         df = df.rename(columns={"value": "OBS_VALUE"})
         df["OBS_VALUE"] = to_numeric(df["OBS_VALUE"], errors="coerce")
 
@@ -0,0 +1 @@
+"""The IMF provider tests."""
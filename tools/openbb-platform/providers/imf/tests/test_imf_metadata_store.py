@@ -0,0 +1,88 @@
+"""Test the IMF metadata store."""
+
+import gzip
+import pickle
+
+import pytest
+from openbb_imf.utils.helpers import (
+    build_codelist_to_hierarchies_map,
+    build_hierarchy_to_codelist_map,
+)
+from openbb_imf.utils.metadata_store import (
+    DERIVED_SECTIONS,
+    SECTIONS,
+    SNAPSHOT_PATH,
+    ImfMetadataStore,
+    LazySection,
+    build_metadata_store,
+)
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture(scope="module")
+def snapshot() -> dict:
+    """Load the packaged snapshot."""
+    with gzip.open(SNAPSHOT_PATH, "rb") as f:
+        return pickle.load(f)  # noqa: S301
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory) -> ImfMetadataStore:
+    """Build the store from the packaged snapshot."""
+    path = tmp_path_factory.mktemp("imf") / "imf_metadata.db"
+    return ImfMetadataStore(build_metadata_store(target=path))
+
+
+@pytest.mark.parametrize("section", SECTIONS)
+def test_store_matches_snapshot(snapshot, store, section):
+    """Test that each section of the store reads back as the snapshot."""
+    expected = snapshot.get(section, {})
+    lazy = LazySection(store, section)
+
+    assert list(lazy) == list(expected)
+    assert len(lazy) == len(expected)
+    for key, value in expected.items():
+        assert key in lazy
+        assert lazy[key] == value
+
+
+def test_derived_sections(snapshot, store):
+    """Test that the hierarchy maps are precomputed from the snapshot."""
+    hierarchies = snapshot.get("hierarchies", {})
+    assert set(DERIVED_SECTIONS) == {
+        "hierarchy_to_codelist_map",
+        "codelist_to_hierarchies_map",
+    }
+    assert store.get(
+        "hierarchy_to_codelist_map", ""
+    ) == build_hierarchy_to_codelist_map(hierarchies)
+    assert store.get(
+        "codelist_to_hierarchies_map", ""
+    ) == build_codelist_to_hierarchies_map(hierarchies)
+
+
+def test_stored_none_is_an_entry(tmp_path):
+    """Test that an entry whose value is None is found by `in` and `[]`."""
+    source = tmp_path / "imf_cache.pkl.gz"
+    with gzip.open(source, "wb") as f:
+        pickle.dump({"metadata_cache": {"CPI": {"id": "CPI"}, "EMPTY": None}}, f)
+    store = ImfMetadataStore(
+        build_metadata_store(source=source, target=tmp_path / "imf_metadata.db")
+    )
+    cache = LazySection(store, "metadata_cache")
+
+    assert "EMPTY" in cache
+    assert cache["EMPTY"] is None
+    assert cache.get("EMPTY", "default") is None
+    assert "MISSING" not in cache
+    assert cache.get("MISSING", "default") == "default"
+    with pytest.raises(KeyError):
+        cache["MISSING"]  # pylint: disable=pointless-statement
+    assert dict(cache) == {"CPI": {"id": "CPI"}, "EMPTY": None}
+
+    cache["NEW"] = None
+    del cache["CPI"]
+    assert list(cache) == ["EMPTY", "NEW"]
+    with pytest.raises(KeyError):
+        cache["CPI"]  # pylint: disable=pointless-statement
@@ -1,6 +1,7 @@
 """Intrinio Provider Modules."""
 
 from openbb_core.provider.abstract.provider import Provider
+from openbb_core.provider.utils.rate_limiter import RateLimit
 from openbb_intrinio.models.balance_sheet import IntrinioBalanceSheetFetcher
 from openbb_intrinio.models.calendar_ipo import IntrinioCalendarIpoFetcher
 from openbb_intrinio.models.cash_flow import IntrinioCashFlowStatementFetcher
@@ -113,4 +114,5 @@ historical financial market data to businesses and developers through an API."""
     repr_name="Intrinio",
     deprecated_credentials={"API_INTRINIO_KEY": "intrinio_api_key"},
     instructions="Go to: https://intrinio.com/starter-plan\n\n![Intrinio](https://user-images.githubusercontent.com/85772166/219207556-fcfee614-59f1-46ae-bff4-c63dd2f6991d.png)\n\nAn API key will be issued with a subscription. Find the token value within the account dashboard.",  # noqa: E501  pylint: disable=line-too-long
+    rate_limit=RateLimit(10, max_concurrency=10, hosts=["intrinio.com"]),
 )
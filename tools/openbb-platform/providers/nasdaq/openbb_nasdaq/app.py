@@ -23,7 +23,6 @@ def main():
     from datetime import datetime
     from typing import Annotated, Any, Literal
 
-    from async_lru import alru_cache
     from fastapi import Depends, FastAPI
     from openbb_nasdaq.models.calendar_dividend import NasdaqCalendarDividendFetcher
     from openbb_nasdaq.models.calendar_earnings import NasdaqCalendarEarningsFetcher
@@ -34,10 +33,10 @@ def main():
     from openbb_nasdaq.models.historical_dividends import (
         NasdaqHistoricalDividendsFetcher,
     )
+    from openbb_core.provider.utils.lru import ttl_cache
+    from openbb_core.provider.utils.reference_data import register_dataset
     from pandas import DataFrame
 
-    listings = DataFrame()
-
     current_year = int(datetime.now().year)
     years = sorted(
         [{"label": str(i), "value": i} for i in range(1994, current_year + 1)],
@@ -47,23 +46,13 @@ def main():
 
     app = FastAPI()
 
-    async def get_listings() -> DataFrame:
-        """Get the Nasdaq listings."""
-        return listings
-
-    Nasdaqlistings = Annotated[
-        DataFrame,
-        Depends(get_listings),
-    ]
-
-    async def startup_event():
-        """Startup event for the FastAPI app."""
-        nonlocal listings
+    async def load_listings() -> DataFrame:
+        """Load the Nasdaq listings."""
         fetcher = NasdaqEquitySearchFetcher()
 
         directory = await fetcher.fetch_data({}, {})
 
-        listings = DataFrame([d.model_dump() for d in directory]).query(  # type: ignore
+        return DataFrame([d.model_dump() for d in directory]).query(  # type: ignore
             "test_issue == 'N' and etf == 'N'"
             " and not name.str.contains('%')"
             " and not name.str.contains('Unit')"
@@ -72,6 +61,24 @@ def main():
             " and not name.str.contains('Preferred')"
         )
 
+    # The listings are refreshed daily, in the background, without a restart.
+    listings = register_dataset(
+        "nasdaq_app_listings", load_listings, ttl=3600 * 24, shared=True
+    )
+
+    async def get_listings() -> DataFrame:
+        """Get the Nasdaq listings."""
+        return await listings.get()
+
+    Nasdaqlistings = Annotated[
+        DataFrame,
+        Depends(get_listings),
+    ]
+
+    async def startup_event():
+        """Startup event for the FastAPI app."""
+        await listings.get()
+
     app.add_event_handler("startup", startup_event)
 
     @app.get("/get_symbol_choices", include_in_schema=False)
@@ -93,7 +100,7 @@ def main():
             for k, v in items.items()
         ]
 
-    @alru_cache
+    @ttl_cache(maxsize=128, ttl=3600, stale_ttl=3600)
     async def get_document_choices(
         symbol: str | None = None,
         year: int | None = None,
@@ -130,7 +137,8 @@ def main():
 
         return docs
 
-    @alru_cache(maxsize=128)
+    # Encoded PDFs are large, so the cache is bounded by memory as well.
+    @ttl_cache(maxsize=128, ttl=86400, max_bytes=256 * 1024 * 1024)
     async def download_pdf_file(document_url: str):
         """Download a PDF file from the given URL."""
         # pylint: disable=import-outside-toplevel
@@ -8,7 +8,6 @@ from typing import Any, Literal
 
 import requests
 import urllib3
-from defusedxml.ElementTree import fromstring
 from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.app.utils import get_user_cache_directory
 from openbb_core.provider import helpers
@@ -68,52 +67,50 @@ def fetch_data(url: str, csv_kwargs: dict | None = None, **kwargs: Any) -> DataF
 ### The functions below are for using the new oecd data-explorer instead of the stats.oecd
 
 
-def oecd_xml_to_df(xml_string: str) -> DataFrame:
+def oecd_xml_to_df(xml_string: str | bytes) -> DataFrame:
     """Parse the OECD XML and return a dataframe.
 
     Parameters
     ----------
-    xml_string : str
-        A string containing the OECD XML data.
+    xml_string : str | bytes
+        A string containing the OECD XML data, in the SDMX generic format.
 
     Returns
     -------
     DataFrame
         A Pandas DataFrame containing the parsed data from the XML string.
     """
-    root = fromstring(xml_string)
-
-    namespaces = {
-        "message": "http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message",
-        "generic": "http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/generic",
-    }
-
-    # Prepare a list to hold your extracted data
-    data = []
-
-    # Iterate through each 'Series' in the XML
-    for series in root.findall(".//generic:Series", namespaces=namespaces):
-        series_data = {}
-        # Extract series key values
-        for value in series.findall(".//generic:Value", namespaces=namespaces):
-            series_data[value.get("id")] = value.get("value")
-        # Extract observation values
-        for obs in series.findall("./generic:Obs", namespaces=namespaces):
-            obs_data = series_data.copy()
-            obs_data["TIME_PERIOD"] = obs.find(
-                "./generic:ObsDimension", namespaces=namespaces
-            ).get(  # type: ignore
-                "value"
-            )
-            obs_data["VALUE"] = obs.find(
-                "./generic:ObsValue", namespaces=namespaces
-            ).get(  # type: ignore
-                "value"
-            )
-            data.append(obs_data)
-
-    # Create a DataFrame
-    return DataFrame(data)
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.provider.utils.sdmx import (
+        OBS_VALUE,
+        TIME_PERIOD,
+        SdmxColumns,
+        SdmxSeries,
+        iter_sdmx,
+    )
+
+    columns = SdmxColumns()
+    for series in iter_sdmx(xml_string, "generic"):
+        if not isinstance(series, SdmxSeries):
+            continue
+        observations = series.observations
+        # Observation attributes are reported with the series values.
+        constants = {**series.key, **series.attributes}
+        for name, values in observations.items():
+            if name not in (TIME_PERIOD, OBS_VALUE):
+                constants[name] = next(
+                    (v for v in reversed(values) if v is not None), None
+                )
+        columns.add(
+            constants,
+            {
+                TIME_PERIOD: observations.get(TIME_PERIOD, []),
+                "VALUE": observations.get(OBS_VALUE, []),
+            },
+            len(series),
+        )
+
+    return columns.to_dataframe()
 
 
 def parse_url(url: str) -> DataFrame:
@@ -131,7 +128,7 @@ def parse_url(url: str) -> DataFrame:
     """
     response = helpers.make_request(url, timeout=30)
     response.raise_for_status()
-    return oecd_xml_to_df(response.text)
+    return oecd_xml_to_df(response.content)
 
 
 def check_cache_exists_and_valid(cache_str: str, cache_method: str = "csv") -> bool:
@@ -1,6 +1,7 @@
 """SEC provider module."""
 
 from openbb_core.provider.abstract.provider import Provider
+from openbb_core.provider.utils.rate_limiter import RateLimit
 from openbb_sec.models.cik_map import SecCikMapFetcher
 from openbb_sec.models.company_filings import SecCompanyFilingsFetcher
 from openbb_sec.models.compare_company_facts import SecCompareCompanyFactsFetcher
@@ -47,4 +48,5 @@ sec_provider = Provider(
         "SymbolMap": SecSymbolMapFetcher,
     },
     repr_name="Securities and Exchange Commission (SEC)",
+    rate_limit=RateLimit(10, max_concurrency=8, hosts=["sec.gov"]),
 )
@@ -55,7 +55,8 @@ class SecCompanyFilingsQueryParams(CompanyFilingsQueryParams):
         description=QUERY_DESCRIPTIONS.get("limit", ""),
     )
     use_cache: bool = Field(
-        description="Whether or not to use cache.  If True, cache will store for one day.",
+        description="Whether or not to use the local index of filings."
+        + " If True, the filings of a company are updated once a day.",
         default=True,
     )
 
@@ -185,16 +186,21 @@ class SecCompanyFilingsFetcher(
         credentials: dict[str, str] | None,
         **kwargs: Any,
     ) -> list[dict]:
-        """Extract the data from the SEC endpoint."""
+        """Extract the data from the SEC endpoint.
+
+        The filings are read from the local index of the filer, after adding the
+        ones filed since its last sync. Pages of older filings are only requested
+        when the query reaches past the recent filings.
+        """
         # pylint: disable=import-outside-toplevel
-        from aiohttp_client_cache import SQLiteBackend
-        from aiohttp_client_cache.session import CachedSession
-        from openbb_core.app.utils import get_user_cache_directory
-        from openbb_core.provider.utils.helpers import amake_request, amake_requests
+        import asyncio
+        import re
+        from openbb_core.provider.utils.helpers import (
+            amake_request,
+            get_async_requests_session,
+        )
+        from openbb_sec.utils.filings_index import FilingsIndex, get_filings_index
         from openbb_sec.utils.helpers import symbol_map
-        from pandas import DataFrame
-
-        filings = DataFrame()
 
         if query.symbol and not query.cik:
             query.cik = await symbol_map(
@@ -213,58 +219,95 @@ class SecCompanyFilingsFetcher(
                 cik_ = cik_ + "0"
             query.cik = cik_ + str(query.cik)  # type: ignore
 
-        url = f"https://data.sec.gov/submissions/CIK{query.cik}.json"
-        data: dict | list[dict] = []
-        if query.use_cache is True:
-            cache_dir = f"{get_user_cache_directory()}/http/sec_company_filings"
-            async with CachedSession(
-                cache=SQLiteBackend(cache_dir, expire_after=3600 * 24)
-            ) as session:
-                await session.delete_expired_responses()
-                try:
-                    data = await amake_request(url, headers=HEADERS, session=session)  # type: ignore
-                finally:
-                    await session.close()
-        else:
-            data = await amake_request(url, headers=HEADERS)  # type: ignore
+        cik = str(query.cik)
+        # Without the cache, the filings are indexed in memory for this query only.
+        index = get_filings_index() if query.use_cache else FilingsIndex(":memory:")
+        session = None
+        try:
+            if not (query.use_cache and index.is_fresh(cik)):
+                session = await get_async_requests_session()
+                data = await amake_request(
+                    f"https://data.sec.gov/submissions/CIK{cik}.json",
+                    headers=HEADERS,
+                    session=session,
+                )
+                index.sync(cik, data)  # type: ignore[arg-type]
+
+            filer = index.filer(cik) or {}
+            recent_from = filer.get("recent_from")
+            # Older filings are only read when the query asks for them.
+            history = (
+                query.form_type is not None
+                or query.limit == 0
+                or bool(
+                    query.start_date and recent_from and query.start_date < recent_from
+                )
+            )
 
-        # This seems to work for the data structure.
-        filings = (
-            DataFrame.from_records(data["filings"].get("recent")) if "filings" in data else DataFrame()  # type: ignore
-        )
-        results = filings.to_dict("records")
-
-        # If there are lots of filings, there will be custom pagination.
-        if (
-            (query.limit and len(filings) >= 1000)
-            or query.form_type is not None
-            or query.limit == 0
-        ):
-
-            async def callback(response, session):
-                """Response callback for excess company filings."""
-                result = await response.json()
-                if result:
-                    new_data = DataFrame.from_records(result)
-                    results.extend(new_data.to_dict("records"))
-
-            urls: list = []
-            new_urls = DataFrame(data["filings"].get("files")) if "filings" in data else DataFrame()  # type: ignore
-            for i in new_urls.index:
-                new_cik: str = data["filings"]["files"][i]["name"]  # type: ignore
-                new_url: str = "https://data.sec.gov/submissions/" + new_cik
-                urls.append(new_url)
-            if query.use_cache is True:
-                cache_dir = f"{get_user_cache_directory()}/http/sec_company_filings"
-                async with CachedSession(
-                    cache=SQLiteBackend(cache_dir, expire_after=3600 * 24)
-                ) as session:
-                    try:
-                        await amake_requests(urls, headers=HEADERS, session=session, response_callback=callback)  # type: ignore
-                    finally:
-                        await session.close()
-            else:
-                await amake_requests(urls, headers=HEADERS, response_callback=callback)  # type: ignore
+            def select() -> list[dict]:
+                """Query the index of the filer."""
+                forms = None
+                if query.form_type:
+                    pattern = re.compile(
+                        "|".join(query.form_type.replace("_", " ").split(",")),
+                        re.IGNORECASE,
+                    )
+                    forms = [f for f in index.forms(cik) if f and pattern.search(f)]
+                start_date = query.start_date
+                if not history and recent_from:
+                    start_date = max(start_date or recent_from, recent_from)
+                return index.query(
+                    cik, forms, start_date, query.end_date, query.limit or None
+                )
+
+            results = select()
+            if query.limit and len(results) < query.limit:
+                history = True
+
+            pages = (
+                index.missing_pages(cik, query.start_date, query.end_date)
+                if history
+                else []
+            )
+            if pages:
+                session = session or await get_async_requests_session()
+                responses = await asyncio.gather(
+                    *[
+                        amake_request(
+                            "https://data.sec.gov/submissions/" + page["name"],
+                            headers=HEADERS,
+                            session=session,
+                        )
+                        for page in pages
+                    ],
+                    return_exceptions=True,
+                )
+                for page, response in zip(pages, responses):
+                    if isinstance(response, Exception):
+                        warn(f"Failed to get {page['name']}: {response}")
+                        continue
+                    index.load_page(cik, page, response)  # type: ignore[arg-type]
+            if history:
+                results = select()
+        finally:
+            if session is not None:
+                await session.close()
+            if not query.use_cache:
+                index.close()
+
+        if not results:
+            if (
+                query.form_type
+                or query.start_date
+                or query.end_date
+                or index.query(cik, limit=1)
+            ):
+                raise EmptyDataError(
+                    "No filings were found using the filters provided."
+                )
+            raise EmptyDataError(
+                f"No filings found for CIK {query.cik}, or symbol {query.symbol}"
+            )
 
         return results
 
@@ -272,64 +315,37 @@ class SecCompanyFilingsFetcher(
     def transform_data(
         query: SecCompanyFilingsQueryParams, data: list[dict], **kwargs: Any
     ) -> list[SecCompanyFilingsData]:
-        """Transform the data."""
-        # pylint: disable=import-outside-toplevel
-        from numpy import nan
-        from pandas import NA, DataFrame, to_datetime
+        """Transform the data.
 
-        if not data:
-            raise EmptyDataError(
-                f"No filings found for CIK {query.cik}, or symbol {query.symbol}"
-            )
-        cols = [
-            "reportDate",
-            "filingDate",
-            "acceptanceDateTime",
-            "act",
-            "form",
-            "items",
-            "primaryDocDescription",
-            "primaryDocument",
-            "accessionNumber",
-            "fileNumber",
-            "filmNumber",
-            "isInlineXBRL",
-            "isXBRL",
-            "size",
-        ]
-        filings = DataFrame(data, columns=cols).astype(str)
-        filings["reportDate"] = to_datetime(filings["reportDate"]).dt.date
-        filings["filingDate"] = to_datetime(filings["filingDate"]).dt.date
-        filings = filings.sort_values(by=["filingDate", "reportDate"], ascending=False)
-        if query.start_date:
-            filings = filings[filings["filingDate"] >= query.start_date]
-        if query.end_date:
-            filings = filings[filings["filingDate"] <= query.end_date]
+        The rows of the index already have the types of the fields,
+        so they are constructed without validating them again.
+        """
         base_url = f"https://www.sec.gov/Archives/edgar/data/{str(int(query.cik))}/"  # type: ignore
-        filings["primaryDocumentUrl"] = (
-            base_url
-            + filings["accessionNumber"].str.replace("-", "")
-            + "/"
-            + filings["primaryDocument"]
-        )
-        filings["completeSubmissionUrl"] = (
-            base_url + filings["accessionNumber"] + ".txt"
-        )
-        filings["filingDetailUrl"] = (
-            base_url + filings["accessionNumber"] + "-index.htm"
-        )
-        if query.form_type:
-            form_types = query.form_type.replace("_", " ").split(",")
-            filings = filings[
-                filings.form.str.contains("|".join(form_types), case=False, na=False)
-            ]
-        if query.limit:
-            filings = filings.head(query.limit) if query.limit != 0 else filings
-
-        if len(filings) == 0:
-            raise EmptyDataError("No filings were found using the filters provided.")
-        filings = filings.replace({NA: None, nan: None})
-
-        return [
-            SecCompanyFilingsData.model_validate(d) for d in filings.to_dict("records")
-        ]
+        results: list[SecCompanyFilingsData] = []
+        for row in data:
+            accession = row["accessionNumber"]
+            results.append(
+                SecCompanyFilingsData.model_construct(
+                    filing_date=row["filingDate"],
+                    report_type=row["form"],
+                    report_url=base_url
+                    + accession.replace("-", "")
+                    + "/"
+                    + row["primaryDocument"],
+                    report_date=row["reportDate"],
+                    act=row["act"],
+                    items=row["items"],
+                    primary_doc_description=row["primaryDocDescription"],
+                    primary_doc=row["primaryDocument"],
+                    accession_number=accession,
+                    file_number=row["fileNumber"],
+                    film_number=row["filmNumber"],
+                    is_inline_xbrl=row["isInlineXBRL"],
+                    is_xbrl=row["isXBRL"],
+                    size=row["size"],
+                    complete_submission_url=base_url + accession + ".txt",
+                    filing_detail_url=base_url + accession + "-index.htm",
+                    accepted_date=row["acceptanceDateTime"],
+                )
+            )
+        return results
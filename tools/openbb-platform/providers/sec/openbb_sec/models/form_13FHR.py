@@ -18,6 +18,12 @@ class SecForm13FHRQueryParams(Form13FHRQueryParams):
     Source: https://www.sec.gov/Archives/edgar/data/
     """
 
+    use_cache: bool = Field(
+        default=True,
+        description="Whether or not to use cache."
+        + " Parsed filings are stored locally, and are not downloaded again.",
+    )
+
 
 class SecForm13FHRData(Form13FHRData):
     """SEC Form 13F-HR Data."""
@@ -55,28 +61,39 @@ class SecForm13FHRFetcher(Fetcher[SecForm13FHRQueryParams, list[SecForm13FHRData
         from openbb_core.app.model.abstract.error import OpenBBError
         from openbb_core.provider.utils.errors import EmptyDataError
         from openbb_sec.utils import parse_13f
+        from openbb_sec.utils.holdings_13f import get_13f_store
 
         symbol = query.symbol
         urls: list = []
         cik = symbol.isnumeric()
         try:
-            filings = (
-                await parse_13f.get_13f_candidates(symbol=symbol)
-                if cik is False
-                else await parse_13f.get_13f_candidates(cik=symbol)
-            )
-            if query.limit and query.date is None:
-                urls = filings.iloc[: query.limit].to_list()
-            if query.date is not None:
+            # A quarter of a filer already stored is read without any request.
+            if cik is True and query.date is not None and query.use_cache is True:
                 date = parse_13f.date_to_quarter_end(query.date.strftime("%Y-%m-%d"))
-                filings.index = filings.index.astype(str)
-                urls = [filings.loc[date]]
+                stored = get_13f_store().find_filings(symbol, date)
+                if len(stored) == 1:
+                    urls = stored
+
+            if not urls:
+                filings = (
+                    await parse_13f.get_13f_candidates(symbol=symbol)
+                    if cik is False
+                    else await parse_13f.get_13f_candidates(cik=symbol)
+                )
+                if query.limit and query.date is None:
+                    urls = filings.iloc[: query.limit].to_list()
+                if query.date is not None:
+                    date = parse_13f.date_to_quarter_end(
+                        query.date.strftime("%Y-%m-%d")
+                    )
+                    filings.index = filings.index.astype(str)
+                    urls = [filings.loc[date]]
 
             results: list = []
 
             async def get_filing(url):
                 """Get a single 13F-HR filing and parse it."""
-                data = await parse_13f.parse_13f_hr(url)
+                data = await parse_13f.parse_13f_hr(url, use_cache=query.use_cache)
 
                 if len(data) > 0:
                     results.extend(data)
@@ -69,7 +69,9 @@ class SecHtmFileFetcher(Fetcher[SecHtmFileQueryParams, SecHtmFileData]):
 
         return {
             "url": query.url,
-            "content": SecBaseFiling.download_file(query.url, False, query.use_cache),
+            "content": await SecBaseFiling._adownload_file(  # pylint: disable=protected-access
+                query.url, query.use_cache
+            ),
         }
 
     @staticmethod
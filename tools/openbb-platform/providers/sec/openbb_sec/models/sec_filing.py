@@ -342,39 +342,25 @@ class SecBaseFiling(Data):  # pylint: disable=too-many-instance-attributes
 
     @staticmethod
     async def _adownload_file(url, use_cache: bool = True):
-        """Download a file asynchronously from a SEC URL."""
+        """Download a file asynchronously from a SEC URL.
+
+        Files in the EDGAR archives never change, so a file in the blob cache
+        is used without any request, unless `use_cache` is False.
+        """
         # pylint: disable=import-outside-toplevel
-        from aiohttp_client_cache import SQLiteBackend
-        from aiohttp_client_cache.session import CachedSession
-        from openbb_core.app.utils import get_user_cache_directory
-        from openbb_core.provider.utils.helpers import amake_request
+        import json  # noqa
+        from openbb_core.provider.utils.blob_cache import fetch_blob
         from openbb_sec.utils.definitions import SEC_HEADERS
-        from openbb_sec.utils.helpers import sec_callback
-
-        response: dict | list | str | None = None
-        if use_cache is True:
-            cache_dir = f"{get_user_cache_directory()}/http/sec_filings"
-            async with CachedSession(cache=SQLiteBackend(cache_dir)) as session:
-                try:
-                    await session.delete_expired_responses()
-                    response = await amake_request(
-                        url,
-                        headers=SEC_HEADERS,
-                        session=session,
-                        response_callback=sec_callback,
-                        raise_for_status=True,
-                    )  # type: ignore
-                finally:
-                    await session.close()
-        else:
-            response = await amake_request(
-                url,
-                headers=SEC_HEADERS,
-                response_callback=sec_callback,
-                raise_for_status=True,
-            )  # type: ignore
-
-        return response
+
+        blob = await fetch_blob(
+            url, headers=SEC_HEADERS, max_age=None, use_cache=use_cache
+        )
+        # Decoded as `sec_callback` decodes a response.
+        if blob.media_type == "application/json":
+            return json.loads(blob.read_bytes())
+        if blob.media_type == "text/html":
+            return blob.read_text("latin-1")
+        return blob.read_text()
 
     @staticmethod
     def download_file(url, read_html_table: bool = False, use_cache: bool = True):
@@ -0,0 +1,405 @@
+"""Local index of the filings of SEC filers.
+
+The submissions of a filer, https://data.sec.gov/submissions/CIK##########.json,
+list its recent filings and link to pages of older ones. The filings are kept
+in a SQLite database, keyed by filer CIK and accession number, and indexed by
+form type and filing date.
+
+- A sync only adds the filings accepted since the newest one stored, which is
+  the watermark of the filer.
+- A page of older filings is loaded once, when a query reaches into its range.
+- Queries by form type and date are answered from the indexes, so a repeat
+  query, even for a filer with tens of thousands of filings, needs no request.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import threading
+from datetime import date as dateType
+from typing import Any
+
+# Bumped when the schema of the index changes, so it is rebuilt.
+STORE_VERSION = 1
+
+# Seconds after which the submissions of a filer are requested again.
+SYNC_INTERVAL = 86400
+
+# Columns of a filing in the submissions JSON, stored as text.
+FILING_COLUMNS = [
+    "reportDate",
+    "filingDate",
+    "acceptanceDateTime",
+    "act",
+    "form",
+    "items",
+    "primaryDocDescription",
+    "primaryDocument",
+    "accessionNumber",
+    "fileNumber",
+    "filmNumber",
+    "isInlineXBRL",
+    "isXBRL",
+    "size",
+]
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS filers (
+    cik TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    watermark TEXT,
+    recent_from TEXT,
+    pages TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    cik TEXT NOT NULL,
+    name TEXT NOT NULL,
+    filing_to TEXT,
+    filings INTEGER,
+    PRIMARY KEY (cik, name)
+);
+CREATE TABLE IF NOT EXISTS filings (
+    cik TEXT NOT NULL,
+    {", ".join(f'"{name}" TEXT' for name in FILING_COLUMNS)},
+    PRIMARY KEY (cik, "accessionNumber")
+);
+CREATE INDEX IF NOT EXISTS filings_form ON filings (cik, form, "filingDate");
+CREATE INDEX IF NOT EXISTS filings_date ON filings (cik, "filingDate");
+"""
+
+_COLUMNS = ", ".join(f'"{name}"' for name in FILING_COLUMNS)
+
+# Stored for missing values; a report date is NULL so that it sorts last.
+_EMPTY = [None if name == "reportDate" else "" for name in FILING_COLUMNS]
+
+_INSERT = (
+    f"INSERT OR IGNORE INTO filings (cik, {_COLUMNS})"  # noqa: S608
+    f" VALUES ({', '.join('?' for _ in range(len(FILING_COLUMNS) + 1))})"
+)
+
+
+def get_store_path() -> str:
+    """Return the path to the filings index, in the user cache directory."""
+    import os
+    from openbb_core.app.utils import get_user_cache_directory
+
+    db_dir = f"{get_user_cache_directory()}/sql"
+    os.makedirs(db_dir, exist_ok=True)
+
+    return f"{db_dir}/sec_filings.db"
+
+
+def _rows(cik: str, columns: dict, watermark: str | None = None) -> list[tuple]:
+    """Return the filings of a columnar block of the submissions JSON as rows.
+
+    Only the filings accepted at or after the watermark are returned.
+    """
+    count = len(columns.get("accessionNumber", []))
+    values = [columns.get(name) or [None] * count for name in FILING_COLUMNS]
+    rows: list[tuple] = []
+    for row in zip(*values):
+        if watermark and (row[2] or "") < watermark:
+            continue
+        rows.append(
+            (
+                cik,
+                *[
+                    str(value) if value not in (None, "") else empty
+                    for value, empty in zip(row, _EMPTY)
+                ],
+            )
+        )
+    return rows
+
+
+class FilingsIndex:
+    """Filings of SEC filers, by CIK.
+
+    The connection is opened once, in WAL mode, and kept open.
+
+    Parameters
+    ----------
+    path : str | None
+        The database file. Defaults to `get_store_path()`.
+        Use ":memory:" for an index that is not kept.
+    """
+
+    def __init__(self, path: str | None = None):
+        """Initialize the index."""
+        self.path = path or get_store_path()
+        self._conn: Any = None
+        self._lock = threading.RLock()
+
+    def connect(self):
+        """Return the connection to the index, opening it if needed."""
+        import sqlite3
+
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(
+                    self.path,
+                    timeout=30,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                conn.execute("PRAGMA journal_mode = WAL")
+                conn.execute("PRAGMA synchronous = NORMAL")
+                if conn.execute("PRAGMA user_version").fetchone()[0] != STORE_VERSION:
+                    conn.executescript(
+                        "DROP TABLE IF EXISTS filers; DROP TABLE IF EXISTS pages;"
+                        " DROP TABLE IF EXISTS filings;"
+                    )
+                    conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+                conn.executescript(_SCHEMA)
+                self._conn = conn
+            return self._conn
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _write(self, statements: list[tuple[str, Any]]) -> list[int]:
+        """Run statements in one transaction.
+
+        A statement with a list of parameters is run once per item.
+
+        Returns
+        -------
+        list[int]
+            The number of rows changed by each statement.
+        """
+        conn = self.connect()
+        changes: list[int] = []
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, params in statements:
+                    before = conn.total_changes
+                    if isinstance(params, list):
+                        conn.executemany(sql, params)
+                    else:
+                        conn.execute(sql, params)
+                    changes.append(conn.total_changes - before)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return changes
+
+    def filer(self, cik: str) -> dict | None:
+        """Return the sync state of a filer, or None if it was never synced.
+
+        Returns
+        -------
+        dict | None
+            The time of the last sync, the watermark, the filing date of the
+            oldest recent filing, and the pages of older filings.
+        """
+        import json
+
+        conn = self.connect()
+        with self._lock:
+            row = conn.execute(
+                "SELECT synced_at, watermark, recent_from, pages FROM filers"
+                " WHERE cik = ?",
+                (str(int(cik)),),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "synced_at": row[0],
+            "watermark": row[1],
+            "recent_from": dateType.fromisoformat(row[2]) if row[2] else None,
+            "pages": json.loads(row[3]),
+        }
+
+    def is_fresh(self, cik: str, max_age: float = SYNC_INTERVAL) -> bool:
+        """Check if a filer was synced less than `max_age` seconds ago."""
+        import time
+
+        filer = self.filer(cik)
+        return filer is not None and time.time() - filer["synced_at"] < max_age
+
+    def sync(self, cik: str, submissions: dict) -> int:
+        """Add the new filings of a filer from its submissions JSON.
+
+        Parameters
+        ----------
+        cik : str
+            The CIK of the filer.
+        submissions : dict
+            The content of https://data.sec.gov/submissions/CIK##########.json.
+
+        Returns
+        -------
+        int
+            The number of filings added.
+        """
+        import json
+        import time
+
+        cik = str(int(cik))
+        filer = self.filer(cik)
+        watermark = filer["watermark"] if filer else None
+        recent = submissions.get("filings", {}).get("recent") or {}
+        pages = submissions.get("filings", {}).get("files") or []
+        rows = _rows(cik, recent, watermark)
+        accepted = [a for a in recent.get("acceptanceDateTime", []) if a]
+        if accepted:
+            watermark = max(accepted + ([watermark] if watermark else []))
+        recent_from = min((d for d in recent.get("filingDate", []) if d), default=None)
+        added, _ = self._write(
+            [
+                (_INSERT, rows),
+                (
+                    "INSERT INTO filers (cik, synced_at, watermark, recent_from, pages)"
+                    " VALUES (?, ?, ?, ?, ?) ON CONFLICT (cik) DO UPDATE SET"
+                    " synced_at = excluded.synced_at, watermark = excluded.watermark,"
+                    " recent_from = excluded.recent_from, pages = excluded.pages",
+                    (cik, time.time(), watermark, recent_from, json.dumps(pages)),
+                ),
+            ]
+        )
+        return added
+
+    def missing_pages(
+        self,
+        cik: str,
+        start_date: dateType | None = None,
+        end_date: dateType | None = None,
+    ) -> list[dict]:
+        """Return the pages of older filings overlapping a range, not loaded yet."""
+        filer = self.filer(cik)
+        if filer is None:
+            return []
+        conn = self.connect()
+        with self._lock:
+            loaded = set(
+                conn.execute(
+                    "SELECT name, filing_to, filings FROM pages WHERE cik = ?",
+                    (str(int(cik)),),
+                ).fetchall()
+            )
+        missing: list[dict] = []
+        for page in filer["pages"]:
+            first, last = page.get("filingFrom"), page.get("filingTo")
+            if (page["name"], last, page.get("filingCount")) in loaded:
+                continue
+            if (start_date and last and last < str(start_date)) or (
+                end_date and first and first > str(end_date)
+            ):
+                continue
+            missing.append(page)
+        return missing
+
+    def load_page(self, cik: str, page: dict, filings: dict) -> int:
+        """Add the filings of a page of older filings, and mark the page as loaded.
+
+        Parameters
+        ----------
+        cik : str
+            The CIK of the filer.
+        page : dict
+            The page, as listed in the submissions JSON.
+        filings : dict
+            The content of the page.
+
+        Returns
+        -------
+        int
+            The number of filings added.
+        """
+        cik = str(int(cik))
+        added, _ = self._write(
+            [
+                (_INSERT, _rows(cik, filings)),
+                (
+                    "INSERT OR REPLACE INTO pages (cik, name, filing_to, filings)"
+                    " VALUES (?, ?, ?, ?)",
+                    (cik, page["name"], page.get("filingTo"), page.get("filingCount")),
+                ),
+            ]
+        )
+        return added
+
+    def forms(self, cik: str) -> list[str]:
+        """Return the distinct form types filed by a filer."""
+        conn = self.connect()
+        with self._lock:
+            rows = conn.execute(
+                "SELECT DISTINCT form FROM filings WHERE cik = ?", (str(int(cik)),)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def query(
+        self,
+        cik: str,
+        forms: list[str] | None = None,
+        start_date: dateType | None = None,
+        end_date: dateType | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Return the stored filings of a filer, latest first.
+
+        Parameters
+        ----------
+        cik : str
+            The CIK of the filer.
+        forms : list[str] | None
+            Only return filings of these exact form types.
+        start_date : date | None
+            Only return filings filed on or after this date.
+        end_date : date | None
+            Only return filings filed on or before this date.
+        limit : int | None
+            The maximum number of filings returned. All by default.
+
+        Returns
+        -------
+        list[dict]
+            The filings, with the columns of the submissions JSON. The filing
+            and report dates are dates.
+        """
+        where = ["cik = ?"]
+        params: list = [str(int(cik))]
+        if forms is not None:
+            where.append(f"form IN ({', '.join('?' for _ in forms)})")
+            params.extend(forms)
+        if start_date:
+            where.append('"filingDate" >= ?')
+            params.append(str(start_date))
+        if end_date:
+            where.append('"filingDate" <= ?')
+            params.append(str(end_date))
+        sql = (
+            f"SELECT {_COLUMNS} FROM filings WHERE {' AND '.join(where)}"  # noqa: S608
+            ' ORDER BY "filingDate" DESC, "reportDate" DESC,'
+            ' "acceptanceDateTime" DESC, "accessionNumber" DESC'
+        )
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        conn = self.connect()
+        with self._lock:
+            rows = conn.execute(sql, params).fetchall()
+        records = [dict(zip(FILING_COLUMNS, row)) for row in rows]
+        for record in records:
+            record["filingDate"] = dateType.fromisoformat(record["filingDate"])
+            if record["reportDate"]:
+                record["reportDate"] = dateType.fromisoformat(record["reportDate"])
+        return records
+
+
+_store: FilingsIndex | None = None
+
+
+def get_filings_index() -> FilingsIndex:
+    """Return the filings index of the process."""
+    global _store  # noqa: PLW0603  # pylint: disable=global-statement
+
+    if _store is None:
+        _store = FilingsIndex()
+
+    return _store
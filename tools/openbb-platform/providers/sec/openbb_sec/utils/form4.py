@@ -97,8 +97,21 @@ def get_logger():
 logger = get_logger()
 
 
+# Bumped when the schema of the store changes, so it is rebuilt.
+STORE_VERSION = 1
+# Filings downloaded at once. Requests are also throttled by the SEC rate limit.
+MAX_CONCURRENCY = 8
+# Filing URLs looked up per query, below the SQLite limit of query parameters.
+LOOKUP_CHUNK_SIZE = 500
+
+
 def setup_database(conn):
-    """Create a caching database for Form 4 data."""
+    """Create the table and indexes of the Form 4 store.
+
+    Each filing is stored as one row per transaction, numbered by `row_index`.
+    A filing without transactions is stored as a single row with only its URL,
+    so it is not downloaded again.
+    """
     create_table_query = """
     CREATE TABLE IF NOT EXISTS form4_data (
         filing_date DATE,
@@ -134,11 +147,18 @@ def setup_database(conn):
         underlying_security_title TEXT,
         underlying_security_shares REAL,
         underlying_security_value MONEY,
-        filing_url TEXT NOT NULL
+        filing_url TEXT NOT NULL,
+        row_index INTEGER NOT NULL DEFAULT 0
     );
+    CREATE UNIQUE INDEX IF NOT EXISTS form4_filing_url
+        ON form4_data (filing_url, row_index);
+    CREATE INDEX IF NOT EXISTS form4_company_cik
+        ON form4_data (company_cik, filing_date);
+    CREATE INDEX IF NOT EXISTS form4_owner_cik
+        ON form4_data (owner_cik, filing_date);
+    CREATE INDEX IF NOT EXISTS form4_filing_date ON form4_data (filing_date);
     """
-    conn.execute(create_table_query)
-    conn.commit()
+    conn.executescript(create_table_query)
 
 
 def add_missing_column(conn, column_name):
@@ -163,17 +183,6 @@ def add_missing_column(conn, column_name):
     cursor.execute(
         f'ALTER TABLE form4_data ADD COLUMN "{column_name_clean}" {missing_type}'
     )
-    conn.commit()
-
-
-def compress_db(db_path):
-    """Compress the database file."""
-    # pylint: disable=import-outside-toplevel
-    import gzip
-    import shutil
-
-    with open(db_path, "rb") as f_in, gzip.open(f"{db_path}.gz", "wb") as f_out:
-        shutil.copyfileobj(f_in, f_out)
 
 
 def decompress_db(db_path):
@@ -186,20 +195,232 @@ def decompress_db(db_path):
         shutil.copyfileobj(f_in, f_out)
 
 
-def close_db(conn, db_path):
-    """Sort the table by "date" before closing the connection and compressing the database."""
+def get_store_path() -> str:
+    """Return the path to the Form 4 store, in the user cache directory."""
     # pylint: disable=import-outside-toplevel
     import os
+    from openbb_core.app.utils import get_user_cache_directory
 
-    conn.execute(
-        "CREATE TABLE IF NOT EXISTS form4_data_sorted AS SELECT * FROM form4_data ORDER BY filing_date"
-    )
-    conn.execute("DROP TABLE form4_data")
-    conn.execute("ALTER TABLE form4_data_sorted RENAME TO form4_data")
-    conn.commit()
-    conn.close()
-    compress_db(db_path)
-    os.remove(db_path)
+    db_dir = f"{get_user_cache_directory()}/sql"
+    os.makedirs(db_dir, exist_ok=True)
+
+    return f"{db_dir}/sec_form4_store.db"
+
+
+class Form4Store:
+    """Form 4 transactions kept in an indexed SQLite database.
+
+    The connection is opened once, in WAL mode, and kept open. Lookups by
+    filing URL, company CIK, owner CIK or filing date use an index, and new
+    filings are upserted, so the cost of a query does not grow with the size
+    of the store.
+
+    Parameters
+    ----------
+    path : str | None
+        The database file. Defaults to `get_store_path()`.
+    """
+
+    def __init__(self, path: str | None = None):
+        """Initialize the store."""
+        # pylint: disable=import-outside-toplevel
+        import threading
+
+        self.path = path or get_store_path()
+        self._conn = None
+        self._columns: set = set()
+        self._lock = threading.RLock()
+
+    def connect(self):
+        """Return the connection to the store, opening it if needed."""
+        # pylint: disable=import-outside-toplevel
+        import sqlite3
+
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(
+                    self.path,
+                    timeout=30,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                conn.execute("PRAGMA journal_mode = WAL")
+                conn.execute("PRAGMA synchronous = NORMAL")
+                if conn.execute("PRAGMA user_version").fetchone()[0] != STORE_VERSION:
+                    conn.execute("DROP TABLE IF EXISTS form4_data")
+                    conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+                setup_database(conn)
+                self._conn = conn
+                self._columns = self._table_columns()
+                self._import_legacy_cache()
+            return self._conn
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def reset(self) -> None:
+        """Set a faulty database aside and start a new one."""
+        # pylint: disable=import-outside-toplevel
+        import os
+
+        with self._lock:
+            self.close()
+            faulty_db_path = f"{self.path}.faulty"
+            if os.path.exists(self.path):
+                os.replace(self.path, faulty_db_path)
+                logger.info("Renamed faulty database to %s", faulty_db_path)
+            for suffix in ("-wal", "-shm"):
+                if os.path.exists(f"{self.path}{suffix}"):
+                    os.remove(f"{self.path}{suffix}")
+            self.connect()
+
+    def _table_columns(self) -> set:
+        """Return the columns of the form4_data table."""
+        return {
+            row[1]
+            for row in self._conn.execute(  # type: ignore
+                "PRAGMA table_info(form4_data)"
+            )
+        }
+
+    def _ensure_columns(self, columns) -> None:
+        """Add the columns missing from the form4_data table."""
+        for column in columns:
+            if column not in self._columns:
+                add_missing_column(self._conn, column)
+                self._columns.add(column)
+
+    def _import_legacy_cache(self) -> None:
+        """Import the gzipped database of previous versions, then remove it."""
+        # pylint: disable=import-outside-toplevel
+        import os
+        import sqlite3
+
+        legacy_path = os.path.join(os.path.dirname(self.path), "sec_form4.db")
+        if not os.path.exists(f"{legacy_path}.gz") and not os.path.exists(
+            legacy_path
+        ):
+            return
+
+        conn = self._conn
+        try:
+            if os.path.exists(f"{legacy_path}.gz"):
+                decompress_db(legacy_path)
+            conn.execute("ATTACH DATABASE ? AS legacy", (legacy_path,))  # type: ignore
+            try:
+                legacy_columns = [
+                    row[1]
+                    for row in conn.execute(  # type: ignore
+                        "PRAGMA legacy.table_info(form4_data)"
+                    )
+                    if row[1] != "row_index"
+                ]
+                self._ensure_columns(legacy_columns)
+                columns = ", ".join(f'"{c}"' for c in legacy_columns)
+                if legacy_columns:
+                    conn.execute(  # type: ignore
+                        f"INSERT OR IGNORE INTO form4_data ({columns}, row_index)"  # noqa: S608
+                        f" SELECT {columns}, ROW_NUMBER() OVER"
+                        " (PARTITION BY filing_url ORDER BY rowid) - 1"
+                        " FROM legacy.form4_data WHERE filing_url IS NOT NULL"
+                    )
+            finally:
+                conn.execute("DETACH DATABASE legacy")  # type: ignore
+        except (OSError, EOFError, sqlite3.DatabaseError) as e:
+            logger.info("Could not import the previous Form 4 cache: %s", e)
+            for path in (legacy_path, f"{legacy_path}.gz"):
+                if os.path.exists(path):
+                    os.replace(path, f"{path}.faulty")
+            return
+
+        for path in (legacy_path, f"{legacy_path}.gz"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def get(self, urls) -> list[dict]:
+        """Return the stored rows of a list of filing URLs.
+
+        Filings stored without transactions are returned as a row with only
+        their `filing_url`.
+        """
+        conn = self.connect()
+        urls = list(dict.fromkeys(urls))
+        results: list = []
+        with self._lock:
+            for i in range(0, len(urls), LOOKUP_CHUNK_SIZE):
+                chunk = urls[i : i + LOOKUP_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor = conn.execute(
+                    f"SELECT * FROM form4_data WHERE filing_url IN ({placeholders})"  # noqa: S608
+                    " ORDER BY filing_url, row_index",
+                    chunk,
+                )
+                columns = [d[0] for d in cursor.description]
+                for row in cursor:
+                    record = dict(zip(columns, row))
+                    record.pop("row_index", None)
+                    results.append(record)
+
+        return results
+
+    def write(self, url: str, rows: list[dict]) -> None:
+        """Upsert the rows of a filing, atomically.
+
+        Parameters
+        ----------
+        url : str
+            The filing URL.
+        rows : list[dict]
+            The transactions of the filing, by column name.
+            An empty list marks the filing as having no transactions.
+        """
+        conn = self.connect()
+        rows = rows or [{}]
+        with self._lock:
+            self._ensure_columns({key for row in rows for key in row})
+            # Every column is set, so a replaced row keeps no previous values.
+            columns = sorted(self._columns - {"filing_url", "row_index"})
+            names = ", ".join(f'"{c}"' for c in ["filing_url", "row_index", *columns])
+            updates = ", ".join(f'"{c}" = excluded."{c}"' for c in columns)
+            query = (
+                f"INSERT INTO form4_data ({names})"  # noqa: S608
+                f" VALUES ({', '.join('?' for _ in range(len(columns) + 2))})"
+                f" ON CONFLICT (filing_url, row_index) DO UPDATE SET {updates}"
+            )
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "DELETE FROM form4_data WHERE filing_url = ? AND row_index >= ?",
+                    (url, len(rows)),
+                )
+                conn.executemany(
+                    query,
+                    [
+                        (url, i, *[row.get(c) for c in columns])
+                        for i, row in enumerate(rows)
+                    ],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+
+_store: Form4Store | None = None
+
+
+def get_form4_store() -> Form4Store:
+    """Return the Form 4 store of the process."""
+    global _store  # noqa: PLW0603  # pylint: disable=global-statement
+
+    if _store is None:
+        _store = Form4Store()
+
+    return _store
 
 
 async def get_form_4_urls(
@@ -496,85 +717,59 @@ async def download_data(urls, use_cache: bool = True):  # noqa: PLR0915
     """Get the Form 4 data from a list of URLs."""
     # pylint: disable=import-outside-toplevel
     import asyncio  # noqa
-    import os
     import sqlite3
     from numpy import nan
-    from openbb_core.app.utils import get_user_cache_directory
     from pandas import DataFrame
 
     results: list = []
     non_cached_urls: list = []
+    store = get_form4_store() if use_cache is True else None
 
     try:
-        if use_cache is True:
-            db_dir = f"{get_user_cache_directory()}/sql"
-            db_path = f"{db_dir}/sec_form4.db"
-            # Decompress the database file
-            if os.path.exists(f"{db_path}.gz"):
-                decompress_db(db_path)
-
-            os.makedirs(db_dir, exist_ok=True)
-
+        if store is not None:
             try:
-                conn = sqlite3.connect(db_path)
-                setup_database(conn)
-                cached_data = get_cached_data(urls, conn)
-                cached_urls = {entry["filing_url"] for entry in cached_data}
-                for url in urls:
-                    if url not in cached_urls:
-                        non_cached_urls.append(url)
+                cached_data = store.get(urls)
             except sqlite3.DatabaseError as e:
                 logger.info("Error connecting to the database.")
                 retry_input = input(
                     "Would you like to retry with a new database? (y/n): "
                 )
                 if retry_input.lower() == "y":
-                    faulty_db_path = f"{db_path}.faulty"
-                    os.rename(db_path, faulty_db_path)
-                    logger.info("Renamed faulty database to %s", faulty_db_path)
-                    db_path = f"{db_dir}/sec_form4.db"
-                    conn = sqlite3.connect(db_path)
-                    setup_database(conn)
-                    cached_data = get_cached_data(urls, conn)
-                    cached_urls = {entry["filing_url"] for entry in cached_data}
-                    for url in urls:
-                        if url not in cached_urls:
-                            non_cached_urls.append(url)
+                    store.reset()
+                    cached_data = store.get(urls)
                 else:
                     raise OpenBBError(e) from e
 
+            cached_urls = {entry["filing_url"] for entry in cached_data}
+            non_cached_urls = [url for url in urls if url not in cached_urls]
             results.extend(cached_data)
-        elif use_cache is False:
+        else:
             non_cached_urls = urls
 
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
         async def get_one(url):
             """Get the data for one URL."""
-            data = await get_form_4_data(url)
+            async with semaphore:
+                data = await get_form_4_data(url)
             result = await parse_form_4_data(data)
-            if not result and use_cache is True:
-                df = DataFrame([{"filing_url": url}])
-                df.to_sql("form4_data", conn, if_exists="append", index=False)
+            rows: list = []
 
             if result:
                 df = DataFrame(result)
                 df["filing_url"] = url
                 df = df.replace({nan: None}).rename(columns=field_map)
+                rows = df.replace({nan: None}).to_dict(orient="records")
+
+            if store is not None:
                 try:
-                    if use_cache is True:
-                        df.to_sql("form4_data", conn, if_exists="append", index=False)
+                    store.write(url, rows)
                 except sqlite3.DatabaseError as e:
-                    if "no column named" in str(e):
-                        missing_column = (
-                            str(e).split("no column named ")[1].split(" ")[0]
-                        )
-                        missing_column = field_map.get(missing_column, missing_column)
-                        add_missing_column(conn, missing_column)
-                        df.to_sql("form4_data", conn, if_exists="append", index=False)
-                    else:
-                        raise OpenBBError(e) from e
-                results.extend(df.replace({nan: None}).to_dict(orient="records"))
-
-        time_estimate = (len(non_cached_urls) / 7) * 1.8
+                    raise OpenBBError(e) from e
+
+            results.extend(rows)
+
+        time_estimate = len(non_cached_urls) / MAX_CONCURRENCY
         logger.info(
             "Found %d total filings and %d uncached entries to download, estimated download time: %d seconds.",
             len(urls),
@@ -589,42 +784,24 @@ async def download_data(urls, use_cache: bool = True):  # noqa: PLR0915
                 "\n\nReduce the number of requests by using a more specific date range."
             )
 
-        if len(non_cached_urls) > 0:
-            async with asyncio.Semaphore(8):
-                for url_chunk in [
-                    non_cached_urls[i : i + 8]
-                    for i in range(0, len(non_cached_urls), 8)
-                ]:
-                    await asyncio.gather(*[get_one(url) for url in url_chunk])
-                    await asyncio.sleep(1.125)
-
-        if use_cache is True:
-            close_db(conn, db_path)
+        # Requests to sec.gov are throttled by the rate limit of the provider.
+        tasks = [asyncio.create_task(get_one(url)) for url in non_cached_urls]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
 
         results = [entry for entry in results if entry.get("filing_date")]
 
         return sorted(results, key=lambda x: x["filing_date"], reverse=True)
 
     except Exception as e:  # pylint: disable=broad-except
-        if use_cache is True:
-            close_db(conn, db_path)
         raise OpenBBError(
             f"Unexpected error while downloading and processing data -> {e.__class__.__name__}: {e}"
         ) from e
 
 
-def get_cached_data(urls, conn):
-    """Retrieve cached data for a list of URLs."""
-    # pylint: disable=import-outside-toplevel
-    from numpy import nan
-    from pandas import read_sql
-
-    placeholders = ", ".join("?" for _ in urls)
-    query = f"SELECT * FROM form4_data WHERE filing_url IN ({placeholders})"  # noqa
-    df = read_sql(query, conn, params=urls)
-    return df.replace({nan: None}).to_dict(orient="records") if not df.empty else []
-
-
 async def get_form_4(
     symbol,
     start_date: dateType | None = None,
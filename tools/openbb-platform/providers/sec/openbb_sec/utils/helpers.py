@@ -189,46 +189,38 @@ def get_schema_filelist(query: str = "", url: str = "", use_cache: bool = True)
 async def download_zip_file(
     url, symbol: str | None = None, use_cache: bool = True
 ) -> list[dict]:
-    """Download a list of files from URLs."""
+    """Download a Fails-to-Deliver ZIP file, and read its records.
+
+    The file is streamed to the blob cache and read from disk. Published
+    files do not change, so a cached file is used without any request,
+    unless `use_cache` is False.
+    """
     # pylint: disable=import-outside-toplevel
-    from io import BytesIO
     from zipfile import ZipFile
 
+    from openbb_core.provider.utils.blob_cache import fetch_blob
     from pandas import concat, read_csv, to_datetime
 
     results = DataFrame()
 
-    async def callback(response, session):
-        """Response callback for ZIP file downloads."""
-        return await response.read()
-
-    response: dict | list[dict] = {}
-    if use_cache is True:
-        cache_dir = f"{get_user_cache_directory()}/http/sec_ftd"
-        async with CachedSession(cache=SQLiteBackend(cache_dir)) as session:
-            try:
-                response = await amake_request(url, session=session, headers=HEADERS, response_callback=callback)  # type: ignore
-            finally:
-                await session.close()
-    else:
-        response = await amake_request(url, headers=HEADERS, response_callback=callback)  # type: ignore
+    blob = await fetch_blob(url, headers=HEADERS, max_age=None, use_cache=use_cache)
 
     try:
-        data = read_csv(BytesIO(response), compression="zip", sep="|")  # type: ignore
+        data = read_csv(blob.path, compression="zip", sep="|")
         results = data.iloc[:-2]
     except ValueError:
-        zip_file = ZipFile(BytesIO(response))  # type: ignore
-        file_list = [d.filename for d in zip_file.infolist()]
-        for item in file_list:
-            with zip_file.open(item) as _item:
-                _file = read_csv(
-                    _item,
-                    encoding="ISO-8859-1",
-                    sep="|",
-                    low_memory=False,
-                    on_bad_lines="skip",
-                )
-                results = concat([results, _file.iloc[:-2]])
+        with ZipFile(blob.path) as zip_file:
+            file_list = [d.filename for d in zip_file.infolist()]
+            for item in file_list:
+                with zip_file.open(item) as _item:
+                    _file = read_csv(
+                        _item,
+                        encoding="ISO-8859-1",
+                        sep="|",
+                        low_memory=False,
+                        on_bad_lines="skip",
+                    )
+                    results = concat([results, _file.iloc[:-2]])
 
     if "SETTLEMENT DATE" in results.columns:
         results = results.rename(
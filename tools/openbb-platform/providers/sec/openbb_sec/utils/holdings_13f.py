@@ -0,0 +1,260 @@
+"""Local warehouse of Form 13F-HR holdings.
+
+A 13F-HR filing does not change once it is filed, so the parsed holdings of
+each filing are kept in a SQLite database, indexed by filer CIK, period and
+CUSIP. Filings already parsed are not downloaded again, and questions across
+quarters or filers, such as which filers hold a security, are answered from
+disk with `Holdings13FStore.holders()`.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import threading
+from datetime import date as dateType
+from typing import Any
+
+# Bumped when the schema of the store changes, so it is rebuilt.
+STORE_VERSION = 1
+
+# Columns of a holding, as returned by `parse_13f_hr`, and their SQL types.
+HOLDING_COLUMNS = {
+    "period_ending": "TEXT",
+    "nameOfIssuer": "TEXT",
+    "cusip": "TEXT",
+    "titleOfClass": "TEXT",
+    "security_type": "TEXT",
+    "putCall": "TEXT",
+    "investmentDiscretion": "TEXT",
+    "value": "INTEGER",
+    "principal_amount": "INTEGER",
+    "voting_authority_sole": "INTEGER",
+    "voting_authority_shared": "INTEGER",
+    "voting_authority_none": "INTEGER",
+    "weight": "REAL",
+}
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS filings (
+    url TEXT PRIMARY KEY,
+    cik TEXT NOT NULL,
+    period_ending TEXT NOT NULL,
+    holdings INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS filings_cik ON filings (cik, period_ending);
+CREATE TABLE IF NOT EXISTS holdings (
+    url TEXT NOT NULL,
+    cik TEXT NOT NULL,
+    {", ".join(f'"{name}" {kind}' for name, kind in HOLDING_COLUMNS.items())}
+);
+CREATE INDEX IF NOT EXISTS holdings_url ON holdings (url);
+CREATE INDEX IF NOT EXISTS holdings_cik ON holdings (cik, period_ending);
+CREATE INDEX IF NOT EXISTS holdings_cusip ON holdings (cusip, period_ending);
+"""
+
+
+def get_store_path() -> str:
+    """Return the path to the 13F-HR store, in the user cache directory."""
+    import os
+    from openbb_core.app.utils import get_user_cache_directory
+
+    db_dir = f"{get_user_cache_directory()}/sql"
+    os.makedirs(db_dir, exist_ok=True)
+
+    return f"{db_dir}/sec_13f.db"
+
+
+def cik_from_url(url: str) -> str | None:
+    """Return the filer CIK in the URL of an EDGAR archive, without leading zeros."""
+    parts = url.split("/edgar/data/", 1)
+    if len(parts) < 2:
+        return None
+    cik = parts[1].split("/", 1)[0]
+    return str(int(cik)) if cik.isdigit() else None
+
+
+class Holdings13FStore:
+    """Parsed 13F-HR holdings, stored by filing.
+
+    The connection is opened once, in WAL mode, and kept open.
+
+    Parameters
+    ----------
+    path : str | None
+        The database file. Defaults to `get_store_path()`.
+    """
+
+    def __init__(self, path: str | None = None):
+        """Initialize the store."""
+        self.path = path or get_store_path()
+        self._conn: Any = None
+        self._lock = threading.RLock()
+
+    def connect(self):
+        """Return the connection to the store, opening it if needed."""
+        import sqlite3
+
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(
+                    self.path,
+                    timeout=30,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                conn.execute("PRAGMA journal_mode = WAL")
+                conn.execute("PRAGMA synchronous = NORMAL")
+                if conn.execute("PRAGMA user_version").fetchone()[0] != STORE_VERSION:
+                    conn.executescript(
+                        "DROP TABLE IF EXISTS filings; DROP TABLE IF EXISTS holdings;"
+                    )
+                    conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+                conn.executescript(_SCHEMA)
+                self._conn = conn
+            return self._conn
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _select(self, where: str, params: tuple) -> list[dict]:
+        """Return the holdings matching a condition, as `parse_13f_hr` records."""
+        conn = self.connect()
+        names = ", ".join(f'"{name}"' for name in HOLDING_COLUMNS)
+        with self._lock:
+            rows = conn.execute(
+                f"SELECT cik, {names} FROM holdings WHERE {where}"  # noqa: S608
+                " ORDER BY period_ending DESC, weight DESC",
+                params,
+            ).fetchall()
+        columns = ["cik", *HOLDING_COLUMNS]
+        records = [
+            {k: v for k, v in zip(columns, row) if v is not None} for row in rows
+        ]
+        for record in records:
+            record["period_ending"] = dateType.fromisoformat(record["period_ending"])
+        return records
+
+    def get_filing(self, url: str) -> list[dict] | None:
+        """Return the holdings of a filing, or None if it is not stored."""
+        conn = self.connect()
+        with self._lock:
+            found = conn.execute(
+                "SELECT 1 FROM filings WHERE url = ?", (url,)
+            ).fetchone()
+        if not found:
+            return None
+        return [
+            {k: v for k, v in row.items() if k != "cik"}
+            for row in self._select("url = ?", (url,))
+        ]
+
+    def find_filings(self, cik: str, period_ending: str | None = None) -> list[str]:
+        """Return the URLs of the stored filings of a filer, latest period first."""
+        conn = self.connect()
+        query = "SELECT url FROM filings WHERE cik = ?"
+        params: tuple = (str(int(cik)),)
+        if period_ending:
+            query += " AND period_ending = ?"
+            params += (period_ending,)
+        with self._lock:
+            rows = conn.execute(query + " ORDER BY period_ending DESC", params)
+            return [row[0] for row in rows]
+
+    def holders(self, cusip: str, period_ending: str | None = None) -> list[dict]:
+        """Return the stored holdings of a security, across filers.
+
+        Parameters
+        ----------
+        cusip : str
+            The CUSIP of the security.
+        period_ending : str | None
+            The end of the quarter, as YYYY-MM-DD. All stored quarters by default.
+
+        Returns
+        -------
+        list[dict]
+            The holdings, with the `cik` of their filer, latest period first.
+        """
+        if period_ending:
+            return self._select(
+                "cusip = ? AND period_ending = ?", (cusip.upper(), period_ending)
+            )
+        return self._select("cusip = ?", (cusip.upper(),))
+
+    def holdings(self, cik: str, period_ending: str | None = None) -> list[dict]:
+        """Return the stored holdings of a filer, for one or all quarters."""
+        if period_ending:
+            return self._select(
+                "cik = ? AND period_ending = ?", (str(int(cik)), period_ending)
+            )
+        return self._select("cik = ?", (str(int(cik)),))
+
+    def write_filing(self, url: str, cik: str, records: list[dict]) -> None:
+        """Store the holdings of a filing, replacing any stored before, atomically.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the Complete Submission TXT file.
+        cik : str
+            The CIK of the filer.
+        records : list[dict]
+            The holdings, as returned by `parse_13f_hr`.
+        """
+        if not records:
+            return
+        cik = str(int(cik))
+        period_ending = str(records[0]["period_ending"])
+        names = ", ".join(f'"{name}"' for name in ["url", "cik", *HOLDING_COLUMNS])
+        placeholders = ", ".join("?" for _ in range(len(HOLDING_COLUMNS) + 2))
+        rows = [
+            (
+                url,
+                cik,
+                *[
+                    (
+                        str(record.get(name))
+                        if name == "period_ending"
+                        else record.get(name)
+                    )
+                    for name in HOLDING_COLUMNS
+                ],
+            )
+            for record in records
+        ]
+        conn = self.connect()
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM holdings WHERE url = ?", (url,))
+                conn.executemany(
+                    f"INSERT INTO holdings ({names}) VALUES ({placeholders})",  # noqa: S608
+                    rows,
+                )
+                conn.execute(
+                    "INSERT INTO filings (url, cik, period_ending, holdings)"
+                    " VALUES (?, ?, ?, ?) ON CONFLICT (url) DO UPDATE SET"
+                    " cik = excluded.cik, period_ending = excluded.period_ending,"
+                    " holdings = excluded.holdings",
+                    (url, cik, period_ending, len(rows)),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+
+_store: Holdings13FStore | None = None
+
+
+def get_13f_store() -> Holdings13FStore:
+    """Return the 13F-HR store of the process."""
+    global _store  # noqa: PLW0603  # pylint: disable=global-statement
+
+    if _store is None:
+        _store = Holdings13FStore()
+
+    return _store
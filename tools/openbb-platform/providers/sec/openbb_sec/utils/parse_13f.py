@@ -122,66 +122,184 @@ def get_period_ending(filing_str: str):
     )
 
 
-async def parse_13f_hr(filing: str):
-    """Parse a 13F-HR filing from the Complete Submission TXT file string."""
+# The leaves of an `infoTable` element, and the columns they are parsed into.
+INFO_TABLE_FIELDS = {
+    "nameOfIssuer": "nameOfIssuer",
+    "titleOfClass": "titleOfClass",
+    "cusip": "cusip",
+    "value": "value",
+    "sshPrnamt": "principal_amount",
+    "sshPrnamtType": "security_type",
+    "putCall": "putCall",
+    "investmentDiscretion": "investmentDiscretion",
+    "Sole": "voting_authority_sole",
+    "Shared": "voting_authority_shared",
+    "None": "voting_authority_none",
+}
+
+NUMERIC_COLUMNS = [
+    "value",
+    "principal_amount",
+    "voting_authority_sole",
+    "voting_authority_shared",
+    "voting_authority_none",
+]
+
+
+def _local_name(tag) -> str:
+    """Return the name of an XML tag, without its namespace or prefix."""
+    return str(tag).rsplit("}", 1)[-1].rsplit(":", 1)[-1]
+
+
+def get_xml_documents(filing: str) -> list[str]:
+    """Split the XML documents out of a Complete Submission TXT file string.
+
+    A string without `<XML>` sections is returned as a single document.
+    """
+    documents: list = []
+    end = 0
+
+    while (start := filing.find("<XML>", end)) != -1:
+        end = filing.find("</XML>", start)
+        if end == -1:
+            break
+        documents.append(filing[start + 5 : end].strip())
+
+    return documents or [filing.strip()]
+
+
+def parse_information_table(document: str | bytes) -> dict[str, list]:
+    """Parse the holdings of a 13F-HR information table into columns.
+
+    The document is streamed: each `infoTable` element is read into the
+    columns and discarded, so the tree of a large filing is never built.
+
+    Parameters
+    ----------
+    document : str | bytes
+        The XML document of the information table.
+
+    Returns
+    -------
+    dict[str, list]
+        The values of each column of `INFO_TABLE_FIELDS`, one per entry,
+        as strings. Missing values are None.
+    """
+    # pylint: disable=import-outside-toplevel
+    from io import BytesIO
+    from lxml import etree
+
+    columns: dict[str, list] = {column: [] for column in INFO_TABLE_FIELDS.values()}
+    if isinstance(document, str):
+        document = document.encode("utf-8")
+
+    for _, element in etree.iterparse(
+        BytesIO(document),
+        events=("end",),
+        tag="{*}infoTable",
+        recover=True,
+        huge_tree=True,
+    ):
+        values: dict = {}
+        for child in element.iter():
+            column = INFO_TABLE_FIELDS.get(_local_name(child.tag))
+            if column and child.text and child.text.strip():
+                values[column] = child.text.strip()
+        for column, column_values in columns.items():
+            column_values.append(values.get(column))
+        # Free the parsed entries.
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+    return columns
+
+
+def _find_period_of_report(documents: list[str], filing: str) -> str | None:
+    """Find the period of report in the cover page, or in the submission header."""
+    # pylint: disable=import-outside-toplevel
+    import re
+
+    for document in documents:
+        if match := re.search(
+            r"<(?:\w+:)?periodOfReport>\s*([^<\s]+)\s*</", document
+        ):
+            return match.group(1)
+    if match := re.search(r"CONFORMED PERIOD OF REPORT:\s*(\d{8})", filing):
+        return match.group(1)
+
+    return None
+
+
+async def parse_13f_hr(filing: str, use_cache: bool = True):
+    """Parse a 13F-HR filing from the Complete Submission TXT file string.
+
+    Parameters
+    ----------
+    filing : str
+        The Complete Submission TXT file string, or its URL.
+    use_cache : bool
+        When `filing` is a URL, read and store the parsed holdings in the
+        local 13F-HR store, so a filing is downloaded only once.
+
+    Returns
+    -------
+    list[dict]
+        The holdings, aggregated by security, sorted by weight.
+    """
     # pylint: disable=import-outside-toplevel
-    import xmltodict
-    from bs4 import BeautifulSoup
     from numpy import nan
-    from pandas import DataFrame, to_datetime
+    from openbb_sec.utils.holdings_13f import cik_from_url, get_13f_store
+    from pandas import DataFrame, to_datetime, to_numeric
 
-    # Check if the input string is a URL
-    if filing.startswith("https://"):
-        filing = await get_complete_submission(filing)  # type: ignore
+    url = filing if filing.startswith("https://") else None
+    store = get_13f_store() if url and use_cache is True else None
 
-    soup = BeautifulSoup(filing, "xml")
+    if store is not None:
+        stored = store.get_filing(url)  # type: ignore[arg-type]
+        if stored is not None:
+            return stored
 
-    info_table = soup.find_all("informationTable")
+    # Check if the input string is a URL
+    if url:
+        filing = await get_complete_submission(url)  # type: ignore
 
-    if not info_table:
-        info_table = soup.find_all("table")[-1]  # type: ignore[assignment]
+    documents = get_xml_documents(filing)
+    columns: dict = {}
 
-    parsed_xml = xmltodict.parse(
-        str(info_table[0]).replace("ns1:", "").replace("n1:", "")  # type: ignore
-    )["informationTable"]["infoTable"]
+    for document in documents:
+        if "informationTable" in document:
+            columns = parse_information_table(document)
+            break
 
-    if parsed_xml is None:
+    if not columns or not columns["cusip"]:
         raise OpenBBError(
             "Failed to parse the 13F-HR information table."
             + " Check the `filing_str` to make sure it is valid and contains the tag 'informationTable'."
             + " Documents filed before Q2 2013 are not supported."
         )
 
-    period_ending = get_period_ending(soup)  # type: ignore
-    data = (
-        DataFrame(parsed_xml)
-        if isinstance(parsed_xml, list)
-        else DataFrame([parsed_xml])
-    )
-    data.columns = data.columns.str.replace("ns1:", "")
-    data["value"] = data["value"].astype(int)
-    security_type: list = []
-    principal_amount: list = []
+    period_ending = _find_period_of_report(documents, filing)
 
-    # Unpack the nested objects
-    try:
-        security_type = [d.get("sshPrnamtType") for d in data["shrsOrPrnAmt"]]
-        data["security_type"] = security_type
-        principal_amount = [int(d.get("sshPrnamt", 0)) for d in data["shrsOrPrnAmt"]]
-        data["principal_amount"] = principal_amount
-        _ = data.pop("shrsOrPrnAmt")
-    except ValueError:
-        pass
-    try:
-        sole = [d.get("Sole") for d in data["votingAuthority"]]
-        shared = [d.get("Shared") for d in data["votingAuthority"]]
-        none = [d.get("None") for d in data["votingAuthority"]]
-        data["voting_authority_sole"] = [int(s) if s else 0 for s in sole]
-        data["voting_authority_shared"] = [int(s) if s else 0 for s in shared]
-        data["voting_authority_none"] = [int(s) if s else 0 for s in none]
-        _ = data.pop("votingAuthority")
-    except ValueError:
-        pass
+    if not period_ending:
+        raise OpenBBError(
+            "Failed to get the period of report from the form header."
+            + " Check the `filing_str` for the tag, 'periodOfReport'."
+        )
+
+    data = DataFrame(columns)
+
+    for col in NUMERIC_COLUMNS:
+        data[col] = to_numeric(data[col], errors="coerce").fillna(0).astype("int64")
+
+    # Drop the descriptive columns that no entry has.
+    data = data.drop(
+        columns=[
+            col
+            for col in data.columns
+            if col not in NUMERIC_COLUMNS and data[col].isna().all()
+        ]
+    )
 
     if "putCall" in data.columns:
         data["putCall"] = data["putCall"].fillna("--")
@@ -223,9 +341,14 @@ async def parse_13f_hr(filing: str):
     total_value = df.value.sum()
     df["weight"] = round(df.value.astype(float) / total_value, 6)
 
-    return (
+    records = (
         df.reset_index()
         .replace({nan: None, "--": None})
         .sort_values(by="weight", ascending=False)
         .to_dict("records")
     )
+
+    if store is not None and (cik := cik_from_url(url)):  # type: ignore[arg-type]
+        store.write_filing(url, cik, records)  # type: ignore[arg-type]
+
+    return records
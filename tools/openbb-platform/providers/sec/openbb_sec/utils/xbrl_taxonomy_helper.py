@@ -111,6 +111,7 @@ from typing import Any
 from xml.etree.ElementTree import Element
 
 from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.provider.utils.lru import ttl_cache
 
 # Constants for XBRL Namespaces
 NS = {
@@ -655,10 +656,8 @@ _IFRS_VERSION_DATES_FALLBACK: dict[int, str] = {
 # No directory listing is available, so years are hardcoded.
 _HMRC_DPL_YEARS: list[int] = [2021, 2019]
 
-# Module-level cache populated on first access
-_ifrs_version_dates_cache: dict[int, str] | None = None
-
 
+@ttl_cache(maxsize=1, ttl=86400, stale_ttl=86400, shared=True)
 def _discover_ifrs_dates() -> dict[int, str]:
     """Discover IFRS taxonomy version dates from SEC's edgartaxonomies.xml.
 
@@ -666,17 +665,12 @@ def _discover_ifrs_dates() -> dict[int, str]:
     path (e.g. ``2025-03-27``), then maps each to its calendar year.
 
     Falls back to hardcoded ``_IFRS_VERSION_DATES_FALLBACK`` on failure.
-    Results are cached so the network request happens at most once per
-    process lifetime.
+    Results are cached for a day, in memory and across processes, so that
+    a newly published taxonomy is picked up without restarting.
     """
     # pylint: disable=import-outside-toplevel
     import re
 
-    global _ifrs_version_dates_cache  # noqa: PLW0603  # pylint: disable=W0603
-
-    if _ifrs_version_dates_cache is not None:
-        return _ifrs_version_dates_cache
-
     discovered: dict[int, str] = {}
     try:
         from openbb_core.provider.utils.helpers import make_request
@@ -695,9 +689,7 @@ def _discover_ifrs_dates() -> dict[int, str]:
         pass
 
     # Merge: discovered dates take precedence, fallback fills gaps
-    merged = {**_IFRS_VERSION_DATES_FALLBACK, **discovered}
-    _ifrs_version_dates_cache = merged
-    return merged
+    return {**_IFRS_VERSION_DATES_FALLBACK, **discovered}
 
 
 def get_ifrs_version_dates() -> dict[int, str]:
@@ -0,0 +1,145 @@
+"""Tests for the SEC filings index."""
+
+import asyncio
+from datetime import date
+
+import pytest
+from openbb_core.provider.utils import helpers
+from openbb_sec.models.company_filings import SecCompanyFilingsFetcher
+from openbb_sec.utils import filings_index, helpers as sec_helpers
+from openbb_sec.utils.filings_index import FilingsIndex
+
+# pylint: disable=redefined-outer-name
+
+BASE_URL = "https://data.sec.gov/submissions/"
+
+
+def block(*filings: tuple[str, str, str]) -> dict:
+    """Return filings, as (accession number, form, filing date), in columns."""
+    return {
+        "accessionNumber": [f[0] for f in filings],
+        "filingDate": [f[2] for f in filings],
+        "reportDate": ["" for _ in filings],
+        "acceptanceDateTime": [f"{f[2]}T16:00:00.000Z" for f in filings],
+        "act": ["34" for _ in filings],
+        "form": [f[1] for f in filings],
+        "fileNumber": ["001-1" for _ in filings],
+        "filmNumber": ["" for _ in filings],
+        "items": ["" for _ in filings],
+        "size": [1000 for _ in filings],
+        "isXBRL": [1 for _ in filings],
+        "isInlineXBRL": [0 for _ in filings],
+        "primaryDocument": ["doc.htm" for _ in filings],
+        "primaryDocDescription": [f[1] for f in filings],
+    }
+
+
+@pytest.fixture
+def responses() -> dict:
+    """Submissions of a filer with one page of older filings."""
+    return {
+        "CIK0000000042.json": {
+            "filings": {
+                "recent": block(
+                    ("0000000042-24-000003", "8-K", "2024-03-01"),
+                    ("0000000042-24-000002", "10-Q", "2024-02-01"),
+                    ("0000000042-24-000001", "10-K/A", "2024-01-02"),
+                ),
+                "files": [
+                    {
+                        "name": "CIK0000000042-submissions-001.json",
+                        "filingCount": 2,
+                        "filingFrom": "2020-01-02",
+                        "filingTo": "2023-12-01",
+                    }
+                ],
+            }
+        },
+        "CIK0000000042-submissions-001.json": block(
+            ("0000000042-23-000002", "10-K", "2023-12-01"),
+            ("0000000042-20-000001", "10-K", "2020-01-02"),
+        ),
+    }
+
+
+@pytest.fixture
+def requested(monkeypatch, tmp_path, responses) -> list:
+    """Serve the responses, recording the files requested, with a fresh index."""
+    calls: list = []
+
+    async def fake_request(url, **kwargs):
+        calls.append(url.removeprefix(BASE_URL))
+        return responses[url.removeprefix(BASE_URL)]
+
+    # The SEC helpers bind amake_request when imported, before it is patched.
+    assert sec_helpers.amake_request is not fake_request
+    monkeypatch.setattr(helpers, "amake_request", fake_request)
+    monkeypatch.setattr(
+        filings_index, "_store", FilingsIndex(str(tmp_path / "filings.db"))
+    )
+    return calls
+
+
+def fetch(**params) -> list:
+    """Fetch the filings of the test filer."""
+    return asyncio.run(SecCompanyFilingsFetcher.fetch_data({"cik": "42", **params}, {}))
+
+
+def test_sync_watermark(tmp_path, responses):
+    """Only the filings accepted since the watermark are added."""
+    index = FilingsIndex(str(tmp_path / "filings.db"))
+    submissions = responses["CIK0000000042.json"]
+    assert index.sync("0000000042", submissions) == 3
+    assert index.sync("42", submissions) == 0
+    assert index.filer("42")["watermark"] == "2024-03-01T16:00:00.000Z"
+    assert index.filer("42")["recent_from"] == date(2024, 1, 2)
+    assert sorted(index.forms("42")) == ["10-K/A", "10-Q", "8-K"]
+
+    assert [p["name"] for p in index.missing_pages("42")] == [
+        "CIK0000000042-submissions-001.json"
+    ]
+    assert index.missing_pages("42", start_date=date(2024, 1, 1)) == []
+    page = submissions["filings"]["files"][0]
+    assert index.load_page("42", page, responses[page["name"]]) == 2
+    assert index.missing_pages("42") == []
+
+    filings = index.query("42", forms=["10-K"], end_date=date(2023, 12, 31))
+    assert [f["accessionNumber"] for f in filings] == [
+        "0000000042-23-000002",
+        "0000000042-20-000001",
+    ]
+    assert filings[0]["filingDate"] == date(2023, 12, 1)
+    assert filings[0]["reportDate"] is None
+
+
+def test_company_filings_from_index(requested):
+    """Older filings are only requested when needed, and then read from disk."""
+    results = fetch()
+    assert [r.report_type for r in results] == ["8-K", "10-Q", "10-K/A"]
+    assert requested == ["CIK0000000042.json"]
+    assert results[0].filing_detail_url == (
+        "https://www.sec.gov/Archives/edgar/data/42/0000000042-24-000003-index.htm"
+    )
+    assert results[0].size == "1000"
+
+    requested.clear()
+    results = fetch(form_type="10-K")
+    assert [r.accession_number for r in results] == [
+        "0000000042-24-000001",
+        "0000000042-23-000002",
+        "0000000042-20-000001",
+    ]
+    assert requested == ["CIK0000000042-submissions-001.json"]
+
+    requested.clear()
+    results = fetch(form_type="10-K", start_date="2021-01-01", limit=1)
+    assert [r.accession_number for r in results] == ["0000000042-24-000001"]
+    assert requested == []
+
+    # Without the cache, the filer is requested again.
+    results = fetch(start_date="2023-06-01", use_cache=False)
+    assert [r.report_type for r in results] == ["8-K", "10-Q", "10-K/A", "10-K"]
+    assert requested == [
+        "CIK0000000042.json",
+        "CIK0000000042-submissions-001.json",
+    ]
@@ -4,6 +4,7 @@ from datetime import date
 
 import pytest
 from openbb_core.app.service.user_service import UserService
+from openbb_core.provider.utils.rate_limiter import rate_limits_disabled
 from openbb_sec.models.cik_map import SecCikMapFetcher
 from openbb_sec.models.company_filings import SecCompanyFilingsFetcher
 from openbb_sec.models.compare_company_facts import SecCompareCompanyFactsFetcher
@@ -38,6 +39,13 @@ def vcr_config():
     }
 
 
+@pytest.fixture(autouse=True, scope="module")
+def no_rate_limits():
+    """Replay the recorded responses without rate limiting or backoff."""
+    with rate_limits_disabled():
+        yield
+
+
 @pytest.mark.record_http
 def test_sec_symbol_map_fetcher(credentials=test_credentials):
     """Test the SEC Symbol Map fetcher."""
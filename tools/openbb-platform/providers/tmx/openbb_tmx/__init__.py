@@ -1,6 +1,7 @@
 """TMX Provider Module."""
 
 from openbb_core.provider.abstract.provider import Provider
+from openbb_core.provider.utils.rate_limiter import RateLimit
 from openbb_tmx.models.available_indices import TmxAvailableIndicesFetcher
 from openbb_tmx.models.bond_prices import TmxBondPricesFetcher
 from openbb_tmx.models.calendar_earnings import TmxCalendarEarningsFetcher
@@ -68,4 +69,5 @@ tmx_provider = Provider(
         "TreasuryPrices": TmxTreasuryPricesFetcher,
     },
     repr_name="TMX",
+    rate_limit=RateLimit(10, max_concurrency=8, hosts=["tmx.com"]),
 )
@@ -11,6 +11,7 @@ from datetime import (
 from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.provider.utils.reference_data import register_dataset
 from openbb_tmx.utils import gql
 
 if TYPE_CHECKING:
@@ -368,29 +369,14 @@ def check_weekday(date) -> str:
     return date
 
 
-async def get_all_etfs(use_cache: bool = True) -> list[dict]:
-    """Get a summary of the TMX ETF universe.
-
-    Returns
-    -------
-    Dict
-        Dictionary with all TMX-listed ETFs.
-    """
+async def _load_all_etfs() -> "DataFrame":
+    """Load the TMX ETF universe from the upstream JSON file."""
     # pylint: disable=import-outside-toplevel
-    from aiohttp_client_cache import SQLiteBackend  # noqa
-    from openbb_core.app.utils import get_user_cache_directory  # noqa
     from pandas import DataFrame  # noqa
 
-    # Only used for obtaining the all ETFs JSON file.
-    tmx_etfs_backend = SQLiteBackend(
-        f"{get_user_cache_directory()}/http/tmx_etfs", expire_after=timedelta(hours=4)
-    )
-
     url = "https://dgr53wu9i7rmp.cloudfront.net/etfs/etfs.json"
 
-    response = await get_data_from_url(
-        url, use_cache=use_cache, backend=tmx_etfs_backend
-    )
+    response = await get_data_from_url(url, use_cache=False)
 
     if not response or response is None:
         raise OpenBBError("There was a problem with the request. Could not get ETFs.")
@@ -418,12 +404,25 @@ async def get_all_etfs(use_cache: bool = True) -> list[dict]:
         ]
     )
 
-    for i in etfs.index:
-        etfs.loc[i, "fund_family"] = etfs.loc[i, "additional_data"].get("fundfamilyen", None)  # type: ignore
-        etfs.loc[i, "website"] = etfs.loc[i, "additional_data"].get("websitefactsheeten", None)  # type: ignore
-        etfs.loc[i, "mer"] = etfs.loc[i, "additional_data"].get("mer", None)  # type: ignore
+    additional_data = etfs["additional_data"]
+    etfs["fund_family"] = additional_data.map(lambda d: d.get("fundfamilyen", None))
+    etfs["website"] = additional_data.map(lambda d: d.get("websitefactsheeten", None))
+    etfs["mer"] = additional_data.map(lambda d: d.get("mer", None))
     etfs = etfs.fillna("N/A").replace("N/A", None)
 
+    return etfs
+
+
+async def get_all_etfs(use_cache: bool = True) -> list[dict]:
+    """Get a summary of the TMX ETF universe.
+
+    Returns
+    -------
+    Dict
+        Dictionary with all TMX-listed ETFs.
+    """
+    etfs = await TMX_ETFS.get(refresh=not use_cache)
+
     return etfs.to_dict(orient="records")
 
 
@@ -448,18 +447,27 @@ async def get_tmx_tickers(
     return results
 
 
-async def get_all_tmx_companies(use_cache: bool = True) -> dict:
-    """Merge TSX and TSX-V listings into a single dictionary."""
+async def _load_all_tmx_companies() -> dict:
+    """Load the TSX and TSX-V listings."""
+    # pylint: disable=import-outside-toplevel
+    import asyncio
+
     all_tmx = {}
-    tsx_tickers = await get_tmx_tickers(use_cache=use_cache)
-    tsxv_tickers = await get_tmx_tickers("tsxv", use_cache=use_cache)
+    tsx_tickers, tsxv_tickers = await asyncio.gather(
+        get_tmx_tickers(use_cache=False), get_tmx_tickers("tsxv", use_cache=False)
+    )
     all_tmx.update(tsxv_tickers)
     all_tmx.update(tsx_tickers)
     return all_tmx
 
 
-async def get_all_options_tickers(use_cache: bool = True) -> "DataFrame":
-    """Return a DataFrame with all valid ticker symbols."""
+async def get_all_tmx_companies(use_cache: bool = True) -> dict:
+    """Merge TSX and TSX-V listings into a single dictionary."""
+    return dict(await TMX_COMPANIES.get(refresh=not use_cache))
+
+
+async def _load_all_options_tickers() -> "DataFrame":
+    """Load the Montreal Exchange list of optionable symbols."""
     # pylint: disable=import-outside-toplevel
     from io import StringIO  # noqa
     from pandas import concat, read_html  # noqa
@@ -467,9 +475,7 @@ async def get_all_options_tickers(use_cache: bool = True) -> "DataFrame":
 
     url = "https://www.m-x.ca/en/trading/data/options-list"
 
-    r = await get_data_from_url(
-        url, use_cache=use_cache, backend=get_companies_backend()
-    )
+    r = await get_data_from_url(url, use_cache=False)
 
     if r is None or r == []:
         raise OpenBBError("Error with the request")  # mypy: ignore
@@ -490,6 +496,13 @@ async def get_all_options_tickers(use_cache: bool = True) -> "DataFrame":
     return symbols.set_index("option_symbol")
 
 
+async def get_all_options_tickers(use_cache: bool = True) -> "DataFrame":
+    """Return a DataFrame with all valid ticker symbols."""
+    symbols = await TMX_OPTIONS_TICKERS.get(refresh=not use_cache)
+
+    return symbols.copy()
+
+
 async def get_current_options(symbol: str, use_cache: bool = True) -> "DataFrame":
     """Get the current quotes for the complete options chain."""
     # pylint: disable=import-outside-toplevel
@@ -1150,3 +1163,21 @@ async def get_all_bonds(use_cache: bool = True) -> "DataFrame":
         bonds_data[column] = bonds_data[column].astype(float)
 
     return bonds_data
+
+
+# Reference datasets shared by the TMX fetchers, kept warm in the background.
+TMX_ETFS = register_dataset(
+    "tmx_etfs", _load_all_etfs, ttl=timedelta(hours=4).total_seconds(), shared=True
+)
+TMX_COMPANIES = register_dataset(
+    "tmx_companies",
+    _load_all_tmx_companies,
+    ttl=timedelta(days=2).total_seconds(),
+    shared=True,
+)
+TMX_OPTIONS_TICKERS = register_dataset(
+    "tmx_options_tickers",
+    _load_all_options_tickers,
+    ttl=timedelta(days=2).total_seconds(),
+    shared=True,
+)
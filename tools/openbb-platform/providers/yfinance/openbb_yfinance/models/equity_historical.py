@@ -173,6 +173,10 @@ class YFinanceEquityHistoricalFetcher(
         **kwargs: Any,
     ) -> list[YFinanceEquityHistoricalData]:
         """Transform the data to the standard format."""
+        # pylint: disable=import-outside-toplevel
+        from openbb_core.provider.abstract.data_table import DataTable
+        from pandas import to_datetime
+
         if "capital_gains" in data.columns:
             data = (
                 data.drop(columns=["capital_gains"])
@@ -187,7 +191,8 @@ class YFinanceEquityHistoricalFetcher(
                 if symbol not in symbols:
                     warn(f"Data for '{symbol}' was not found.")
 
-        return [
-            YFinanceEquityHistoricalData.model_validate(d)
-            for d in data.to_dict("records")
-        ]
+        # Long intraday histories are returned as columns, and only validated
+        # as rows when they are accessed.
+        data = data.assign(date=to_datetime(data["date"]))
+
+        return DataTable.from_dataframe(data, YFinanceEquityHistoricalData)  # type: ignore[return-value]
@@ -5,6 +5,7 @@
 from typing import TYPE_CHECKING, Any, Literal, Union
 
 from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_core.provider.utils.reference_data import register_dataset
 from openbb_yfinance.utils.references import INTERVALS, MONTHS, PERIODS
 
 if TYPE_CHECKING:
@@ -225,8 +226,8 @@ def get_expiration_month(symbol: str) -> str:
     return f"{year}-{MONTH_MAP[month]}"
 
 
-def get_futures_data() -> "DataFrame":
-    """Return the dataframe of the futures csv file."""
+def _load_futures_data() -> "DataFrame":
+    """Read the futures csv file."""
     # pylint: disable=import-outside-toplevel
     from pathlib import Path  # noqa
     from pandas import read_csv  # noqa
@@ -234,6 +235,15 @@ def get_futures_data() -> "DataFrame":
     return read_csv(Path(__file__).resolve().parent / "futures.csv")
 
 
+# The futures csv ships with the package, so it is read once per process.
+YF_FUTURES = register_dataset("yfinance_futures", _load_futures_data)
+
+
+def get_futures_data() -> "DataFrame":
+    """Return the dataframe of the futures csv file."""
+    return YF_FUTURES.get_sync().copy()
+
+
 def get_futures_symbols(symbol: str) -> list:
     """Get the list of futures symbols from the continuation symbol."""
     # pylint: disable=import-outside-toplevel
@@ -3,6 +3,7 @@
 import pandas as pd
 import pytest
 from unittest.mock import patch, MagicMock
+from openbb_core.provider.utils.reference_data import clear_datasets
 from openbb_yfinance.utils.helpers import (
     df_transform_numbers,
     get_futures_data,
@@ -17,6 +18,14 @@ from openbb_yfinance.utils.helpers import (
 MOCK_FUTURES_DATA = pd.DataFrame({"Ticker": ["ES", "NQ"], "Exchange": ["CME", "CME"]})
 
 
+@pytest.fixture(autouse=True)
+def reference_data():
+    """Load the reference datasets afresh in each test."""
+    clear_datasets()
+    yield
+    clear_datasets()
+
+
 @pytest.fixture
 def mock_futures_csv(monkeypatch):
     """Mock pd.read_csv to return predefined futures data."""